@@ -11,14 +11,29 @@ import glob as glob_module
 import json
 import logging
 import os
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
 from datetime import datetime, timezone
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 
 import boto3
 from botocore.exceptions import ClientError
 
 from .manifest_parser import parse_manifest
 from .stack_info import StackInfo
+from .transfer import (
+    BASELINE_MAX_WORKERS,
+    DEFAULT_MAX_WORKERS,
+    DOWNLOAD_FORMATS,
+    DOWNLOAD_STATE_FILE,
+    RESULT_FILE_TYPES,
+    DownloadState,
+    JsonlResultWriter,
+    ResultArchive,
+    TransferStats,
+    UploadCheckpoint,
+    build_client_config,
+    build_transfer_config,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +46,7 @@ class BatchProcessor:
         stack_name: str,
         config_path: Optional[str] = None,
         region: Optional[str] = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
     ):
         """
         Initialize batch processor
@@ -39,13 +55,18 @@ class BatchProcessor:
             stack_name: Name of the CloudFormation stack
             config_path: Optional path to configuration YAML
             region: AWS region (optional)
+            max_workers: Number of documents transferred concurrently
         """
         self.stack_name = stack_name
         self.config_path = config_path
         self.region = region
+        self.max_workers = max(1, max_workers)
+        self.transfer_config = build_transfer_config()
 
         # Initialize AWS clients
-        self.s3 = boto3.client("s3", region_name=region)
+        self.s3 = boto3.client(
+            "s3", region_name=region, config=build_client_config(self.max_workers)
+        )
         self.dynamodb = boto3.resource("dynamodb", region_name=region)
 
         # Get stack resources
@@ -63,6 +84,8 @@ class BatchProcessor:
         manifest_path: str,
         output_prefix: str = "cli-batch",
         batch_id: Optional[str] = None,
+        checkpoint_file: Optional[str] = None,
+        progress_callback: Optional[Callable[[Dict], None]] = None,
     ) -> Dict:
         """
         Process batch of documents from manifest
@@ -71,6 +94,8 @@ class BatchProcessor:
             manifest_path: Path to manifest file (CSV or JSON)
             output_prefix: Prefix for output organization
             batch_id: Optional custom batch ID (auto-generated if not provided)
+            checkpoint_file: Optional local checkpoint file for resuming an interrupted batch
+            progress_callback: Optional callable receiving TransferStats snapshots
 
         Returns:
             Dictionary with batch processing results
@@ -78,8 +103,8 @@ class BatchProcessor:
         logger.info(f"Processing batch from manifest: {manifest_path}")
 
         # Generate or use provided batch ID
-        if not batch_id:
-            batch_id = self._generate_batch_id(output_prefix)
+        checkpoint = UploadCheckpoint(checkpoint_file) if checkpoint_file else None
+        batch_id = self._resolve_batch_id(batch_id, output_prefix, checkpoint)
         logger.info(f"Batch ID: {batch_id}")
 
         # Parse manifest
@@ -88,7 +113,12 @@ class BatchProcessor:
 
         # Process documents
         return self._process_documents(
-            documents, batch_id, output_prefix, manifest_path
+            documents,
+            batch_id,
+            output_prefix,
+            manifest_path,
+            checkpoint=checkpoint,
+            progress_callback=progress_callback,
         )
 
     def process_batch_from_directory(
@@ -98,6 +128,8 @@ class BatchProcessor:
         recursive: bool = True,
         output_prefix: str = "cli-batch",
         batch_id: Optional[str] = None,
+        checkpoint_file: Optional[str] = None,
+        progress_callback: Optional[Callable[[Dict], None]] = None,
     ) -> Dict:
         """
         Process batch of documents from local directory
@@ -108,6 +140,8 @@ class BatchProcessor:
             recursive: Include subdirectories
             output_prefix: Prefix for output organization
             batch_id: Optional custom batch ID (auto-generated if not provided)
+            checkpoint_file: Optional local checkpoint file for resuming an interrupted batch
+            progress_callback: Optional callable receiving TransferStats snapshots
 
         Returns:
             Dictionary with batch processing results
@@ -115,8 +149,8 @@ class BatchProcessor:
         logger.info(f"Scanning directory: {dir_path}")
 
         # Generate or use provided batch ID
-        if not batch_id:
-            batch_id = self._generate_batch_id(output_prefix)
+        checkpoint = UploadCheckpoint(checkpoint_file) if checkpoint_file else None
+        batch_id = self._resolve_batch_id(batch_id, output_prefix, checkpoint)
         logger.info(f"Batch ID: {batch_id}")
 
         # Scan directory and create manifest
@@ -130,7 +164,13 @@ class BatchProcessor:
 
         # Process documents
         return self._process_documents(
-            documents, batch_id, output_prefix, dir_path, base_dir=dir_path
+            documents,
+            batch_id,
+            output_prefix,
+            dir_path,
+            base_dir=dir_path,
+            checkpoint=checkpoint,
+            progress_callback=progress_callback,
         )
 
     def process_batch_from_s3_uri(
@@ -140,6 +180,8 @@ class BatchProcessor:
         recursive: bool = True,
         output_prefix: str = "cli-batch",
         batch_id: Optional[str] = None,
+        checkpoint_file: Optional[str] = None,
+        progress_callback: Optional[Callable[[Dict], None]] = None,
     ) -> Dict:
         """
         Process batch of documents from S3 URI
@@ -150,6 +192,8 @@ class BatchProcessor:
             recursive: Include sub-prefixes
             output_prefix: Prefix for output organization
             batch_id: Optional custom batch ID (auto-generated if not provided)
+            checkpoint_file: Optional local checkpoint file for resuming an interrupted batch
+            progress_callback: Optional callable receiving TransferStats snapshots
 
         Returns:
             Dictionary with batch processing results
@@ -157,8 +201,8 @@ class BatchProcessor:
         logger.info(f"Scanning S3 URI: {s3_uri}")
 
         # Generate or use provided batch ID
-        if not batch_id:
-            batch_id = self._generate_batch_id(output_prefix)
+        checkpoint = UploadCheckpoint(checkpoint_file) if checkpoint_file else None
+        batch_id = self._resolve_batch_id(batch_id, output_prefix, checkpoint)
         logger.info(f"Batch ID: {batch_id}")
 
         # Parse S3 URI to get bucket and prefix
@@ -186,6 +230,8 @@ class BatchProcessor:
             batch_id,
             output_prefix,
             s3_uri,
+            checkpoint=checkpoint,
+            progress_callback=progress_callback,
         )
 
     def _process_documents(
@@ -195,17 +241,23 @@ class BatchProcessor:
         output_prefix: str,
         source: str,
         base_dir: Optional[str] = None,
+        checkpoint: Optional[UploadCheckpoint] = None,
+        progress_callback: Optional[Callable[[Dict], None]] = None,
     ) -> Dict:
         """
         Process list of documents
 
+        Documents (and their baselines) are transferred concurrently by up to
+        max_workers threads. document_ids keep the order of the input list.
+
         Args:
             documents: List of document specifications
             batch_id: Batch identifier
-            steps: Steps to execute
             output_prefix: Output prefix
             source: Source path/manifest for metadata
             base_dir: Base directory for path preservation (optional)
+            checkpoint: Optional checkpoint; recorded documents are not transferred again
+            progress_callback: Optional callable receiving TransferStats snapshots
 
         Returns:
             Dictionary with batch processing results
@@ -217,53 +269,162 @@ class BatchProcessor:
             "queued": 0,
             "failed": 0,
             "baselines_uploaded": 0,
+            "resumed": 0,
+            "bytes_transferred": 0,
             "source": source,
             "output_prefix": output_prefix,
             "timestamp": datetime.now(timezone.utc).isoformat(),
         }
 
-        for doc in documents:
-            try:
-                # Upload baseline if specified
-                if doc.get("baseline_source"):
-                    try:
-                        self._upload_baseline(doc, batch_id, base_dir)
-                        results["baselines_uploaded"] += 1
-                        logger.info(f"Uploaded baseline for {doc['filename']}")
-                    except Exception as e:
-                        logger.error(
-                            f"Failed to upload baseline for {doc['filename']}: {e}"
-                        )
-                        # Continue processing document even if baseline fails
-
-                # Handle document upload/reference
-                # S3 upload automatically triggers EventBridge -> QueueSender -> SQS
-                s3_key = self._process_document_with_base(doc, batch_id, base_dir)
-
-                results["document_ids"].append(
-                    s3_key
-                )  # Use s3_key as document_id for tracking
-                results["queued"] += 1
-
-                if doc["type"] == "local":
-                    results["uploaded"] += 1
-
-            except Exception as e:
-                filename = doc.get(
-                    "filename", os.path.basename(doc.get("path", "unknown"))
-                )
-                logger.error(f"Failed to process document {filename}: {e}")
-                results["failed"] += 1
+        if checkpoint:
+            checkpoint.start(batch_id)
+
+        stats = TransferStats(total=len(documents))
+        if progress_callback:
+            progress_callback(stats.snapshot())
+
+        outcomes: List[Optional[Dict]] = [None] * len(documents)
+        workers = max(1, min(self.max_workers, len(documents)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(
+                    self._submit_document, doc, batch_id, base_dir, checkpoint
+                ): index
+                for index, doc in enumerate(documents)
+            }
+            for future in as_completed(futures):
+                index = futures[future]
+                try:
+                    outcomes[index] = future.result()
+                    stats.add(documents=1, bytes_transferred=outcomes[index]["bytes"])
+                except Exception as e:
+                    doc = documents[index]
+                    filename = doc.get(
+                        "filename", os.path.basename(doc.get("path", "unknown"))
+                    )
+                    logger.error(f"Failed to process document {filename}: {e}")
+                    results["failed"] += 1
+                    stats.add(documents=1)
+                if progress_callback:
+                    progress_callback(stats.snapshot())
+
+        for doc, outcome in zip(documents, outcomes):
+            if outcome is None:
+                continue
+            # Use s3_key as document_id for tracking
+            results["document_ids"].append(outcome["s3_key"])
+            results["queued"] += 1
+            if doc["type"] == "local":
+                results["uploaded"] += 1
+            if outcome["baseline"]:
+                results["baselines_uploaded"] += 1
+            if outcome["resumed"]:
+                results["resumed"] += 1
+
+        snapshot = stats.snapshot()
+        results["bytes_transferred"] = snapshot["bytes"]
+        results["elapsed_seconds"] = round(snapshot["elapsed_seconds"], 3)
 
         # Store batch metadata
         self._store_batch_metadata(batch_id, results)
 
         logger.info(
             f"Batch processing complete: {results['queued']} queued, "
-            f"{results['failed']} failed, {results['baselines_uploaded']} baselines uploaded"
+            f"{results['failed']} failed, {results['baselines_uploaded']} baselines uploaded, "
+            f"{results['resumed']} resumed from checkpoint "
+            f"({snapshot['mb_per_second']:.1f} MB/s, {snapshot['docs_per_second']:.1f} docs/s)"
         )
         return results
 
+    def _submit_document(
+        self,
+        doc: Dict,
+        batch_id: str,
+        base_dir: Optional[str] = None,
+        checkpoint: Optional[UploadCheckpoint] = None,
+    ) -> Dict:
+        """
+        Transfer one document and its baseline
+
+        Args:
+            doc: Document specification
+            batch_id: Batch identifier
+            base_dir: Base directory for path preservation (optional)
+            checkpoint: Optional checkpoint to consult and update
+
+        Returns:
+            Dictionary with s3_key, baseline, resumed and bytes
+        """
+        entry = checkpoint.get(doc["path"]) if checkpoint else None
+        if entry:
+            logger.info(
+                f"Skipping {doc['filename']}: already submitted as {entry['s3_key']}"
+            )
+            return {
+                "s3_key": entry["s3_key"],
+                "baseline": entry.get("baseline", False),
+                "resumed": True,
+                "bytes": 0,
+            }
+
+        bytes_transferred = 0
+        baseline_uploaded = False
+
+        # Upload baseline if specified
+        if doc.get("baseline_source"):
+            try:
+                bytes_transferred += self._upload_baseline(doc, batch_id, base_dir)
+                baseline_uploaded = True
+                logger.info(f"Uploaded baseline for {doc['filename']}")
+            except Exception as e:
+                logger.error(f"Failed to upload baseline for {doc['filename']}: {e}")
+                # Continue processing document even if baseline fails
+
+        # Handle document upload/reference
+        # S3 upload automatically triggers EventBridge -> QueueSender -> SQS
+        s3_key = self._process_document_with_base(doc, batch_id, base_dir)
+
+        if doc["type"] == "local":
+            bytes_transferred += os.path.getsize(doc["path"])
+        elif doc["type"] == "s3":
+            bytes_transferred += doc.get("size", 0)
+
+        if checkpoint:
+            checkpoint.record(
+                doc["path"], s3_key, type=doc["type"], baseline=baseline_uploaded
+            )
+
+        return {
+            "s3_key": s3_key,
+            "baseline": baseline_uploaded,
+            "resumed": False,
+            "bytes": bytes_transferred,
+        }
+
+    def _resolve_batch_id(
+        self,
+        batch_id: Optional[str],
+        output_prefix: str,
+        checkpoint: Optional[UploadCheckpoint] = None,
+    ) -> str:
+        """
+        Use the provided batch ID, the checkpoint's batch ID, or a new one
+
+        Args:
+            batch_id: Optional custom batch ID
+            output_prefix: Prefix for generated batch IDs
+            checkpoint: Optional checkpoint being resumed
+
+        Returns:
+            Batch ID
+        """
+        if batch_id:
+            return batch_id
+        if checkpoint and checkpoint.batch_id:
+            logger.info(f"Resuming batch {checkpoint.batch_id} from checkpoint")
+            return checkpoint.batch_id
+        return self._generate_batch_id(output_prefix)
+
     def _scan_local_directory(
         self, dir_path: str, pattern: str, recursive: bool
     ) -> List[Dict]:
@@ -372,6 +533,7 @@ class BatchProcessor:
                             "path": full_uri,
                             "filename": filename,
                             "type": "s3",  # Will be copied to InputBucket
+                            "size": obj.get("Size", 0),
                         }
                     )
 
@@ -442,7 +604,12 @@ class BatchProcessor:
 
         # Upload file
         input_bucket = self.resources["InputBucket"]
-        self.s3.upload_file(Filename=local_path, Bucket=input_bucket, Key=s3_key)
+        self.s3.upload_file(
+            Filename=local_path,
+            Bucket=input_bucket,
+            Key=s3_key,
+            Config=self.transfer_config,
+        )
 
         return s3_key
 
@@ -499,7 +666,12 @@ class BatchProcessor:
 
         # Upload file
         input_bucket = self.resources["InputBucket"]
-        self.s3.upload_file(Filename=local_path, Bucket=input_bucket, Key=s3_key)
+        self.s3.upload_file(
+            Filename=local_path,
+            Bucket=input_bucket,
+            Key=s3_key,
+            Config=self.transfer_config,
+        )
 
         return s3_key
 
@@ -531,15 +703,46 @@ class BatchProcessor:
 
         # Copy object
         input_bucket = self.resources["InputBucket"]
-        copy_source = {"Bucket": source_bucket, "Key": source_key}
-
-        self.s3.copy_object(CopySource=copy_source, Bucket=input_bucket, Key=dest_key)
+        self._server_side_copy(
+            source_bucket, source_key, input_bucket, dest_key, doc.get("size")
+        )
 
         return dest_key
 
+    def _server_side_copy(
+        self,
+        source_bucket: str,
+        source_key: str,
+        dest_bucket: str,
+        dest_key: str,
+        size: Optional[int] = None,
+    ) -> None:
+        """
+        Copy an object within S3 without downloading it
+
+        Objects larger than the multipart threshold are copied in parts, several
+        parts at a time; smaller objects (or unknown sizes) use one CopyObject call.
+
+        Args:
+            source_bucket: Source bucket
+            source_key: Source key
+            dest_bucket: Destination bucket
+            dest_key: Destination key
+            size: Object size in bytes, if known
+        """
+        copy_source = {"Bucket": source_bucket, "Key": source_key}
+        if size and size > self.transfer_config.multipart_threshold:
+            self.s3.copy(
+                copy_source, dest_bucket, dest_key, Config=self.transfer_config
+            )
+        else:
+            self.s3.copy_object(
+                CopySource=copy_source, Bucket=dest_bucket, Key=dest_key
+            )
+
     def _upload_baseline(
         self, doc: Dict, batch_id: str, base_dir: Optional[str] = None
-    ) -> None:
+    ) -> int:
         """
         Upload baseline data for automatic evaluation
 
@@ -547,10 +750,13 @@ class BatchProcessor:
             doc: Document specification with baseline_source
             batch_id: Batch identifier
             base_dir: Base directory (unused for baselines)
+
+        Returns:
+            Number of bytes copied or uploaded
         """
         baseline_source = doc.get("baseline_source")
         if not baseline_source:
-            return
+            return 0
 
         # Get destination key (matches where document will be processed)
         if "relative_path" in doc and doc["relative_path"]:
@@ -565,7 +771,7 @@ class BatchProcessor:
             logger.warning(
                 "EvaluationBaselineBucket not found - skipping baseline upload"
             )
-            return
+            return 0
 
         logger.info(
             f"Uploading baseline from {baseline_source} for document key: {dest_doc_key}"
@@ -574,23 +780,30 @@ class BatchProcessor:
         # Detect source type
         if baseline_source.startswith("s3://"):
             # Copy from S3 (preserves directory structure)
-            self._copy_s3_baseline_tree(baseline_source, baseline_bucket, dest_doc_key)
+            return self._copy_s3_baseline_tree(
+                baseline_source, baseline_bucket, dest_doc_key
+            )
         else:
             # Upload from local directory
-            self._upload_local_baseline_tree(
+            return self._upload_local_baseline_tree(
                 baseline_source, baseline_bucket, dest_doc_key
             )
 
     def _copy_s3_baseline_tree(
         self, source_uri: str, dest_bucket: str, dest_doc_key: str
-    ) -> None:
+    ) -> int:
         """
         Copy baseline directory tree from S3
 
+        Objects are copied server-side, up to BASELINE_MAX_WORKERS at a time.
+
         Args:
             source_uri: S3 URI to baseline root (e.g., s3://bucket/doc-001/)
             dest_bucket: Destination bucket (BaselineEvaluationBucket)
             dest_doc_key: Document key for destination path
+
+        Returns:
+            Number of bytes copied
         """
         # Parse S3 URI
         uri_parts = source_uri[5:].split("/", 1)
@@ -604,64 +817,97 @@ class BatchProcessor:
         # List all objects under source prefix
         paginator = self.s3.get_paginator("list_objects_v2")
         pages = paginator.paginate(Bucket=source_bucket, Prefix=source_prefix)
+        objects = [obj for page in pages for obj in page.get("Contents", [])]
 
-        copied_count = 0
-        for page in pages:
-            for obj in page.get("Contents", []):
-                source_key = obj["Key"]
+        def copy(obj: Dict) -> int:
+            source_key = obj["Key"]
 
-                # Calculate relative path from source prefix
-                rel_path = source_key[len(source_prefix) :]
+            # Calculate relative path from source prefix
+            rel_path = source_key[len(source_prefix) :]
 
-                # Construct destination key
-                dest_key = f"{dest_doc_key}/{rel_path}"
+            # Construct destination key
+            dest_key = f"{dest_doc_key}/{rel_path}"
 
-                # Copy object
-                copy_source = {"Bucket": source_bucket, "Key": source_key}
-                self.s3.copy_object(
-                    CopySource=copy_source, Bucket=dest_bucket, Key=dest_key
-                )
-                copied_count += 1
-                logger.debug(f"Copied baseline file: {source_key} -> {dest_key}")
+            # Copy object
+            self._server_side_copy(
+                source_bucket, source_key, dest_bucket, dest_key, obj.get("Size")
+            )
+            logger.debug(f"Copied baseline file: {source_key} -> {dest_key}")
+            return obj.get("Size", 0)
 
-        logger.info(f"Copied {copied_count} baseline files from {source_uri}")
+        copied_bytes = self._run_parallel(copy, objects)
+        logger.info(f"Copied {len(objects)} baseline files from {source_uri}")
+        return copied_bytes
 
     def _upload_local_baseline_tree(
         self, local_dir: str, dest_bucket: str, dest_doc_key: str
-    ) -> None:
+    ) -> int:
         """
         Upload baseline directory tree from local filesystem
 
+        Files are uploaded up to BASELINE_MAX_WORKERS at a time.
+
         Args:
             local_dir: Local directory containing baseline structure
             dest_bucket: Destination bucket (BaselineEvaluationBucket)
             dest_doc_key: Document key for destination path
+
+        Returns:
+            Number of bytes uploaded
         """
         if not os.path.isdir(local_dir):
             raise ValueError(f"Baseline directory not found: {local_dir}")
 
         local_dir = os.path.abspath(local_dir)
-        uploaded_count = 0
 
         # Walk directory tree
-        for root, dirs, files in os.walk(local_dir):
-            for filename in files:
-                local_file_path = os.path.join(root, filename)
+        local_files = [
+            os.path.join(root, filename)
+            for root, dirs, files in os.walk(local_dir)
+            for filename in files
+        ]
+
+        def upload(local_file_path: str) -> int:
+            # Calculate relative path from local_dir
+            rel_path = os.path.relpath(local_file_path, local_dir)
+
+            # Construct destination key
+            dest_key = f"{dest_doc_key}/{rel_path}"
+
+            # Upload file
+            self.s3.upload_file(
+                Filename=local_file_path,
+                Bucket=dest_bucket,
+                Key=dest_key,
+                Config=self.transfer_config,
+            )
+            logger.debug(f"Uploaded baseline file: {local_file_path} -> {dest_key}")
+            return os.path.getsize(local_file_path)
+
+        uploaded_bytes = self._run_parallel(upload, local_files)
+        logger.info(f"Uploaded {len(local_files)} baseline files from {local_dir}")
+        return uploaded_bytes
 
-                # Calculate relative path from local_dir
-                rel_path = os.path.relpath(local_file_path, local_dir)
+    def _run_parallel(self, func: Callable[..., int], items: List) -> int:
+        """
+        Apply func to every item with a small thread pool
 
-                # Construct destination key
-                dest_key = f"{dest_doc_key}/{rel_path}"
+        Args:
+            func: Callable returning a byte count
+            items: Items to process
 
-                # Upload file
-                self.s3.upload_file(
-                    Filename=local_file_path, Bucket=dest_bucket, Key=dest_key
-                )
-                uploaded_count += 1
-                logger.debug(f"Uploaded baseline file: {local_file_path} -> {dest_key}")
+        Returns:
+            Sum of the byte counts
 
-        logger.info(f"Uploaded {uploaded_count} baseline files from {local_dir}")
+        Raises:
+            Exception: The first error raised by func, in item order
+        """
+        if len(items) <= 1:
+            return sum(func(item) for item in items)
+        with ThreadPoolExecutor(
+            max_workers=min(BASELINE_MAX_WORKERS, len(items))
+        ) as executor:
+            return sum(executor.map(func, items))
 
     def _validate_s3_key(self, s3_key: str):
         """Validate that S3 key exists in InputBucket"""
@@ -752,94 +998,224 @@ class BatchProcessor:
             return []
 
     def download_batch_results(
-        self, batch_id: str, output_dir: str, file_types: List[str]
+        self,
+        batch_id: str,
+        output_dir: str,
+        file_types: List[str],
+        output_format: str = "files",
+        progress_callback: Optional[Callable[[Dict], None]] = None,
     ) -> Dict:
         """
-        Download batch processing results from OutputBucket with progress display
+        Download batch processing results from OutputBucket
+
+        Listing pages are fed into a pool of up to max_workers downloads as they
+        arrive. With the "files" format, objects whose local copy already has the
+        same size and ETag are skipped, so an interrupted download can be re-run.
+        "tar" and "zip" write all objects into <output_dir>/<batch_id>.<format>;
+        "jsonl" writes the JSON results under <output_dir>/<batch_id>/ into one
+        <document class>.jsonl file per document class, and results without a
+        class (pages, summaries, evaluation) into unclassified/<result type>.jsonl.
 
         Args:
             batch_id: Batch identifier
             output_dir: Local directory to download to
             file_types: List of file types to download (pages, sections, summary)
+            output_format: One of "files", "tar", "zip" or "jsonl"
+            progress_callback: Optional callable receiving TransferStats snapshots
 
         Returns:
             Dictionary with download statistics
         """
-        from rich.console import Console
-        from rich.progress import (
-            BarColumn,
-            Progress,
-            SpinnerColumn,
-            TextColumn,
-        )
+        if output_format not in DOWNLOAD_FORMATS:
+            raise ValueError(
+                f"Unsupported output format '{output_format}', "
+                f"expected one of {', '.join(DOWNLOAD_FORMATS)}"
+            )
 
-        console = Console()
         output_bucket = self.resources["OutputBucket"]
+        batch_prefix = f"{batch_id}/"
 
         # Create output directory
         os.makedirs(output_dir, exist_ok=True)
 
-        # First pass: count files to download
-        batch_prefix = f"{batch_id}/"
-        paginator = self.s3.get_paginator("list_objects_v2")
-        pages = paginator.paginate(Bucket=output_bucket, Prefix=batch_prefix)
-
-        files_to_download = []
-        for page in pages:
-            for obj in page.get("Contents", []):
-                s3_key = obj["Key"]
-
-                # Skip if not in requested file types
-                if "all" not in file_types:
-                    if not any(f"/{file_type}/" in s3_key for file_type in file_types):
-                        continue
-
-                files_to_download.append(s3_key)
-
-        total_files = len(files_to_download)
-        console.print(f"Found {total_files} files to download")
-        console.print()
+        state = None
+        writer = None
+        output_path = os.path.join(output_dir, batch_id)
+        if output_format == "files":
+            state = DownloadState(os.path.join(output_path, DOWNLOAD_STATE_FILE))
+        elif output_format == "jsonl":
+            writer = JsonlResultWriter(output_path)
+        else:
+            output_path = f"{output_path}.{output_format}"
+            writer = ResultArchive(output_path, output_format)
 
-        # Download with progress bar
-        files_downloaded = 0
+        stats = TransferStats()
         documents_downloaded = set()
+        files_failed = 0
+        max_pending = self.max_workers * 4
+
+        def collect(done) -> None:
+            nonlocal files_failed
+            for future in done:
+                obj, document_id = pending.pop(future)
+                try:
+                    bytes_downloaded, skipped = future.result()
+                    stats.add(
+                        documents=1,
+                        bytes_transferred=bytes_downloaded,
+                        skipped=int(skipped),
+                    )
+                    documents_downloaded.add(document_id)
+                except Exception as e:
+                    logger.error(f"Failed to download {obj['Key']}: {e}")
+                    files_failed += 1
+                    stats.add(documents=1)
+            if progress_callback:
+                progress_callback(stats.snapshot())
+
+        pending: Dict = {}
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                paginator = self.s3.get_paginator("list_objects_v2")
+                for page in paginator.paginate(
+                    Bucket=output_bucket, Prefix=batch_prefix
+                ):
+                    for obj in page.get("Contents", []):
+                        s3_key = obj["Key"]
+
+                        # Skip if not in requested file types
+                        if "all" not in file_types:
+                            if not any(
+                                f"/{file_type}/" in s3_key for file_type in file_types
+                            ):
+                                continue
+                        # Only JSON results can be consolidated into JSON Lines
+                        if output_format == "jsonl" and not s3_key.endswith(".json"):
+                            continue
 
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-            TextColumn("•"),
-            TextColumn("{task.completed}/{task.total} files"),
-            console=console,
-        ) as progress:
-            task = progress.add_task("Downloading results...", total=total_files)
-
-            for s3_key in files_to_download:
-                # Construct local file path
-                local_path = os.path.join(output_dir, s3_key)
-
-                # Create directory if needed
-                local_dir = os.path.dirname(local_path)
-                os.makedirs(local_dir, exist_ok=True)
-
-                # Download file
-                self.s3.download_file(
-                    Bucket=output_bucket, Key=s3_key, Filename=local_path
-                )
+                        document_id, file_type = self._parse_result_key(
+                            s3_key, batch_prefix
+                        )
+                        stats.total += 1
+                        future = executor.submit(
+                            self._download_result_object,
+                            output_bucket,
+                            obj,
+                            output_dir,
+                            document_id,
+                            file_type,
+                            state,
+                            writer,
+                        )
+                        pending[future] = (obj, document_id)
 
-                files_downloaded += 1
+                        # Bound the number of listed objects waiting for a worker
+                        if len(pending) >= max_pending:
+                            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                            collect(done)
 
-                # Track document
-                doc_key = s3_key.split("/")[1] if "/" in s3_key else s3_key
-                documents_downloaded.add(doc_key)
+                    if progress_callback:
+                        progress_callback(stats.snapshot())
 
-                # Update progress
-                progress.update(task, advance=1)
-                logger.debug(f"Downloaded: {s3_key}")
+                collect(list(pending))
+        finally:
+            if writer:
+                writer.close()
+
+        snapshot = stats.snapshot()
+        logger.info(
+            f"Downloaded {snapshot['completed'] - snapshot['skipped'] - files_failed} "
+            f"files ({snapshot['bytes']} bytes), skipped {snapshot['skipped']} "
+            f"unchanged, {files_failed} failed "
+            f"({snapshot['mb_per_second']:.1f} MB/s)"
+        )
 
         return {
-            "files_downloaded": files_downloaded,
+            "files_downloaded": snapshot["completed"]
+            - snapshot["skipped"]
+            - files_failed,
+            "files_skipped": snapshot["skipped"],
+            "files_failed": files_failed,
             "documents_downloaded": len(documents_downloaded),
+            "bytes_downloaded": snapshot["bytes"],
+            "elapsed_seconds": round(snapshot["elapsed_seconds"], 3),
+            "mb_per_second": snapshot["mb_per_second"],
+            "files_per_second": snapshot["docs_per_second"],
             "output_dir": output_dir,
+            "output_path": output_path,
+            "output_format": output_format,
         }
+
+    def _parse_result_key(self, s3_key: str, batch_prefix: str) -> Tuple[str, str]:
+        """
+        Split an OutputBucket key into document ID and result type
+
+        Args:
+            s3_key: Key under the batch prefix (e.g. batch/doc.pdf/sections/1/result.json)
+            batch_prefix: Batch prefix including the trailing slash
+
+        Returns:
+            Tuple of (document_id, file_type); file_type is "other" for objects
+            outside the known result folders
+        """
+        relative = s3_key[len(batch_prefix) :]
+        for file_type in RESULT_FILE_TYPES:
+            marker = f"/{file_type}/"
+            if marker in relative:
+                return relative.split(marker, 1)[0], file_type
+        return os.path.dirname(relative) or relative, "other"
+
+    def _download_result_object(
+        self,
+        bucket: str,
+        obj: Dict,
+        output_dir: str,
+        document_id: str,
+        file_type: str,
+        state: Optional[DownloadState] = None,
+        writer=None,
+    ) -> Tuple[int, bool]:
+        """
+        Download one result object to a local file or into a result writer
+
+        Args:
+            bucket: OutputBucket name
+            obj: Object summary from list_objects_v2
+            output_dir: Local output directory
+            document_id: Document the object belongs to
+            file_type: Result type of the object
+            state: Download state (files format)
+            writer: ResultArchive or JsonlResultWriter (other formats)
+
+        Returns:
+            Tuple of (bytes downloaded, skipped)
+        """
+        s3_key = obj["Key"]
+        etag = obj.get("ETag", "")
+        size = obj.get("Size", 0)
+
+        if writer is not None:
+            body = self.s3.get_object(Bucket=bucket, Key=s3_key)["Body"].read()
+            writer.add(s3_key, body, document_id, file_type, obj.get("LastModified"))
+            return len(body), False
+
+        # Construct local file path
+        local_path = os.path.join(output_dir, s3_key)
+        if state and state.is_current(s3_key, etag, size, local_path):
+            logger.debug(f"Unchanged, skipping: {s3_key}")
+            return 0, True
+
+        # Create directory if needed
+        os.makedirs(os.path.dirname(local_path), exist_ok=True)
+
+        # download_file writes to a temporary file and renames it when complete
+        self.s3.download_file(
+            Bucket=bucket,
+            Key=s3_key,
+            Filename=local_path,
+            Config=self.transfer_config,
+        )
+        if state:
+            state.record(s3_key, etag, size, local_path)
+        logger.debug(f"Downloaded: {s3_key}")
+        return size, False
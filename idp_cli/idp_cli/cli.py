@@ -22,6 +22,7 @@ from .batch_processor import BatchProcessor
 from .deployer import StackDeployer, build_parameters
 from .manifest_parser import validate_manifest
 from .progress_monitor import ProgressMonitor
+from .transfer import DEFAULT_MAX_WORKERS, DOWNLOAD_FORMATS
 
 # Configure logging
 logging.basicConfig(
@@ -673,6 +674,17 @@ def rerun_inference(
     default="cli-batch",
     help="Batch ID prefix (used only if --batch-id not provided, default: cli-batch)",
 )
+@click.option(
+    "--max-workers",
+    default=DEFAULT_MAX_WORKERS,
+    type=click.IntRange(min=1),
+    help=f"Documents uploaded or copied concurrently (default: {DEFAULT_MAX_WORKERS})",
+)
+@click.option(
+    "--checkpoint-file",
+    type=click.Path(dir_okay=False),
+    help="Checkpoint file for resuming an interrupted submission (reuses its batch ID)",
+)
 @click.option("--monitor", is_flag=True, help="Monitor progress until completion")
 @click.option(
     "--refresh-interval",
@@ -691,6 +703,8 @@ def run_inference(
     recursive: bool,
     config: Optional[str],
     batch_prefix: str,
+    max_workers: int,
+    checkpoint_file: Optional[str],
     monitor: bool,
     refresh_interval: int,
     region: Optional[str],
@@ -719,6 +733,9 @@ def run_inference(
 
       # Process with file pattern
       idp-cli run-inference --stack-name my-stack --dir ./docs/ --file-pattern "invoice*.pdf"
+
+      # Large submission that can be resumed after an interruption
+      idp-cli run-inference --stack-name my-stack --dir ./eval-set/ --checkpoint-file eval-set.ckpt
     """
     try:
         # Validate mutually exclusive options
@@ -750,32 +767,43 @@ def run_inference(
             f"[bold blue]Initializing batch processor for stack: {stack_name}[/bold blue]"
         )
         processor = BatchProcessor(
-            stack_name=stack_name, config_path=config, region=region
+            stack_name=stack_name,
+            config_path=config,
+            region=region,
+            max_workers=max_workers,
         )
 
         # Process batch based on source type
-        with console.status("[bold green]Processing batch..."):
+        with display.create_upload_progress() as progress:
+            task = progress.add_task(
+                "Processing batch...",
+                total=None,
+                mb_per_second=0.0,
+                docs_per_second=0.0,
+            )
+            submit_options = {
+                "output_prefix": batch_prefix,
+                "batch_id": batch_id,
+                "checkpoint_file": checkpoint_file,
+                "progress_callback": display.upload_progress_callback(progress, task),
+            }
             if manifest:
                 batch_result = processor.process_batch(
-                    manifest_path=manifest,
-                    output_prefix=batch_prefix,
-                    batch_id=batch_id,
+                    manifest_path=manifest, **submit_options
                 )
             elif directory:
                 batch_result = processor.process_batch_from_directory(
                     dir_path=directory,
                     file_pattern=file_pattern,
                     recursive=recursive,
-                    output_prefix=batch_prefix,
-                    batch_id=batch_id,
+                    **submit_options,
                 )
             else:  # s3_uri
                 batch_result = processor.process_batch_from_s3_uri(
                     s3_uri=s3_uri,
                     file_pattern=file_pattern,
                     recursive=recursive,
-                    output_prefix=batch_prefix,
-                    batch_id=batch_id,
+                    **submit_options,
                 )
 
         # Show submission results
@@ -934,12 +962,28 @@ def list_batches(stack_name: str, limit: int, region: Optional[str]):
     default="all",
     help="File types to download: pages, sections, summary, evaluation, or 'all' (default: all)",
 )
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(DOWNLOAD_FORMATS),
+    default="files",
+    help="Output layout: individual files (default), a single tar or zip archive, "
+    "or one JSONL file per document class",
+)
+@click.option(
+    "--max-workers",
+    type=click.IntRange(min=1),
+    default=DEFAULT_MAX_WORKERS,
+    help=f"Files downloaded concurrently (default: {DEFAULT_MAX_WORKERS})",
+)
 @click.option("--region", help="AWS region (optional)")
 def download_results(
     stack_name: str,
     batch_id: str,
     output_dir: str,
     file_types: str,
+    output_format: str,
+    max_workers: int,
     region: Optional[str],
 ):
     """
@@ -955,13 +999,18 @@ def download_results(
 
       # Download evaluations only
       idp-cli download-results --stack-name my-stack --batch-id <id> --output-dir ./results/ --file-types evaluation
+
+      # Consolidate extraction results into one JSONL file per document class
+      idp-cli download-results --stack-name my-stack --batch-id <id> --output-dir ./results/ --file-types sections --format jsonl
     """
     try:
         console.print(
             f"[bold blue]Downloading results for batch: {batch_id}[/bold blue]"
         )
 
-        processor = BatchProcessor(stack_name=stack_name, region=region)
+        processor = BatchProcessor(
+            stack_name=stack_name, region=region, max_workers=max_workers
+        )
 
         # Parse file types
         if file_types == "all":
@@ -970,17 +1019,44 @@ def download_results(
             types_list = [t.strip() for t in file_types.split(",")]
 
         # Download results
-        result = processor.download_batch_results(
-            batch_id=batch_id, output_dir=output_dir, file_types=types_list
-        )
+        with display.create_download_progress() as progress:
+            task = progress.add_task(
+                "Downloading results...", total=None, mb_per_second=0.0, skipped=0
+            )
+            result = processor.download_batch_results(
+                batch_id=batch_id,
+                output_dir=output_dir,
+                file_types=types_list,
+                output_format=output_format,
+                progress_callback=display.download_progress_callback(progress, task),
+            )
 
+        megabytes = result["bytes_downloaded"] / (1024 * 1024)
         console.print(
             f"\n[green]✓ Downloaded {result['files_downloaded']} files to {output_dir}[/green]"
         )
+        if result["files_skipped"]:
+            console.print(
+                f"[yellow]↻ Skipped {result['files_skipped']} unchanged files[/yellow]"
+            )
         console.print(f"  Documents: {result['documents_downloaded']}")
-        console.print(f"  Output: {output_dir}/{batch_id}/")
+        console.print(
+            f"  Transferred: {megabytes:.1f} MB in {result['elapsed_seconds']:.1f}s "
+            f"({result['mb_per_second']:.1f} MB/s)"
+        )
+        if output_format == "files":
+            console.print(f"  Output: {output_dir}/{batch_id}/")
+        else:
+            console.print(f"  Output: {result['output_path']}")
         console.print()
 
+        if result["files_failed"]:
+            console.print(
+                f"[red]✗ Failed to download {result['files_failed']} files; "
+                f"re-run to retry[/red]"
+            )
+            sys.exit(1)
+
     except Exception as e:
         logger.error(f"Error downloading results: {e}", exc_info=True)
         console.print(f"[red]✗ Error: {e}[/red]")
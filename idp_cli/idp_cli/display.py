@@ -7,13 +7,16 @@ Display Module
 Rich UI components for displaying batch processing progress and status.
 """
 
-from typing import Dict
+from typing import Callable, Dict
 
 from rich.console import Console
 from rich.panel import Panel
 from rich.progress import (
     BarColumn,
+    MofNCompleteColumn,
     Progress,
+    SpinnerColumn,
+    TaskID,
     TaskProgressColumn,
     TextColumn,
     TimeRemainingColumn,
@@ -50,6 +53,101 @@ def create_progress_bar(status_data: Dict) -> Progress:
     return progress
 
 
+def create_upload_progress() -> Progress:
+    """
+    Create progress bar for batch submission with throughput columns
+
+    Returns:
+        Progress object (tasks need mb_per_second and docs_per_second fields)
+    """
+    return Progress(
+        SpinnerColumn(),
+        TextColumn("[bold green]{task.description}"),
+        BarColumn(),
+        TaskProgressColumn(),
+        MofNCompleteColumn(),
+        TextColumn("docs •"),
+        TextColumn("{task.fields[mb_per_second]:.1f} MB/s •"),
+        TextColumn("{task.fields[docs_per_second]:.1f} docs/s"),
+        TimeRemainingColumn(),
+        console=console,
+    )
+
+
+def upload_progress_callback(
+    progress: Progress, task_id: TaskID
+) -> Callable[[Dict], None]:
+    """
+    Create a callback that updates a submission progress task
+
+    Args:
+        progress: Progress created by create_upload_progress
+        task_id: Task to update
+
+    Returns:
+        Callable accepting TransferStats snapshots from the batch processor
+    """
+
+    def update(snapshot: Dict):
+        progress.update(
+            task_id,
+            total=snapshot["total"],
+            completed=snapshot["completed"],
+            mb_per_second=snapshot["mb_per_second"],
+            docs_per_second=snapshot["docs_per_second"],
+        )
+
+    return update
+
+
+def create_download_progress() -> Progress:
+    """
+    Create progress bar for result download with throughput columns
+
+    Returns:
+        Progress object (tasks need mb_per_second and skipped fields)
+    """
+    return Progress(
+        SpinnerColumn(),
+        TextColumn("[bold green]{task.description}"),
+        BarColumn(),
+        TaskProgressColumn(),
+        MofNCompleteColumn(),
+        TextColumn("files •"),
+        TextColumn("{task.fields[mb_per_second]:.1f} MB/s •"),
+        TextColumn("{task.fields[skipped]} unchanged"),
+        console=console,
+    )
+
+
+def download_progress_callback(
+    progress: Progress, task_id: TaskID
+) -> Callable[[Dict], None]:
+    """
+    Create a callback that updates a download progress task
+
+    The task total grows while the batch prefix is still being listed.
+
+    Args:
+        progress: Progress created by create_download_progress
+        task_id: Task to update
+
+    Returns:
+        Callable accepting TransferStats snapshots from the batch processor
+    """
+
+    def update(snapshot: Dict):
+        progress.update(
+            task_id,
+            total=snapshot["total"],
+            completed=snapshot["completed"],
+            mb_per_second=snapshot["mb_per_second"],
+            skipped=snapshot["skipped"],
+        )
+
+    return update
+
+
 def create_status_table(status_data: Dict) -> Table:
     """
     Create status summary table
@@ -260,9 +358,24 @@ def show_batch_submission_summary(results: Dict):
             f"✓ Sent {results['queued']} messages to processing queue", style="green"
         )
 
+    if results.get("resumed", 0) > 0:
+        console.print(
+            f"↻ Skipped {results['resumed']} documents already submitted (checkpoint)",
+            style="yellow",
+        )
+
     if results["failed"] > 0:
         console.print(f"✗ Failed to process {results['failed']} documents", style="red")
 
+    elapsed = results.get("elapsed_seconds")
+    if elapsed:
+        megabytes = results.get("bytes_transferred", 0) / (1024 * 1024)
+        transferred = results["queued"] - results.get("resumed", 0)
+        console.print(
+            f"Transferred {megabytes:.1f} MB in {elapsed:.1f}s "
+            f"({megabytes / elapsed:.1f} MB/s, {transferred / elapsed:.1f} docs/s)"
+        )
+
     console.print()
     console.print(f"Batch ID: [bold cyan]{results['batch_id']}[/bold cyan]")
     console.print()
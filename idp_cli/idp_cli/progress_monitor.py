@@ -9,12 +9,20 @@ Monitors batch processing progress by querying document status via LookupFunctio
 
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List
 
 import boto3
 
 logger = logging.getLogger(__name__)
 
+# Documents per LookupFunction invocation (keeps responses well under the
+# 6 MB Lambda payload limit)
+LOOKUP_BATCH_SIZE = 1000
+
+# LookupFunction invocations in flight per poll
+LOOKUP_MAX_CONCURRENCY = 4
+
 
 class ProgressMonitor:
     """Monitors document processing progress"""
@@ -37,6 +45,10 @@ class ProgressMonitor:
         # Track finished documents to avoid redundant queries
         self.finished_docs = {}  # {doc_id: status_info}
 
+        # Last status of unfinished documents; sent as known_statuses so the
+        # LookupFunction only returns documents whose status changed
+        self.active_docs = {}  # {doc_id: status_info}
+
         if not self.lookup_function:
             raise ValueError("LookupFunctionName not found in stack resources")
 
@@ -92,6 +104,9 @@ class ProgressMonitor:
                 # Cache finished documents
                 if status["status"] in ["COMPLETED", "FAILED"]:
                     self.finished_docs[status["document_id"]] = status
+                    self.active_docs.pop(status["document_id"], None)
+                else:
+                    self.active_docs[status["document_id"]] = status
 
         except Exception as e:
             logger.error(f"Error in batch query: {e}", exc_info=True)
@@ -117,24 +132,72 @@ class ProgressMonitor:
 
     def _batch_query_documents(self, document_ids: List[str]) -> List[Dict]:
         """
-        Query multiple documents in a single Lambda invocation
+        Query multiple documents with batch Lambda invocations
+
+        Documents are sent in chunks of LOOKUP_BATCH_SIZE, up to
+        LOOKUP_MAX_CONCURRENCY chunks at a time. The last known status of each
+        unfinished document is included, so the LookupFunction only returns
+        documents whose status changed; the others keep their previous status.
 
         Args:
             document_ids: List of document IDs to query
 
         Returns:
-            List of document status dictionaries
+            List of document status dictionaries, in document_ids order
+        """
+        chunks = [
+            document_ids[i : i + LOOKUP_BATCH_SIZE]
+            for i in range(0, len(document_ids), LOOKUP_BATCH_SIZE)
+        ]
+        if len(chunks) == 1:
+            chunk_results = [self._query_document_chunk(chunks[0])]
+        else:
+            with ThreadPoolExecutor(
+                max_workers=min(LOOKUP_MAX_CONCURRENCY, len(chunks))
+            ) as executor:
+                chunk_results = list(executor.map(self._query_document_chunk, chunks))
+
+        changed = {}
+        for statuses in chunk_results:
+            for status in statuses:
+                changed[status["document_id"]] = status
+
+        statuses = []
+        for doc_id in document_ids:
+            status = changed.get(doc_id) or self.active_docs.get(doc_id)
+            if status is None:
+                raise Exception(f"No status returned for {doc_id}")
+            statuses.append(status)
+        return statuses
+
+    def _query_document_chunk(self, document_ids: List[str]) -> List[Dict]:
+        """
+        Query one chunk of documents in a single Lambda invocation
+
+        Args:
+            document_ids: Document IDs to query
+
+        Returns:
+            Status dictionaries for documents whose status changed (or all
+            documents, when none were known before)
         """
+        request = {
+            "object_keys": document_ids,
+            "status_only": True,  # Includes status + timing, excludes processingDetail
+        }
+        known_statuses = {
+            doc_id: self.active_docs[doc_id]["status"]
+            for doc_id in document_ids
+            if doc_id in self.active_docs
+        }
+        if known_statuses:
+            request["known_statuses"] = known_statuses
+
         # Invoke Lambda with batch request (status_only=True includes timing, excludes Step Functions)
         response = self.lambda_client.invoke(
             FunctionName=self.lookup_function,
             InvocationType="RequestResponse",
-            Payload=json.dumps(
-                {
-                    "object_keys": document_ids,
-                    "status_only": True,  # Includes status + timing, excludes processingDetail
-                }
-            ),
+            Payload=json.dumps(request),
         )
 
         # Parse response
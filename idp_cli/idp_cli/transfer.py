@@ -0,0 +1,510 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Transfer Module
+
+S3 transfer tuning, checkpointing and result writers shared by batch submission
+and result download.
+"""
+
+import hashlib
+import io
+import json
+import logging
+import math
+import os
+import re
+import tarfile
+import threading
+import time
+import zipfile
+from datetime import datetime
+from typing import Dict, Optional
+
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
+
+logger = logging.getLogger(__name__)
+
+# Documents transferred concurrently
+DEFAULT_MAX_WORKERS = 16
+
+# Objects copied/uploaded concurrently within one document's baseline tree
+BASELINE_MAX_WORKERS = 8
+
+# Large PDFs are uploaded and copied in parts, several parts at a time
+MULTIPART_THRESHOLD = 64 * 1024 * 1024
+MULTIPART_CHUNKSIZE = 16 * 1024 * 1024
+MULTIPART_MAX_CONCURRENCY = 4
+
+# Part size boto3 uses unless configured otherwise (for multipart ETags)
+DEFAULT_MULTIPART_CHUNKSIZE = 8 * 1024 * 1024
+
+# Result types stored under each document in the OutputBucket
+RESULT_FILE_TYPES = ("pages", "sections", "summary", "evaluation")
+
+# Local layouts for downloaded results
+DOWNLOAD_FORMATS = ("files", "tar", "zip", "jsonl")
+
+# Download state kept next to downloaded files (files format only)
+DOWNLOAD_STATE_FILE = ".download-state.jsonl"
+
+
+def build_transfer_config() -> TransferConfig:
+    """
+    Build the TransferConfig used for uploads and large server-side copies
+
+    Returns:
+        TransferConfig with multipart thresholds tuned for large PDFs
+    """
+    return TransferConfig(
+        multipart_threshold=MULTIPART_THRESHOLD,
+        multipart_chunksize=MULTIPART_CHUNKSIZE,
+        max_concurrency=MULTIPART_MAX_CONCURRENCY,
+        use_threads=True,
+    )
+
+
+def build_client_config(max_workers: int) -> Config:
+    """
+    Build a botocore Config whose connection pool fits the worker pool
+
+    Args:
+        max_workers: Number of concurrent document transfers
+
+    Returns:
+        botocore Config
+    """
+    return Config(
+        max_pool_connections=max(10, max_workers * MULTIPART_MAX_CONCURRENCY),
+        retries={"max_attempts": 10, "mode": "adaptive"},
+    )
+
+
+class TransferStats:
+    """Thread-safe counters for documents and bytes transferred"""
+
+    def __init__(self, total: int = 0):
+        self.total = total
+        self.completed = 0
+        self.skipped = 0
+        self.bytes = 0
+        self.started_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def add(
+        self, documents: int = 0, bytes_transferred: int = 0, skipped: int = 0
+    ) -> None:
+        with self._lock:
+            self.completed += documents
+            self.bytes += bytes_transferred
+            self.skipped += skipped
+
+    def snapshot(self) -> Dict:
+        """
+        Current progress and throughput
+
+        Returns:
+            Dictionary with total, completed, skipped, bytes, elapsed_seconds,
+            mb_per_second and docs_per_second
+        """
+        with self._lock:
+            elapsed = max(time.monotonic() - self.started_at, 1e-6)
+            return {
+                "total": self.total,
+                "completed": self.completed,
+                "skipped": self.skipped,
+                "bytes": self.bytes,
+                "elapsed_seconds": elapsed,
+                "mb_per_second": self.bytes / elapsed / (1024 * 1024),
+                "docs_per_second": self.completed / elapsed,
+            }
+
+
+class UploadCheckpoint:
+    """
+    Append-only JSON Lines record of submitted documents
+
+    The first line holds the batch ID; each following line records one document
+    whose upload or copy (including its baseline) finished. Re-running a batch
+    with the same checkpoint file skips recorded documents, so an interrupted
+    submission continues where it stopped without re-triggering processing for
+    documents already in the InputBucket.
+    """
+
+    def __init__(self, path: str):
+        """
+        Load an existing checkpoint file, if any
+
+        Args:
+            path: Local checkpoint file path
+        """
+        self.path = path
+        self.batch_id: Optional[str] = None
+        self.completed: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+
+        if os.path.exists(path):
+            with open(path) as f:
+                for line_number, line in enumerate(f, 1):
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        # A partially written last line from an interrupted run
+                        logger.warning(
+                            f"Ignoring invalid checkpoint line {line_number} in {path}"
+                        )
+                        continue
+                    if "batch_id" in entry and "source" not in entry:
+                        self.batch_id = entry["batch_id"]
+                    elif "source" in entry:
+                        self.completed[entry["source"]] = entry
+            logger.info(
+                f"Loaded checkpoint {path}: batch {self.batch_id}, "
+                f"{len(self.completed)} documents already submitted"
+            )
+
+    def start(self, batch_id: str) -> None:
+        """
+        Bind the checkpoint to a batch, writing the header for a new file
+
+        Args:
+            batch_id: Batch identifier
+
+        Raises:
+            ValueError: If the checkpoint belongs to a different batch
+        """
+        if self.batch_id and self.batch_id != batch_id:
+            raise ValueError(
+                f"Checkpoint {self.path} belongs to batch '{self.batch_id}', "
+                f"not '{batch_id}'"
+            )
+        if not self.batch_id:
+            self.batch_id = batch_id
+            directory = os.path.dirname(os.path.abspath(self.path))
+            os.makedirs(directory, exist_ok=True)
+            self._append({"batch_id": batch_id})
+
+    def get(self, source: str) -> Optional[Dict]:
+        """Return the recorded entry for a document source, if any"""
+        return self.completed.get(source)
+
+    def record(self, source: str, s3_key: str, **fields) -> None:
+        """
+        Record a submitted document
+
+        Args:
+            source: Document source path or URI
+            s3_key: Key of the document in the InputBucket
+            **fields: Additional fields to store (e.g. type, bytes)
+        """
+        entry = {"source": source, "s3_key": s3_key, **fields}
+        with self._lock:
+            self.completed[source] = entry
+            self._append(entry)
+
+    def _append(self, entry: Dict) -> None:
+        with open(self.path, "a") as f:
+            f.write(json.dumps(entry) + "\n")
+            f.flush()
+
+
+def _md5():
+    return hashlib.md5(usedforsecurity=False)
+
+
+def _part_digests(path: str, part_size: int):
+    """Yield the MD5 digest of each part_size chunk of a file"""
+    with open(path, "rb") as f:
+        while True:
+            md5 = _md5()
+            remaining = part_size
+            while remaining:
+                chunk = f.read(min(remaining, 1024 * 1024))
+                if not chunk:
+                    break
+                md5.update(chunk)
+                remaining -= len(chunk)
+            if remaining == part_size:
+                return
+            yield md5.digest()
+
+
+def etag_matches(path: str, etag: str) -> bool:
+    """
+    Check whether a local file has the content an S3 ETag describes
+
+    Single-part ETags are the MD5 of the object. Multipart ETags are the MD5 of
+    the part MD5s followed by the part count; the part size is not recorded, so
+    the boto3 default, the CLI's chunk size and an even split are tried. ETags
+    that are not MD5 based (e.g. SSE-KMS objects) never match.
+
+    Args:
+        path: Local file path
+        etag: ETag returned by S3 (quoted or not)
+
+    Returns:
+        True if the local file matches the ETag
+    """
+    etag = etag.strip('"')
+    size = os.path.getsize(path)
+
+    if "-" not in etag:
+        digests = list(_part_digests(path, max(size, 1)))
+        return (digests[0].hex() if digests else _md5().hexdigest()) == etag
+
+    expected, _, count = etag.partition("-")
+    try:
+        part_count = int(count)
+    except ValueError:
+        return False
+    even_split = math.ceil(size / part_count / (1024 * 1024)) * 1024 * 1024
+    for part_size in sorted(
+        {DEFAULT_MULTIPART_CHUNKSIZE, MULTIPART_CHUNKSIZE, even_split}
+    ):
+        if not part_size or math.ceil(size / part_size) != part_count:
+            continue
+        md5 = _md5()
+        for digest in _part_digests(path, part_size):
+            md5.update(digest)
+        if md5.hexdigest() == expected:
+            return True
+    return False
+
+
+class DownloadState:
+    """
+    Append-only JSON Lines record of downloaded result objects
+
+    Each line holds an object's key, ETag and size together with the size and
+    modification time of the local file written for it. A later download skips
+    objects whose recorded ETag still matches and whose local file is unchanged,
+    without hashing it; this also covers objects whose ETag is not an MD5.
+    """
+
+    def __init__(self, path: str):
+        """
+        Load an existing state file, if any
+
+        Args:
+            path: Local state file path
+        """
+        self.path = path
+        self.entries: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+
+        if os.path.exists(path):
+            with open(path) as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                        self.entries[entry["key"]] = entry
+                    except (json.JSONDecodeError, KeyError, TypeError):
+                        # A partially written last line from an interrupted run
+                        continue
+
+    def is_current(self, key: str, etag: str, size: int, local_path: str) -> bool:
+        """
+        Check whether the local copy of an object is up to date
+
+        Args:
+            key: S3 key
+            etag: Current ETag of the object
+            size: Current size of the object
+            local_path: Local file path for the object
+
+        Returns:
+            True if the local file exists with the same size and content
+        """
+        try:
+            local = os.stat(local_path)
+        except FileNotFoundError:
+            return False
+        if local.st_size != size:
+            return False
+
+        entry = self.entries.get(key)
+        if (
+            entry
+            and entry.get("etag") == etag
+            and entry.get("mtime_ns") == local.st_mtime_ns
+        ):
+            return True
+        if etag_matches(local_path, etag):
+            self.record(key, etag, size, local_path)
+            return True
+        return False
+
+    def record(self, key: str, etag: str, size: int, local_path: str) -> None:
+        """
+        Record a downloaded object
+
+        Args:
+            key: S3 key
+            etag: ETag of the downloaded object
+            size: Size of the downloaded object
+            local_path: Local file the object was written to
+        """
+        entry = {
+            "key": key,
+            "etag": etag,
+            "size": size,
+            "mtime_ns": os.stat(local_path).st_mtime_ns,
+        }
+        with self._lock:
+            self.entries[key] = entry
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            with open(self.path, "a") as f:
+                f.write(json.dumps(entry) + "\n")
+
+
+class ResultArchive:
+    """Thread-safe writer collecting result objects into one tar or zip file"""
+
+    def __init__(self, path: str, archive_format: str):
+        """
+        Create (or overwrite) the archive
+
+        Args:
+            path: Archive file path
+            archive_format: "tar" or "zip"
+        """
+        if archive_format not in ("tar", "zip"):
+            raise ValueError(f"Unsupported archive format: {archive_format}")
+        self.path = path
+        self.archive_format = archive_format
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        if archive_format == "tar":
+            self._archive = tarfile.open(path, "w")
+        else:
+            self._archive = zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED)
+
+    def add(
+        self,
+        key: str,
+        body: bytes,
+        document_id: str,
+        file_type: str,
+        last_modified: Optional[datetime] = None,
+    ) -> None:
+        """
+        Add an object under its S3 key
+
+        Args:
+            key: S3 key (used as the member name)
+            body: Object content
+            document_id: Document the object belongs to (unused)
+            file_type: Result type of the object (unused)
+            last_modified: Object modification time
+        """
+        timestamp = last_modified.timestamp() if last_modified else time.time()
+        with self._lock:
+            if self.archive_format == "tar":
+                info = tarfile.TarInfo(name=key)
+                info.size = len(body)
+                info.mtime = int(timestamp)
+                self._archive.addfile(info, io.BytesIO(body))
+            else:
+                date_time = time.localtime(max(timestamp, 315532800))[:6]
+                info = zipfile.ZipInfo(key, date_time=date_time)
+                info.compress_type = zipfile.ZIP_DEFLATED
+                self._archive.writestr(info, body)
+
+    def close(self) -> None:
+        with self._lock:
+            self._archive.close()
+
+
+class JsonlResultWriter:
+    """
+    Thread-safe writer consolidating JSON result objects into JSON Lines files
+
+    Results that carry a document class (section extraction results, with
+    document_class.type) are written to one file per document class, e.g.
+    Invoice.jsonl. Results without one (page OCR output, summaries, evaluation
+    reports) are written to unclassified/<result type>.jsonl. Each line holds
+    the document ID, the S3 key and the parsed object.
+    """
+
+    UNCLASSIFIED_DIRECTORY = "unclassified"
+
+    def __init__(self, directory: str):
+        """
+        Args:
+            directory: Directory for the <document class>.jsonl files
+        """
+        self.directory = directory
+        self._files: Dict[str, io.TextIOWrapper] = {}
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def document_class(content) -> Optional[str]:
+        """
+        Return the document class of a result object, if it has one
+
+        Args:
+            content: Parsed result object
+
+        Returns:
+            Value of document_class.type (or a plain document_class string), or None
+        """
+        if not isinstance(content, dict):
+            return None
+        document_class = content.get("document_class")
+        if isinstance(document_class, dict):
+            document_class = document_class.get("type")
+        if isinstance(document_class, str) and document_class.strip():
+            return document_class.strip()
+        return None
+
+    def _path(self, document_class: Optional[str], file_type: str) -> str:
+        """Local JSON Lines file for a document class or, without one, a result type"""
+        if document_class is None:
+            return os.path.join(
+                self.directory, self.UNCLASSIFIED_DIRECTORY, f"{file_type}.jsonl"
+            )
+        # Class names come from the configuration; keep them to one file name
+        safe_name = re.sub(r"[^\w.\- ]", "_", document_class).lstrip(".") or "_"
+        return os.path.join(self.directory, f"{safe_name}.jsonl")
+
+    def add(
+        self,
+        key: str,
+        body: bytes,
+        document_id: str,
+        file_type: str,
+        last_modified: Optional[datetime] = None,
+    ) -> None:
+        """
+        Append a JSON object to the file for its document class
+
+        Args:
+            key: S3 key
+            body: Object content (JSON)
+            document_id: Document the object belongs to
+            file_type: Result type, used for objects without a document class
+            last_modified: Object modification time (unused)
+
+        Raises:
+            ValueError: If the object is not valid JSON
+        """
+        content = json.loads(body)
+        path = self._path(self.document_class(content), file_type)
+        line = json.dumps({"document_id": document_id, "key": key, "content": content})
+        with self._lock:
+            if path not in self._files:
+                # Truncate on first use so a re-run does not duplicate lines
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                self._files[path] = open(path, "w")
+            self._files[path].write(line + "\n")
+
+    def close(self) -> None:
+        with self._lock:
+            for f in self._files.values():
+                f.close()
@@ -6,6 +6,7 @@ Tests for batch processor module
 """
 
 import json
+import os
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -283,3 +284,384 @@ class TestBatchProcessor:
         result = processor.get_batch_info("nonexistent-batch")
 
         assert result is None
+
+
+def _make_processor(mock_client, mock_stack_info_class, max_workers=4):
+    """Create a processor with a mocked stack and S3 client"""
+    mock_stack_info = MagicMock()
+    mock_stack_info.validate_stack.return_value = True
+    mock_stack_info.get_resources.return_value = {
+        "InputBucket": "input-bucket",
+        "OutputBucket": "output-bucket",
+        "EvaluationBaselineBucket": "baseline-bucket",
+    }
+    mock_stack_info_class.return_value = mock_stack_info
+    mock_s3 = MagicMock()
+    mock_client.return_value = mock_s3
+    return BatchProcessor("test-stack", max_workers=max_workers), mock_s3
+
+
+@patch("idp_cli.batch_processor.StackInfo")
+@patch("boto3.client")
+@patch("boto3.resource")
+class TestConcurrentSubmission:
+    """Test concurrent batch submission"""
+
+    def test_directory_upload_keeps_order_and_reports_throughput(
+        self, mock_resource, mock_client, mock_stack_info_class, tmp_path
+    ):
+        """Documents upload concurrently; document_ids follow the scan order"""
+        import threading
+        import time
+
+        for i in range(12):
+            (tmp_path / f"doc{i:02d}.pdf").write_bytes(b"x" * 1024)
+
+        processor, mock_s3 = _make_processor(mock_client, mock_stack_info_class)
+        active, peak = [0], [0]
+        lock = threading.Lock()
+
+        def upload_file(**kwargs):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.02)
+            with lock:
+                active[0] -= 1
+
+        mock_s3.upload_file.side_effect = upload_file
+        snapshots = []
+
+        result = processor.process_batch_from_directory(
+            str(tmp_path), batch_id="b1", progress_callback=snapshots.append
+        )
+
+        expected = [
+            f"b1/{name}"
+            for name in sorted(
+                p.name for p in tmp_path.iterdir() if p.name.endswith(".pdf")
+            )
+        ]
+        assert sorted(result["document_ids"]) == expected
+        scanned = [
+            f"b1/{doc['relative_path']}"
+            for doc in processor._scan_local_directory(str(tmp_path), "*.pdf", True)
+        ]
+        assert result["document_ids"] == scanned
+        assert result["uploaded"] == 12
+        assert result["bytes_transferred"] == 12 * 1024
+        assert peak[0] == 4
+        assert snapshots[0]["completed"] == 0
+        assert snapshots[-1]["completed"] == 12
+        assert "mb_per_second" in snapshots[-1]
+        # Uploads use the tuned TransferConfig
+        assert (
+            mock_s3.upload_file.call_args.kwargs["Config"] is processor.transfer_config
+        )
+
+    def test_failed_documents_are_counted(
+        self, mock_resource, mock_client, mock_stack_info_class, tmp_path
+    ):
+        """A failing upload does not stop the other documents"""
+        for name in ("a.pdf", "b.pdf", "c.pdf"):
+            (tmp_path / name).write_bytes(b"x")
+
+        processor, mock_s3 = _make_processor(mock_client, mock_stack_info_class)
+
+        def upload_file(**kwargs):
+            if kwargs["Key"].endswith("b.pdf"):
+                raise RuntimeError("AccessDenied")
+
+        mock_s3.upload_file.side_effect = upload_file
+        result = processor.process_batch_from_directory(str(tmp_path), batch_id="b1")
+
+        assert result["queued"] == 2
+        assert result["failed"] == 1
+        assert "b1/b.pdf" not in result["document_ids"]
+
+    def test_checkpoint_resumes_interrupted_batch(
+        self, mock_resource, mock_client, mock_stack_info_class, tmp_path
+    ):
+        """A second run with the same checkpoint only submits unfinished documents"""
+        docs_dir = tmp_path / "docs"
+        docs_dir.mkdir()
+        for name in ("a.pdf", "b.pdf", "c.pdf"):
+            (docs_dir / name).write_bytes(b"x")
+        checkpoint = str(tmp_path / "batch.ckpt")
+
+        processor, mock_s3 = _make_processor(mock_client, mock_stack_info_class)
+
+        def interrupted(**kwargs):
+            if kwargs["Key"].endswith("c.pdf"):
+                raise ConnectionError("connection reset")
+
+        mock_s3.upload_file.side_effect = interrupted
+        first = processor.process_batch_from_directory(
+            str(docs_dir), output_prefix="eval", checkpoint_file=checkpoint
+        )
+        assert first["failed"] == 1
+
+        mock_s3.upload_file.reset_mock(side_effect=True)
+        second = processor.process_batch_from_directory(
+            str(docs_dir), output_prefix="eval", checkpoint_file=checkpoint
+        )
+
+        # The batch ID is taken from the checkpoint and only c.pdf is uploaded
+        assert second["batch_id"] == first["batch_id"]
+        assert [c.kwargs["Key"] for c in mock_s3.upload_file.call_args_list] == [
+            f"{first['batch_id']}/c.pdf"
+        ]
+        assert second["resumed"] == 2
+        assert second["queued"] == 3
+        assert second["failed"] == 0
+
+    def test_checkpoint_for_another_batch_is_rejected(
+        self, mock_resource, mock_client, mock_stack_info_class, tmp_path
+    ):
+        """Reusing a checkpoint with a different batch ID fails before uploading"""
+        (tmp_path / "a.pdf").write_bytes(b"x")
+        checkpoint = tmp_path / "batch.ckpt"
+        checkpoint.write_text('{"batch_id": "other"}\n')
+
+        processor, mock_s3 = _make_processor(mock_client, mock_stack_info_class)
+        with pytest.raises(ValueError, match="belongs to batch 'other'"):
+            processor.process_batch_from_directory(
+                str(tmp_path), batch_id="b1", checkpoint_file=str(checkpoint)
+            )
+        mock_s3.upload_file.assert_not_called()
+
+    def test_s3_baseline_tree_is_copied_server_side(
+        self, mock_resource, mock_client, mock_stack_info_class
+    ):
+        """Baseline objects are copied with CopyObject, large ones in parts"""
+        processor, mock_s3 = _make_processor(mock_client, mock_stack_info_class)
+        threshold = processor.transfer_config.multipart_threshold
+        mock_s3.get_paginator.return_value.paginate.return_value = [
+            {
+                "Contents": [
+                    {"Key": "baselines/doc1/sections/1/result.json", "Size": 10},
+                    {"Key": "baselines/doc1/sections/2/result.json", "Size": 20},
+                    {"Key": "baselines/doc1/big.bin", "Size": threshold + 1},
+                ]
+            }
+        ]
+
+        copied = processor._copy_s3_baseline_tree(
+            "s3://src/baselines/doc1", "baseline-bucket", "b1/doc1.pdf"
+        )
+
+        assert copied == threshold + 31
+        assert sorted(c.kwargs["Key"] for c in mock_s3.copy_object.call_args_list) == [
+            "b1/doc1.pdf/sections/1/result.json",
+            "b1/doc1.pdf/sections/2/result.json",
+        ]
+        mock_s3.copy.assert_called_once_with(
+            {"Bucket": "src", "Key": "baselines/doc1/big.bin"},
+            "baseline-bucket",
+            "b1/doc1.pdf/big.bin",
+            Config=processor.transfer_config,
+        )
+
+
+class _FakeOutputBucket:
+    """Minimal S3 stand-in for listing and downloading result objects"""
+
+    def __init__(self, objects, page_size=2):
+        import hashlib
+        from datetime import datetime, timezone
+
+        self.objects = objects
+        self.page_size = page_size
+        self.downloaded = []
+        self.summaries = [
+            {
+                "Key": key,
+                "Size": len(body),
+                "ETag": f'"{hashlib.md5(body).hexdigest()}"',
+                "LastModified": datetime(2025, 10, 15, tzinfo=timezone.utc),
+            }
+            for key, body in sorted(objects.items())
+        ]
+
+    def paginate(self, Bucket, Prefix):
+        matching = [o for o in self.summaries if o["Key"].startswith(Prefix)]
+        for i in range(0, len(matching), self.page_size):
+            yield {"Contents": matching[i : i + self.page_size]}
+
+    def download_file(self, Bucket, Key, Filename, Config=None):
+        self.downloaded.append(Key)
+        with open(Filename, "wb") as f:
+            f.write(self.objects[Key])
+
+    def get_object(self, Bucket, Key):
+        import io
+
+        self.downloaded.append(Key)
+        return {"Body": io.BytesIO(self.objects[Key])}
+
+    def attach(self, mock_s3):
+        mock_s3.get_paginator.return_value.paginate.side_effect = self.paginate
+        mock_s3.download_file.side_effect = self.download_file
+        mock_s3.get_object.side_effect = self.get_object
+
+
+RESULT_OBJECTS = {
+    "b1/a.pdf/pages/1/result.json": b'{"page": 1}',
+    "b1/a.pdf/sections/1/result.json": (
+        b'{"document_class": {"type": "Invoice"}, "inference_result": {"x": 1}}'
+    ),
+    "b1/a.pdf/summary/summary.md": b"# Summary",
+    "b1/sub/c.pdf/sections/1/result.json": (
+        b'{"document_class": {"type": "Invoice"}, "inference_result": {"x": 2}}'
+    ),
+    "b1/sub/c.pdf/evaluation/report.json": b'{"accuracy": 1.0}',
+}
+
+
+@patch("idp_cli.batch_processor.StackInfo")
+@patch("boto3.client")
+@patch("boto3.resource")
+class TestResultDownload:
+    """Test concurrent result download"""
+
+    def test_download_files_then_skip_unchanged(
+        self, mock_resource, mock_client, mock_stack_info_class, tmp_path
+    ):
+        """A second download only fetches objects that changed"""
+        processor, mock_s3 = _make_processor(mock_client, mock_stack_info_class)
+        bucket = _FakeOutputBucket(dict(RESULT_OBJECTS))
+        bucket.attach(mock_s3)
+        snapshots = []
+
+        first = processor.download_batch_results(
+            "b1", str(tmp_path), ["all"], progress_callback=snapshots.append
+        )
+
+        assert sorted(bucket.downloaded) == sorted(RESULT_OBJECTS)
+        assert first["files_downloaded"] == 5
+        assert first["files_skipped"] == 0
+        assert first["documents_downloaded"] == 2
+        assert first["bytes_downloaded"] == sum(map(len, RESULT_OBJECTS.values()))
+        assert (tmp_path / "b1/sub/c.pdf/evaluation/report.json").read_bytes() == (
+            RESULT_OBJECTS["b1/sub/c.pdf/evaluation/report.json"]
+        )
+        assert snapshots[-1]["completed"] == snapshots[-1]["total"] == 5
+
+        # Change one object remotely and corrupt one local file
+        changed = dict(RESULT_OBJECTS)
+        changed["b1/a.pdf/pages/1/result.json"] = b'{"page": 2}'
+        bucket = _FakeOutputBucket(changed)
+        bucket.attach(mock_s3)
+        (tmp_path / "b1/a.pdf/summary/summary.md").write_bytes(b"# Sumary!")
+
+        second = processor.download_batch_results("b1", str(tmp_path), ["all"])
+
+        assert sorted(bucket.downloaded) == [
+            "b1/a.pdf/pages/1/result.json",
+            "b1/a.pdf/summary/summary.md",
+        ]
+        assert second["files_downloaded"] == 2
+        assert second["files_skipped"] == 3
+        assert second["documents_downloaded"] == 2
+
+    def test_file_type_filter(
+        self, mock_resource, mock_client, mock_stack_info_class, tmp_path
+    ):
+        """Only requested result types are downloaded"""
+        processor, mock_s3 = _make_processor(mock_client, mock_stack_info_class)
+        bucket = _FakeOutputBucket(dict(RESULT_OBJECTS))
+        bucket.attach(mock_s3)
+
+        result = processor.download_batch_results("b1", str(tmp_path), ["sections"])
+
+        assert sorted(bucket.downloaded) == [
+            "b1/a.pdf/sections/1/result.json",
+            "b1/sub/c.pdf/sections/1/result.json",
+        ]
+        assert result["documents_downloaded"] == 2
+
+    def test_failed_downloads_are_counted(
+        self, mock_resource, mock_client, mock_stack_info_class, tmp_path
+    ):
+        """A failing object does not stop the rest of the download"""
+        processor, mock_s3 = _make_processor(mock_client, mock_stack_info_class)
+        bucket = _FakeOutputBucket(dict(RESULT_OBJECTS))
+        bucket.attach(mock_s3)
+
+        def download_file(Bucket, Key, Filename, Config=None):
+            if Key.endswith("summary.md"):
+                raise RuntimeError("AccessDenied")
+            bucket.download_file(Bucket, Key, Filename, Config)
+
+        mock_s3.download_file.side_effect = download_file
+        result = processor.download_batch_results("b1", str(tmp_path), ["all"])
+
+        assert result["files_downloaded"] == 4
+        assert result["files_failed"] == 1
+
+    @pytest.mark.parametrize("output_format", ["tar", "zip"])
+    def test_archive_formats(
+        self,
+        mock_resource,
+        mock_client,
+        mock_stack_info_class,
+        tmp_path,
+        output_format,
+    ):
+        """Results are written into a single archive named after the batch"""
+        import tarfile
+        import zipfile
+
+        processor, mock_s3 = _make_processor(mock_client, mock_stack_info_class)
+        _FakeOutputBucket(dict(RESULT_OBJECTS)).attach(mock_s3)
+
+        result = processor.download_batch_results(
+            "b1", str(tmp_path), ["all"], output_format=output_format
+        )
+
+        archive_path = tmp_path / f"b1.{output_format}"
+        assert result["output_path"] == str(archive_path)
+        assert not (tmp_path / "b1").exists()
+        if output_format == "tar":
+            with tarfile.open(archive_path) as archive:
+                contents = {
+                    m.name: archive.extractfile(m).read() for m in archive.getmembers()
+                }
+        else:
+            with zipfile.ZipFile(archive_path) as archive:
+                contents = {n: archive.read(n) for n in archive.namelist()}
+        assert contents == RESULT_OBJECTS
+
+    def test_jsonl_format(
+        self, mock_resource, mock_client, mock_stack_info_class, tmp_path
+    ):
+        """JSON results are consolidated into one file per document class"""
+        processor, mock_s3 = _make_processor(mock_client, mock_stack_info_class)
+        _FakeOutputBucket(dict(RESULT_OBJECTS)).attach(mock_s3)
+
+        result = processor.download_batch_results(
+            "b1", str(tmp_path), ["all"], output_format="jsonl"
+        )
+
+        assert result["files_downloaded"] == 4
+        assert sorted(os.listdir(tmp_path / "b1")) == ["Invoice.jsonl", "unclassified"]
+        assert sorted(os.listdir(tmp_path / "b1/unclassified")) == [
+            "evaluation.jsonl",
+            "pages.jsonl",
+        ]
+        sections = [json.loads(line) for line in (tmp_path / "b1/Invoice.jsonl").open()]
+        assert sorted(
+            (s["document_id"], s["content"]["inference_result"]["x"]) for s in sections
+        ) == [
+            ("a.pdf", 1),
+            ("sub/c.pdf", 2),
+        ]
+
+    def test_unknown_format_is_rejected(
+        self, mock_resource, mock_client, mock_stack_info_class, tmp_path
+    ):
+        processor, _ = _make_processor(mock_client, mock_stack_info_class)
+        with pytest.raises(ValueError, match="Unsupported output format"):
+            processor.download_batch_results(
+                "b1", str(tmp_path), ["all"], output_format="rar"
+            )
@@ -259,3 +259,67 @@ class TestProgressMonitor:
         assert failed[0]["document_id"] == "doc1"
         assert failed[0]["error"] == "Timeout"
         assert failed[1]["document_id"] == "doc2"
+
+    @patch("idp_cli.progress_monitor.LOOKUP_BATCH_SIZE", 3)
+    @patch("boto3.client")
+    def test_get_batch_status_incremental(self, mock_boto_client):
+        """Large batches are chunked and later polls only receive changes"""
+        import threading
+
+        mock_lambda = MagicMock()
+        mock_boto_client.return_value = mock_lambda
+        current = {f"doc{i}": "RUNNING" for i in range(7)}
+        requests = []
+        lock = threading.Lock()
+
+        def mock_invoke(FunctionName, InvocationType, Payload):
+            request = json.loads(Payload)
+            with lock:
+                requests.append(request)
+            known = request.get("known_statuses", {})
+            results = [
+                {"object_key": key, "status": current[key]}
+                for key in request["object_keys"]
+                if known.get(key) != current[key]
+            ]
+            body = {"results": results}
+            if "known_statuses" in request:
+                body["unchanged"] = len(request["object_keys"]) - len(results)
+            return {"Payload": MagicMock(read=lambda: json.dumps(body).encode())}
+
+        mock_lambda.invoke.side_effect = mock_invoke
+
+        monitor = ProgressMonitor("test-stack", {"LookupFunctionName": "test-function"})
+        document_ids = list(current)
+
+        first = monitor.get_batch_status(document_ids)
+        assert len(first["running"]) == 7
+        assert sorted(len(r["object_keys"]) for r in requests) == [1, 3, 3]
+        assert all("known_statuses" not in r for r in requests)
+
+        requests.clear()
+        current["doc4"] = "COMPLETED"
+        second = monitor.get_batch_status(document_ids)
+
+        assert [d["document_id"] for d in second["completed"]] == ["doc4"]
+        assert [d["document_id"] for d in second["running"]] == [
+            "doc0",
+            "doc1",
+            "doc2",
+            "doc3",
+            "doc5",
+            "doc6",
+        ]
+        assert all(r["known_statuses"] for r in requests)
+
+        # Finished documents are no longer queried
+        requests.clear()
+        monitor.get_batch_status(document_ids)
+        assert sorted(k for r in requests for k in r["object_keys"]) == [
+            "doc0",
+            "doc1",
+            "doc2",
+            "doc3",
+            "doc5",
+            "doc6",
+        ]
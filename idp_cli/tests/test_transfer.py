@@ -0,0 +1,161 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Tests for transfer module
+"""
+
+import hashlib
+import json
+import os
+
+import pytest
+from idp_cli.transfer import (
+    DownloadState,
+    JsonlResultWriter,
+    UploadCheckpoint,
+    etag_matches,
+)
+
+
+def _multipart_etag(data: bytes, part_size: int) -> str:
+    digests = [
+        hashlib.md5(data[i : i + part_size]).digest()
+        for i in range(0, len(data), part_size)
+    ]
+    return f'"{hashlib.md5(b"".join(digests)).hexdigest()}-{len(digests)}"'
+
+
+class TestEtagMatches:
+    """Test local file comparison against S3 ETags"""
+
+    def test_single_part(self, tmp_path):
+        path = tmp_path / "result.json"
+        data = b'{"a": 1}'
+        path.write_bytes(data)
+
+        assert etag_matches(str(path), f'"{hashlib.md5(data).hexdigest()}"')
+        assert not etag_matches(str(path), f'"{hashlib.md5(b"other").hexdigest()}"')
+
+    def test_empty_file(self, tmp_path):
+        path = tmp_path / "empty.txt"
+        path.write_bytes(b"")
+
+        assert etag_matches(str(path), hashlib.md5(b"").hexdigest())
+
+    def test_multipart(self, tmp_path):
+        data = os.urandom(20 * 1024 * 1024 + 5)
+        path = tmp_path / "large.pdf"
+        path.write_bytes(data)
+
+        assert etag_matches(str(path), _multipart_etag(data, 8 * 1024 * 1024))
+        assert etag_matches(str(path), _multipart_etag(data, 16 * 1024 * 1024))
+        assert not etag_matches(str(path), _multipart_etag(data[:-1] + b"x", 8 << 20))
+
+    def test_non_md5_etag(self, tmp_path):
+        path = tmp_path / "result.json"
+        path.write_bytes(b"{}")
+
+        assert not etag_matches(str(path), '"not-an-md5"')
+
+
+class TestUploadCheckpoint:
+    """Test the submission checkpoint file"""
+
+    def test_record_and_reload(self, tmp_path):
+        path = str(tmp_path / "ckpt" / "batch.jsonl")
+        checkpoint = UploadCheckpoint(path)
+        checkpoint.start("batch-1")
+        checkpoint.record("/docs/a.pdf", "batch-1/a.pdf", type="local")
+
+        # Simulate a line cut off by an interrupted run
+        with open(path, "a") as f:
+            f.write('{"source": "/docs/b.pdf", "s3_')
+
+        reloaded = UploadCheckpoint(path)
+        assert reloaded.batch_id == "batch-1"
+        assert reloaded.get("/docs/a.pdf")["s3_key"] == "batch-1/a.pdf"
+        assert reloaded.get("/docs/b.pdf") is None
+
+        reloaded.start("batch-1")
+        with pytest.raises(ValueError):
+            reloaded.start("batch-2")
+
+
+class TestDownloadState:
+    """Test the download state used to skip unchanged files"""
+
+    def test_recorded_etag_skips_hashing(self, tmp_path):
+        local = tmp_path / "result.json"
+        local.write_bytes(b"{}")
+        state = DownloadState(str(tmp_path / "state.jsonl"))
+        state.record("b/result.json", '"kms-etag"', 2, str(local))
+
+        assert DownloadState(state.path).is_current(
+            "b/result.json", '"kms-etag"', 2, str(local)
+        )
+        # Changed remotely, or a different size
+        assert not state.is_current("b/result.json", '"new-etag"', 2, str(local))
+        assert not state.is_current("b/result.json", '"kms-etag"', 3, str(local))
+        assert not state.is_current(
+            "b/missing.json", '"kms-etag"', 2, str(tmp_path / "x")
+        )
+
+    def test_unrecorded_file_is_compared_by_md5(self, tmp_path):
+        local = tmp_path / "result.json"
+        local.write_bytes(b"{}")
+        state = DownloadState(str(tmp_path / "state.jsonl"))
+        etag = f'"{hashlib.md5(b"{}").hexdigest()}"'
+
+        assert state.is_current("b/result.json", etag, 2, str(local))
+        assert state.entries["b/result.json"]["etag"] == etag
+
+
+class TestJsonlResultWriter:
+    """Test consolidation of JSON results"""
+
+    def test_one_file_per_document_class(self, tmp_path):
+        invoice = b'{"document_class": {"type": "Invoice"}, "x": 1}'
+        writer = JsonlResultWriter(str(tmp_path))
+        writer.add("b/a.pdf/sections/1/result.json", invoice, "a.pdf", "sections")
+        writer.add("b/c.pdf/sections/1/result.json", invoice, "c.pdf", "sections")
+        writer.add(
+            "b/c.pdf/sections/2/result.json",
+            b'{"document_class": {"type": "Bank/Statement"}}',
+            "c.pdf",
+            "sections",
+        )
+        writer.add("b/a.pdf/sections/2/result.json", b'{"x": 3}', "a.pdf", "sections")
+        writer.add("b/a.pdf/summary/summary.json", b'{"s": "t"}', "a.pdf", "summary")
+        writer.close()
+
+        invoices = [json.loads(line) for line in (tmp_path / "Invoice.jsonl").open()]
+        assert invoices == [
+            {
+                "document_id": "a.pdf",
+                "key": "b/a.pdf/sections/1/result.json",
+                "content": {"document_class": {"type": "Invoice"}, "x": 1},
+            },
+            {
+                "document_id": "c.pdf",
+                "key": "b/c.pdf/sections/1/result.json",
+                "content": {"document_class": {"type": "Invoice"}, "x": 1},
+            },
+        ]
+        assert (tmp_path / "Bank_Statement.jsonl").read_text().count("\n") == 1
+        # Results without a document class are grouped by result type
+        unclassified = tmp_path / "unclassified"
+        assert sorted(os.listdir(unclassified)) == ["sections.jsonl", "summary.jsonl"]
+        assert (unclassified / "sections.jsonl").read_text().count("\n") == 1
+
+    def test_document_class(self):
+        assert (
+            JsonlResultWriter.document_class({"document_class": {"type": "W2"}}) == "W2"
+        )
+        assert (
+            JsonlResultWriter.document_class({"document_class": "Letter"}) == "Letter"
+        )
+        assert (
+            JsonlResultWriter.document_class({"document_class": {"type": ""}}) is None
+        )
+        assert JsonlResultWriter.document_class([1, 2]) is None
@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Measure Pattern-1 BDA page splitting and page output writes, per-page rescans vs single-pass index.
+
+Builds a synthetic BDA standard output result.json of --pages pages with
+--elements-per-page elements per page (some spanning two pages) and
+--explainability-entries explainability entries, and runs the page step of
+the Pattern-1 processresults Lambda against moto with --s3-latency seconds
+per S3 request. "previous" replays the earlier loop: one
+extract_page_from_multipage_json call per page, each rescanning all pages and
+elements and re-adding confidence thresholds to explainability_info, with the
+page's S3 requests made one after another. "indexed" is process_bda_pages:
+split_multipage_json once, then page outputs written on --workers threads.
+Split is the CPU time spent building single page JSONs; both modes must
+write identical objects.
+
+Usage:
+    python benchmarks/bda_page_splitting.py --pages 100 1000
+"""
+
+import argparse
+import importlib.util
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import boto3
+from idp_common import s3
+from idp_common.models import Document, Status
+from moto import mock_aws
+
+INPUT_BUCKET = "bench-bda"
+OUTPUT_BUCKET = "bench-output"
+OBJECT_KEY = "bench.pdf"
+BDA_PREFIX = "bda/job-1/0"
+LAMBDA_DIR = (
+    Path(__file__).resolve().parents[3]
+    / "patterns"
+    / "pattern-1"
+    / "src"
+    / "processresults_function"
+)
+
+
+def load_lambda():
+    os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+    spec = importlib.util.spec_from_file_location(
+        "pattern1_processresults", LAMBDA_DIR / "index.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def previous_extract_page(index, raw_json, page_index, confidence_threshold=None):
+    """The earlier extract_page_from_multipage_json, without its per-page log line."""
+    single_page_json = {"metadata": raw_json.get("metadata", {})}
+    if "metadata" in single_page_json:
+        single_page_json["metadata"]["start_page_index"] = page_index
+        single_page_json["metadata"]["end_page_index"] = page_index
+        single_page_json["metadata"]["number_of_pages"] = 1
+    if "document" in raw_json:
+        single_page_json["document"] = raw_json["document"]
+    single_page_json["pages"] = []
+    if "pages" in raw_json:
+        for page in raw_json["pages"]:
+            if page.get("page_index") == page_index:
+                single_page_json["pages"].append(page)
+                break
+    single_page_json["elements"] = []
+    if "elements" in raw_json:
+        for element in raw_json["elements"]:
+            if page_index in element.get("page_indices", []):
+                element_copy = element.copy()
+                element_copy["page_indices"] = [page_index]
+                single_page_json["elements"].append(element_copy)
+    if "explainability_info" in raw_json:
+        explainability_info = raw_json["explainability_info"]
+        if confidence_threshold is not None:
+            single_page_json["explainability_info"] = (
+                index.add_confidence_thresholds_to_explainability(
+                    explainability_info, confidence_threshold
+                )
+            )
+        else:
+            single_page_json["explainability_info"] = explainability_info
+    return single_page_json
+
+
+def make_result(pages, elements_per_page, explainability_entries):
+    elements = []
+    for page in range(pages):
+        for i in range(elements_per_page):
+            # Every tenth element continues on the next page
+            spans = [page, page + 1] if i % 10 == 9 and page + 1 < pages else [page]
+            elements.append(
+                {
+                    "id": f"{page}-{i}",
+                    "type": "TEXT",
+                    "sub_type": "PARAGRAPH",
+                    "page_indices": spans,
+                    "representation": {"markdown": f"Paragraph {i} of page {page}."},
+                    "locations": [
+                        {
+                            "page_index": p,
+                            "bounding_box": {
+                                "left": 0.1,
+                                "top": 0.05 * (i % 20),
+                                "width": 0.8,
+                                "height": 0.04,
+                            },
+                        }
+                        for p in spans
+                    ],
+                }
+            )
+    return {
+        "metadata": {
+            "asset_id": "0",
+            "semantic_modality": "DOCUMENT",
+            "start_page_index": 0,
+            "end_page_index": pages - 1,
+            "number_of_pages": pages,
+        },
+        "document": {"representation": {"markdown": "..."}, "statistics": {}},
+        "pages": [
+            {
+                "page_index": page,
+                "representation": {"markdown": f"# Page {page}\n" + "Text. " * 200},
+                "statistics": {"element_count": elements_per_page},
+            }
+            for page in range(pages)
+        ],
+        "elements": elements,
+        "explainability_info": [
+            {
+                f"field_{i}": {"value": f"value {i}", "confidence": 0.9}
+                for i in range(explainability_entries)
+            }
+        ],
+    }
+
+
+def previous_pages(index, document, raw_json, confidence_threshold, timer):
+    """Page loop of the earlier process_bda_pages for one result.json."""
+    prefix = f"{OBJECT_KEY}/pages/"
+    for page in raw_json["pages"]:
+        page_index = page["page_index"]
+        start = time.perf_counter()
+        single_page_json = previous_extract_page(
+            index, raw_json, page_index, confidence_threshold
+        )
+        timer["split"] += time.perf_counter() - start
+        # The same requests as before, in the same order, one page at a time
+        document.pages[str(page_index)] = index.write_page_outputs(
+            str(page_index), single_page_json, OUTPUT_BUCKET, prefix, ""
+        )
+
+
+def run(index, mode, raw_json, args):
+    with mock_aws():
+        client = boto3.client("s3", region_name="us-east-1")
+        for bucket in (INPUT_BUCKET, OUTPUT_BUCKET):
+            client.create_bucket(Bucket=bucket)
+        client.put_object(
+            Bucket=INPUT_BUCKET,
+            Key=f"{BDA_PREFIX}/standard_output/0/result.json",
+            Body=json.dumps(raw_json),
+        )
+        requests = {"count": 0}
+        lock = threading.Lock()
+
+        def before_call(**kwargs):
+            with lock:
+                requests["count"] += 1
+            time.sleep(args.s3_latency)
+
+        client.meta.events.register("before-call.s3.*", before_call)
+        document = Document(
+            id=OBJECT_KEY,
+            input_key=OBJECT_KEY,
+            output_bucket=OUTPUT_BUCKET,
+            status=Status.POSTPROCESSING,
+        )
+        timer = {"split": 0.0}
+        split_multipage_json = index.split_multipage_json
+
+        def timed_split(*a, **kw):
+            start = time.perf_counter()
+            try:
+                return split_multipage_json(*a, **kw)
+            finally:
+                timer["split"] += time.perf_counter() - start
+
+        with (
+            patch.object(s3, "_s3_client", client),
+            patch.object(index, "s3_client", client),
+            patch.object(index, "split_multipage_json", timed_split),
+            patch.object(index, "PAGE_WRITE_WORKERS", args.workers),
+        ):
+            start = time.perf_counter()
+            if mode == "previous":
+                previous_pages(index, document, raw_json, 0.8, timer)
+            else:
+                index.process_bda_pages(
+                    INPUT_BUCKET, BDA_PREFIX, OUTPUT_BUCKET, OBJECT_KEY, document, 0.8
+                )
+            seconds = time.perf_counter() - start
+            request_count = requests["count"]
+            listed = client.get_paginator("list_objects_v2").paginate(
+                Bucket=OUTPUT_BUCKET
+            )
+            written = {
+                item["Key"]: client.get_object(Bucket=OUTPUT_BUCKET, Key=item["Key"])[
+                    "Body"
+                ].read()
+                for listing in listed
+                for item in listing.get("Contents", [])
+                if not item["Key"].endswith(".metadata.json")
+            }
+        return len(document.pages), request_count, timer["split"], seconds, written
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--pages", type=int, nargs="+", default=[100, 1000])
+    parser.add_argument("--elements-per-page", type=int, default=20)
+    parser.add_argument("--explainability-entries", type=int, default=50)
+    parser.add_argument("--s3-latency", type=float, default=0.01)
+    parser.add_argument("--workers", type=int, default=10)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    sys.path.insert(0, str(LAMBDA_DIR))
+    index = load_lambda()
+
+    print(
+        f"{'pages':>6} {'mode':>9} {'written':>8} {'S3 requests':>12} "
+        f"{'split (s)':>10} {'total (s)':>10} {'speedup':>8}"
+    )
+    for pages in args.pages:
+        raw_json = make_result(
+            pages, args.elements_per_page, args.explainability_entries
+        )
+        outputs = {}
+        baseline = None
+        for mode in ("previous", "indexed"):
+            written, requests, split, seconds, outputs[mode] = run(
+                index, mode, raw_json, args
+            )
+            baseline = baseline or seconds
+            print(
+                f"{pages:>6} {mode:>9} {written:>8} {requests:>12} "
+                f"{split:>10.2f} {seconds:>10.2f} {baseline / seconds:>8.1f}"
+            )
+        if outputs["previous"] != outputs["indexed"]:
+            raise SystemExit("Page outputs differ between modes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Compare per-page and batched page classification on request count and input tokens.
+
+Runs ClassificationService.classify_document on synthetic packets with Bedrock
+stubbed out. Input tokens are estimated as characters / 4 for text plus a fixed
+--image-tokens per page image. "uncached" counts the tokens billed at the full
+input rate: content before a cache point is counted once per document, assuming
+later requests read it from the prompt cache.
+
+Usage:
+    python benchmarks/classification_page_batching.py --pages 10 50 200 --batch-sizes 1 4 8
+"""
+
+import argparse
+import json
+import logging
+import threading
+from unittest.mock import patch
+
+from idp_common.classification.service import ClassificationService
+from idp_common.models import Document, Page, Status
+
+WORDS = (
+    "invoice total amount due remit payment account statement period balance".split()
+)
+
+
+def build_config(classes: int, batch_size: int):
+    return {
+        "classes": [
+            {
+                "name": f"type_{i}",
+                "description": f"Document type {i}: " + " ".join(WORDS * 3),
+                "examples": [
+                    {"classPrompt": f"Example of type_{i}: " + " ".join(WORDS * 8)}
+                ],
+            }
+            for i in range(classes)
+        ],
+        "classification": {
+            "model": "us.amazon.nova-pro-v1:0",
+            "system_prompt": "You are a document classification expert.",
+            "task_prompt": (
+                "<document-types>\n{CLASS_NAMES_AND_DESCRIPTIONS}\n</document-types>\n"
+                "{FEW_SHOT_EXAMPLES}\n<<CACHEPOINT>>\n"
+                "<document-ocr-data>\n{DOCUMENT_TEXT}\n</document-ocr-data>\n"
+                "{DOCUMENT_IMAGE}\n"
+                'Return JSON: {"class": "...", "document_boundary": "start|continue"}'
+            ),
+            "page_batch": {"size": batch_size},
+        },
+    }
+
+
+class StubBedrock:
+    """Answers classification requests and estimates their input tokens."""
+
+    def __init__(self, image_tokens: int):
+        self.image_tokens = image_tokens
+        self.requests = 0
+        self.tokens = 0
+        self.uncached_tokens = 0
+        self.prefix_seen = set()
+        self.lock = threading.Lock()
+
+    def invoke(self, content, config):
+        prefix, suffix, before_cachepoint = 0, 0, True
+        page_ids = []
+        for item in content:
+            text = item.get("text", "")
+            tokens = len(text) // 4 if "text" in item else self.image_tokens
+            if "<<CACHEPOINT>>" in text:
+                head, _, tail = text.partition("<<CACHEPOINT>>")
+                prefix += len(head) // 4
+                suffix += len(tail) // 4
+                before_cachepoint = False
+                continue
+            if before_cachepoint:
+                prefix += tokens
+            else:
+                suffix += tokens
+            if text.startswith('<page page_id="'):
+                page_ids.append(text.split('"')[1])
+        with self.lock:
+            self.requests += 1
+            self.tokens += prefix + suffix
+            key = (before_cachepoint, prefix)
+            cached = not before_cachepoint and key in self.prefix_seen
+            self.prefix_seen.add(key)
+            self.uncached_tokens += suffix + (0 if cached else prefix)
+        if page_ids:
+            body = {"pages": [{"page_id": p, "class": "type_0"} for p in page_ids]}
+        else:
+            body = {"class": "type_0"}
+        return {
+            "response": {
+                "output": {"message": {"content": [{"text": json.dumps(body)}]}}
+            },
+            "metering": {},
+        }
+
+
+def run(pages: int, batch_size: int, classes: int, image_tokens: int):
+    service = ClassificationService(
+        region="us-east-1", config=build_config(classes, batch_size)
+    )
+    stub = StubBedrock(image_tokens)
+    document = Document(id="bench", input_key="bench.pdf", status=Status.CLASSIFYING)
+    for i in range(1, pages + 1):
+        document.pages[str(i)] = Page(
+            page_id=str(i),
+            parsed_text_uri=f"s3://bench/{i}.json",
+            image_uri=f"s3://bench/{i}.jpg",
+        )
+    page_text = " ".join(WORDS * 40)
+    with (
+        patch.object(service, "_invoke_bedrock_model", side_effect=stub.invoke),
+        patch("idp_common.s3.get_text_content", return_value=page_text),
+        patch("idp_common.image.prepare_image", return_value=b"jpeg"),
+        patch(
+            "idp_common.image.prepare_bedrock_image_attachment",
+            return_value={"image": {"format": "jpeg", "source": {"bytes": b"jpeg"}}},
+        ),
+    ):
+        result = service.classify_document(document)
+    assert not result.errors, result.errors
+    return stub
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--pages", type=int, nargs="+", default=[10, 50, 200])
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 4, 8])
+    parser.add_argument("--classes", type=int, default=12)
+    parser.add_argument("--image-tokens", type=int, default=1600)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    print(
+        f"{'pages':>6} {'batch':>6} {'requests':>9} {'input tokens':>13} "
+        f"{'uncached':>10} {'vs per-page':>12}"
+    )
+    for pages in args.pages:
+        baseline = None
+        for batch_size in args.batch_sizes:
+            stub = run(pages, batch_size, args.classes, args.image_tokens)
+            baseline = baseline or stub.tokens
+            print(
+                f"{pages:>6} {batch_size:>6} {stub.requests:>9} {stub.tokens:>13} "
+                f"{stub.uncached_tokens:>10} {baseline / stub.tokens:>11.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
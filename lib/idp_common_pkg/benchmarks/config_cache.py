@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Measure DynamoDB reads and latency of get_config() over repeated invocations.
+
+Simulates a warm Lambda container calling idp_common.config.get_config() once per
+document against a moto configuration table, with and without the module-level
+cache (CONFIGURATION_CACHE_TTL_SECONDS=0 is the previous behavior). Invocations
+are spread over --duration simulated seconds so TTL expiries and version checks
+occur; --updates configuration changes are made during the run. Read units
+assume eventually consistent reads (0.5 RCU per 4 KB).
+
+Usage:
+    python benchmarks/config_cache.py --invocations 1000 --duration 600
+"""
+
+import argparse
+import logging
+import math
+import os
+import time
+from unittest.mock import patch
+
+import boto3
+from idp_common import config
+from idp_common.config import clear_config_cache, get_config
+from idp_common.config.configuration_manager import ConfigurationManager
+from moto import mock_aws
+
+TABLE = "bench-config"
+
+
+def default_config():
+    """A configuration of realistic size (prompts dominate)."""
+    prompt = "Extract the following attributes from the document. " * 200
+    return {
+        section: {"model": "us.amazon.nova-pro-v1:0", "task_prompt": prompt}
+        for section in ("ocr", "classification", "extraction", "assessment")
+    } | {
+        "classes": [
+            {"name": f"class_{i}", "description": "A document type. " * 20}
+            for i in range(20)
+        ]
+    }
+
+
+def run(ttl: str, invocations: int, duration: float, updates: int):
+    os.environ["CONFIGURATION_CACHE_TTL_SECONDS"] = ttl
+    os.environ["CONFIGURATION_TABLE_NAME"] = TABLE
+    os.environ["AWS_REGION"] = "us-east-1"
+    clear_config_cache()
+    with mock_aws():
+        boto3.setup_default_session(region_name="us-east-1")
+        boto3.resource("dynamodb").create_table(
+            TableName=TABLE,
+            KeySchema=[{"AttributeName": "Configuration", "KeyType": "HASH"}],
+            AttributeDefinitions=[
+                {"AttributeName": "Configuration", "AttributeType": "S"}
+            ],
+            BillingMode="PAY_PER_REQUEST",
+        )
+        manager = ConfigurationManager(TABLE)
+        manager.update_configuration("Default", default_config())
+        manager.update_configuration("Custom", {"extraction": {"temperature": "0"}})
+
+        reads = {"count": 0, "rcu": 0.0}
+
+        def count_read(http_response, parsed, **kwargs):
+            size = len(http_response.content)
+            reads["count"] += 1
+            reads["rcu"] += 0.5 * max(1, math.ceil(size / 4096))
+
+        boto3.DEFAULT_SESSION.events.register("after-call.dynamodb.GetItem", count_read)
+
+        update_at = {int(invocations * (i + 1) / (updates + 1)) for i in range(updates)}
+        latencies = []
+        for i in range(invocations):
+            if i in update_at:
+                manager.update_configuration(
+                    "Custom", {"extraction": {"temperature": str(i)}}
+                )
+            now = i * duration / invocations
+            with patch.object(config.time, "monotonic", return_value=now):
+                start = time.perf_counter()
+                get_config()
+                latencies.append(time.perf_counter() - start)
+    latencies.sort()
+    return reads, latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--invocations", type=int, default=1000)
+    parser.add_argument(
+        "--duration", type=float, default=600, help="Simulated seconds for the run"
+    )
+    parser.add_argument("--ttl", default="60")
+    parser.add_argument("--updates", type=int, default=2)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    print(
+        f"{'mode':<10} {'GetItem calls':>14} {'read units':>11} "
+        f"{'p50 (ms)':>9} {'p99 (ms)':>9}"
+    )
+    for label, ttl in (("uncached", "0"), (f"ttl={args.ttl}s", args.ttl)):
+        reads, latencies = run(ttl, args.invocations, args.duration, args.updates)
+        p50 = latencies[len(latencies) // 2] * 1000
+        p99 = latencies[int(len(latencies) * 0.99)] * 1000
+        print(
+            f"{label:<10} {reads['count']:>14} {reads['rcu']:>11.1f} "
+            f"{p50:>9.3f} {p99:>9.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
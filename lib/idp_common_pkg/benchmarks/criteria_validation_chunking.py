@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Measure criteria validation chunking quality and S3 reads, character slicing vs chunk manifests.
+
+Builds an underwriting packet of --files user history files of --pages pages,
+mixing narrative sentences with lab-value and billing-code lines, and
+validates it against --types criteria types of --questions questions with
+bedrock.invoke_model stubbed out and S3 served by moto.
+
+Chunk quality compares the previous chunker (len(text) // 4 tokens, slices of
+max_chunk_size * 4 characters) with chunking.chunk_text at the same budget:
+"over budget" is the share of chunks whose chunking.estimate_tokens count
+exceeds max_chunk_size (the estimate, not a model tokenizer), "mid-sentence"
+the share of chunks that end inside a sentence.
+
+S3 reads compare two validation runs of the same packet. "previous" replays
+the earlier flow (each file read and re-chunked on every run, each criteria
+file read per chunk and criteria type); "manifest" is
+CriteriaValidationService.validate_request with chunk manifests. Chunking is
+the time spent computing chunks in the run.
+
+Usage:
+    python benchmarks/criteria_validation_chunking.py --files 50 200
+"""
+
+import argparse
+import json
+import logging
+import random
+import time
+from unittest.mock import patch
+
+import boto3
+from idp_common import bedrock, s3
+from idp_common.criteria_validation import CriteriaValidationService, chunking
+from moto import mock_aws
+
+BUCKET = "bench-criteria"
+MODEL_ID = "us.anthropic.claude-3-5-sonnet-20240620-v1:0"
+TOKEN_SIZE = 4
+
+NARRATIVE = [
+    "The patient reports intermittent chest pain over the last three months.",
+    "Prior conservative therapy with physical therapy was completed without relief.",
+    "The attending physician recommends an MRI of the lumbar spine.",
+    "No contraindications to the requested procedure were documented.",
+]
+
+
+def stub_model(model_id, system_prompt, content, *args):
+    text = json.dumps({"Recommendation": "Pass", "Reasoning": "Documented"})
+    return {
+        "response": {"output": {"message": {"content": [{"text": text}]}}},
+        "metering": {},
+    }
+
+
+def make_history(rng: random.Random, pages: int) -> str:
+    parts = []
+    for page in range(1, pages + 1):
+        parts.append(f"<page-number>{page}</page-number>\n")
+        for _ in range(12):
+            parts.append(rng.choice(NARRATIVE) + " ")
+            parts.append(
+                f"\nLab {rng.randint(1000, 9999)}-{rng.randint(10, 99)}: "
+                f"HbA1c {rng.uniform(4, 12):.1f}%, LDL {rng.randint(60, 220)} mg/dL, "
+                f"ICD-10 E11.{rng.randint(10, 99)}, CPT {rng.randint(70000, 79999)}, "
+                f"2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}\n"
+            )
+    return "".join(parts)
+
+
+def previous_chunks(text, max_chunk_size, overlap_percentage):
+    """The earlier character-slicing chunker (with its end-of-text fix)."""
+    if len(text) // TOKEN_SIZE <= max_chunk_size:
+        return [text]
+    chunk_chars = max_chunk_size * TOKEN_SIZE
+    overlap_chars = int(chunk_chars * overlap_percentage / 100)
+    chunks, start = [], 0
+    while start < len(text):
+        end = min(start + chunk_chars, len(text))
+        chunks.append(text[start:end])
+        if end == len(text):
+            break
+        start = end - overlap_chars
+    return chunks
+
+
+def chunk_quality(texts, max_chunk_size):
+    rows = []
+    for mode in ("previous", "token-aware"):
+        over = mid = total = 0
+        start = time.perf_counter()
+        for text in texts:
+            if mode == "previous":
+                chunks = previous_chunks(text, max_chunk_size, 10)
+            else:
+                chunks = [
+                    text[c.start : c.end]
+                    for c in chunking.chunk_text(text, max_chunk_size, 10)
+                ]
+            for chunk in chunks:
+                total += 1
+                over += chunking.estimate_tokens(chunk) > max_chunk_size
+                mid += not chunk.rstrip(" ").endswith((".", "\n", "%"))
+        seconds = time.perf_counter() - start
+        rows.append((mode, total, over / total, mid / total, seconds))
+    return rows
+
+
+def seed_bucket(client, texts, types, questions):
+    client.create_bucket(Bucket=BUCKET)
+    for i in range(types):
+        client.put_object(
+            Bucket=BUCKET,
+            Key=f"type_{i}.json",
+            Body=json.dumps(
+                {"criteria": [f"Type {i} question {q}" for q in range(questions)]}
+            ),
+        )
+    uris = []
+    for i, text in enumerate(texts):
+        key = f"prior-auth-bench/extracted_text/file_{i}.txt"
+        client.put_object(Bucket=BUCKET, Key=key, Body=text)
+        uris.append(f"s3://{BUCKET}/{key}")
+    return uris
+
+
+def build_config(types):
+    return {
+        "model_id": MODEL_ID,
+        "system_prompt": "You evaluate prior authorization criteria.",
+        "task_prompt": "Question: {question}\nCriteria type: {criteria_type}\n"
+        "History: {content}\nSource: {source_filepath}\n"
+        "Options: {recommendation_options}",
+        "recommendation_options": "Pass/Fail/Information Not Found",
+        "request_bucket": BUCKET,
+        "request_history_prefix": "prior-auth",
+        "criteria_bucket": BUCKET,
+        "output_bucket": BUCKET,
+        "criteria_types": [f"type_{i}" for i in range(types)],
+    }
+
+
+def previous_run(uris, config, max_chunk_size, timer):
+    """Reads and chunking of the earlier validate_request_async, without model calls."""
+    for uri in uris:
+        content = s3.get_text_content(uri)
+        start = time.perf_counter()
+        chunks = previous_chunks(content, max_chunk_size, 10)
+        timer["chunking"] += time.perf_counter() - start
+        for _ in chunks:
+            for criteria_type in config["criteria_types"]:
+                s3.get_json_content(f"s3://{BUCKET}/{criteria_type}.json")
+
+
+def s3_reads(texts, args):
+    rows = []
+    for mode in ("previous", "manifest"):
+        with mock_aws():
+            client = boto3.client("s3", region_name="us-east-1")
+            uris = seed_bucket(client, texts, args.types, args.questions)
+            config = build_config(args.types)
+            gets = {"count": 0}
+            client.meta.events.register(
+                "before-call.s3.GetObject",
+                lambda **kwargs: gets.__setitem__("count", gets["count"] + 1),
+            )
+            service = CriteriaValidationService(
+                config={"criteria_validation": {"max_chunk_size": args.max_chunk_size}}
+            )
+            original_chunk_text = chunking.chunk_text
+            timer = {"chunking": 0.0}
+
+            def timed_chunk_text(*a, **kw):
+                start = time.perf_counter()
+                try:
+                    return original_chunk_text(*a, **kw)
+                finally:
+                    timer["chunking"] += time.perf_counter() - start
+
+            with (
+                patch.object(s3, "_s3_client", client),
+                patch.object(bedrock, "invoke_model", stub_model),
+                patch.object(chunking, "chunk_text", timed_chunk_text),
+                patch.object(service, "_list_text_files", return_value=uris),
+            ):
+                for run in ("first", "re-run"):
+                    gets["count"] = 0
+                    timer["chunking"] = 0.0
+                    if mode == "previous":
+                        previous_run(uris, config, args.max_chunk_size, timer)
+                    else:
+                        service.validate_request("bench", config)
+                    rows.append((mode, run, gets["count"], timer["chunking"]))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--files", type=int, nargs="+", default=[50, 200])
+    parser.add_argument("--pages", type=int, default=8)
+    parser.add_argument("--types", type=int, default=4)
+    parser.add_argument("--questions", type=int, default=5)
+    parser.add_argument("--max-chunk-size", type=int, default=2000)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    rng = random.Random(7)
+
+    for files in args.files:
+        texts = [make_history(rng, args.pages) for _ in range(files)]
+        print(
+            f"\n{files} files of {args.pages} pages, max_chunk_size {args.max_chunk_size}"
+        )
+        print(
+            f"{'chunker':>12} {'chunks':>7} {'over budget':>12} "
+            f"{'mid-sentence':>13} {'time (s)':>9}"
+        )
+        for mode, total, over, mid, seconds in chunk_quality(
+            texts, args.max_chunk_size
+        ):
+            print(f"{mode:>12} {total:>7} {over:>12.1%} {mid:>13.1%} {seconds:>9.3f}")
+        print(f"{'flow':>12} {'run':>7} {'S3 GETs':>8} {'chunking (s)':>13}")
+        for mode, run, count, seconds in s3_reads(texts, args):
+            print(f"{mode:>12} {run:>7} {count:>8} {seconds:>13.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Measure criteria validation throughput, default executor vs async client lanes.
+
+Runs a request of --files user history files (two chunks each) against
+--types criteria types of --questions questions each, with bedrock.invoke_model
+replaced by a stub that sleeps --latency seconds plus up to --jitter seconds
+and S3 served by moto with --s3-latency seconds per request. "previous"
+replays the earlier scheduling: files and chunks one after another, one
+service-wide semaphore, model calls in the event loop's default executor
+(min(32, --vcpus + 4) threads, as on a Lambda function with that many vCPUs)
+and S3 reads on the event loop. "async-client" is
+CriteriaValidationService.validate_request with per-model lanes. Peak is the
+number of model calls the stub saw in flight at once.
+
+Usage:
+    python benchmarks/criteria_validation_concurrency.py --semaphore 5 20 50
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import boto3
+from idp_common import bedrock, s3
+from idp_common.criteria_validation import CriteriaValidationService
+from moto import mock_aws
+
+BUCKET = "bench-criteria"
+MODEL_ID = "us.anthropic.claude-3-5-sonnet-20240620-v1:0"
+
+
+class StubModel:
+    """bedrock.invoke_model stand-in that sleeps and counts calls in flight."""
+
+    def __init__(self, latency: float, jitter: float):
+        self.latency = latency
+        self.jitter = jitter
+        self.rng = random.Random(7)
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.peak = 0
+        self.calls = 0
+
+    def __call__(self, model_id, system_prompt, content, *args):
+        with self.lock:
+            self.calls += 1
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+            delay = self.latency + self.rng.uniform(0, self.jitter)
+        time.sleep(delay)
+        with self.lock:
+            self.in_flight -= 1
+        text = json.dumps({"Recommendation": "Pass", "Reasoning": "Documented"})
+        return {
+            "response": {"output": {"message": {"content": [{"text": text}]}}},
+            "metering": {},
+        }
+
+
+def build_config(types: int) -> dict:
+    return {
+        "model_id": MODEL_ID,
+        "system_prompt": "You evaluate prior authorization criteria.",
+        "task_prompt": "Question: {question}\nCriteria type: {criteria_type}\n"
+        "History: {content}\nSource: {source_filepath}\n"
+        "Options: {recommendation_options}",
+        "recommendation_options": "Pass/Fail/Information Not Found",
+        "request_bucket": BUCKET,
+        "request_history_prefix": "prior-auth",
+        "criteria_bucket": BUCKET,
+        "output_bucket": BUCKET,
+        "criteria_types": [f"type_{i}" for i in range(types)],
+    }
+
+
+def seed_bucket(client, files: int, types: int, questions: int) -> list:
+    client.create_bucket(Bucket=BUCKET)
+    for i in range(types):
+        client.put_object(
+            Bucket=BUCKET,
+            Key=f"type_{i}.json",
+            Body=json.dumps(
+                {"criteria": [f"Type {i} question {q}" for q in range(questions)]}
+            ),
+        )
+    uris = []
+    for i in range(files):
+        key = f"prior-auth-bench/extracted_text/file_{i}.txt"
+        # 6,000 characters: two chunks at max_chunk_size 1,000 tokens
+        client.put_object(Bucket=BUCKET, Key=key, Body="Patient history. " * 353)
+        uris.append(f"s3://{BUCKET}/{key}")
+    return uris
+
+
+async def previous_validate(service, config, txt_files, semaphore, vcpus):
+    """The earlier validate_request_async control flow, without result parsing."""
+    loop = asyncio.get_running_loop()
+    loop.set_default_executor(ThreadPoolExecutor(max_workers=min(32, vcpus + 4)))
+    sem = asyncio.Semaphore(semaphore)
+
+    async def question(text, chunk, txt_file, criteria_type):
+        async with sem:
+            prompt = service._prepare_prompt(
+                config["task_prompt"],
+                {
+                    "content": chunk,
+                    "question": text,
+                    "source_filepath": txt_file,
+                    "criteria_type": criteria_type,
+                    "recommendation_options": config["recommendation_options"],
+                },
+            )
+            response = await loop.run_in_executor(
+                None,
+                bedrock.invoke_model,
+                config["model_id"],
+                config["system_prompt"],
+                [{"text": prompt}],
+                0.0,
+                5,
+                0.1,
+                None,
+                None,
+                "CriteriaValidation",
+            )
+            return bedrock.extract_text_from_response(response)
+
+    async def criteria_type_questions(criteria_type, chunk, txt_file):
+        criteria = s3.get_json_content(f"s3://{BUCKET}/{criteria_type}.json")
+        return await asyncio.gather(
+            *[question(q, chunk, txt_file, criteria_type) for q in criteria["criteria"]]
+        )
+
+    for txt_file in txt_files:
+        content = s3.get_text_content(txt_file)
+        for chunk in service._chunk_text_with_overlap(content, 1000, 4, 10):
+            await asyncio.gather(
+                *[
+                    criteria_type_questions(criteria_type, chunk, txt_file)
+                    for criteria_type in config["criteria_types"]
+                ]
+            )
+
+
+def run(mode, args, semaphore):
+    with mock_aws():
+        client = boto3.client("s3", region_name="us-east-1")
+        txt_files = seed_bucket(client, args.files, args.types, args.questions)
+
+        def before_call(**kwargs):
+            time.sleep(args.s3_latency)
+
+        client.meta.events.register("before-call.s3.*", before_call)
+        stub = StubModel(args.latency, args.jitter)
+        config = build_config(args.types)
+        service = CriteriaValidationService(
+            config={
+                "criteria_validation": {
+                    "semaphore": semaphore,
+                    "max_chunk_size": 1000,
+                }
+            }
+        )
+        with (
+            patch.object(s3, "_s3_client", client),
+            patch.object(bedrock, "invoke_model", stub),
+            patch.object(service, "_list_text_files", return_value=txt_files),
+        ):
+            start = time.perf_counter()
+            if mode == "previous":
+                asyncio.run(
+                    previous_validate(service, config, txt_files, semaphore, args.vcpus)
+                )
+            else:
+                service.validate_request("bench", config)
+            seconds = time.perf_counter() - start
+        return stub.calls, stub.peak, seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--semaphore", type=int, nargs="+", default=[5, 20, 50])
+    parser.add_argument("--files", type=int, default=4)
+    parser.add_argument("--types", type=int, default=4)
+    parser.add_argument("--questions", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.1)
+    parser.add_argument("--jitter", type=float, default=0.1)
+    parser.add_argument("--s3-latency", type=float, default=0.03)
+    parser.add_argument("--vcpus", type=int, default=2)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+
+    print(
+        f"{'semaphore':>9} {'mode':>12} {'calls':>6} {'peak':>5} "
+        f"{'wall (s)':>9} {'calls/s':>8} {'speedup':>8}"
+    )
+    for semaphore in args.semaphore:
+        baseline = None
+        for mode in ("previous", "async-client"):
+            calls, peak, seconds = run(mode, args, semaphore)
+            baseline = baseline or seconds
+            print(
+                f"{semaphore:>9} {mode:>12} {calls:>6} {peak:>5} {seconds:>9.2f} "
+                f"{calls / seconds:>8.1f} {baseline / seconds:>8.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Measure memory and (de)serialization time of Document for large page counts.
+
+Each mode runs in a fresh subprocess: a document with --pages pages (OCR and
+classification fields set, one section per 10 pages) is parsed with
+Document.from_json() and serialized with to_json(). Load time, RSS growth (Linux)
+and peak/retained allocations (tracemalloc) cover parsing and reading pages.
+"legacy" reproduces the previous model (plain dataclasses, every page and
+section built by from_dict); "eager" reads every page and section after
+loading; "lazy" reads only one section and its pages, as an extraction or
+assessment step does.
+
+Usage:
+    python benchmarks/document_model.py --pages 1000 10000
+"""
+
+import argparse
+import gc
+import json
+import os
+import subprocess
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+MODES = ("legacy", "eager", "lazy")
+
+
+@dataclass
+class LegacyPage:
+    page_id: str
+    image_uri: Optional[str] = None
+    raw_text_uri: Optional[str] = None
+    parsed_text_uri: Optional[str] = None
+    text_confidence_uri: Optional[str] = None
+    classification: Optional[str] = None
+    confidence: float = 0.0
+    tables: List[Dict[str, Any]] = field(default_factory=list)
+    forms: Dict[str, str] = field(default_factory=dict)
+
+
+@dataclass
+class LegacySection:
+    section_id: str
+    classification: str
+    confidence: float = 1.0
+    page_ids: List[str] = field(default_factory=list)
+    extraction_result_uri: Optional[str] = None
+    attributes: Optional[Dict[str, Any]] = None
+    confidence_threshold_alerts: List[Dict[str, Any]] = field(default_factory=list)
+
+
+def legacy_from_json(document_json: str):
+    """The previous Document.from_dict page and section handling."""
+    from idp_common.models import Document
+
+    data = json.loads(document_json)
+    pages = data.pop("pages")
+    sections = data.pop("sections")
+    document = Document.from_dict(data)
+    document.sections = [
+        LegacySection(
+            section_id=section.get("section_id"),
+            classification=section.get("classification"),
+            confidence=section.get("confidence", 1.0),
+            page_ids=section.get("page_ids", []),
+            extraction_result_uri=section.get("extraction_result_uri"),
+            attributes=section.get("attributes"),
+            confidence_threshold_alerts=section.get("confidence_threshold_alerts", []),
+        )
+        for section in sections
+    ]
+    document.pages = {
+        page_id: LegacyPage(
+            page_id=page_id,
+            image_uri=page.get("image_uri"),
+            raw_text_uri=page.get("raw_text_uri"),
+            parsed_text_uri=page.get("parsed_text_uri"),
+            text_confidence_uri=page.get("text_confidence_uri"),
+            classification=page.get("classification"),
+            confidence=page.get("confidence", 0.0),
+            tables=page.get("tables", []),
+            forms=page.get("forms", {}),
+        )
+        for page_id, page in pages.items()
+    }
+    return document
+
+
+def legacy_to_json(document) -> str:
+    """The previous Document.to_dict page handling (sections are a plain list)."""
+    pages, document.pages = document.pages, {}
+    data = document.to_dict()
+    document.pages = pages
+    data["pages"] = {
+        page_id: {
+            "page_id": page.page_id,
+            "image_uri": page.image_uri,
+            "raw_text_uri": page.raw_text_uri,
+            "parsed_text_uri": page.parsed_text_uri,
+            "text_confidence_uri": page.text_confidence_uri,
+            "classification": page.classification,
+            "confidence": page.confidence,
+            "tables": page.tables,
+            "forms": page.forms,
+        }
+        for page_id, page in pages.items()
+    }
+    return json.dumps(data, default=str)
+
+
+def document_json(pages: int) -> str:
+    prefix = "s3://working-bucket/archive-scan-2024-000123.pdf/pages"
+    return json.dumps(
+        {
+            "id": "archive-scan-2024-000123.pdf",
+            "input_key": "archive-scan-2024-000123.pdf",
+            "status": "EXTRACTING",
+            "num_pages": pages,
+            "pages": {
+                str(i): {
+                    "page_id": str(i),
+                    "image_uri": f"{prefix}/{i}/image.jpg",
+                    "raw_text_uri": f"{prefix}/{i}/rawText.json",
+                    "parsed_text_uri": f"{prefix}/{i}/result.json",
+                    "text_confidence_uri": f"{prefix}/{i}/textConfidence.json",
+                    "classification": "invoice",
+                    "confidence": 0.97,
+                    "tables": [],
+                    "forms": {},
+                }
+                for i in range(1, pages + 1)
+            },
+            "sections": [
+                {
+                    "section_id": str(n + 1),
+                    "classification": "invoice",
+                    "confidence": 1.0,
+                    "page_ids": [
+                        str(i) for i in range(start, min(start + 10, pages + 1))
+                    ],
+                }
+                for n, start in enumerate(range(1, pages + 1, 10))
+            ],
+            "metering": {},
+        }
+    )
+
+
+def current_rss() -> int:
+    """Resident set size in bytes (0 where /proc is unavailable)."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        return 0
+
+
+def load(mode: str, payload: str):
+    """Parse the document and read the pages and sections the mode reads."""
+    from idp_common.models import Document
+
+    document = (
+        legacy_from_json(payload) if mode == "legacy" else Document.from_json(payload)
+    )
+    if mode != "lazy":
+        for other in document.sections:
+            other.confidence = 1.0
+    section = document.sections[len(document.sections) // 2]
+    page_ids = section.page_ids if mode == "lazy" else list(document.pages)
+    for page_id in page_ids:
+        document.pages[page_id].confidence = 0.99
+    return document
+
+
+def measure(mode: str, pages: int) -> Dict[str, float]:
+    payload = document_json(pages)
+    gc.collect()
+
+    rss_before = current_rss()
+    start = time.perf_counter()
+    document = load(mode, payload)
+    load_seconds = time.perf_counter() - start
+    rss_growth = current_rss() - rss_before
+
+    start = time.perf_counter()
+    output = legacy_to_json(document) if mode == "legacy" else document.to_json()
+    dump_seconds = time.perf_counter() - start
+    assert json.loads(output)["num_pages"] == pages
+    del document, output
+    gc.collect()
+
+    tracemalloc.start()
+    document = load(mode, payload)
+    gc.collect()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(document.pages) == pages
+
+    return {
+        "load_ms": load_seconds * 1000,
+        "dump_ms": dump_seconds * 1000,
+        "rss_growth_mb": rss_growth / 1e6,
+        "peak_mb": peak / 1e6,
+        "retained_mb": retained / 1e6,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--pages", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument(
+        "--child", nargs=2, metavar=("MODE", "PAGES"), help=argparse.SUPPRESS
+    )
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(measure(args.child[0], int(args.child[1]))))
+        return
+
+    print(
+        f"{'pages':>6} {'mode':>7} {'load (ms)':>10} {'to_json (ms)':>13} "
+        f"{'RSS growth (MB)':>16} {'peak (MB)':>10} {'retained (MB)':>14}"
+    )
+    for pages in args.pages:
+        for mode in MODES:
+            output = subprocess.run(
+                [sys.executable, __file__, "--child", mode, str(pages)],
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout
+            result = json.loads(output)
+            print(
+                f"{pages:>6} {mode:>7} {result['load_ms']:>10.1f} {result['dump_ms']:>13.1f} "
+                f"{result['rss_growth_mb']:>16.1f} {result['peak_mb']:>10.1f} "
+                f"{result['retained_mb']:>14.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
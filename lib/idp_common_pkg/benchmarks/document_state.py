@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Compare JSON and delta Document state: bytes written and load/save time per step.
+
+Replays the Step Functions hops of a pattern-2 workflow (OCR, classification,
+extraction and assessment of every section, summarization) against moto S3. Each
+hop loads the previous state, changes what that step changes, and saves it with
+Document.compress(). Extraction and assessment hops load only their section when
+--section-loads is given. "json" is the previous behavior (full JSON per hop).
+
+Usage:
+    python benchmarks/document_state.py --pages 10 500 5000
+"""
+
+import argparse
+import logging
+import os
+import time
+
+import boto3
+from idp_common.models import Document, Page, Section, Status
+from moto import mock_aws
+
+BUCKET = "bench-working"
+SECTION_PAGES = 10
+
+
+def ocr_document(pages: int) -> Document:
+    document = Document(
+        id="bench",
+        input_bucket="input",
+        input_key="bench.pdf",
+        output_bucket="output",
+        num_pages=pages,
+        status=Status.OCR,
+    )
+    for i in range(1, pages + 1):
+        document.pages[str(i)] = Page(
+            page_id=str(i),
+            image_uri=f"s3://{BUCKET}/bench/pages/{i}/image.jpg",
+            raw_text_uri=f"s3://{BUCKET}/bench/pages/{i}/rawText.json",
+            parsed_text_uri=f"s3://{BUCKET}/bench/pages/{i}/result.json",
+            text_confidence_uri=f"s3://{BUCKET}/bench/pages/{i}/textConfidence.json",
+        )
+    document.metering = {"OCR/textract/analyze_document": {"pages": pages}}
+    return document
+
+
+def classify(document: Document) -> None:
+    document.status = Status.CLASSIFYING
+    for page in document.pages.values():
+        page.classification = "invoice"
+        page.confidence = 0.97
+    page_ids = list(document.pages)
+    document.sections = [
+        Section(
+            section_id=str(n + 1),
+            classification="invoice",
+            page_ids=page_ids[start : start + SECTION_PAGES],
+        )
+        for n, start in enumerate(range(0, len(page_ids), SECTION_PAGES))
+    ]
+    document.metering["Classification/bedrock"] = {"inputTokens": 1000 * len(page_ids)}
+
+
+def process_section(document: Document, section_id: str, step: str) -> None:
+    for section in document.sections:
+        if section.section_id == section_id:
+            section.extraction_result_uri = (
+                f"s3://output/bench/sections/{section_id}/result.json"
+            )
+            section.attributes = {"step": step, "fields": 12}
+    document.metering = {f"{step}/bedrock": {"inputTokens": 4000}}
+
+
+def run(pages: int, state_format: str, section_loads: bool):
+    os.environ["DOCUMENT_STATE_FORMAT"] = state_format
+    written = 0
+    load_seconds = 0.0
+    save_seconds = 0.0
+    hops = 0
+
+    def save(document, step):
+        nonlocal written, save_seconds, hops
+        start = time.perf_counter()
+        wrapper = document.compress(BUCKET, step)
+        save_seconds += time.perf_counter() - start
+        key = wrapper["s3_uri"].split(f"{BUCKET}/", 1)[1]
+        written += (
+            wrapper.get("bytes_written")
+            or s3.head_object(Bucket=BUCKET, Key=key)["ContentLength"]
+        )
+        hops += 1
+        return wrapper
+
+    def load(wrapper, section_id=None):
+        nonlocal load_seconds
+        start = time.perf_counter()
+        document = Document.load_document(
+            wrapper, BUCKET, section_id=section_id if section_loads else None
+        )
+        load_seconds += time.perf_counter() - start
+        return document
+
+    with mock_aws():
+        s3 = boto3.client("s3", region_name="us-east-1")
+        s3.create_bucket(Bucket=BUCKET)
+
+        wrapper = save(ocr_document(pages), "ocr")
+        document = load(wrapper)
+        classify(document)
+        wrapper = save(document, "classification")
+
+        for step in ("extraction", "assessment"):
+            for section_id in list(wrapper["sections"]):
+                document = load(wrapper, section_id)
+                process_section(document, section_id, step)
+                save(document, f"{step}_{section_id}")
+
+        document = load(wrapper)
+        document.status = Status.COMPLETED
+        document.metering["Summarization/bedrock"] = {"inputTokens": 2000}
+        save(document, "summarization")
+
+    return written, load_seconds, save_seconds, hops
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--pages", type=int, nargs="+", default=[10, 500, 5000])
+    parser.add_argument("--section-loads", action="store_true")
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+    print(
+        f"{'pages':>6} {'format':>7} {'hops':>5} {'MB written':>11} "
+        f"{'KB/hop':>8} {'load (s)':>9} {'save (s)':>9}"
+    )
+    for pages in args.pages:
+        for state_format in ("json", "delta"):
+            written, load_s, save_s, hops = run(pages, state_format, args.section_loads)
+            print(
+                f"{pages:>6} {state_format:>7} {hops:>5} {written / 1e6:>11.2f} "
+                f"{written / hops / 1024:>8.1f} {load_s:>9.2f} {save_s:>9.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
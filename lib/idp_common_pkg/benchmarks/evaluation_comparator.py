@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Micro-benchmarks for the evaluation comparator engine.
+
+Compares the previous full-matrix Levenshtein and nested-loop Hungarian matching
+(reproduced here as the legacy baseline) with idp_common.evaluation.comparator,
+for fuzz_score on short and long strings and compare_hungarian on list
+attributes of increasing size. The Hungarian solver used depends on whether
+SciPy is installed; --no-scipy forces the Munkres fallback.
+
+Usage:
+    python benchmarks/evaluation_comparator.py
+    python benchmarks/evaluation_comparator.py --sizes 10 50 200 --no-scipy
+"""
+
+import argparse
+import random
+import timeit
+from unittest.mock import patch
+
+from idp_common.evaluation import comparator
+from idp_common.evaluation.comparator import (
+    ExactComparator,
+    FuzzyComparator,
+    NumericComparator,
+    compare_hungarian,
+    fuzz_score,
+    strip_punctuation_space,
+)
+from munkres import Munkres, make_cost_matrix
+
+
+def legacy_fuzz_score(s1: str, s2: str) -> float:
+    """Previous fuzz_score: full (len1 + 1) x (len2 + 1) list-of-lists DP."""
+    s1 = strip_punctuation_space(s1)
+    s2 = strip_punctuation_space(s2)
+    if s1 == s2:
+        return 1.0
+    if not s1 or not s2:
+        return 0.0
+    len_s1, len_s2 = len(s1), len(s2)
+    d = [[0 for _ in range(len_s2 + 1)] for _ in range(len_s1 + 1)]
+    for i in range(len_s1 + 1):
+        d[i][0] = i
+    for j in range(len_s2 + 1):
+        d[0][j] = j
+    for i in range(1, len_s1 + 1):
+        for j in range(1, len_s2 + 1):
+            cost = 0 if s1[i - 1] == s2[j - 1] else 1
+            d[i][j] = min(d[i - 1][j] + 1, d[i][j - 1] + 1, d[i - 1][j - 1] + cost)
+    return 1.0 - d[len_s1][len_s2] / max(len_s1, len_s2)
+
+
+class LegacyFuzzyComparator(FuzzyComparator):
+    def compare(self, value1, value2):
+        return legacy_fuzz_score(str(value1), str(value2))
+
+
+def legacy_compare_hungarian(expected_list, actual_list, comp, threshold=0.8):
+    """Previous compare_hungarian: pairwise compare() loop plus Munkres."""
+    matrix = [[comp.compare(e, a) for a in actual_list] for e in expected_list]
+    indexes = Munkres().compute(make_cost_matrix(matrix, lambda x: 1 - x))
+    matches = [(i, j, matrix[i][j]) for i, j in indexes]
+    tp = sum(1 for _, _, score in matches if score >= threshold)
+    return tp, len(actual_list) - tp, sum(s for _, _, s in matches) / len(matches)
+
+
+def line_items(rng: random.Random, count: int, noise: float):
+    """Synthetic line item descriptions, with a noisy copy for the actual values."""
+    words = ["widget", "bolt", "service", "fee", "labor", "steel", "blue", "kit"]
+    expected = [
+        f"{rng.choice(words)} {rng.choice(words)} {rng.randint(1, 9999)} ea"
+        for _ in range(count)
+    ]
+    actual = [
+        "".join(c if rng.random() > noise else rng.choice("abcxyz") for c in item)
+        for item in expected
+    ]
+    rng.shuffle(actual)
+    return expected, actual
+
+
+def bench(fn, repeat: int) -> float:
+    """Best-of-3 seconds per call."""
+    return min(timeit.repeat(fn, number=repeat, repeat=3)) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 50, 200])
+    parser.add_argument(
+        "--legacy-max-size",
+        type=int,
+        default=100,
+        help="skip the legacy baseline above this list size (it is very slow)",
+    )
+    parser.add_argument("--no-scipy", action="store_true")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    use_scipy = comparator.SCIPY_AVAILABLE and not args.no_scipy
+    print(f"NumPy: {comparator.NUMPY_AVAILABLE}, SciPy solver: {use_scipy}\n")
+
+    print(f"{'benchmark':<34} {'legacy (ms)':>12} {'new (ms)':>10} {'speedup':>8}")
+    for length in (16, 64, 256):
+        a = "".join(rng.choice("abcdefgh ") for _ in range(length))
+        b = "".join(rng.choice("abcdefgh ") for _ in range(length))
+        repeat = max(1, 20000 // (length * 4))
+        legacy = bench(lambda: legacy_fuzz_score(a, b), repeat)
+        new = bench(lambda: fuzz_score(a, b), repeat)
+        print(
+            f"{f'fuzz_score len={length}':<34} {legacy * 1e3:>12.3f} "
+            f"{new * 1e3:>10.3f} {legacy / new:>7.1f}x"
+        )
+
+    comparators = [
+        ("EXACT", ExactComparator(), ExactComparator()),
+        ("NUMERIC", NumericComparator(), NumericComparator()),
+        ("FUZZY", LegacyFuzzyComparator(0.8), FuzzyComparator(0.8)),
+    ]
+    with patch.object(comparator, "SCIPY_AVAILABLE", use_scipy):
+        for size in args.sizes:
+            expected, actual = line_items(rng, size, noise=0.1)
+            for name, legacy_comp, new_comp in comparators:
+                label = f"compare_hungarian {name} n={size}"
+                new = bench(lambda: compare_hungarian(expected, actual, new_comp), 1)
+                if size > args.legacy_max_size:
+                    print(f"{label:<34} {'skipped':>12} {new * 1e3:>10.3f} {'':>8}")
+                    continue
+                legacy = bench(
+                    lambda: legacy_compare_hungarian(expected, actual, legacy_comp), 1
+                )
+                print(
+                    f"{label:<34} {legacy * 1e3:>12.3f} {new * 1e3:>10.3f} "
+                    f"{legacy / new:>7.1f}x"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Benchmark embedding calls made by SEMANTIC evaluation.
+
+Runs EvaluationService.evaluate_document on a synthetic document whose sections
+share many SEMANTIC values (vendor names and payment terms),
+with a stub embedding client that sleeps --call-latency seconds per call. The
+uncached baseline reproduces the previous behavior of two generate_embedding calls
+per comparison; the cached runs use EmbeddingService, first cold and then warm (a
+second evaluation of the same document in the same process, as in a batch run).
+
+Usage:
+    python benchmarks/evaluation_embeddings.py --sections 10 --attributes 12
+"""
+
+import argparse
+import logging
+import random
+import threading
+import time
+from unittest.mock import patch
+
+from idp_common.bedrock.embedding_cache import EmbeddingService
+from idp_common.models import Document, Section
+
+
+class StubEmbeddingClient:
+    """Stand-in for BedrockClient.generate_embedding with fixed latency."""
+
+    def __init__(self, call_latency: float):
+        self.call_latency = call_latency
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def generate_embedding(self, text, model_id="amazon.titan-embed-text-v1"):
+        with self.lock:
+            self.calls += 1
+        time.sleep(self.call_latency)
+        rng = random.Random(" ".join(text.split()))
+        return [rng.uniform(-1, 1) for _ in range(256)]
+
+
+class UncachedEmbeddingService(EmbeddingService):
+    """Previous behavior: every lookup calls Bedrock, no batching."""
+
+    def embed(self, text, model_id="amazon.titan-embed-text-v1"):
+        return self.client.generate_embedding(text, model_id)
+
+    def embed_many(self, texts, model_id="amazon.titan-embed-text-v1", prefetch=False):
+        return []
+
+
+def build_document(sections: int, attributes: int, rng: random.Random):
+    """Config plus expected/actual documents and their S3 results."""
+    vendors = ["Acme Corp", "Globex LLC", "Initech", "Umbrella Co"]
+    phrases = ["net 30 days", "ship to billing address", "paid in full", "see terms"]
+    config = {
+        "classes": [
+            {
+                "name": "invoice",
+                "attributes": [
+                    {"name": f"field_{i}", "evaluation_method": "SEMANTIC"}
+                    for i in range(attributes)
+                ],
+            }
+        ]
+    }
+    results = {}
+    documents = []
+    for kind in ("expected", "actual"):
+        doc = Document(id=f"bench-{kind}", input_key="bench.pdf")
+        for s in range(sections):
+            uri = f"s3://bench/{kind}/{s}.json"
+            section_rng = random.Random(s)
+            values = {
+                f"field_{i}": (
+                    section_rng.choice(vendors)
+                    if i % 2
+                    else section_rng.choice(phrases)
+                )
+                for i in range(attributes)
+            }
+            if kind == "actual":
+                values = {
+                    k: v.upper() if rng.random() < 0.3 else v for k, v in values.items()
+                }
+            results[uri] = {"inference_result": values}
+            doc.sections.append(
+                Section(
+                    section_id=str(s),
+                    classification="invoice",
+                    page_ids=[str(s)],
+                    extraction_result_uri=uri,
+                )
+            )
+        documents.append(doc)
+    return config, documents[0], documents[1], results
+
+
+def run(service, config, expected, actual, results, max_workers):
+    """Evaluate once, returning wall seconds."""
+    from idp_common.evaluation.service import EvaluationService
+
+    evaluator = EvaluationService(
+        region="us-east-1", config=config, max_workers=max_workers
+    )
+    start = time.perf_counter()
+    with (
+        patch("idp_common.bedrock.get_embedding_service", return_value=service),
+        patch("idp_common.s3.get_json_content", side_effect=lambda uri: results[uri]),
+    ):
+        result = evaluator.evaluate_document(actual, expected, store_results=False)
+    assert not result.errors, result.errors
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sections", type=int, default=10)
+    parser.add_argument("--attributes", type=int, default=12)
+    parser.add_argument("--call-latency", type=float, default=0.05)
+    parser.add_argument("--max-workers", type=int, default=10)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    config, expected, actual, results = build_document(
+        args.sections, args.attributes, random.Random(3)
+    )
+    comparisons = args.sections * args.attributes
+    print(f"{comparisons} SEMANTIC comparisons\n")
+    print(
+        f"{'run':<16} {'Bedrock calls':>14} {'wall (s)':>9} {'hit rate':>9} {'saved':>6}"
+    )
+
+    client = StubEmbeddingClient(args.call_latency)
+    wall = run(
+        UncachedEmbeddingService(client=client),
+        config,
+        expected,
+        actual,
+        results,
+        args.max_workers,
+    )
+    print(f"{'uncached':<16} {client.calls:>14} {wall:>9.2f} {'':>9} {'':>6}")
+
+    client = StubEmbeddingClient(args.call_latency)
+    service = EmbeddingService(client=client)
+    for label in ("cached (cold)", "cached (warm)"):
+        calls_before, stats_before = client.calls, service.get_stats()
+        wall = run(service, config, expected, actual, results, args.max_workers)
+        stats = service.stats_delta(stats_before, service.get_stats())
+        print(
+            f"{label:<16} {client.calls - calls_before:>14} {wall:>9.2f} "
+            f"{stats['hit_rate']:>8.1%} {stats['calls_saved']:>6}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Measure agentic extraction setup time per section, model built per section vs schema cache.
+
+Setup is what ExtractionService does before calling structured_output: create
+the Pydantic model of the section's class (with nested group and list item
+models) and render its JSON schema, which the agent does twice (tool
+description and system prompt). "previous" creates the model and schemas for
+every section; "cached" uses the process-wide schema cache, cold at the start
+of the run, and "prewarmed" fills it at service creation first
+(extraction.agentic.prewarm_schemas). The prewarm time is reported separately.
+
+Usage:
+    python benchmarks/extraction_schema_cache.py --classes 10 100 --sections 1000
+"""
+
+import argparse
+import logging
+import random
+import time
+
+from idp_common.bedrock import clear_prompt_template_cache
+from idp_common.extraction import schema_cache
+from idp_common.extraction.service import ExtractionService
+
+
+def build_config(classes: int, prewarm: bool) -> dict:
+    """Classes with 10 simple, 3 group (5 fields) and 3 list (8 item fields) attributes."""
+    config = {
+        "extraction": {"agentic": {"enabled": True, "prewarm_schemas": prewarm}},
+        "classes": [],
+    }
+    for i in range(classes):
+        attributes = [
+            {"name": f"field_{j}", "description": f"Field {j} of class {i}"}
+            for j in range(10)
+        ]
+        attributes += [
+            {
+                "name": f"group_{j}",
+                "description": f"Group {j}",
+                "attributeType": "group",
+                "groupAttributes": [
+                    {"name": f"group_field_{k}", "description": f"Nested {k}"}
+                    for k in range(5)
+                ],
+            }
+            for j in range(3)
+        ]
+        attributes += [
+            {
+                "name": f"list_{j}",
+                "description": f"List {j}",
+                "attributeType": "list",
+                "listItemTemplate": {
+                    "itemDescription": f"Line item {j}",
+                    "itemAttributes": [
+                        {"name": f"item_{k}", "description": f"Item field {k}"}
+                        for k in range(8)
+                    ],
+                },
+            }
+            for j in range(3)
+        ]
+        config["classes"].append({"name": f"Class_{i}", "attributes": attributes})
+    return config
+
+
+def previous_setup(service, class_label):
+    attributes = service._get_class_attributes(class_label)
+    model = service._create_pydantic_model_from_attributes(class_label, attributes)
+    model.model_json_schema()
+    model.model_json_schema()
+
+
+def cached_setup(service, class_label):
+    attributes = service._get_class_attributes(class_label)
+    model = service._get_extraction_model(class_label, attributes)
+    schema_cache.get_model_json_schema(model)
+    schema_cache.get_model_json_schema(model)
+
+
+def run(mode, classes, labels):
+    schema_cache.clear_schema_cache()
+    clear_prompt_template_cache()
+    start = time.perf_counter()
+    service = ExtractionService(config=build_config(classes, mode == "prewarmed"))
+    init_seconds = time.perf_counter() - start
+
+    setup = previous_setup if mode == "previous" else cached_setup
+    start = time.perf_counter()
+    for class_label in labels:
+        setup(service, class_label)
+    return init_seconds, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--classes", type=int, nargs="+", default=[10, 100])
+    parser.add_argument("--sections", type=int, default=1000)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    rng = random.Random(7)
+
+    print(
+        f"{'classes':>7} {'sections':>8} {'mode':>10} {'init (ms)':>10} "
+        f"{'setup (ms)':>11} {'per section (ms)':>17} {'speedup':>8}"
+    )
+    for classes in args.classes:
+        labels = [f"Class_{rng.randrange(classes)}" for _ in range(args.sections)]
+        baseline = None
+        for mode in ("previous", "cached", "prewarmed"):
+            init_seconds, seconds = run(mode, classes, labels)
+            baseline = baseline or seconds
+            print(
+                f"{classes:>7} {args.sections:>8} {mode:>10} {init_seconds * 1000:>10.1f} "
+                f"{seconds * 1000:>11.1f} {seconds / args.sections * 1000:>17.3f} "
+                f"{baseline / seconds:>8.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Measure lookup_function poll latency and read units for batch status queries.
+
+Loads src/lambda/lookup_function/index.py against an in-memory tracking table and
+compares one status poll (status_only) done the previous way, one consistent
+GetItem per document, with BatchGetItem in chunks of 100. Each DynamoDB request
+costs --latency seconds plus --item-latency per item returned, standing in for
+the network round trip and response transfer. Read units are computed from item
+sizes: a consistent read costs 1 RCU and an eventually consistent read 0.5 RCU
+per 4 KB of the whole item (projections do not reduce read units). The "changed
+only" row is a later poll in which --finished of the documents have completed
+and are no longer queried.
+
+Usage:
+    python benchmarks/lookup_batch_status.py --documents 1000 5000 20000
+"""
+
+import argparse
+import importlib.util
+import logging
+import math
+import os
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+LAMBDA_DIR = Path(__file__).resolve().parents[3] / "src/lambda/lookup_function"
+
+
+def load_lookup_function():
+    os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+    spec = importlib.util.spec_from_file_location(
+        "lookup_index", LAMBDA_DIR / "index.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def tracking_item(key: str, status: str) -> dict:
+    """A tracking record of realistic size (page and section metadata)."""
+    return {
+        "PK": f"doc#{key}",
+        "SK": "none",
+        "ObjectKey": key,
+        "ObjectStatus": status,
+        "InitialEventTime": "2025-10-15T10:00:00+00:00",
+        "QueuedTime": "2025-10-15T10:00:01+00:00",
+        "WorkflowStartTime": "2025-10-15T10:00:02+00:00",
+        "WorkflowExecutionArn": "arn:aws:states:us-east-1:123456789012:execution:"
+        + "x" * 80,
+        "Pages": [
+            {"Id": str(i), "Class": "invoice", "ImageUri": "s3://b/" + "p" * 80}
+            for i in range(12)
+        ],
+        "Sections": [
+            {"Id": "1", "Class": "invoice", "PageIds": [str(i) for i in range(12)]}
+        ],
+    }
+
+
+def item_size(value) -> int:
+    """Approximate DynamoDB item size in bytes."""
+    if isinstance(value, dict):
+        return sum(len(k) + item_size(v) for k, v in value.items()) + 3
+    if isinstance(value, list):
+        return sum(item_size(v) + 1 for v in value) + 3
+    return len(str(value))
+
+
+def rcu(size: int, consistent: bool) -> float:
+    return (1.0 if consistent else 0.5) * max(1, math.ceil(size / 4096))
+
+
+class FakeTrackingTable:
+    """In-memory stand-in for the boto3 DynamoDB resource and tracking table."""
+
+    def __init__(self, items, latency, item_latency):
+        self.items = items
+        self.latency = latency
+        self.item_latency = item_latency
+        self.requests = 0
+        self.read_units = 0.0
+
+    def Table(self, name):
+        return self
+
+    def _read(self, pk, consistent):
+        item = self.items.get(pk)
+        if item is not None:
+            self.read_units += rcu(item_size(item), consistent)
+        return item
+
+    def get_item(self, Key, ConsistentRead=False):
+        self.requests += 1
+        time.sleep(self.latency + self.item_latency)
+        item = self._read(Key["PK"], ConsistentRead)
+        return {"Item": item} if item else {}
+
+    def batch_get_item(self, RequestItems):
+        self.requests += 1
+        ((table, request),) = RequestItems.items()
+        names = [
+            request["ExpressionAttributeNames"][a.strip()]
+            for a in request["ProjectionExpression"].split(",")
+        ]
+        found = []
+        for key in request["Keys"]:
+            item = self._read(key["PK"], request.get("ConsistentRead", False))
+            if item:
+                found.append({n: item[n] for n in names if n in item})
+        time.sleep(self.latency + self.item_latency * len(found))
+        return {"Responses": {table: found}, "UnprocessedKeys": {}}
+
+
+def run(index, documents: int, finished: float, latency: float, item_latency: float):
+    keys = [f"batch/doc{i:06d}.pdf" for i in range(documents)]
+    items = {f"doc#{key}": tracking_item(key, "RUNNING") for key in keys}
+    active = keys[int(documents * finished) :]
+    polls = [
+        ("GetItem per document", None),
+        ("BatchGetItem", {"object_keys": keys, "status_only": True}),
+        (
+            f"BatchGetItem, changed only ({finished:.0%} done)",
+            {
+                "object_keys": active,
+                "status_only": True,
+                "known_statuses": {key: "RUNNING" for key in active},
+            },
+        ),
+    ]
+
+    rows = []
+    for label, event in polls:
+        table = FakeTrackingTable(items, latency, item_latency)
+        with (
+            patch.object(index, "dynamodb", table),
+            patch.dict(os.environ, {"TRACKING_TABLE": "bench-tracking"}),
+        ):
+            start = time.perf_counter()
+            if event is None:
+                for key in keys:
+                    index.get_document_status(key, status_only=True)
+            else:
+                index.handler(event, None)
+            rows.append(
+                (label, time.perf_counter() - start, table.requests, table.read_units)
+            )
+    return item_size(items[f"doc#{keys[0]}"]), rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--documents", type=int, nargs="+", default=[1000, 5000, 20000])
+    parser.add_argument("--finished", type=float, default=0.8)
+    parser.add_argument(
+        "--latency", type=float, default=0.004, help="Seconds per DynamoDB request"
+    )
+    parser.add_argument(
+        "--item-latency", type=float, default=0.00002, help="Seconds per item returned"
+    )
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    index = load_lookup_function()
+    print(
+        f"{'documents':>9}  {'mode':<40} {'poll (s)':>9} {'requests':>9} {'read units':>11}"
+    )
+    for documents in args.documents:
+        size, rows = run(
+            index, documents, args.finished, args.latency, args.item_latency
+        )
+        for label, seconds, requests, units in rows:
+            print(
+                f"{documents:>9}  {label:<40} {seconds:>9.2f} {requests:>9} {units:>11.0f}"
+            )
+    print(f"(tracking item size ~{size} bytes)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Benchmark per-call overhead of idp_common.metrics.put_metric under thread contention.
+
+Compares the synchronous path (one put_metric_data call per data point, serialized
+on the module lock) with the buffered emitter, using a stub CloudWatch client that
+simulates the PutMetricData round trip.
+
+Usage:
+    python benchmarks/metrics_emitter.py --threads 32 --calls 50 --latency-ms 20
+"""
+
+import argparse
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+from idp_common import metrics
+
+
+class StubCloudWatch:
+    """CloudWatch stand-in that sleeps for a fixed round-trip latency."""
+
+    def __init__(self, latency_ms: float):
+        self.latency = latency_ms / 1000
+        self.requests = 0
+        self.datums = 0
+        self._lock = threading.Lock()
+
+    def put_metric_data(self, Namespace, MetricData):
+        time.sleep(self.latency)
+        with self._lock:
+            self.requests += 1
+            self.datums += len(MetricData)
+
+
+def run(buffered: bool, threads: int, calls: int, latency_ms: float) -> dict:
+    stub = StubCloudWatch(latency_ms)
+    with patch.object(metrics, "get_cloudwatch_client", return_value=stub):
+        metrics.configure_buffering(buffered, flush_interval=1.0)
+
+        def worker(_):
+            start = time.perf_counter()
+            for i in range(calls):
+                metrics.put_metric("BedrockRequestLatency", 1000 + i, "Milliseconds")
+            return time.perf_counter() - start
+
+        wall_start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            per_thread = list(executor.map(worker, range(threads)))
+        wall = time.perf_counter() - wall_start
+        metrics.flush_metrics()
+        metrics.configure_buffering(False)
+
+    total_calls = threads * calls
+    return {
+        "mode": "buffered" if buffered else "synchronous",
+        "wall_s": wall,
+        "per_call_us": sum(per_thread) / total_calls * 1e6,
+        "requests": stub.requests,
+        "datums": stub.datums,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--threads", type=int, default=32)
+    parser.add_argument(
+        "--calls", type=int, default=50, help="put_metric calls per thread"
+    )
+    parser.add_argument(
+        "--latency-ms", type=float, default=20.0, help="simulated PutMetricData latency"
+    )
+    args = parser.parse_args()
+
+    print(
+        f"{args.threads} threads x {args.calls} calls, "
+        f"{args.latency_ms:.0f} ms simulated CloudWatch latency"
+    )
+    print(
+        f"{'mode':<12} {'wall (s)':>10} {'per call (us)':>15} {'API calls':>10} {'datums':>8}"
+    )
+    for buffered in (False, True):
+        r = run(buffered, args.threads, args.calls, args.latency_ms)
+        print(
+            f"{r['mode']:<12} {r['wall_s']:>10.3f} {r['per_call_us']:>15.1f} "
+            f"{r['requests']:>10} {r['datums']:>8}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Count S3 requests and time OCR output writes and page reads, per-page objects vs page bundle.
+
+Runs OcrService.process_document with the "none" backend on a generated
+--pages page PDF against a moto S3 bucket (page rendering is stubbed with a
+fixed JPEG so S3 dominates), then reads every page's text and image through
+idp_common.s3 as classification does. Each S3 request sleeps --s3-latency
+seconds to stand in for the network round trip moto does not have. "per-page"
+is the default layout, "bundle" sets ocr.page_bundle.enabled. moto copies the
+whole object for a ranged GET, so bundle read times grow with --pack-size-mb
+in a way S3 itself does not.
+
+Usage:
+    python benchmarks/ocr_page_bundle.py --pages 100 1000 --s3-latency 0.02
+"""
+
+import argparse
+import io
+import logging
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import boto3
+import fitz
+from idp_common import s3
+from idp_common.models import Document
+from idp_common.ocr.service import OcrService
+from moto import mock_aws
+from PIL import Image, ImageDraw
+
+BUCKET_IN = "bench-input"
+BUCKET_OUT = "bench-output"
+
+
+def page_image() -> bytes:
+    """A JPEG roughly the size of a resized page image."""
+    img = Image.new("RGB", (951, 1268), "white")
+    draw = ImageDraw.Draw(img)
+    for y in range(40, 1228, 30):
+        draw.line((60, y, 891, y), fill="black", width=2)
+    buffer = io.BytesIO()
+    img.save(buffer, format="JPEG", quality=85)
+    return buffer.getvalue()
+
+
+def make_pdf(pages: int) -> bytes:
+    pdf = fitz.open()
+    for i in range(pages):
+        pdf.new_page().insert_text((72, 72), f"Page {i + 1}")
+    return pdf.tobytes()
+
+
+def instrument(client, latency: float, counts: Counter):
+    def before_call(event_name, **kwargs):
+        counts[event_name.rsplit(".", 1)[-1]] += 1
+        time.sleep(latency)
+
+    client.meta.events.register("before-call.s3.*", before_call)
+
+
+def run(layout, pages, latency, workers, image, pack_size_mb):
+    with mock_aws():
+        client = boto3.client("s3", region_name="us-east-1")
+        client.create_bucket(Bucket=BUCKET_IN)
+        client.create_bucket(Bucket=BUCKET_OUT)
+        client.put_object(Bucket=BUCKET_IN, Key="doc.pdf", Body=make_pdf(pages))
+
+        counts: Counter = Counter()
+        instrument(client, latency, counts)
+        config = {
+            "ocr": {
+                "backend": "none",
+                "max_workers": workers,
+                "page_bundle": {
+                    "enabled": layout == "bundle",
+                    "pack_size_mb": pack_size_mb,
+                },
+            }
+        }
+        with patch.object(s3, "_s3_client", client):
+            service = OcrService(config=config)
+            service.s3_client = client
+            document = Document(
+                id="bench",
+                input_bucket=BUCKET_IN,
+                input_key="doc.pdf",
+                output_bucket=BUCKET_OUT,
+            )
+            start = time.perf_counter()
+            with patch.object(service, "_render_page", return_value=image):
+                document = service.process_document(document)
+            write_seconds = time.perf_counter() - start
+            assert not document.errors, document.errors
+            write_counts = dict(counts)
+            counts.clear()
+
+            def read_page(page):
+                s3.get_text_content(page.parsed_text_uri)
+                s3.get_binary_content(page.image_uri)
+
+            start = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                list(executor.map(read_page, document.pages.values()))
+            read_seconds = time.perf_counter() - start
+            objects = sum(
+                page.get("KeyCount", 0)
+                for page in client.get_paginator("list_objects_v2").paginate(
+                    Bucket=BUCKET_OUT
+                )
+            )
+        return write_counts, write_seconds, dict(counts), read_seconds, objects
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--pages", type=int, nargs="+", default=[100, 1000])
+    parser.add_argument("--s3-latency", type=float, default=0.02)
+    parser.add_argument("--workers", type=int, default=20)
+    parser.add_argument("--pack-size-mb", type=float, default=32)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    image = page_image()
+
+    print(
+        f"{'pages':>6} {'layout':>9} {'PUTs':>6} {'write (s)':>10} {'objects':>8} "
+        f"{'GETs':>6} {'read (s)':>9}"
+    )
+    for pages in args.pages:
+        for layout in ("per-page", "bundle"):
+            writes, write_seconds, reads, read_seconds, objects = run(
+                layout,
+                pages,
+                args.s3_latency,
+                args.workers,
+                image,
+                args.pack_size_mb,
+            )
+            print(
+                f"{pages:>6} {layout:>9} {writes.get('PutObject', 0):>6} "
+                f"{write_seconds:>10.2f} {objects:>8} {reads.get('GetObject', 0):>6} "
+                f"{read_seconds:>9.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Benchmark OCR page rasterization throughput, thread vs process rasterizer.
+
+Each measurement runs OcrService.process_document with the 'none' backend (render
+and upload only, S3 stubbed) in a subprocess pinned to N CPUs with
+sched_setaffinity, to approximate Lambda and ECS sizes with N vCPUs. CPU counts
+above what this machine has are skipped.
+
+Usage:
+    python benchmarks/ocr_rasterization.py --pages 120 --cpus 1 2 4 6
+"""
+
+import argparse
+import json
+import logging
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from unittest.mock import MagicMock, patch
+
+
+def build_pdf(path: str, pages: int) -> None:
+    """Write a PDF with dense vector text and shapes, which is costly to render."""
+    import fitz
+
+    doc = fitz.open()
+    for page_number in range(1, pages + 1):
+        page = doc.new_page(width=612, height=792)
+        for line in range(60):
+            page.insert_text(
+                (36, 30 + line * 12),
+                f"Page {page_number} line {line} " + "lorem ipsum dolor sit amet " * 3,
+                fontsize=8,
+            )
+        for i in range(40):
+            page.draw_circle((306, 396), 20 + i * 6, color=(i / 40, 0.2, 0.5))
+    doc.save(path)
+    doc.close()
+
+
+def run_worker(pdf_path: str, rasterizer: str, cpus: int, dpi: int) -> dict:
+    """Process the PDF once on the pinned CPUs and return pages per second."""
+    from idp_common.models import Document
+    from idp_common.ocr.service import OcrService
+
+    logging.disable(logging.WARNING)
+    with patch("boto3.client"):
+        service = OcrService(
+            region="us-east-1",
+            config={
+                "ocr": {
+                    "backend": "none",
+                    "max_workers": 20,
+                    "image": {
+                        "dpi": dpi,
+                        "rasterizer": rasterizer,
+                        "rasterizer_workers": cpus,
+                    },
+                }
+            },
+        )
+    service.s3_client = MagicMock()
+    service.s3_client.get_object.side_effect = lambda **kwargs: {
+        "Body": open(pdf_path, "rb")
+    }
+    document = Document(
+        id="bench", input_bucket="input", input_key="bench.pdf", output_bucket="output"
+    )
+    if service.rasterizer is not None:
+        # Start the worker processes before timing
+        service.rasterizer.render(pdf_path, 0)
+
+    start = time.perf_counter()
+    with patch("idp_common.s3.write_content"):
+        result = service.process_document(document)
+    wall = time.perf_counter() - start
+    if service.rasterizer is not None:
+        service.close()
+    return {"pages": len(result.pages), "pages_per_second": len(result.pages) / wall}
+
+
+def measure(pdf_path: str, rasterizer: str, cpus: int, dpi: int) -> dict:
+    """Run one measurement in a subprocess restricted to the first `cpus` CPUs."""
+    allowed = sorted(os.sched_getaffinity(0))[:cpus]
+    output = subprocess.check_output(
+        [
+            sys.executable,
+            __file__,
+            "--worker",
+            "--pdf",
+            pdf_path,
+            "--rasterizer",
+            rasterizer,
+            "--cpus",
+            str(cpus),
+            "--dpi",
+            str(dpi),
+        ],
+        preexec_fn=lambda: os.sched_setaffinity(0, allowed),
+    )
+    return json.loads(output.decode("utf-8").strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--pages", type=int, default=120)
+    parser.add_argument("--cpus", type=int, nargs="+", default=[1, 2, 4, 6])
+    parser.add_argument("--dpi", type=int, default=150)
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--pdf", help=argparse.SUPPRESS)
+    parser.add_argument("--rasterizer", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(run_worker(args.pdf, args.rasterizer, args.cpus[0], args.dpi)))
+        return
+
+    available = len(os.sched_getaffinity(0))
+    print(f"{'vCPUs':>5} {'thread pages/s':>15} {'process pages/s':>16} {'speedup':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        pdf_path = os.path.join(tmp, "synthetic.pdf")
+        build_pdf(pdf_path, args.pages)
+        for cpus in args.cpus:
+            if cpus > available:
+                print(f"{cpus:>5} skipped: only {available} CPUs available")
+                continue
+            thread = measure(pdf_path, "thread", cpus, args.dpi)
+            process = measure(pdf_path, "process", cpus, args.dpi)
+            print(
+                f"{cpus:>5} {thread['pages_per_second']:>15.1f} "
+                f"{process['pages_per_second']:>16.1f} "
+                f"{process['pages_per_second'] / thread['pages_per_second']:>7.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Benchmark peak memory of OcrService.process_document against page count.
+
+Each measurement runs in a fresh subprocess that OCRs a synthetic scanned PDF
+(one noise image per page) with stubbed S3, Textract and Bedrock clients, and
+reports its peak RSS. The bounded pipeline (ocr.max_pages_in_flight) is compared
+with an unbounded window that submits every page at once.
+
+Usage:
+    python benchmarks/ocr_streaming_memory.py --pages 50 200 500
+    python benchmarks/ocr_streaming_memory.py --pages 100 500 2000 --plot memory.png
+"""
+
+import argparse
+import io
+import json
+import logging
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from unittest.mock import MagicMock, patch
+
+BACKENDS = ["textract", "bedrock", "none"]
+
+TEXTRACT_RESPONSE = {
+    "DocumentMetadata": {"Pages": 1},
+    "Blocks": [
+        {
+            "BlockType": "LINE",
+            "Id": f"line-{i}",
+            "Text": f"Synthetic line {i}",
+            "Confidence": 99.0,
+            "TextType": "PRINTED",
+        }
+        for i in range(40)
+    ],
+}
+
+BEDROCK_RESPONSE = {
+    "response": {"output": {"message": {"content": [{"text": "Synthetic page text"}]}}},
+    "metering": {"OCR/bedrock/stub": {"inputTokens": 1000, "outputTokens": 100}},
+}
+
+
+def build_pdf(path: str, pages: int) -> None:
+    """Write a PDF with one full-page noise image per page, like a scanned document."""
+    import fitz
+    from PIL import Image
+
+    noise = Image.effect_noise((1240, 1754), 64).convert("L")
+    buffer = io.BytesIO()
+    noise.save(buffer, format="JPEG", quality=60)
+    image_bytes = buffer.getvalue()
+
+    doc = fitz.open()
+    for _ in range(pages):
+        page = doc.new_page(width=612, height=792)
+        page.insert_image(page.rect, stream=image_bytes)
+    doc.save(path)
+    doc.close()
+
+
+def run_worker(backend: str, pdf_path: str, window: int, workers: int) -> dict:
+    """OCR the PDF once with stubbed AWS clients and return peak RSS and wall time."""
+    from idp_common.models import Document
+    from idp_common.ocr.service import OcrService
+
+    # The stub Textract response trips the textractor fallback path on every page
+    logging.disable(logging.WARNING)
+    config = {
+        "ocr": {
+            "backend": backend,
+            "max_workers": workers,
+            "max_pages_in_flight": window,
+            "model_id": "stub-model",
+            "system_prompt": "stub",
+            "task_prompt": "stub",
+        }
+    }
+    with patch("boto3.client"):
+        service = OcrService(region="us-east-1", config=config)
+
+    service.s3_client = MagicMock()
+    service.s3_client.get_object.side_effect = lambda **kwargs: {
+        "Body": open(pdf_path, "rb")
+    }
+    service.textract_client = MagicMock()
+    service.textract_client.detect_document_text.return_value = TEXTRACT_RESPONSE
+
+    document = Document(
+        id="bench",
+        input_bucket="input",
+        input_key="bench.pdf",
+        output_bucket="output",
+    )
+    start = time.perf_counter()
+    with (
+        patch("idp_common.s3.write_content"),
+        patch("idp_common.bedrock.invoke_model", return_value=BEDROCK_RESPONSE),
+    ):
+        result = service.process_document(document)
+    wall = time.perf_counter() - start
+
+    return {
+        "pages": len(result.pages),
+        "errors": len(result.errors),
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        "wall_s": wall,
+    }
+
+
+def measure(backend: str, pdf_path: str, window: int, workers: int) -> dict:
+    """Run one measurement in a subprocess so peak RSS is not shared between runs."""
+    output = subprocess.check_output(
+        [
+            sys.executable,
+            __file__,
+            "--worker",
+            "--backend",
+            backend,
+            "--pdf",
+            pdf_path,
+            "--window",
+            str(window),
+            "--workers",
+            str(workers),
+        ]
+    )
+    return json.loads(output.decode("utf-8").strip().splitlines()[-1])
+
+
+def plot(results: list, path: str) -> None:
+    """Plot peak RSS against page count, one line per backend and window mode."""
+    try:
+        import matplotlib
+
+        matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
+    except ImportError:
+        print("matplotlib is not installed; skipping plot")
+        return
+
+    fig, ax = plt.subplots(figsize=(8, 5))
+    for backend in BACKENDS:
+        for mode in ("unbounded", "bounded"):
+            rows = [r for r in results if r["backend"] == backend and r["mode"] == mode]
+            if rows:
+                ax.plot(
+                    [r["page_count"] for r in rows],
+                    [r["peak_rss_mb"] for r in rows],
+                    marker="o",
+                    linestyle="-" if mode == "bounded" else "--",
+                    label=f"{backend} ({mode})",
+                )
+    ax.set_xlabel("Pages")
+    ax.set_ylabel("Peak RSS (MB)")
+    ax.set_title("OcrService.process_document peak memory")
+    ax.legend()
+    fig.savefig(path, dpi=120, bbox_inches="tight")
+    print(f"Saved plot to {path}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--pages", type=int, nargs="+", default=[50, 200, 500])
+    parser.add_argument("--backends", nargs="+", default=BACKENDS, choices=BACKENDS)
+    parser.add_argument("--workers", type=int, default=20)
+    parser.add_argument(
+        "--window", type=int, default=40, help="max_pages_in_flight for bounded mode"
+    )
+    parser.add_argument(
+        "--plot", help="write a PNG plot to this path (needs matplotlib)"
+    )
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--backend", help=argparse.SUPPRESS)
+    parser.add_argument("--pdf", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(run_worker(args.backend, args.pdf, args.window, args.workers)))
+        return
+
+    results = []
+    print(
+        f"{'backend':<10} {'pages':>6} {'mode':<10} {'peak RSS (MB)':>14} {'wall (s)':>9}"
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        for page_count in args.pages:
+            pdf_path = os.path.join(tmp, f"synthetic-{page_count}.pdf")
+            build_pdf(pdf_path, page_count)
+            for backend in args.backends:
+                for mode, window in (("unbounded", 0), ("bounded", args.window)):
+                    r = measure(backend, pdf_path, window, args.workers)
+                    r.update(backend=backend, mode=mode, page_count=page_count)
+                    results.append(r)
+                    print(
+                        f"{backend:<10} {page_count:>6} {mode:<10} "
+                        f"{r['peak_rss_mb']:>14.1f} {r['wall_s']:>9.2f}"
+                    )
+
+    if args.plot:
+        plot(results, args.plot)
+
+
+if __name__ == "__main__":
+    main()
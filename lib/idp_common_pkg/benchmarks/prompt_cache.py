@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Estimate extraction input-token cost of a multi-section packet with and without cache points.
+
+Renders the lending-package extraction prompt for --sections sections (spread
+over the package's classes) with ExtractionService's content builder and sends
+each request to a simulated Bedrock prompt cache: a request reads the longest
+cached prefix ending at one of its cache points and writes the rest up to its
+last cache point (prefixes under the model minimum are not cached). Sections run
+in waves of --concurrency, like the extraction Map state, and prefixes written
+in a wave are only readable by later waves. Token counts use the same
+4-characters-per-token estimate as the planner, so "observed" here is the
+simulator's outcome, not a Bedrock measurement.
+
+Modes: "none" is the template with its <<CACHEPOINT>> removed (a custom
+configuration without markers), "auto" is that template after
+apply_cache_points, "config" is the shipped template with its explicit marker.
+
+Usage:
+    python benchmarks/prompt_cache.py --sections 4 24 --concurrency 1 8
+"""
+
+import argparse
+import logging
+import os
+import random
+
+import yaml
+from idp_common.bedrock.prompt_cache import (
+    CACHEPOINT_TAG,
+    PromptCacheTracker,
+    apply_cache_points,
+    plan_prompt_cache,
+)
+from idp_common.extraction.service import ExtractionService
+
+MODEL_ID = "us.anthropic.claude-3-7-sonnet-20250219-v1:0"
+CONFIG_PATH = os.path.join(
+    os.path.dirname(__file__),
+    "../../../config_library/pattern-2/lending-package-sample/config.yaml",
+)
+
+# Price per million tokens (Claude 3.7 Sonnet on-demand): input, cache write, cache read
+PRICES = {"input": 3.0, "write": 3.75, "read": 0.30}
+
+WORDS = "account payment balance date amount employer total deposit gross net".split()
+
+
+def section_text(rng: random.Random, chars: int) -> str:
+    words = []
+    while sum(len(word) + 1 for word in words) < chars:
+        words.append(
+            rng.choice(WORDS) if rng.random() < 0.8 else str(rng.randint(1, 99999))
+        )
+    return " ".join(words)
+
+
+def estimate_total_tokens(system_prompt, content) -> int:
+    chars = sum(len(item.get("text", "")) for item in system_prompt)
+    for item in content:
+        if isinstance(item.get("text"), str):
+            chars += len(item["text"].replace(CACHEPOINT_TAG, ""))
+    return chars // 4
+
+
+def run(config, mode: str, sections: int, concurrency: int, text_chars: int):
+    template = config["extraction"]["task_prompt"]
+    if mode != "config":
+        template = template.replace(CACHEPOINT_TAG, "")
+    if mode == "auto":
+        template = apply_cache_points(template, MODEL_ID)
+
+    service = ExtractionService(config=config)
+    classes = [class_obj["name"] for class_obj in config["classes"]]
+    rng = random.Random(7)
+    tracker = PromptCacheTracker()
+    bedrock_cache = set()
+    totals = {"input": 0, "write": 0, "read": 0, "predicted_read": 0}
+
+    for wave_start in range(0, sections, concurrency):
+        written = set()
+        for index in range(wave_start, min(wave_start + concurrency, sections)):
+            class_label = classes[index % len(classes)]
+            attributes = service._format_attribute_descriptions(
+                service._get_class_attributes(class_label)
+            )
+            content = service._build_content_with_or_without_image_placeholder(
+                template, section_text(rng, text_chars), class_label, attributes, []
+            )
+            system_prompt, content, plan = plan_prompt_cache(
+                MODEL_ID, config["extraction"]["system_prompt"], content, "Extraction"
+            )
+            if isinstance(system_prompt, str):
+                system_prompt = [{"text": system_prompt}]
+            total = estimate_total_tokens(system_prompt, content)
+
+            eligible = [
+                (key, tokens)
+                for key, tokens in plan.checkpoints
+                if tokens >= plan.min_tokens
+            ]
+            read = max(
+                (tokens for key, tokens in eligible if key in bedrock_cache), default=0
+            )
+            write = eligible[-1][1] - read if eligible else 0
+            written.update(key for key, _ in eligible)
+
+            outcome = tracker.record(
+                plan,
+                {
+                    "response": {
+                        "usage": {
+                            "inputTokens": total - read - write,
+                            "cacheReadInputTokens": read,
+                            "cacheWriteInputTokens": write,
+                        }
+                    }
+                },
+            )
+            totals["input"] += total - read - write
+            totals["write"] += write
+            totals["read"] += read
+            totals["predicted_read"] += outcome["predicted_read_tokens"]
+        bedrock_cache.update(written)
+
+    cost = sum(totals[name] * price for name, price in PRICES.items()) / 1e6
+    return totals, cost
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sections", type=int, nargs="+", default=[4, 24])
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8])
+    parser.add_argument("--text-chars", type=int, default=6000)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    with open(CONFIG_PATH) as f:
+        config = yaml.safe_load(f)
+    config["extraction"]["model"] = MODEL_ID
+
+    print(
+        f"{'sections':>8} {'conc':>5} {'mode':>7} {'input':>9} {'cache write':>12} "
+        f"{'cache read':>11} {'pred. read':>11} {'cost ($)':>9} {'vs none':>8}"
+    )
+    for sections in args.sections:
+        for concurrency in args.concurrency:
+            baseline = None
+            for mode in ("none", "auto", "config"):
+                totals, cost = run(config, mode, sections, concurrency, args.text_chars)
+                baseline = baseline or cost
+                print(
+                    f"{sections:>8} {concurrency:>5} {mode:>7} {totals['input']:>9} "
+                    f"{totals['write']:>12} {totals['read']:>11} "
+                    f"{totals['predicted_read']:>11} {cost:>9.4f} {cost / baseline:>8.2f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
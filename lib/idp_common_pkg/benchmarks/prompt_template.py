@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Measure extraction prompt construction time per section, format_prompt vs compiled templates.
+
+Builds a configuration with --classes classes, each with simple, group and list
+attributes, and renders the extraction prompt for --sections sections spread
+over the classes, as ExtractionService does for every section: look up the
+class, format its attribute descriptions and substitute them into the task
+prompt. "previous" is the linear class scan, per-section description formatting
+and format_prompt(); "compiled" goes through get_prompt_sections() and
+render_prompt() with a cold cache at the start of each run. Both modes are
+checked to produce identical prompts.
+
+Usage:
+    python benchmarks/prompt_template.py --classes 100 500 --sections 5000
+"""
+
+import argparse
+import logging
+import random
+import time
+
+from idp_common.bedrock import format_prompt
+from idp_common.bedrock.prompt_template import (
+    clear_prompt_template_cache,
+    get_prompt_sections,
+    get_prompt_template_stats,
+    render_prompt,
+)
+from idp_common.extraction.service import ExtractionService
+
+TASK_PROMPT = (
+    "Extract the following fields from this {DOCUMENT_CLASS} document.\n"
+    "Return a JSON object with 100%% of the listed fields.\n\n"
+    "<attributes>\n{ATTRIBUTE_NAMES_AND_DESCRIPTIONS}\n</attributes>\n\n"
+    + 'Use null for missing values and the format {"field": "value"}. ' * 20
+    + "\n<document>\n{DOCUMENT_TEXT}\n</document>"
+)
+
+
+def build_config(classes: int) -> dict:
+    """Classes with 10 simple, 3 group (5 fields) and 2 list (6 item fields) attributes."""
+    config = {"extraction": {"task_prompt": TASK_PROMPT}, "classes": []}
+    for i in range(classes):
+        attributes = [
+            {"name": f"field_{j}", "description": f"Field {j} of class {i}. " * 3}
+            for j in range(10)
+        ]
+        attributes += [
+            {
+                "name": f"group_{j}",
+                "description": f"Group {j}",
+                "attributeType": "group",
+                "groupAttributes": [
+                    {"name": f"group_{j}_field_{k}", "description": f"Nested {k}. " * 3}
+                    for k in range(5)
+                ],
+            }
+            for j in range(3)
+        ]
+        attributes += [
+            {
+                "name": f"list_{j}",
+                "description": f"List {j}",
+                "attributeType": "list",
+                "listItemTemplate": {
+                    "itemDescription": f"Line item {j}",
+                    "itemAttributes": [
+                        {"name": f"item_{k}", "description": f"Item field {k}. " * 3}
+                        for k in range(6)
+                    ],
+                },
+            }
+            for j in range(2)
+        ]
+        config["classes"].append(
+            {
+                "name": f"Class_{i}",
+                "description": f"Class {i}",
+                "attributes": attributes,
+            }
+        )
+    return config
+
+
+def previous_prompt(service, config, class_label, text):
+    class_config = next(
+        (
+            class_obj
+            for class_obj in config.get("classes", [])
+            if class_obj.get("name", "").lower() == class_label.lower()
+        ),
+        None,
+    )
+    attributes = class_config.get("attributes", []) if class_config else []
+    descriptions = service._format_attribute_descriptions(attributes)
+    return format_prompt(
+        TASK_PROMPT,
+        {
+            "DOCUMENT_TEXT": text,
+            "DOCUMENT_CLASS": class_label,
+            "ATTRIBUTE_NAMES_AND_DESCRIPTIONS": descriptions,
+        },
+        ["DOCUMENT_TEXT"],
+    )
+
+
+def compiled_prompt(service, config, class_label, text):
+    sections = get_prompt_sections(config)
+    class_config = sections.class_config(class_label)
+    attributes = class_config.get("attributes", []) if class_config else []
+    descriptions = sections.get(
+        class_label,
+        "extraction.attributes",
+        lambda: service._format_attribute_descriptions(attributes),
+    )
+    return render_prompt(
+        TASK_PROMPT,
+        {
+            "DOCUMENT_TEXT": text,
+            "DOCUMENT_CLASS": class_label,
+            "ATTRIBUTE_NAMES_AND_DESCRIPTIONS": descriptions,
+        },
+        ["DOCUMENT_TEXT"],
+    )
+
+
+def run(build, service, config, labels, texts):
+    clear_prompt_template_cache()
+    prompts = []
+    start = time.perf_counter()
+    for label, text in zip(labels, texts):
+        prompts.append(build(service, config, label, text))
+    return time.perf_counter() - start, prompts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--classes", type=int, nargs="+", default=[100, 500])
+    parser.add_argument("--sections", type=int, default=5000)
+    parser.add_argument("--text-chars", type=int, default=4000)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    rng = random.Random(7)
+
+    print(
+        f"{'classes':>7} {'sections':>8} {'mode':>9} {'total (ms)':>11} "
+        f"{'per section (us)':>17} {'speedup':>8} {'section hits':>13}"
+    )
+    for classes in args.classes:
+        config = build_config(classes)
+        service = ExtractionService(config=config)
+        labels = [f"class_{rng.randrange(classes)}" for _ in range(args.sections)]
+        texts = [
+            f"Section {i} total 100% {{DOCUMENT_CLASS}} " * (args.text_chars // 40)
+            for i in range(args.sections)
+        ]
+
+        baseline, expected = run(previous_prompt, service, config, labels, texts)
+        elapsed, actual = run(compiled_prompt, service, config, labels, texts)
+        assert actual == expected, "compiled prompts differ from format_prompt()"
+        hits = get_prompt_template_stats()["sections"]["hits"]
+
+        for mode, seconds, section_hits in (
+            ("previous", baseline, "-"),
+            ("compiled", elapsed, hits),
+        ):
+            print(
+                f"{classes:>7} {args.sections:>8} {mode:>9} {seconds * 1000:>11.1f} "
+                f"{seconds / args.sections * 1e6:>17.1f} {baseline / seconds:>8.2f} "
+                f"{section_hits:>13}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Load test of the queue_processor Lambda: workflows started per second.
+
+Loads src/lambda/queue_processor/index.py with stubbed DynamoDB, Step Functions
+and document service clients and drains --messages SQS records through
+--pollers concurrent invocations of --batch-size records each, as the SQS event
+source does under a burst of uploads. Writes to the workflow counter item are
+serialized (one hot item) and cost --counter-latency each; start_execution and
+update_document cost --start-latency and --update-latency. Compares the
+per-record loop with BATCH_ADMISSION (one reservation per batch, concurrent
+starts).
+
+Usage:
+    python benchmarks/queue_processor_admission.py --messages 2000 --pollers 5
+"""
+
+import argparse
+import importlib.util
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from botocore.exceptions import ClientError
+
+LAMBDA_DIR = Path(__file__).resolve().parents[3] / "src/lambda/queue_processor"
+
+
+def load_queue_processor():
+    os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+    os.environ.setdefault("CONCURRENCY_TABLE", "bench-concurrency")
+    os.environ.setdefault(
+        "STATE_MACHINE_ARN", "arn:aws:states:us-east-1:123456789012:stateMachine:b"
+    )
+    os.environ.pop("WORKING_BUCKET", None)
+    spec = importlib.util.spec_from_file_location(
+        "queue_processor_index", LAMBDA_DIR / "index.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    with patch("idp_common.docs_service.create_document_service"):
+        spec.loader.exec_module(module)
+    return module
+
+
+class FakeCounterTable:
+    """The workflow counter item; writes to it are serialized."""
+
+    def __init__(self, latency):
+        self.latency = latency
+        self.active = 0
+        self.writes = 0
+        self._lock = threading.Lock()
+
+    def update_item(self, ExpressionAttributeValues, ConditionExpression=None, **_):
+        with self._lock:
+            time.sleep(self.latency)
+            self.writes += 1
+            inc = ExpressionAttributeValues.get(":inc", 0)
+            if ":dec" in ExpressionAttributeValues:
+                inc = ExpressionAttributeValues[":dec"]
+            if ConditionExpression == "active_count < :max":
+                ok = self.active < ExpressionAttributeValues[":max"]
+            elif ConditionExpression:
+                ok = self.active <= ExpressionAttributeValues[":limit"]
+            else:
+                ok = True
+            if not ok:
+                raise ClientError(
+                    {
+                        "Error": {"Code": "ConditionalCheckFailedException"},
+                        "Item": {"active_count": {"N": str(self.active)}},
+                    },
+                    "UpdateItem",
+                )
+            self.active += inc
+            return {"Attributes": {"active_count": self.active}}
+
+
+def run(index, batch_mode, args):
+    counter = FakeCounterTable(args.counter_latency)
+    sfn = MagicMock()
+    sfn.start_execution.side_effect = lambda **kwargs: (
+        time.sleep(args.start_latency) or {"executionArn": "arn"}
+    )
+    document_service = MagicMock()
+    document_service.update_document.side_effect = lambda doc: time.sleep(
+        args.update_latency
+    )
+
+    messages = queue.Queue()
+    for i in range(args.messages):
+        body = {"id": f"doc{i}.pdf", "input_key": f"doc{i}.pdf", "status": "QUEUED"}
+        messages.put({"messageId": f"m{i}", "body": json.dumps(body)})
+
+    def poller():
+        while True:
+            batch = []
+            while len(batch) < args.batch_size:
+                try:
+                    batch.append(messages.get_nowait())
+                except queue.Empty:
+                    break
+            if not batch:
+                return
+            index.handler({"Records": batch}, None)
+
+    with (
+        patch.object(index, "concurrency_table", counter),
+        patch.object(index, "sfn", sfn),
+        patch.object(index, "document_service", document_service),
+        patch.object(index, "MAX_CONCURRENT", args.messages),
+        patch.object(index, "BATCH_ADMISSION", batch_mode),
+    ):
+        start = time.perf_counter()
+        threads = [threading.Thread(target=poller) for _ in range(args.pollers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+    return sfn.start_execution.call_count, elapsed, counter.writes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--messages", type=int, default=2000)
+    parser.add_argument("--pollers", type=int, default=5)
+    parser.add_argument("--batch-size", type=int, default=50)
+    parser.add_argument("--counter-latency", type=float, default=0.005)
+    parser.add_argument("--start-latency", type=float, default=0.03)
+    parser.add_argument("--update-latency", type=float, default=0.02)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    index = load_queue_processor()
+    print(
+        f"{'mode':<18} {'started':>8} {'seconds':>8} {'workflows/s':>12} "
+        f"{'counter writes':>15}"
+    )
+    for label, batch_mode in (("per record", False), ("batch admission", True)):
+        started, elapsed, writes = run(index, batch_mode, args)
+        print(
+            f"{label:<18} {started:>8} {elapsed:>8.2f} {started / elapsed:>12.1f} "
+            f"{writes:>15}"
+        )
+
+
+if __name__ == "__main__":
+    main()
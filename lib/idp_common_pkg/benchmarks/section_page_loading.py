@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Compare sequential and concurrent loading of section page text and images.
+
+Runs idp_common.utils.page_loader.load_section_pages, which extraction, assessment
+and summarization use to read a section's pages, and reports the "read text" and
+"read images" timings those services log. S3 reads are stubbed with a fixed
+--s3-latency per object; image resizing is real (PIL) on a generated page image.
+--workers 1 reproduces the previous sequential loops.
+
+Usage:
+    python benchmarks/section_page_loading.py --pages 10 40 --workers 1 4 8 16
+"""
+
+import argparse
+import io
+import logging
+import time
+from unittest.mock import patch
+
+from idp_common.models import Document, Page
+from idp_common.utils.page_loader import load_section_pages
+from PIL import Image, ImageDraw
+
+
+def page_image(width: int, height: int) -> bytes:
+    """A JPEG roughly the size of a rasterized page."""
+    img = Image.new("RGB", (width, height), "white")
+    draw = ImageDraw.Draw(img)
+    for y in range(40, height - 40, 30):
+        draw.line((60, y, width - 60, y), fill="black", width=2)
+    buffer = io.BytesIO()
+    img.save(buffer, format="JPEG", quality=90)
+    return buffer.getvalue()
+
+
+def run(pages: int, workers: int, latency: float, image_bytes: bytes):
+    document = Document(id="bench", input_key="bench.pdf")
+    for i in range(1, pages + 1):
+        document.pages[str(i)] = Page(
+            page_id=str(i),
+            parsed_text_uri=f"s3://bench/{i}/result.json",
+            image_uri=f"s3://bench/{i}/image.jpg",
+        )
+
+    def get_text_content(uri):
+        time.sleep(latency)
+        return f"text of {uri}"
+
+    def get_binary_content(uri):
+        time.sleep(latency)
+        return image_bytes
+
+    with (
+        patch("idp_common.s3.get_text_content", side_effect=get_text_content),
+        patch("idp_common.image.get_binary_content", side_effect=get_binary_content),
+    ):
+        return load_section_pages(
+            document,
+            list(document.pages),
+            target_width=951,
+            target_height=1268,
+            max_workers=workers,
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--pages", type=int, nargs="+", default=[10, 40])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4, 8, 16])
+    parser.add_argument("--s3-latency", type=float, default=0.03)
+    parser.add_argument("--image-width", type=int, default=1700)
+    parser.add_argument("--image-height", type=int, default=2200)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    image_bytes = page_image(args.image_width, args.image_height)
+    print(
+        f"{'pages':>6} {'workers':>8} {'read text (s)':>14} "
+        f"{'read images (s)':>16} {'total (s)':>10} {'speedup':>8}"
+    )
+    for pages in args.pages:
+        baseline = None
+        for workers in args.workers:
+            result = run(pages, workers, args.s3_latency, image_bytes)
+            total = result.text_seconds + result.image_seconds
+            baseline = baseline or total
+            print(
+                f"{pages:>6} {workers:>8} {result.text_seconds:>14.2f} "
+                f"{result.image_seconds:>16.2f} {total:>10.2f} {baseline / total:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Measure whole-document summarization wall time and peak memory, single prompt vs hierarchical.
+
+Runs SummarizationService._process_document_as_whole on documents of --pages
+pages of --page-chars characters each. Page reads sleep --s3-latency seconds
+and bedrock.invoke_model is a stub that sleeps --base-latency seconds plus
+input tokens / --tokens-per-second and rejects prompts above --context-tokens,
+as Bedrock does. "single" sends the whole document in one prompt (the default);
+"hierarchical" sets summarization.hierarchical.enabled with --chunk-tokens and
+--workers. Peak memory is the tracemalloc peak of the run.
+
+Usage:
+    python benchmarks/summarization_hierarchical.py --pages 50 500 2000
+"""
+
+import argparse
+import json
+import logging
+import time
+import tracemalloc
+from unittest.mock import patch
+
+from idp_common.models import Document, Page, Status
+from idp_common.summarization.service import SummarizationService
+
+CHARS_PER_TOKEN = 4
+
+
+class StubModel:
+    """bedrock.invoke_model stand-in with latency proportional to input tokens."""
+
+    def __init__(self, base_latency, tokens_per_second, context_tokens):
+        self.base_latency = base_latency
+        self.tokens_per_second = tokens_per_second
+        self.context_tokens = context_tokens
+        self.calls = 0
+
+    def __call__(self, model_id, system_prompt, content, **kwargs):
+        self.calls += 1
+        tokens = sum(len(item.get("text", "")) for item in content) // CHARS_PER_TOKEN
+        if tokens > self.context_tokens:
+            raise ValueError(f"Input is too long for requested model ({tokens} tokens)")
+        time.sleep(self.base_latency + tokens / self.tokens_per_second)
+        text = json.dumps(
+            {"summary": "## Summary\n" + "Key point [Cite-1, Page-1]. " * 40}
+        )
+        return {
+            "response": {"output": {"message": {"content": [{"text": text}]}}},
+            "metering": {f"Summarization/bedrock/{model_id}": {"inputTokens": tokens}},
+        }
+
+
+def make_document(pages: int) -> Document:
+    document = Document(
+        id="bench",
+        input_key="bench.pdf",
+        output_bucket="bench-output",
+        status=Status.SUMMARIZING,
+    )
+    document.pages = {
+        str(i): Page(page_id=str(i), parsed_text_uri=f"s3://bench/{i}/result.json")
+        for i in range(1, pages + 1)
+    }
+    return document
+
+
+def run(mode, pages, args):
+    service = SummarizationService(
+        config={
+            "summarization": {
+                "model": "us.amazon.nova-pro-v1:0",
+                "system_prompt": "You summarize documents.",
+                "task_prompt": "<document-text>\n{DOCUMENT_TEXT}\n</document-text>",
+                "hierarchical": {
+                    "enabled": mode == "hierarchical",
+                    "chunk_tokens": args.chunk_tokens,
+                    "max_workers": args.workers,
+                },
+            }
+        }
+    )
+    model = StubModel(args.base_latency, args.tokens_per_second, args.context_tokens)
+    page_text = "Statement line with an amount and a date. " * (args.page_chars // 42)
+
+    def read_page(uri):
+        time.sleep(args.s3_latency)
+        return page_text
+
+    document = make_document(pages)
+    tracemalloc.start()
+    start = time.perf_counter()
+    with (
+        patch(
+            "idp_common.utils.page_loader.s3.get_text_content", side_effect=read_page
+        ),
+        patch("idp_common.summarization.service.s3.write_content"),
+        patch("idp_common.bedrock.invoke_model", model),
+    ):
+        try:
+            service._process_document_as_whole(document)
+            outcome = "ok"
+        except ValueError as e:
+            outcome = "too long" if "too long" in str(e) else str(e)
+    seconds = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return outcome, model.calls, seconds, peak / 1024 / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--pages", type=int, nargs="+", default=[50, 500, 2000])
+    parser.add_argument("--page-chars", type=int, default=3000)
+    parser.add_argument("--s3-latency", type=float, default=0.02)
+    parser.add_argument("--base-latency", type=float, default=0.5)
+    parser.add_argument("--tokens-per-second", type=float, default=100000)
+    parser.add_argument("--context-tokens", type=int, default=200000)
+    parser.add_argument("--chunk-tokens", type=int, default=30000)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    logging.disable(logging.ERROR)
+
+    print(
+        f"{'pages':>6} {'mode':>12} {'outcome':>9} {'calls':>6} "
+        f"{'wall (s)':>9} {'peak (MB)':>10}"
+    )
+    for pages in args.pages:
+        for mode in ("single", "hierarchical"):
+            outcome, calls, seconds, peak_mb = run(mode, pages, args)
+            print(
+                f"{pages:>6} {mode:>12} {outcome:>9} {calls:>6} "
+                f"{seconds:>9.2f} {peak_mb:>10.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Compare per-page and asynchronous Textract OCR on API call count and wall time.
+
+A local stub Textract server speaks the Textract JSON protocol, so OcrService uses
+a real boto3 client (pointed at the stub with AWS_ENDPOINT_URL_TEXTRACT). Each
+synchronous call sleeps for --call-latency seconds; asynchronous jobs finish after
+--job-base-seconds plus --job-seconds-per-page. S3 is stubbed in-process.
+
+Usage:
+    python benchmarks/textract_async_vs_per_page.py --pages 20 100 300
+"""
+
+import argparse
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+import uuid
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import MagicMock, patch
+
+LINES_PER_PAGE = 40
+
+
+def page_blocks(page: int):
+    """Blocks for one page: a PAGE block plus LINES_PER_PAGE lines."""
+    blocks = [{"BlockType": "PAGE", "Id": f"p{page}", "Page": page}]
+    blocks.extend(
+        {
+            "BlockType": "LINE",
+            "Id": f"p{page}-l{i}",
+            "Text": f"Page {page} line {i}",
+            "Confidence": 99.0,
+            "Page": page,
+        }
+        for i in range(LINES_PER_PAGE)
+    )
+    return blocks
+
+
+class StubTextract:
+    """In-memory Textract job state shared by the HTTP handler threads."""
+
+    def __init__(self, call_latency, job_base_seconds, job_seconds_per_page):
+        self.call_latency = call_latency
+        self.job_base_seconds = job_base_seconds
+        self.job_seconds_per_page = job_seconds_per_page
+        self.document_pages = 0
+        self.jobs = {}
+        self.calls = Counter()
+        self.lock = threading.Lock()
+
+    def handle(self, operation, request):
+        with self.lock:
+            self.calls[operation] += 1
+        if operation in ("DetectDocumentText", "AnalyzeDocument"):
+            time.sleep(self.call_latency)
+            return {
+                "DocumentMetadata": {"Pages": 1},
+                "Blocks": page_blocks(1),
+                "DetectDocumentTextModelVersion": "1.0",
+            }
+        if operation in ("StartDocumentTextDetection", "StartDocumentAnalysis"):
+            job_id = uuid.uuid4().hex
+            duration = (
+                self.job_base_seconds + self.job_seconds_per_page * self.document_pages
+            )
+            self.jobs[job_id] = (time.monotonic() + duration, self.document_pages)
+            return {"JobId": job_id}
+        if operation in ("GetDocumentTextDetection", "GetDocumentAnalysis"):
+            time.sleep(self.call_latency / 10)
+            ready_at, pages = self.jobs[request["JobId"]]
+            if time.monotonic() < ready_at:
+                return {"JobStatus": "IN_PROGRESS"}
+            blocks = [b for page in range(1, pages + 1) for b in page_blocks(page)]
+            start = int(request.get("NextToken") or 0)
+            end = start + request.get("MaxResults", 1000)
+            response = {
+                "JobStatus": "SUCCEEDED",
+                "DocumentMetadata": {"Pages": pages},
+                "DetectDocumentTextModelVersion": "1.0",
+                "Blocks": blocks[start:end],
+            }
+            if end < len(blocks):
+                response["NextToken"] = str(end)
+            return response
+        raise ValueError(f"Unsupported operation {operation}")
+
+
+def start_server(stub):
+    """Serve the stub on a free local port and return the server."""
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            operation = self.headers["X-Amz-Target"].split(".")[-1]
+            length = int(self.headers.get("Content-Length", 0))
+            request = json.loads(self.rfile.read(length) or b"{}")
+            body = json.dumps(stub.handle(operation, request)).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/x-amz-json-1.1")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def build_pdf(path, pages):
+    """Write a text-only PDF with the given number of pages."""
+    import fitz
+
+    doc = fitz.open()
+    for page_number in range(1, pages + 1):
+        page = doc.new_page(width=612, height=792)
+        for line in range(LINES_PER_PAGE):
+            page.insert_text((72, 72 + line * 16), f"Page {page_number} line {line}")
+    doc.save(path)
+    doc.close()
+
+
+def run(stub, pdf_path, pages, page_threshold, workers, poll_interval):
+    """OCR the PDF once and return (api calls by operation, wall seconds, result)."""
+    from idp_common.models import Document
+    from idp_common.ocr.service import OcrService
+
+    stub.document_pages = pages
+    stub.calls.clear()
+    service = OcrService(
+        region="us-east-1",
+        config={
+            "ocr": {
+                "backend": "textract",
+                "max_workers": workers,
+                "textract_async": {
+                    "page_threshold": page_threshold,
+                    "poll_interval_seconds": poll_interval,
+                },
+            }
+        },
+    )
+    service.s3_client = MagicMock()
+    service.s3_client.get_object.side_effect = lambda **kwargs: {
+        "Body": open(pdf_path, "rb")
+    }
+    document = Document(
+        id="bench", input_bucket="input", input_key="bench.pdf", output_bucket="output"
+    )
+    start = time.perf_counter()
+    with patch("idp_common.s3.write_content"):
+        result = service.process_document(document)
+    return dict(stub.calls), time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--pages", type=int, nargs="+", default=[20, 100, 300])
+    parser.add_argument("--workers", type=int, default=20)
+    parser.add_argument("--call-latency", type=float, default=0.5)
+    parser.add_argument("--job-base-seconds", type=float, default=3.0)
+    parser.add_argument("--job-seconds-per-page", type=float, default=0.02)
+    parser.add_argument("--poll-interval", type=float, default=1.0)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    stub = StubTextract(
+        args.call_latency, args.job_base_seconds, args.job_seconds_per_page
+    )
+    server = start_server(stub)
+    os.environ["AWS_ENDPOINT_URL_TEXTRACT"] = f"http://127.0.0.1:{server.server_port}"
+    os.environ.setdefault("AWS_ACCESS_KEY_ID", "benchmark")
+    os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "benchmark")
+
+    print(
+        f"{'pages':>6} {'mode':<9} {'API calls':>10} {'wall (s)':>9}  calls by operation"
+    )
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            for pages in args.pages:
+                pdf_path = os.path.join(tmp, f"synthetic-{pages}.pdf")
+                build_pdf(pdf_path, pages)
+                for mode, threshold in (("per-page", 0), ("async", 1)):
+                    calls, wall, result = run(
+                        stub,
+                        pdf_path,
+                        pages,
+                        threshold,
+                        args.workers,
+                        args.poll_interval,
+                    )
+                    assert len(result.pages) == pages, result.errors
+                    print(
+                        f"{pages:>6} {mode:<9} {sum(calls.values()):>10} {wall:>9.2f}  "
+                        f"{calls}"
+                    )
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -22,6 +22,7 @@ from typing import Any, Dict, List, Optional, Tuple
 from idp_common import bedrock, image, metrics, s3, utils
 from idp_common.models import Document, Status
 from idp_common.utils import check_token_limit, extract_json_from_text
+from idp_common.utils.page_loader import get_page_read_workers, load_section_pages
 
 logger = logging.getLogger(__name__)
 
@@ -172,14 +173,8 @@ class GranularAssessmentService:
         Returns:
             List of attribute configurations
         """
-        classes_config = self.config.get("classes", [])
-        class_config = next(
-            (
-                class_obj
-                for class_obj in classes_config
-                if class_obj.get("name", "").lower() == class_label.lower()
-            ),
-            None,
+        class_config = bedrock.get_prompt_sections(self.config).class_config(
+            class_label
         )
         return class_config.get("attributes", []) if class_config else []
 
@@ -337,8 +332,17 @@ class GranularAssessmentService:
         Returns:
             List of content items for the cacheable portion
         """
-        # Get the base task prompt template
-        task_prompt_template = self.assessment_config.get("task_prompt", "")
+        # Get the base task prompt template. Without explicit cache points, one goes
+        # before the section content and one before the task-specific content.
+        task_prompt_template = bedrock.apply_cache_points(
+            self.assessment_config.get("task_prompt", ""),
+            self.config.get("model_id") or self.assessment_config.get("model"),
+            enabled=self.assessment_config.get("auto_cachepoint", True),
+            boundaries=(
+                bedrock.prompt_cache.DOCUMENT_PLACEHOLDERS,
+                bedrock.prompt_cache.TASK_PLACEHOLDERS,
+            ),
+        )
 
         if not task_prompt_template:
             raise ValueError(
@@ -404,7 +408,10 @@ class GranularAssessmentService:
         return content
 
     def _get_task_specific_attribute_descriptions(
-        self, task: AssessmentTask, all_attributes: List[Dict[str, Any]]
+        self,
+        task: AssessmentTask,
+        all_attributes: List[Dict[str, Any]],
+        class_label: Optional[str] = None,
     ) -> str:
         """
         Get attribute descriptions specific to this task.
@@ -412,10 +419,26 @@ class GranularAssessmentService:
         Args:
             task: The assessment task
             all_attributes: All attribute configurations
+            class_label: Class that all_attributes belong to. When given, the
+                descriptions are memoized per class and task attributes.
 
         Returns:
             Formatted attribute descriptions for this specific task
         """
+        if class_label is None:
+            return self._format_task_attribute_descriptions(task, all_attributes)
+
+        # List item tasks of the same list share one entry
+        return bedrock.get_prompt_sections(self.config).get(
+            class_label,
+            ("granular_assessment.task", task.task_type, tuple(task.attributes)),
+            lambda: self._format_task_attribute_descriptions(task, all_attributes),
+        )
+
+    def _format_task_attribute_descriptions(
+        self, task: AssessmentTask, all_attributes: List[Dict[str, Any]]
+    ) -> str:
+        """Format the attribute descriptions for a task (see _get_task_specific_attribute_descriptions)."""
         if task.task_type == "simple_batch":
             # For simple batches, include only the attributes in this batch
             task_attributes = [
@@ -465,6 +488,7 @@ class GranularAssessmentService:
         task: AssessmentTask,
         base_content: List[Dict[str, Any]],
         all_attributes: List[Dict[str, Any]],
+        class_label: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
         """
         Build the specific assessment prompt for a task by replacing the {EXTRACTION_RESULTS} placeholder
@@ -474,6 +498,7 @@ class GranularAssessmentService:
             task: The assessment task
             base_content: The cached base content (which has empty {EXTRACTION_RESULTS})
             all_attributes: All attribute configurations for task-specific filtering
+            class_label: Class that all_attributes belong to (enables memoized descriptions)
 
         Returns:
             Complete content list for the assessment
@@ -494,7 +519,7 @@ class GranularAssessmentService:
 
         # Get task-specific attribute descriptions
         task_specific_attributes = self._get_task_specific_attribute_descriptions(
-            task, all_attributes
+            task, all_attributes, class_label
         )
 
         # Create a new content list by replacing placeholders in the base content
@@ -674,6 +699,7 @@ class GranularAssessmentService:
         top_k: float,
         top_p: float,
         max_tokens: Optional[int],
+        class_label: Optional[str] = None,
     ) -> AssessmentResult:
         """
         Process a single assessment task.
@@ -688,6 +714,7 @@ class GranularAssessmentService:
             top_k: Top-k parameter
             top_p: Top-p parameter
             max_tokens: Max tokens parameter
+            class_label: Class that all_attributes belong to
 
         Returns:
             Assessment result
@@ -697,7 +724,7 @@ class GranularAssessmentService:
         try:
             # Build the complete prompt
             content = self._build_specific_assessment_prompt(
-                task, base_content, all_attributes
+                task, base_content, all_attributes, class_label
             )
 
             logger.debug(
@@ -705,6 +732,9 @@ class GranularAssessmentService:
             )
 
             # Invoke Bedrock
+            system_prompt, content, cache_plan = bedrock.plan_prompt_cache(
+                model_id, system_prompt, content, context="GranularAssessment"
+            )
             response_with_metering = bedrock.invoke_model(
                 model_id=model_id,
                 system_prompt=system_prompt,
@@ -715,6 +745,7 @@ class GranularAssessmentService:
                 max_tokens=max_tokens,
                 context="GranularAssessment",
             )
+            bedrock.record_prompt_cache_usage(cache_plan, response_with_metering)
 
             # Extract text from response
             assessment_text = bedrock.extract_text_from_response(response_with_metering)
@@ -1466,45 +1497,26 @@ class GranularAssessmentService:
             t1 = time.time()
             logger.info(f"Time taken to read extraction results: {t1 - t0:.2f} seconds")
 
-            # Read document text from all pages in order
-            document_texts = []
-            for page_id in sorted_page_ids:
-                if page_id not in document.pages:
-                    error_msg = f"Page {page_id} not found in document"
-                    logger.error(error_msg)
-                    document.errors.append(error_msg)
-                    continue
-
-                page = document.pages[page_id]
-                text_path = page.parsed_text_uri
-                page_text = s3.get_text_content(text_path)
-                document_texts.append(page_text)
-
-            document_text = "\n".join(document_texts)
-            t2 = time.time()
-            logger.info(f"Time taken to read text content: {t2 - t1:.2f} seconds")
-
-            # Read page images with configurable dimensions
+            # Read document text and page images with configurable dimensions,
+            # fetching all pages concurrently
             assessment_config = self.assessment_config
             image_config = assessment_config.get("image", {})
-            target_width = image_config.get("target_width")
-            target_height = image_config.get("target_height")
-
-            page_images = []
-            for page_id in sorted_page_ids:
-                if page_id not in document.pages:
-                    continue
-
-                page = document.pages[page_id]
-                image_uri = page.image_uri
-                # Just pass the values directly - prepare_image handles empty strings/None
-                image_content = image.prepare_image(
-                    image_uri, target_width, target_height
-                )
-                page_images.append(image_content)
-
+            section_pages = load_section_pages(
+                document,
+                sorted_page_ids,
+                target_width=image_config.get("target_width"),
+                target_height=image_config.get("target_height"),
+                max_workers=get_page_read_workers(assessment_config),
+            )
+            document_text = "\n".join(section_pages.texts)
+            page_images = section_pages.images
             t3 = time.time()
-            logger.info(f"Time taken to read images: {t3 - t2:.2f} seconds")
+            logger.info(
+                f"Time taken to read text content: {section_pages.text_seconds:.2f} seconds"
+            )
+            logger.info(
+                f"Time taken to read images: {section_pages.image_seconds:.2f} seconds"
+            )
 
             # Read text confidence data for confidence information
             ocr_text_confidence = ""
@@ -1621,6 +1633,7 @@ class GranularAssessmentService:
                                 top_k,
                                 top_p,
                                 max_tokens,
+                                class_label,
                             ): task
                             for task in tasks_to_process
                         }
@@ -1673,6 +1686,7 @@ class GranularAssessmentService:
                                 top_k,
                                 top_p,
                                 max_tokens,
+                                class_label,
                             )
                             all_task_results.append(result)
 
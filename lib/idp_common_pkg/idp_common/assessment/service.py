@@ -22,6 +22,7 @@ from typing import Any, Dict, List
 from idp_common import bedrock, image, metrics, s3, utils
 from idp_common.models import Document
 from idp_common.utils import extract_json_from_text
+from idp_common.utils.page_loader import get_page_read_workers, load_section_pages
 
 logger = logging.getLogger(__name__)
 
@@ -97,14 +98,8 @@ class AssessmentService:
         Returns:
             List of attribute configurations
         """
-        classes_config = self.config.get("classes", [])
-        class_config = next(
-            (
-                class_obj
-                for class_obj in classes_config
-                if class_obj.get("name", "").lower() == class_label.lower()
-            ),
-            None,
+        class_config = bedrock.get_prompt_sections(self.config).class_config(
+            class_label
         )
         return class_config.get("attributes", []) if class_config else []
 
@@ -371,9 +366,9 @@ class AssessmentService:
         Raises:
             ValueError: If a required placeholder is missing from the template
         """
-        from idp_common.bedrock import format_prompt
-
-        return format_prompt(prompt_template, substitutions, required_placeholders)
+        return bedrock.render_prompt(
+            prompt_template, substitutions, required_placeholders
+        )
 
     def _build_content_with_or_without_image_placeholder(
         self,
@@ -816,45 +811,26 @@ class AssessmentService:
             t1 = time.time()
             logger.info(f"Time taken to read extraction results: {t1 - t0:.2f} seconds")
 
-            # Read document text from all pages in order
-            document_texts = []
-            for page_id in sorted_page_ids:
-                if page_id not in document.pages:
-                    error_msg = f"Page {page_id} not found in document"
-                    logger.error(error_msg)
-                    document.errors.append(error_msg)
-                    continue
-
-                page = document.pages[page_id]
-                text_path = page.parsed_text_uri
-                page_text = s3.get_text_content(text_path)
-                document_texts.append(page_text)
-
-            document_text = "\n".join(document_texts)
-            t2 = time.time()
-            logger.info(f"Time taken to read text content: {t2 - t1:.2f} seconds")
-
-            # Read page images with configurable dimensions
+            # Read document text and page images with configurable dimensions,
+            # fetching all pages concurrently
             assessment_config = self.config.get("assessment", {})
             image_config = assessment_config.get("image", {})
-            target_width = image_config.get("target_width")
-            target_height = image_config.get("target_height")
-
-            page_images = []
-            for page_id in sorted_page_ids:
-                if page_id not in document.pages:
-                    continue
-
-                page = document.pages[page_id]
-                image_uri = page.image_uri
-                # Just pass the values directly - prepare_image handles empty strings/None
-                image_content = image.prepare_image(
-                    image_uri, target_width, target_height
-                )
-                page_images.append(image_content)
-
+            section_pages = load_section_pages(
+                document,
+                sorted_page_ids,
+                target_width=image_config.get("target_width"),
+                target_height=image_config.get("target_height"),
+                max_workers=get_page_read_workers(assessment_config),
+            )
+            document_text = "\n".join(section_pages.texts)
+            page_images = section_pages.images
             t3 = time.time()
-            logger.info(f"Time taken to read images: {t3 - t2:.2f} seconds")
+            logger.info(
+                f"Time taken to read text content: {section_pages.text_seconds:.2f} seconds"
+            )
+            logger.info(
+                f"Time taken to read images: {section_pages.image_seconds:.2f} seconds"
+            )
 
             # Read text confidence data for confidence information
             ocr_text_confidence = ""
@@ -893,10 +869,18 @@ class AssessmentService:
 
             # Get attributes for this document class
             attributes = self._get_class_attributes(class_label)
-            attribute_descriptions = self._format_attribute_descriptions(attributes)
+            attribute_descriptions = bedrock.get_prompt_sections(self.config).get(
+                class_label,
+                "assessment.attributes",
+                lambda: self._format_attribute_descriptions(attributes),
+            )
 
             # Prepare prompt
-            prompt_template = assessment_config.get("task_prompt", "")
+            prompt_template = bedrock.apply_cache_points(
+                assessment_config.get("task_prompt", ""),
+                model_id,
+                enabled=assessment_config.get("auto_cachepoint", True),
+            )
             extraction_results_str = json.dumps(extraction_results, indent=2)
 
             if not prompt_template:
@@ -929,6 +913,9 @@ class AssessmentService:
             request_start_time = time.time()
 
             # Invoke Bedrock with the common library
+            system_prompt, content, cache_plan = bedrock.plan_prompt_cache(
+                model_id, system_prompt, content, context="Assessment"
+            )
             response_with_metering = bedrock.invoke_model(
                 model_id=model_id,
                 system_prompt=system_prompt,
@@ -939,6 +926,7 @@ class AssessmentService:
                 max_tokens=max_tokens,
                 context="Assessment",
             )
+            bedrock.record_prompt_cache_usage(cache_plan, response_with_metering)
 
             total_duration = time.time() - request_start_time
             logger.info(f"Time taken for assessment: {total_duration:.2f} seconds")
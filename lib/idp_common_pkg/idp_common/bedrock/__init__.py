@@ -4,6 +4,32 @@
 """Bedrock integration module for IDP Common package."""
 
 from .client import BedrockClient, invoke_model, default_client
+from .rate_limiter import ModelRateGovernor, configure_model_limits, get_governor
+from .response_cache import (
+    ResponseCache,
+    MemoryResponseCache,
+    DiskResponseCache,
+    S3ResponseCache,
+    DynamoDBResponseCache,
+    create_response_cache
+)
+from .embedding_cache import EmbeddingService, get_embedding_service
+from .prompt_cache import (
+    PromptCachePlan,
+    apply_cache_points,
+    plan_prompt_cache,
+    record_prompt_cache_usage,
+    get_prompt_cache_stats
+)
+from .prompt_template import (
+    PromptTemplate,
+    PromptSections,
+    compile_prompt_template,
+    render_prompt,
+    get_prompt_sections,
+    get_prompt_template_stats,
+    clear_prompt_template_cache
+)
 
 # Add version info
 __version__ = "0.1.0"
@@ -12,7 +38,30 @@ __version__ = "0.1.0"
 __all__ = [
     "BedrockClient",
     "invoke_model",
-    "default_client"
+    "default_client",
+    "ModelRateGovernor",
+    "configure_model_limits",
+    "get_governor",
+    "ResponseCache",
+    "MemoryResponseCache",
+    "DiskResponseCache",
+    "S3ResponseCache",
+    "DynamoDBResponseCache",
+    "create_response_cache",
+    "EmbeddingService",
+    "get_embedding_service",
+    "PromptCachePlan",
+    "apply_cache_points",
+    "plan_prompt_cache",
+    "record_prompt_cache_usage",
+    "get_prompt_cache_stats",
+    "PromptTemplate",
+    "PromptSections",
+    "compile_prompt_template",
+    "render_prompt",
+    "get_prompt_sections",
+    "get_prompt_template_stats",
+    "clear_prompt_template_cache"
 ]
 
 # Re-export key functions from the default client for backward compatibility
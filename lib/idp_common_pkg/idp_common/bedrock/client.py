@@ -27,6 +27,14 @@ except ImportError:
     RequestsReadTimeout = Exception
     RequestsConnectTimeout = Exception
 
+from .rate_limiter import (
+    DEFAULT_METRICS_INTERVAL_SECONDS,
+    estimate_request_tokens,
+    get_governor,
+    is_rate_limiting_enabled,
+)
+from .response_cache import ResponseCache, get_response_cache_from_env, make_cache_key
+
 logger = logging.getLogger(__name__)
 
 # Default retry settings
@@ -49,6 +57,14 @@ CACHEPOINT_SUPPORTED_MODELS = [
     "us.amazon.nova-pro-v1:0"
 ]
 
+# Error codes that indicate Bedrock is throttling this caller
+THROTTLING_ERROR_CODES = [
+    'ThrottlingException',
+    'ServiceQuotaExceededException',
+    'RequestLimitExceeded',
+    'TooManyRequestsException'
+]
+
 class BedrockClient:
     """Client for interacting with Amazon Bedrock models."""
     
@@ -58,7 +74,9 @@ class BedrockClient:
         max_retries: int = DEFAULT_MAX_RETRIES,
         initial_backoff: float = DEFAULT_INITIAL_BACKOFF,
         max_backoff: float = DEFAULT_MAX_BACKOFF,
-        metrics_enabled: bool = True
+        metrics_enabled: bool = True,
+        rate_limiting_enabled: Optional[bool] = None,
+        response_cache: Optional[ResponseCache] = None
     ):
         """
         Initialize a Bedrock client.
@@ -69,12 +87,18 @@ class BedrockClient:
             initial_backoff: Initial backoff time in seconds
             max_backoff: Maximum backoff time in seconds
             metrics_enabled: Whether to publish metrics
+            rate_limiting_enabled: Whether to gate converse calls through the shared
+                per-model rate governor (defaults to BEDROCK_RATE_LIMITING_ENABLED env var)
+            response_cache: Optional response cache backend (defaults to the cache
+                configured by the BEDROCK_RESPONSE_CACHE env var, if any)
         """
         self.region = region or os.environ.get('AWS_REGION')
         self.max_retries = max_retries
         self.initial_backoff = initial_backoff
         self.max_backoff = max_backoff
         self.metrics_enabled = metrics_enabled
+        self.rate_limiting_enabled = rate_limiting_enabled
+        self.response_cache = response_cache
         self._client = None
         
     @property
@@ -361,6 +385,17 @@ class BedrockClient:
         if guardrail_config:
             converse_params["guardrailConfig"] = guardrail_config
         
+        # Serve identical requests from the response cache when one is configured
+        response_cache = self._get_response_cache()
+        cache_key = None
+        if response_cache is not None:
+            cache_key = make_cache_key(converse_params)
+            cached_response = response_cache.get(cache_key)
+            self._put_response_cache_metrics(cached_response is not None)
+            if cached_response is not None:
+                logger.info(f"Bedrock response cache hit for {model_id} (key {cache_key[:12]})")
+                return self._build_cached_result(cached_response, model_id, context)
+        
         # Start timing the entire request
         request_start_time = time.time()
         
@@ -374,8 +409,44 @@ class BedrockClient:
             context=context
         )
         
+        if response_cache is not None and 'output' in result.get('response', {}):
+            response_cache.put(cache_key, result['response'])
+        
         return result
 
+    def _get_response_cache(self) -> Optional[ResponseCache]:
+        """Get the instance response cache or the process-wide one from the environment."""
+        if self.response_cache is not None:
+            return self.response_cache
+        return get_response_cache_from_env()
+
+    def _build_cached_result(self, cached_response: Dict[str, Any], model_id: str, context: str) -> Dict[str, Any]:
+        """
+        Wrap a cached response like a live one, with zeroed metering so that
+        cached calls are not billed twice.
+        
+        Args:
+            cached_response: The cached converse response
+            model_id: The Bedrock model ID
+            context: Context prefix for the metering key
+            
+        Returns:
+            Response object with zeroed metering and a cache_hit flag
+        """
+        usage = cached_response.get('usage', {})
+        return {
+            "response": cached_response,
+            "metering": {
+                f"{context}/bedrock/{model_id}": {key: 0 for key in usage}
+            },
+            "cache_hit": True
+        }
+
+    def _put_response_cache_metrics(self, hit: bool) -> None:
+        """Publish response cache hit/miss metrics; the average of the ratio metric is the hit ratio."""
+        self._put_metric('BedrockResponseCacheHits' if hit else 'BedrockResponseCacheMisses', 1)
+        self._put_metric('BedrockResponseCacheHitRatio', 100 if hit else 0, 'Percent')
+
     def _invoke_with_retry(
         self,
         model_id: str,
@@ -423,8 +494,8 @@ class BedrockClient:
             # Start timing this attempt
             attempt_start_time = time.time()
 
-            # Make the API call
-            response = self.client.converse(**converse_params)
+            # Make the API call, gated by the shared rate governor when enabled
+            response = self._converse_with_governor(model_id, converse_params)
             
             # Calculate duration
             duration = time.time() - attempt_start_time
@@ -563,6 +634,74 @@ class BedrockClient:
             self._put_metric('BedrockUnexpectedErrors', 1)
             raise
 
+    def _is_rate_limiting_enabled(self) -> bool:
+        """Check whether the shared rate governor should gate requests."""
+        if self.rate_limiting_enabled is not None:
+            return self.rate_limiting_enabled
+        return is_rate_limiting_enabled()
+
+    def _converse_with_governor(self, model_id: str, converse_params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Call converse, waiting for a slot from the per-model rate governor if enabled.
+        
+        The governor shrinks its concurrency limit when the call is throttled and
+        grows it back on success; its state is published as metrics.
+        
+        Args:
+            model_id: The Bedrock model ID (used as the governor key)
+            converse_params: Parameters for the Bedrock converse API call
+            
+        Returns:
+            Raw converse response
+        """
+        if not self._is_rate_limiting_enabled():
+            return self.client.converse(**converse_params)
+        
+        governor = get_governor(model_id)
+        estimated_tokens = estimate_request_tokens(converse_params)
+        wait_seconds = governor.acquire(estimated_tokens)
+        self._put_governor_metrics(governor, wait_seconds)
+        
+        success = False
+        actual_tokens = None
+        try:
+            response = self.client.converse(**converse_params)
+            success = True
+            actual_tokens = response.get('usage', {}).get('totalTokens')
+            return response
+        except ClientError as e:
+            if e.response.get('Error', {}).get('Code') in THROTTLING_ERROR_CODES:
+                governor.on_throttle()
+            raise
+        finally:
+            governor.release(success=success, estimated_tokens=estimated_tokens, actual_tokens=actual_tokens)
+
+    def _put_governor_metrics(self, governor, wait_seconds: float) -> None:
+        """
+        Publish the rate governor state (limit, queue depth, wait time).
+        
+        With the buffered metrics emitter every call is recorded, since that only
+        updates an in-memory aggregate. Otherwise each metric would be a synchronous
+        PutMetricData request, so the state is published only when the concurrency
+        limit changes or every BEDROCK_GOVERNOR_METRICS_INTERVAL_SECONDS (default 60),
+        with the longest wait since the previous report.
+        """
+        if not self.metrics_enabled:
+            return
+        from ..metrics import get_metrics_buffer
+        if get_metrics_buffer() is not None:
+            state = governor.get_state()
+        else:
+            interval = float(os.environ.get('BEDROCK_GOVERNOR_METRICS_INTERVAL_SECONDS',
+                                            DEFAULT_METRICS_INTERVAL_SECONDS))
+            state = governor.collect_metrics(interval)
+            if state is None:
+                return
+            wait_seconds = state['max_wait_seconds']
+        dimensions = [{'Name': 'ModelId', 'Value': governor.model_id}]
+        self._put_metric('BedrockGovernorWaitTime', wait_seconds * 1000, 'Milliseconds', dimensions)
+        self._put_metric('BedrockGovernorConcurrencyLimit', state['concurrency_limit'], 'Count', dimensions)
+        self._put_metric('BedrockGovernorQueueDepth', state['queue_depth'], 'Count', dimensions)
     
     def get_guardrail_config(self) -> Optional[Dict[str, str]]:
         """
@@ -822,7 +961,8 @@ class BedrockClient:
         
         return backoff_seconds + jitter
     
-    def _put_metric(self, metric_name: str, value: Union[int, float], unit: str = 'Count'):
+    def _put_metric(self, metric_name: str, value: Union[int, float], unit: str = 'Count',
+                    dimensions: Optional[List[Dict[str, str]]] = None):
         """
         Publish a metric if metrics are enabled.
         
@@ -830,11 +970,15 @@ class BedrockClient:
             metric_name: Name of the metric
             value: Metric value
             unit: Metric unit (default: Count)
+            dimensions: Optional list of metric dimensions
         """
         if self.metrics_enabled:
             try:
                 from ..metrics import put_metric
-                put_metric(metric_name, value, unit)
+                if dimensions:
+                    put_metric(metric_name, value, unit, dimensions)
+                else:
+                    put_metric(metric_name, value, unit)
             except Exception as e:
                 logger.warning(f"Failed to publish metric {metric_name}: {str(e)}")
     
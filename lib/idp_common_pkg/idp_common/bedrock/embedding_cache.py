@@ -0,0 +1,287 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Caching embedding service on top of BedrockClient.generate_embedding.
+
+Embeddings are keyed on the model ID and the whitespace-normalized text (the same
+normalization generate_embedding applies before calling Bedrock), so repeated
+values within a document, across sections and across evaluation runs are embedded
+once. Lookups go through:
+
+1. An in-process LRU of vectors
+2. Requests already in flight for the same key (concurrent callers wait for the
+   first request instead of calling Bedrock again)
+3. An optional persistent backend, reusing the response cache backends
+   (disk, S3, DynamoDB)
+4. BedrockClient.generate_embedding
+"""
+
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence
+
+from .response_cache import ResponseCache, create_response_cache
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_EMBEDDING_MODEL = 'amazon.titan-embed-text-v1'
+DEFAULT_MAX_ENTRIES = 4096
+DEFAULT_BATCH_WORKERS = 8
+
+_STAT_FIELDS = ('requests', 'memory_hits', 'persistent_hits', 'coalesced', 'bedrock_calls', 'errors')
+
+
+def normalize_text(text: str) -> str:
+    """Collapse whitespace the same way BedrockClient.generate_embedding does."""
+    return ' '.join(text.split())
+
+
+def make_embedding_key(model_id: str, normalized_text: str) -> str:
+    """
+    Build a stable cache key for an embedding request.
+
+    Args:
+        model_id: Embedding model ID
+        normalized_text: Text after normalize_text()
+
+    Returns:
+        Hex SHA-256 digest of the model ID and text
+    """
+    payload = f"embedding\n{model_id}\n{normalized_text}"
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class EmbeddingService:
+    """
+    Embedding lookups with an LRU, request coalescing and an optional persistent cache.
+
+    Safe to share between threads. Statistics are cumulative; use stats_delta() to
+    report on a single run.
+    """
+
+    def __init__(self, client=None, max_entries: int = DEFAULT_MAX_ENTRIES,
+                 persistent_cache: Optional[ResponseCache] = None,
+                 max_batch_workers: int = DEFAULT_BATCH_WORKERS):
+        """
+        Initialize the embedding service.
+
+        Args:
+            client: BedrockClient used for cache misses (defaults to the shared default client)
+            max_entries: Maximum number of vectors kept in memory
+            persistent_cache: Optional response cache backend for vectors
+            max_batch_workers: Maximum concurrent Bedrock calls made by embed_many()
+        """
+        self._client = client
+        self.max_entries = max_entries
+        self.persistent_cache = persistent_cache
+        self.max_batch_workers = max_batch_workers
+        self._entries: 'OrderedDict[str, List[float]]' = OrderedDict()
+        self._in_flight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._stats = dict.fromkeys(_STAT_FIELDS, 0)
+
+    @property
+    def client(self):
+        if self._client is None:
+            from .client import default_client
+            self._client = default_client
+        return self._client
+
+    def embed(self, text: str, model_id: str = DEFAULT_EMBEDDING_MODEL) -> List[float]:
+        """
+        Get the embedding vector for a text.
+
+        Args:
+            text: Text to embed
+            model_id: Embedding model ID
+
+        Returns:
+            Embedding vector, or an empty list for empty input
+
+        Raises:
+            Exception: Errors from BedrockClient.generate_embedding
+        """
+        if not text or not isinstance(text, str):
+            return []
+        normalized = normalize_text(text)
+        if not normalized:
+            return []
+        return self._get_or_fetch(make_embedding_key(model_id, normalized), normalized, model_id)
+
+    def embed_many(self, texts: Sequence[str], model_id: str = DEFAULT_EMBEDDING_MODEL,
+                   prefetch: bool = False) -> List[List[float]]:
+        """
+        Embed a batch of texts in one pass.
+
+        Duplicate texts are embedded once and cache misses are fetched concurrently
+        (up to max_batch_workers). A text whose embedding fails gets an empty vector.
+
+        Args:
+            texts: Texts to embed
+            model_id: Embedding model ID
+            prefetch: Warm the cache for embed() calls that follow. Prefetch lookups
+                are not counted as requests (the later embed() calls are), so hit
+                rate and calls saved are not inflated; Bedrock calls still count.
+
+        Returns:
+            Embedding vectors in the same order as texts
+        """
+        unique: Dict[str, str] = {}
+        keys = []
+        for text in texts:
+            normalized = normalize_text(text) if isinstance(text, str) else ''
+            key = make_embedding_key(model_id, normalized) if normalized else None
+            if key is not None:
+                unique.setdefault(key, normalized)
+            keys.append(key)
+
+        vectors: Dict[str, List[float]] = {}
+
+        def fetch(key: str) -> None:
+            try:
+                vectors[key] = self._get_or_fetch(key, unique[key], model_id, counted=not prefetch)
+            except Exception as e:
+                logger.warning(f"Embedding failed for batch item: {e}")
+                vectors[key] = []
+
+        workers = min(len(unique), self.max_batch_workers)
+        if workers <= 1:
+            for key in unique:
+                fetch(key)
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                list(executor.map(fetch, unique))
+
+        # Duplicates within the batch were served without a separate lookup
+        duplicates = sum(1 for key in keys if key is not None) - len(unique)
+        if duplicates and not prefetch:
+            self._add_stats(requests=duplicates, memory_hits=duplicates)
+
+        return [vectors[key] if key is not None else [] for key in keys]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Return cumulative statistics.
+
+        Returns:
+            Dictionary with request, hit and Bedrock call counts, calls_saved and hit_rate
+        """
+        with self._lock:
+            return self._with_derived(dict(self._stats))
+
+    @classmethod
+    def stats_delta(cls, before: Dict[str, Any], after: Dict[str, Any]) -> Dict[str, Any]:
+        """Statistics for the interval between two get_stats() snapshots."""
+        return cls._with_derived({field: after[field] - before[field] for field in _STAT_FIELDS})
+
+    def clear(self) -> None:
+        """Drop in-memory vectors. The persistent backend is left untouched."""
+        with self._lock:
+            self._entries.clear()
+
+    @staticmethod
+    def _with_derived(stats: Dict[str, Any]) -> Dict[str, Any]:
+        stats['calls_saved'] = stats['requests'] - stats['bedrock_calls'] - stats['errors']
+        stats['hit_rate'] = stats['calls_saved'] / stats['requests'] if stats['requests'] else 0.0
+        return stats
+
+    def _add_stats(self, **counts: int) -> None:
+        with self._lock:
+            for field, count in counts.items():
+                self._stats[field] += count
+
+    def _get_or_fetch(self, key: str, normalized: str, model_id: str, counted: bool = True) -> List[float]:
+        with self._lock:
+            self._stats['requests'] += counted
+            vector = self._entries.get(key)
+            if vector is not None:
+                self._entries.move_to_end(key)
+                self._stats['memory_hits'] += counted
+                return vector
+            future = self._in_flight.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._in_flight[key] = future
+            else:
+                self._stats['coalesced'] += counted
+
+        if not owner:
+            try:
+                return future.result()
+            except Exception:
+                self._add_stats(errors=int(counted))
+                raise
+
+        try:
+            vector = self._fetch(key, normalized, model_id, counted)
+            if vector:
+                with self._lock:
+                    self._entries[key] = vector
+                    self._entries.move_to_end(key)
+                    while len(self._entries) > self.max_entries:
+                        self._entries.popitem(last=False)
+            future.set_result(vector)
+            return vector
+        except Exception as e:
+            self._add_stats(errors=int(counted))
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._in_flight.pop(key, None)
+
+    def _fetch(self, key: str, normalized: str, model_id: str, counted: bool) -> List[float]:
+        """Read the vector from the persistent backend, or generate and store it."""
+        if self.persistent_cache is not None:
+            cached = self.persistent_cache.get(key)
+            if cached and cached.get('embedding'):
+                self._add_stats(persistent_hits=int(counted))
+                return cached['embedding']
+
+        vector = self.client.generate_embedding(normalized, model_id)
+        self._add_stats(bedrock_calls=1)
+
+        if vector and self.persistent_cache is not None:
+            self.persistent_cache.put(key, {'model_id': model_id, 'embedding': [float(v) for v in vector]})
+        return vector
+
+
+_default_service: Optional[EmbeddingService] = None
+_default_service_lock = threading.Lock()
+
+
+def get_embedding_service() -> EmbeddingService:
+    """
+    Get the process-wide embedding service, creating it on first use.
+
+    BEDROCK_EMBEDDING_CACHE_MAX_ENTRIES sets the in-memory size and
+    BEDROCK_EMBEDDING_CACHE selects an optional persistent backend (same specs as
+    BEDROCK_RESPONSE_CACHE; entries do not expire unless
+    BEDROCK_EMBEDDING_CACHE_TTL_SECONDS is set).
+
+    Returns:
+        Shared EmbeddingService instance
+    """
+    global _default_service
+    if _default_service is not None:
+        return _default_service
+    with _default_service_lock:
+        if _default_service is None:
+            spec = os.environ.get('BEDROCK_EMBEDDING_CACHE', '')
+            ttl = float(os.environ.get('BEDROCK_EMBEDDING_CACHE_TTL_SECONDS', 0)) or None
+            try:
+                persistent_cache = create_response_cache(spec, ttl)
+            except Exception as e:
+                logger.warning(f"Could not create Bedrock embedding cache '{spec}': {e}")
+                persistent_cache = None
+            _default_service = EmbeddingService(
+                max_entries=int(os.environ.get('BEDROCK_EMBEDDING_CACHE_MAX_ENTRIES', DEFAULT_MAX_ENTRIES)),
+                persistent_cache=persistent_cache,
+            )
+        return _default_service
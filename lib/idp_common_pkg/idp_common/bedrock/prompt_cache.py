@@ -0,0 +1,437 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Prompt cache planning for Bedrock requests built from task prompt templates.
+
+Bedrock caches the prompt prefix that ends at a cachePoint, so a cache point only
+pays off if everything before it is identical across requests. The extraction,
+assessment and classification services render their task prompts from templates
+whose placeholders change at different rates:
+
+- class definitions, attribute descriptions and few-shot examples are the same
+  for every section of a class (and every document using the configuration)
+- document text, page images and OCR confidence change with every section
+- in granular assessment, the extraction results and attribute descriptions
+  also change with every task of a section
+
+This module:
+
+1. Inserts <<CACHEPOINT>> markers into templates that have none, directly before
+   the first placeholder of each volatility tier (apply_cache_points). Templates
+   with explicit markers are left as they are.
+2. Plans each rendered request (plan_prompt_cache): caps the number of cache
+   points, adds a system prompt cache point when the system prompt alone is long
+   enough to be cached, and estimates the cacheable prefix of every cache point.
+3. Records the outcome (record_prompt_cache_usage): the read/write tokens
+   predicted from the prefixes seen in this process within the cache TTL are
+   logged next to the cacheReadInputTokens/cacheWriteInputTokens Bedrock
+   reports, and totals are available from get_prompt_cache_stats().
+"""
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, FrozenSet, List, Optional, Sequence, Tuple, Union
+
+from .client import CACHEPOINT_SUPPORTED_MODELS
+
+logger = logging.getLogger(__name__)
+
+CACHEPOINT_TAG = '<<CACHEPOINT>>'
+CACHE_POINT = {'cachePoint': {'type': 'default'}}
+
+# Bedrock accepts at most this many cache points per request
+MAX_CACHEPOINTS = 4
+
+# Cached prefixes expire this long after their last use
+CACHE_TTL_SECONDS = 300
+
+# Prefixes remembered for prediction (least recently used are dropped first)
+MAX_TRACKED_PREFIXES = 4096
+
+# Same rough estimate as the rate governor: ~4 characters per token, fixed per image
+CHARS_PER_TOKEN = 4
+IMAGE_TOKEN_ESTIMATE = 1600
+
+# Prefixes shorter than this are not cached by the model
+DEFAULT_MIN_CACHEABLE_TOKENS = 1024
+MIN_CACHEABLE_TOKENS = {
+    'claude-3-5-haiku': 2048,
+    'nova': 1000,
+}
+
+# Placeholders whose value changes with every section of a document
+DOCUMENT_PLACEHOLDERS: FrozenSet[str] = frozenset({
+    'DOCUMENT_TEXT',
+    'DOCUMENT_IMAGE',
+    'OCR_TEXT_CONFIDENCE',
+    'EXTRACTION_RESULTS',
+})
+
+# Placeholders whose value changes with every granular assessment task
+TASK_PLACEHOLDERS: FrozenSet[str] = frozenset({
+    'EXTRACTION_RESULTS',
+    'ATTRIBUTE_NAMES_AND_DESCRIPTIONS',
+})
+
+
+def supports_cache_points(model_id: Optional[str]) -> bool:
+    """Check whether the model accepts cachePoint content blocks."""
+    return model_id in CACHEPOINT_SUPPORTED_MODELS
+
+
+def min_cacheable_tokens(model_id: str) -> int:
+    """Minimum prefix length (tokens) the model caches."""
+    for fragment, tokens in MIN_CACHEABLE_TOKENS.items():
+        if fragment in model_id:
+            return tokens
+    return DEFAULT_MIN_CACHEABLE_TOKENS
+
+
+def insert_cache_points(
+    template: str,
+    boundaries: Sequence[FrozenSet[str]] = (DOCUMENT_PLACEHOLDERS,)
+) -> str:
+    """
+    Insert <<CACHEPOINT>> markers before the first volatile placeholder of each tier.
+
+    Boundaries are ordered from least to most volatile. The marker for a tier goes
+    before the first placeholder of that tier or of any more volatile tier, so every
+    marker ends a prefix that is stable for at least as long as the tier.
+
+    Args:
+        template: Task prompt template
+        boundaries: Placeholder sets, least volatile first
+
+    Returns:
+        Template with markers inserted (unchanged if it already has markers or no
+        volatile placeholder follows any text)
+    """
+    if not template or CACHEPOINT_TAG in template:
+        return template
+
+    positions = set()
+    for tier in range(len(boundaries)):
+        names = frozenset().union(*boundaries[tier:])
+        found = [template.find(f'{{{name}}}') for name in names]
+        found = [position for position in found if position > 0]
+        if found and template[:min(found)].strip():
+            positions.add(min(found))
+
+    for position in sorted(positions, reverse=True):
+        template = template[:position] + CACHEPOINT_TAG + template[position:]
+    return template
+
+
+def apply_cache_points(
+    template: str,
+    model_id: Optional[str],
+    enabled: bool = True,
+    boundaries: Sequence[FrozenSet[str]] = (DOCUMENT_PLACEHOLDERS,)
+) -> str:
+    """
+    Insert cache points into a task prompt template for models that support them.
+
+    Args:
+        template: Task prompt template
+        model_id: Bedrock model ID the prompt is sent to
+        enabled: Value of the service's auto_cachepoint setting
+        boundaries: Placeholder sets, least volatile first (see insert_cache_points)
+
+    Returns:
+        The template, with markers inserted when enabled and supported
+    """
+    if not enabled or not supports_cache_points(model_id):
+        return template
+    return insert_cache_points(template, boundaries)
+
+
+@dataclass
+class PromptCachePlan:
+    """Cache points of one request and the estimated prefix each one caches."""
+
+    model_id: str
+    context: str
+    # (prefix key, estimated prefix tokens) for every cache point, in order
+    checkpoints: List[Tuple[str, int]] = field(default_factory=list)
+    min_tokens: int = DEFAULT_MIN_CACHEABLE_TOKENS
+
+    @property
+    def cacheable_tokens(self) -> int:
+        """Estimated tokens up to the last cache point that can be cached."""
+        eligible = [tokens for _, tokens in self.checkpoints if tokens >= self.min_tokens]
+        return eligible[-1] if eligible else 0
+
+
+def _estimate_tokens(item: Dict[str, Any]) -> int:
+    if isinstance(item.get('text'), str):
+        return len(item['text']) // CHARS_PER_TOKEN
+    if 'image' in item:
+        return IMAGE_TOKEN_ESTIMATE
+    return 0
+
+
+def _update_hash(digest, item: Dict[str, Any]) -> None:
+    if isinstance(item.get('text'), str):
+        digest.update(b'T' + item['text'].encode('utf-8'))
+    elif 'image' in item:
+        image = item['image'] or {}
+        digest.update(b'I' + str(image.get('format')).encode('utf-8'))
+        source = image.get('source') or {}
+        data = source.get('bytes')
+        if isinstance(data, (bytes, bytearray)):
+            digest.update(hashlib.blake2b(data, digest_size=16).digest())
+        else:
+            digest.update(json.dumps(source, sort_keys=True, default=str).encode('utf-8'))
+    elif 'cachePoint' not in item:
+        digest.update(b'O' + json.dumps(item, sort_keys=True, default=str).encode('utf-8'))
+
+
+def _drop_markers(content: List[Dict[str, Any]], count: int) -> List[Dict[str, Any]]:
+    """Remove the first `count` cache point markers from content."""
+    result = []
+    for item in content:
+        if count and 'cachePoint' in item:
+            count -= 1
+            continue
+        text = item.get('text')
+        if count and isinstance(text, str) and CACHEPOINT_TAG in text:
+            parts = text.split(CACHEPOINT_TAG)
+            removed = min(count, len(parts) - 1)
+            text = ''.join(parts[:removed + 1]) + ''.join(CACHEPOINT_TAG + part for part in parts[removed + 1:])
+            count -= removed
+            item = {**item, 'text': text}
+        result.append(item)
+    return result
+
+
+def _count_markers(content: List[Dict[str, Any]]) -> int:
+    count = 0
+    for item in content:
+        if 'cachePoint' in item:
+            count += 1
+        elif isinstance(item.get('text'), str):
+            count += item['text'].count(CACHEPOINT_TAG)
+    return count
+
+
+def plan_prompt_cache(
+    model_id: str,
+    system_prompt: Union[str, List[Dict[str, Any]]],
+    content: List[Dict[str, Any]],
+    context: str = 'Unspecified'
+) -> Tuple[Union[str, List[Dict[str, Any]]], List[Dict[str, Any]], Optional[PromptCachePlan]]:
+    """
+    Prepare a request's cache points and estimate what each one caches.
+
+    Content keeps its <<CACHEPOINT>> text markers (BedrockClient turns them into
+    cachePoint blocks). Markers beyond MAX_CACHEPOINTS are dropped from the start,
+    keeping the longest prefixes. A system prompt string long enough to be cached on
+    its own gets a cache point when the budget allows.
+
+    Args:
+        model_id: Bedrock model ID
+        system_prompt: System prompt as passed to invoke_model
+        content: User message content as passed to invoke_model
+        context: Request context (as passed to invoke_model), for reporting
+
+    Returns:
+        Tuple of (system_prompt, content, plan); the plan is None for models
+        without cache point support
+    """
+    if not supports_cache_points(model_id):
+        return system_prompt, content, None
+
+    min_tokens = min_cacheable_tokens(model_id)
+    markers = _count_markers(content)
+    if markers > MAX_CACHEPOINTS:
+        logger.warning(
+            f"{context} prompt has {markers} cache points, keeping the last {MAX_CACHEPOINTS}"
+        )
+        content = _drop_markers(content, markers - MAX_CACHEPOINTS)
+        markers = MAX_CACHEPOINTS
+
+    if isinstance(system_prompt, str):
+        system_items = [{'text': system_prompt}] if system_prompt else []
+    else:
+        system_items = list(system_prompt or [])
+
+    digest = hashlib.blake2b(model_id.encode('utf-8'), digest_size=16)
+    tokens = 0
+    checkpoints: List[Tuple[str, int]] = []
+
+    for item in system_items:
+        if 'cachePoint' in item:
+            checkpoints.append((digest.hexdigest(), tokens))
+        else:
+            _update_hash(digest, item)
+            tokens += _estimate_tokens(item)
+    if (
+        isinstance(system_prompt, str)
+        and tokens >= min_tokens
+        and markers < MAX_CACHEPOINTS
+    ):
+        system_prompt = [{'text': system_prompt}, dict(CACHE_POINT)]
+        checkpoints.append((digest.hexdigest(), tokens))
+    digest.update(b'|')
+
+    for item in content:
+        if 'cachePoint' in item:
+            checkpoints.append((digest.hexdigest(), tokens))
+            continue
+        text = item.get('text')
+        if isinstance(text, str) and CACHEPOINT_TAG in text:
+            parts = text.split(CACHEPOINT_TAG)
+            for index, part in enumerate(parts):
+                _update_hash(digest, {'text': part})
+                tokens += len(part) // CHARS_PER_TOKEN
+                if index < len(parts) - 1:
+                    checkpoints.append((digest.hexdigest(), tokens))
+            continue
+        _update_hash(digest, item)
+        tokens += _estimate_tokens(item)
+
+    plan = PromptCachePlan(
+        model_id=model_id,
+        context=context,
+        checkpoints=checkpoints,
+        min_tokens=min_tokens,
+    )
+    return system_prompt, content, plan
+
+
+class PromptCacheTracker:
+    """Predicts prompt cache reads from recently sent prefixes and tallies outcomes."""
+
+    _STAT_FIELDS = (
+        'requests',
+        'predicted_read_tokens',
+        'predicted_write_tokens',
+        'observed_read_tokens',
+        'observed_write_tokens',
+        'input_tokens',
+    )
+
+    def __init__(self, ttl_seconds: float = CACHE_TTL_SECONDS,
+                 max_prefixes: int = MAX_TRACKED_PREFIXES):
+        """
+        Args:
+            ttl_seconds: How long a prefix stays cached after its last use
+            max_prefixes: Number of prefixes remembered for prediction
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_prefixes = max_prefixes
+        self._seen: 'OrderedDict[str, float]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {name: 0 for name in self._STAT_FIELDS}
+
+    def predict(self, plan: PromptCachePlan, now: Optional[float] = None) -> Tuple[int, int]:
+        """
+        Predict read and write tokens for a request and remember its prefixes.
+
+        Returns:
+            Tuple of (predicted read tokens, predicted write tokens)
+        """
+        now = time.time() if now is None else now
+        eligible = [(key, tokens) for key, tokens in plan.checkpoints if tokens >= plan.min_tokens]
+        if not eligible:
+            return 0, 0
+
+        with self._lock:
+            read = 0
+            for key, tokens in eligible:
+                seen_at = self._seen.get(key)
+                if seen_at is not None and now - seen_at <= self.ttl_seconds:
+                    read = tokens
+            for key, _ in eligible:
+                self._seen[key] = now
+                self._seen.move_to_end(key)
+            while len(self._seen) > self.max_prefixes:
+                self._seen.popitem(last=False)
+        return read, eligible[-1][1] - read
+
+    def record(self, plan: Optional[PromptCachePlan], response_with_metering: Dict[str, Any]) -> Optional[Dict[str, int]]:
+        """
+        Compare predicted and observed cache usage for a completed request.
+
+        Args:
+            plan: Plan from plan_prompt_cache (None for unsupported models)
+            response_with_metering: Result of invoke_model
+
+        Returns:
+            Dict with predicted/observed read and write tokens, or None if the
+            request was not sent to Bedrock
+        """
+        if plan is None or not isinstance(response_with_metering, dict):
+            return None
+        if response_with_metering.get('cache_hit'):
+            # Served from the response cache, Bedrock was not called
+            return None
+
+        response = response_with_metering.get('response') or {}
+        usage = response.get('usage') or {}
+        predicted_read, predicted_write = self.predict(plan)
+        outcome = {
+            'predicted_read_tokens': predicted_read,
+            'predicted_write_tokens': predicted_write,
+            'observed_read_tokens': int(usage.get('cacheReadInputTokens', 0) or 0),
+            'observed_write_tokens': int(usage.get('cacheWriteInputTokens', 0) or 0),
+            'input_tokens': int(usage.get('inputTokens', 0) or 0),
+        }
+        with self._lock:
+            self._stats['requests'] += 1
+            for name, value in outcome.items():
+                self._stats[name] += value
+
+        if plan.checkpoints:
+            logger.info(
+                f"Prompt cache ({plan.context}, {plan.model_id}): "
+                f"predicted read {predicted_read} / write {predicted_write} tokens, "
+                f"observed read {outcome['observed_read_tokens']} / "
+                f"write {outcome['observed_write_tokens']} tokens"
+            )
+        return outcome
+
+    def stats(self) -> Dict[str, Any]:
+        """Totals since creation (or the last reset), with the observed read ratio."""
+        with self._lock:
+            stats: Dict[str, Any] = dict(self._stats)
+        total_input = (
+            stats['input_tokens'] + stats['observed_read_tokens'] + stats['observed_write_tokens']
+        )
+        stats['observed_read_ratio'] = (
+            stats['observed_read_tokens'] / total_input if total_input else 0.0
+        )
+        return stats
+
+    def reset(self) -> None:
+        """Forget remembered prefixes and clear the totals."""
+        with self._lock:
+            self._seen.clear()
+            self._stats = {name: 0 for name in self._STAT_FIELDS}
+
+
+_tracker = PromptCacheTracker()
+
+
+def record_prompt_cache_usage(
+    plan: Optional[PromptCachePlan],
+    response_with_metering: Dict[str, Any]
+) -> Optional[Dict[str, int]]:
+    """Record a request's cache usage with the process-wide tracker (see PromptCacheTracker.record)."""
+    return _tracker.record(plan, response_with_metering)
+
+
+def get_prompt_cache_stats() -> Dict[str, Any]:
+    """Prompt cache totals for this process."""
+    return _tracker.stats()
+
+
+def reset_prompt_cache_stats() -> None:
+    """Reset the process-wide prompt cache tracker."""
+    _tracker.reset()
@@ -0,0 +1,272 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Compiled prompt templates and memoized prompt sections.
+
+format_prompt() checks the required placeholders, rewrites every {KEY} of the
+substitutions into %(KEY)s and applies the % operator, scanning the whole template
+once per substitution key on every call. The extraction, assessment and
+classification services call it for every section and page, and rebuild the
+attribute descriptions of a class from the configuration each time.
+
+This module:
+
+1. Compiles a template once (compile_prompt_template). Its placeholders are parsed
+   up front and the rewritten %-format string is kept per substitution key set, so
+   rendering is a single % operation. The output is byte-identical to
+   format_prompt(), including its handling of literal % characters.
+2. Memoizes text derived from the class configuration (PromptSections), such as
+   attribute descriptions and class lists, per (config version, class label,
+   prompt section). The config version is a digest of the classes configuration,
+   so warm invocations that load the same configuration share entries.
+
+Both caches are process-wide and bounded by an LRU. Configurations are treated as
+read-only once a service has been created from them, which is how the services
+use them.
+"""
+
+import hashlib
+import json
+import logging
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, FrozenSet, Hashable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Compiled templates kept in memory (least recently used are dropped first)
+MAX_COMPILED_TEMPLATES = 256
+
+# Rendered prompt sections kept in memory
+MAX_PROMPT_SECTIONS = 4096
+
+# Configurations whose class index is kept (one per distinct classes list)
+MAX_INDEXED_CONFIGS = 8
+
+# Substitution key sets remembered per template before the formats are reset
+MAX_FORMATS_PER_TEMPLATE = 16
+
+_PLACEHOLDER_RE = re.compile(r'\{([^{}]+)\}')
+
+_STAT_FIELDS = ('hits', 'misses', 'evictions')
+
+
+class _LRU:
+    """Thread-safe LRU that builds missing values with a caller-supplied function."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: 'OrderedDict[Hashable, Any]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = dict.fromkeys(_STAT_FIELDS, 0)
+
+    def get_or_build(self, key: Hashable, build: Callable[[], Any]) -> Any:
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self._stats['hits'] += 1
+                return self._entries[key]
+            self._stats['misses'] += 1
+
+        # Build outside the lock; concurrent misses for the same key build the same value
+        value = build()
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats['evictions'] += 1
+        return value
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            stats = dict(self._stats)
+            stats['entries'] = len(self._entries)
+        return stats
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._stats = dict.fromkeys(_STAT_FIELDS, 0)
+
+
+class PromptTemplate:
+    """
+    A prompt template parsed once and rendered with format_prompt() semantics.
+
+    Safe to share between threads.
+    """
+
+    __slots__ = ('template', 'placeholders', '_formats')
+
+    def __init__(self, template: str):
+        """
+        Args:
+            template: Prompt template with placeholders in {PLACEHOLDER} format
+        """
+        self.template = template
+        self.placeholders: FrozenSet[str] = frozenset(_PLACEHOLDER_RE.findall(template))
+        self._formats: Dict[Tuple[str, ...], str] = {}
+
+    def missing_placeholders(self, required_placeholders: Sequence[str]) -> List[str]:
+        """Required placeholder names that do not appear in the template."""
+        return [
+            p for p in required_placeholders
+            if p not in self.placeholders and f'{{{p}}}' not in self.template
+        ]
+
+    def render(
+        self,
+        substitutions: Dict[str, str],
+        required_placeholders: Optional[Sequence[str]] = None
+    ) -> str:
+        """
+        Replace placeholders with values.
+
+        Args:
+            substitutions: Dictionary of placeholder values
+            required_placeholders: Placeholder names that must be present in the template
+
+        Returns:
+            The same string format_prompt() returns for these arguments
+
+        Raises:
+            ValueError: If a required placeholder is missing from the template
+        """
+        if required_placeholders:
+            missing_placeholders = self.missing_placeholders(required_placeholders)
+            if missing_placeholders:
+                raise ValueError(f"Prompt template must contain the following placeholders: {', '.join([f'{{{p}}}' for p in missing_placeholders])}")
+
+        keys = tuple(substitutions)
+        format_string = self._formats.get(keys)
+        if format_string is None:
+            format_string = self._build_format(keys)
+            if len(self._formats) >= MAX_FORMATS_PER_TEMPLATE:
+                self._formats.clear()
+            self._formats[keys] = format_string
+        return format_string % substitutions
+
+    def _build_format(self, keys: Tuple[str, ...]) -> str:
+        # Same rewrite, in the same order, as format_prompt()
+        format_string = self.template
+        for key in keys:
+            placeholder = f'{{{key}}}'
+            if placeholder in format_string:
+                format_string = format_string.replace(placeholder, f'%({key})s')
+        return format_string
+
+
+_templates = _LRU(MAX_COMPILED_TEMPLATES)
+_sections = _LRU(MAX_PROMPT_SECTIONS)
+
+
+def compile_prompt_template(template: str) -> PromptTemplate:
+    """Get the compiled form of a template from the process-wide cache."""
+    return _templates.get_or_build(template, lambda: PromptTemplate(template))
+
+
+def render_prompt(
+    template: str,
+    substitutions: Dict[str, str],
+    required_placeholders: Optional[Sequence[str]] = None
+) -> str:
+    """Drop-in replacement for format_prompt() that compiles the template once."""
+    return compile_prompt_template(template).render(substitutions, required_placeholders)
+
+
+def classes_config_version(classes: Any) -> str:
+    """
+    Digest of a classes configuration.
+
+    Args:
+        classes: The 'classes' list of a configuration
+
+    Returns:
+        Hex SHA-256 digest of the canonical JSON form
+    """
+    payload = json.dumps(classes, sort_keys=True, default=str, separators=(',', ':'))
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class PromptSections:
+    """
+    Class lookups and memoized prompt sections for one classes configuration.
+
+    Obtain instances with get_prompt_sections(); building one digests the classes
+    configuration, which is done once per configuration object.
+    """
+
+    def __init__(self, classes: List[Dict[str, Any]]):
+        """
+        Args:
+            classes: The 'classes' list of a configuration
+        """
+        self.classes = classes
+        self.version = classes_config_version(classes)
+        self._by_name: Dict[str, Dict[str, Any]] = {}
+        for class_obj in classes:
+            # The first class with a given name wins, as with a linear search
+            self._by_name.setdefault((class_obj.get('name') or '').lower(), class_obj)
+
+    def class_config(self, class_label: str) -> Optional[Dict[str, Any]]:
+        """Configuration of a class, matched case-insensitively, or None."""
+        return self._by_name.get(class_label.lower())
+
+    def get(self, class_label: str, section: Hashable, build: Callable[[], str]) -> str:
+        """
+        Get a rendered prompt section, building it on first use.
+
+        Args:
+            class_label: Class the section belongs to ('' for sections covering all classes)
+            section: Name of the prompt section, unique within the class
+            build: Function producing the section text from this configuration
+
+        Returns:
+            The section text
+        """
+        return _sections.get_or_build((self.version, class_label.lower(), section), build)
+
+
+_NO_CLASSES: List[Dict[str, Any]] = []
+_indexed: 'OrderedDict[int, PromptSections]' = OrderedDict()
+_indexed_lock = threading.Lock()
+
+
+def get_prompt_sections(config: Dict[str, Any]) -> PromptSections:
+    """
+    Get the PromptSections for a configuration.
+
+    Instances are kept per classes list object (the instance holds a reference, so
+    the object cannot be replaced by another one with the same id while cached).
+    """
+    classes = config.get('classes') or _NO_CLASSES
+    key = id(classes)
+    with _indexed_lock:
+        sections = _indexed.get(key)
+        if sections is not None and sections.classes is classes:
+            _indexed.move_to_end(key)
+            return sections
+
+    sections = PromptSections(classes)
+    with _indexed_lock:
+        _indexed[key] = sections
+        _indexed.move_to_end(key)
+        while len(_indexed) > MAX_INDEXED_CONFIGS:
+            _indexed.popitem(last=False)
+    return sections
+
+
+def get_prompt_template_stats() -> Dict[str, Dict[str, int]]:
+    """Hit/miss/eviction counts of the template and section caches."""
+    return {'templates': _templates.stats(), 'sections': _sections.stats()}
+
+
+def clear_prompt_template_cache() -> None:
+    """Drop all compiled templates, prompt sections and class indexes."""
+    _templates.clear()
+    _sections.clear()
+    with _indexed_lock:
+        _indexed.clear()
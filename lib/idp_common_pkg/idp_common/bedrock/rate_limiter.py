@@ -0,0 +1,343 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Client-side rate limiting for Bedrock model invocations.
+
+Each model_id gets a process-wide ModelRateGovernor that combines:
+- token buckets for requests-per-minute and tokens-per-minute budgets
+- an AIMD (additive increase, multiplicative decrease) concurrency limit that
+  halves when Bedrock throttles and grows back on successful calls
+
+All BedrockClient instances in a process share the same governors, so threads
+from different services (classification, extraction, assessment) are gated together.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONCURRENCY = 32
+DEFAULT_MIN_CONCURRENCY = 1
+DEFAULT_DECREASE_FACTOR = 0.5
+# Throttles within this window after a decrease are treated as the same congestion event
+DECREASE_COOLDOWN_SECONDS = 1.0
+# Longest time between governor metric publications while the concurrency limit is unchanged
+DEFAULT_METRICS_INTERVAL_SECONDS = 60.0
+
+
+@dataclass
+class RateLimitConfig:
+    """Budgets for a single model. None disables the corresponding limit."""
+    requests_per_minute: Optional[float] = None
+    tokens_per_minute: Optional[float] = None
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+    min_concurrency: int = DEFAULT_MIN_CONCURRENCY
+    decrease_factor: float = DEFAULT_DECREASE_FACTOR
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'RateLimitConfig':
+        """Create a config from a dict, ignoring unknown keys."""
+        config = cls()
+        for key in ('requests_per_minute', 'tokens_per_minute'):
+            if data.get(key) is not None:
+                setattr(config, key, float(data[key]))
+        for key in ('max_concurrency', 'min_concurrency'):
+            if data.get(key) is not None:
+                setattr(config, key, int(data[key]))
+        if data.get('decrease_factor') is not None:
+            config.decrease_factor = float(data['decrease_factor'])
+        return config
+
+
+class TokenBucket:
+    """
+    Token bucket refilled continuously at capacity/60 tokens per second.
+
+    Not thread-safe on its own; ModelRateGovernor guards it with its lock.
+    """
+
+    def __init__(self, per_minute: float):
+        self.capacity = float(per_minute)
+        self.rate = self.capacity / 60.0
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def time_until_available(self, amount: float, now: float) -> float:
+        """Seconds until `amount` tokens are available (0 if available now)."""
+        self._refill(now)
+        amount = min(amount, self.capacity)
+        if self.tokens >= amount:
+            return 0.0
+        return (amount - self.tokens) / self.rate
+
+    def consume(self, amount: float) -> None:
+        """Remove tokens; the balance may go negative when reconciling actual usage."""
+        self.tokens -= amount
+
+
+class ModelRateGovernor:
+    """Shared request gate for one Bedrock model."""
+
+    def __init__(self, model_id: str, config: Optional[RateLimitConfig] = None):
+        self.model_id = model_id
+        self.config = config or RateLimitConfig()
+        self._request_bucket = (TokenBucket(self.config.requests_per_minute)
+                                if self.config.requests_per_minute else None)
+        self._token_bucket = (TokenBucket(self.config.tokens_per_minute)
+                              if self.config.tokens_per_minute else None)
+        self._limit = float(self.config.max_concurrency)
+        self._in_flight = 0
+        self._waiting = 0
+        self._throttles = 0
+        self._last_wait = 0.0
+        self._last_decrease = 0.0
+        self._max_wait_since_report = 0.0
+        self._reported_at: Optional[float] = None
+        self._reported_limit: Optional[int] = None
+        self._condition = threading.Condition()
+
+    @property
+    def concurrency_limit(self) -> int:
+        """Current effective concurrency limit."""
+        return max(self.config.min_concurrency, int(self._limit))
+
+    def acquire(self, estimated_tokens: int = 0, timeout: Optional[float] = None) -> float:
+        """
+        Block until a request slot and rate budget are available.
+
+        Args:
+            estimated_tokens: Estimated input + output tokens for the request
+            timeout: Optional maximum time to wait in seconds
+
+        Returns:
+            Time spent waiting in seconds
+
+        Raises:
+            TimeoutError: If the slot could not be acquired within the timeout
+        """
+        start = time.monotonic()
+        deadline = start + timeout if timeout is not None else None
+        with self._condition:
+            self._waiting += 1
+            try:
+                while True:
+                    now = time.monotonic()
+                    delay = 0.0
+                    if self._in_flight >= self.concurrency_limit:
+                        delay = None
+                    else:
+                        if self._request_bucket:
+                            delay = max(delay, self._request_bucket.time_until_available(1, now))
+                        if self._token_bucket and estimated_tokens:
+                            delay = max(delay, self._token_bucket.time_until_available(estimated_tokens, now))
+                        if delay == 0.0:
+                            break
+                    if deadline is not None:
+                        remaining = deadline - now
+                        if remaining <= 0:
+                            raise TimeoutError(f"Timed out waiting for Bedrock rate limit slot for {self.model_id}")
+                        delay = remaining if delay is None else min(delay, remaining)
+                    self._condition.wait(delay)
+
+                self._in_flight += 1
+                if self._request_bucket:
+                    self._request_bucket.consume(1)
+                if self._token_bucket and estimated_tokens:
+                    self._token_bucket.consume(estimated_tokens)
+            finally:
+                self._waiting -= 1
+            self._last_wait = time.monotonic() - start
+            self._max_wait_since_report = max(self._max_wait_since_report, self._last_wait)
+            return self._last_wait
+
+    def release(self, success: bool = True, estimated_tokens: int = 0,
+                actual_tokens: Optional[int] = None) -> None:
+        """
+        Release a slot acquired with acquire().
+
+        Args:
+            success: Whether the call succeeded; successes grow the concurrency limit
+            estimated_tokens: The estimate passed to acquire()
+            actual_tokens: Actual tokens used, to reconcile the tokens-per-minute bucket
+        """
+        with self._condition:
+            self._in_flight = max(0, self._in_flight - 1)
+            if self._token_bucket and actual_tokens is not None:
+                self._token_bucket.consume(actual_tokens - estimated_tokens)
+            if success and self._limit < self.config.max_concurrency:
+                # Additive increase: roughly +1 per window of `limit` successful calls
+                self._limit = min(float(self.config.max_concurrency), self._limit + 1.0 / max(self._limit, 1.0))
+            self._condition.notify_all()
+
+    def on_throttle(self) -> None:
+        """Multiplicatively decrease the concurrency limit after a throttling error."""
+        with self._condition:
+            self._throttles += 1
+            now = time.monotonic()
+            if now - self._last_decrease < DECREASE_COOLDOWN_SECONDS:
+                return
+            self._last_decrease = now
+            previous = self.concurrency_limit
+            self._limit = max(float(self.config.min_concurrency), self._limit * self.config.decrease_factor)
+            if self.concurrency_limit != previous:
+                logger.info(f"Bedrock rate governor for {self.model_id} reduced concurrency "
+                            f"limit from {previous} to {self.concurrency_limit}")
+
+    def get_state(self) -> Dict[str, Any]:
+        """Snapshot of the governor state for metrics and logging."""
+        with self._condition:
+            return {
+                'model_id': self.model_id,
+                'concurrency_limit': self.concurrency_limit,
+                'in_flight': self._in_flight,
+                'queue_depth': self._waiting,
+                'throttles': self._throttles,
+                'last_wait_seconds': self._last_wait,
+            }
+
+    def collect_metrics(self, interval: float = DEFAULT_METRICS_INTERVAL_SECONDS) -> Optional[Dict[str, Any]]:
+        """
+        Snapshot of the governor state if a metric report is due.
+
+        A report is due on the first call, when the concurrency limit changed since
+        the last report, or when interval seconds have passed since it.
+
+        Args:
+            interval: Longest time between reports while the limit is unchanged
+
+        Returns:
+            get_state() plus max_wait_seconds (longest wait since the last report),
+            or None when no report is due
+        """
+        with self._condition:
+            now = time.monotonic()
+            if (self._reported_at is not None
+                    and self.concurrency_limit == self._reported_limit
+                    and now - self._reported_at < interval):
+                return None
+            state = self.get_state()
+            state['max_wait_seconds'] = self._max_wait_since_report
+            self._max_wait_since_report = 0.0
+            self._reported_at = now
+            self._reported_limit = state['concurrency_limit']
+            return state
+
+
+_governors: Dict[str, ModelRateGovernor] = {}
+_model_configs: Dict[str, RateLimitConfig] = {}
+_registry_lock = threading.Lock()
+
+
+def is_rate_limiting_enabled() -> bool:
+    """Check whether client-side rate limiting is enabled via BEDROCK_RATE_LIMITING_ENABLED."""
+    return os.environ.get('BEDROCK_RATE_LIMITING_ENABLED', 'false').lower() == 'true'
+
+
+def configure_model_limits(model_id: str, **limits) -> ModelRateGovernor:
+    """
+    Set the budgets for a model, replacing any existing governor for it.
+
+    Args:
+        model_id: The Bedrock model ID
+        **limits: RateLimitConfig fields (requests_per_minute, tokens_per_minute, ...)
+
+    Returns:
+        The new governor for the model
+    """
+    with _registry_lock:
+        _model_configs[model_id] = RateLimitConfig.from_dict(limits)
+        governor = ModelRateGovernor(model_id, _model_configs[model_id])
+        _governors[model_id] = governor
+        return governor
+
+
+def _config_from_environment(model_id: str) -> RateLimitConfig:
+    """
+    Build a config from environment variables.
+
+    BEDROCK_RATE_LIMITS may hold a JSON object mapping model IDs (or "default") to
+    RateLimitConfig fields. BEDROCK_REQUESTS_PER_MINUTE, BEDROCK_TOKENS_PER_MINUTE and
+    BEDROCK_MAX_CONCURRENCY provide process-wide defaults.
+    """
+    data: Dict[str, Any] = {
+        'requests_per_minute': os.environ.get('BEDROCK_REQUESTS_PER_MINUTE') or None,
+        'tokens_per_minute': os.environ.get('BEDROCK_TOKENS_PER_MINUTE') or None,
+        'max_concurrency': os.environ.get('BEDROCK_MAX_CONCURRENCY') or None,
+    }
+    raw = os.environ.get('BEDROCK_RATE_LIMITS')
+    if raw:
+        try:
+            per_model = json.loads(raw)
+            data.update(per_model.get('default', {}))
+            data.update(per_model.get(model_id, {}))
+        except (ValueError, AttributeError) as e:
+            logger.warning(f"Invalid BEDROCK_RATE_LIMITS value, ignoring: {e}")
+    return RateLimitConfig.from_dict(data)
+
+
+def get_governor(model_id: str) -> ModelRateGovernor:
+    """
+    Get the shared governor for a model, creating it on first use.
+
+    Args:
+        model_id: The Bedrock model ID
+
+    Returns:
+        The process-wide ModelRateGovernor for the model
+    """
+    governor = _governors.get(model_id)
+    if governor is not None:
+        return governor
+    with _registry_lock:
+        if model_id not in _governors:
+            config = _model_configs.get(model_id) or _config_from_environment(model_id)
+            _governors[model_id] = ModelRateGovernor(model_id, config)
+        return _governors[model_id]
+
+
+def reset_governors() -> None:
+    """Drop all governors and configured budgets (mainly for tests)."""
+    with _registry_lock:
+        _governors.clear()
+        _model_configs.clear()
+
+
+def estimate_request_tokens(converse_params: Dict[str, Any]) -> int:
+    """
+    Roughly estimate tokens for a converse request (about 4 characters per token
+    for text, a fixed allowance per image, plus the requested max output tokens).
+
+    Args:
+        converse_params: Parameters for the Bedrock converse API call
+
+    Returns:
+        Estimated token count
+    """
+    chars = 0
+    images = 0
+    for item in converse_params.get('system') or []:
+        if isinstance(item, dict) and isinstance(item.get('text'), str):
+            chars += len(item['text'])
+    for message in converse_params.get('messages') or []:
+        for item in message.get('content', []):
+            if not isinstance(item, dict):
+                continue
+            if isinstance(item.get('text'), str):
+                chars += len(item['text'])
+            elif 'image' in item:
+                images += 1
+    inference_config = converse_params.get('inferenceConfig') or {}
+    additional = converse_params.get('additionalModelRequestFields') or {}
+    output_tokens = inference_config.get('maxTokens') or additional.get('max_tokens') or 0
+    return chars // 4 + images * 1600 + int(output_tokens)
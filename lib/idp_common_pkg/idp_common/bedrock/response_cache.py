@@ -0,0 +1,342 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Content-addressed cache for Bedrock converse responses.
+
+Cache keys are a SHA-256 hash of the canonicalized converse request (model, system
+prompt, messages with image/document bytes replaced by their own hash, inference
+parameters and guardrail config), so identical requests made while reprocessing a
+document or re-running an evaluation batch can be served without calling Bedrock.
+
+Backends:
+- MemoryResponseCache: in-process LRU
+- DiskResponseCache: one JSON file per entry in a local directory
+- S3ResponseCache: one JSON object per entry under a bucket prefix
+- DynamoDBResponseCache: one item per entry with a TTL attribute
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+import boto3
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_SECONDS = 7 * 24 * 3600
+DEFAULT_MEMORY_MAX_ENTRIES = 1024
+
+# Request fields that determine the model output
+_KEY_FIELDS = (
+    'modelId',
+    'system',
+    'messages',
+    'inferenceConfig',
+    'additionalModelRequestFields',
+    'guardrailConfig',
+)
+
+
+def _canonicalize(value: Any) -> Any:
+    """Replace binary payloads with their digest so the request can be hashed as JSON."""
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return {'__sha256__': hashlib.sha256(bytes(value)).hexdigest()}
+    if isinstance(value, dict):
+        return {k: _canonicalize(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_canonicalize(v) for v in value]
+    return value
+
+
+def make_cache_key(converse_params: Dict[str, Any]) -> str:
+    """
+    Build a stable cache key for a converse request.
+
+    Args:
+        converse_params: Parameters for the Bedrock converse API call
+
+    Returns:
+        Hex SHA-256 digest of the canonical request
+    """
+    canonical = {field: _canonicalize(converse_params.get(field)) for field in _KEY_FIELDS}
+    payload = json.dumps(canonical, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class ResponseCache(ABC):
+    """Base class for response cache backends."""
+
+    def __init__(self, ttl_seconds: Optional[float] = DEFAULT_TTL_SECONDS):
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._stats_lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached response, recording hit/miss statistics.
+
+        Args:
+            key: Cache key from make_cache_key()
+
+        Returns:
+            Cached converse response, or None on a miss or expired entry
+        """
+        try:
+            entry = self._get_entry(key)
+        except Exception as e:
+            logger.warning(f"Bedrock response cache read failed for {key}: {e}")
+            entry = None
+        value = None
+        if entry is not None:
+            expires_at = entry.get('expires_at')
+            if expires_at is None or expires_at > time.time():
+                value = entry.get('response')
+        with self._stats_lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+    def put(self, key: str, response: Dict[str, Any]) -> None:
+        """
+        Store a converse response. Failures are logged and ignored.
+
+        Args:
+            key: Cache key from make_cache_key()
+            response: Converse response to cache
+        """
+        entry = {
+            'response': {k: v for k, v in response.items() if k != 'ResponseMetadata'},
+            'created_at': time.time(),
+            'expires_at': time.time() + self.ttl_seconds if self.ttl_seconds else None,
+        }
+        try:
+            self._put_entry(key, entry)
+        except Exception as e:
+            logger.warning(f"Bedrock response cache write failed for {key}: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return hit/miss counts and the hit ratio."""
+        with self._stats_lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_ratio': self.hits / lookups if lookups else 0.0,
+            }
+
+    @abstractmethod
+    def _get_entry(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Read a stored entry.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Entry dictionary with response, created_at and expires_at, or None
+        """
+        pass
+
+    @abstractmethod
+    def _put_entry(self, key: str, entry: Dict[str, Any]) -> None:
+        """
+        Store an entry, replacing any existing one.
+
+        Args:
+            key: Cache key
+            entry: Entry dictionary with response, created_at and expires_at
+        """
+        pass
+
+
+class MemoryResponseCache(ResponseCache):
+    """In-process LRU cache."""
+
+    def __init__(self, max_entries: int = DEFAULT_MEMORY_MAX_ENTRIES,
+                 ttl_seconds: Optional[float] = DEFAULT_TTL_SECONDS):
+        super().__init__(ttl_seconds)
+        self.max_entries = max_entries
+        self._entries: 'OrderedDict[str, Dict[str, Any]]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get_entry(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def _put_entry(self, key: str, entry: Dict[str, Any]) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+class DiskResponseCache(ResponseCache):
+    """Local directory cache with one JSON file per entry."""
+
+    def __init__(self, directory: str, ttl_seconds: Optional[float] = DEFAULT_TTL_SECONDS):
+        super().__init__(ttl_seconds)
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], f"{key}.json")
+
+    def _get_entry(self, key: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self._path(key), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    def _put_entry(self, key: str, entry: Dict[str, Any]) -> None:
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Write to a temp file and rename so concurrent readers never see partial JSON
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(entry, f, default=str)
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+
+class S3ResponseCache(ResponseCache):
+    """S3 cache storing one JSON object per entry under a prefix."""
+
+    def __init__(self, bucket: str, prefix: str = 'bedrock-response-cache',
+                 ttl_seconds: Optional[float] = DEFAULT_TTL_SECONDS, client=None):
+        super().__init__(ttl_seconds)
+        self.bucket = bucket
+        self.prefix = prefix.strip('/')
+        self.client = client or boto3.client('s3')
+
+    def _object_key(self, key: str) -> str:
+        return f"{self.prefix}/{key[:2]}/{key}.json" if self.prefix else f"{key[:2]}/{key}.json"
+
+    def _get_entry(self, key: str) -> Optional[Dict[str, Any]]:
+        try:
+            response = self.client.get_object(Bucket=self.bucket, Key=self._object_key(key))
+        except self.client.exceptions.NoSuchKey:
+            return None
+        return json.loads(response['Body'].read().decode('utf-8'))
+
+    def _put_entry(self, key: str, entry: Dict[str, Any]) -> None:
+        self.client.put_object(
+            Bucket=self.bucket,
+            Key=self._object_key(key),
+            Body=json.dumps(entry, default=str).encode('utf-8'),
+            ContentType='application/json',
+        )
+
+
+class DynamoDBResponseCache(ResponseCache):
+    """
+    DynamoDB cache. The table needs a string partition key (default 'cache_key');
+    enable DynamoDB TTL on the 'expires_at' attribute to expire entries server-side.
+    """
+
+    def __init__(self, table_name: str, key_attribute: str = 'cache_key',
+                 ttl_seconds: Optional[float] = DEFAULT_TTL_SECONDS, resource=None):
+        super().__init__(ttl_seconds)
+        self.key_attribute = key_attribute
+        self.table = (resource or boto3.resource('dynamodb')).Table(table_name)
+
+    def _get_entry(self, key: str) -> Optional[Dict[str, Any]]:
+        item = self.table.get_item(Key={self.key_attribute: key}).get('Item')
+        if not item:
+            return None
+        expires_at = item.get('expires_at')
+        return {
+            'response': json.loads(item['response']),
+            'expires_at': int(expires_at) if expires_at is not None else None,
+        }
+
+    def _put_entry(self, key: str, entry: Dict[str, Any]) -> None:
+        item = {
+            self.key_attribute: key,
+            'response': json.dumps(entry['response'], default=str),
+            'created_at': int(entry['created_at']),
+        }
+        if entry.get('expires_at'):
+            item['expires_at'] = int(entry['expires_at'])
+        self.table.put_item(Item=item)
+
+
+def create_response_cache(spec: str, ttl_seconds: Optional[float] = DEFAULT_TTL_SECONDS) -> Optional[ResponseCache]:
+    """
+    Create a cache backend from a spec string.
+
+    Supported specs:
+        memory or memory:<max_entries>
+        disk:<directory>
+        s3://<bucket>/<prefix>
+        dynamodb:<table_name>
+
+    Args:
+        spec: Backend spec
+        ttl_seconds: Entry time-to-live in seconds (None or 0 for no expiry)
+
+    Returns:
+        ResponseCache instance, or None for an empty/disabled spec
+    """
+    spec = (spec or '').strip()
+    if not spec or spec.lower() in ('none', 'false', 'disabled'):
+        return None
+    if spec.lower().startswith('memory'):
+        _, _, size = spec.partition(':')
+        return MemoryResponseCache(int(size) if size else DEFAULT_MEMORY_MAX_ENTRIES, ttl_seconds)
+    if spec.startswith('disk:'):
+        return DiskResponseCache(spec[len('disk:'):], ttl_seconds)
+    if spec.startswith('s3://'):
+        bucket, _, prefix = spec[len('s3://'):].partition('/')
+        return S3ResponseCache(bucket, prefix or 'bedrock-response-cache', ttl_seconds)
+    if spec.startswith('dynamodb:'):
+        return DynamoDBResponseCache(spec[len('dynamodb:'):], ttl_seconds=ttl_seconds)
+    raise ValueError(f"Unsupported Bedrock response cache spec: {spec}")
+
+
+_env_cache: Optional[ResponseCache] = None
+_env_cache_spec: Optional[str] = None
+_env_cache_lock = threading.Lock()
+
+
+def get_response_cache_from_env() -> Optional[ResponseCache]:
+    """
+    Get the process-wide cache configured by BEDROCK_RESPONSE_CACHE and
+    BEDROCK_RESPONSE_CACHE_TTL_SECONDS, creating it on first use.
+
+    Returns:
+        Shared ResponseCache instance, or None when caching is not configured
+    """
+    global _env_cache, _env_cache_spec
+    spec = os.environ.get('BEDROCK_RESPONSE_CACHE', '')
+    if spec == _env_cache_spec:
+        return _env_cache
+    with _env_cache_lock:
+        if spec != _env_cache_spec:
+            ttl = float(os.environ.get('BEDROCK_RESPONSE_CACHE_TTL_SECONDS', DEFAULT_TTL_SECONDS))
+            try:
+                _env_cache = create_response_cache(spec, ttl)
+            except Exception as e:
+                logger.warning(f"Could not create Bedrock response cache '{spec}': {e}")
+                _env_cache = None
+            _env_cache_spec = spec
+        return _env_cache
@@ -24,7 +24,7 @@ import threading
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional, Set, Union
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
 import boto3
 from botocore.exceptions import ClientError
@@ -37,11 +37,30 @@ from idp_common.classification.models import (
     DocumentType,
     PageClassification,
 )
-from idp_common.models import Document, Section, Status
+from idp_common.models import Document, Page, Section, Status
 from idp_common.utils import extract_json_from_text, extract_structured_data_from_text
 
 logger = logging.getLogger(__name__)
 
+# Task prompt for batched page classification (classification.page_batch). The page
+# contents are appended after the <<CACHEPOINT>>, so everything before it is a
+# prefix shared by every batch of the document.
+DEFAULT_PAGE_BATCH_TASK_PROMPT = """Classify each page of a document packet into one of the document types below. For each page, also decide whether it starts a new document ("start") or continues the document on the previous page ("continue").
+
+<document-types>
+{CLASS_NAMES_AND_DESCRIPTIONS}
+</document-types>
+
+{FEW_SHOT_EXAMPLES}
+
+<output-format>
+The pages follow, each inside a <page page_id="..."> element with its OCR text and image. They are consecutive pages of the packet; the first page shown may continue a document from earlier pages that are not shown.
+Return only valid JSON with one entry per page, in page order, using the page_id values given:
+{"pages": [{"page_id": "1", "class": "exact_document_type_from_list", "document_boundary": "start or continue"}]}
+</output-format>
+
+<<CACHEPOINT>>"""
+
 
 class ClassificationService:
     """Service for classifying documents using various backends."""
@@ -156,6 +175,25 @@ class ClassificationService:
                 "Using multimodal page-level classification method with document boundary detection"
             )
 
+        # Batched page classification: K consecutive pages per Bedrock request
+        page_batch_config = classification_config.get("page_batch", {}) or {}
+        self.page_batch_size = max(1, int(page_batch_config.get("size") or 1))
+        if self.page_batch_size > 1 and self.backend != "bedrock":
+            logger.warning(
+                "Batched page classification requires the bedrock backend, classifying pages individually"
+            )
+            self.page_batch_size = 1
+        self.page_batch_task_prompt = (
+            page_batch_config.get("task_prompt") or DEFAULT_PAGE_BATCH_TASK_PROMPT
+        )
+        self.page_batch_image_config = page_batch_config.get(
+            "image"
+        ) or classification_config.get("image", {})
+        if self.page_batch_size > 1:
+            logger.info(
+                f"Using batched page classification with {self.page_batch_size} pages per request"
+            )
+
     def _load_document_types(self) -> List[DocumentType]:
         """Load document types from configuration with regex patterns."""
         doc_types = []
@@ -386,22 +424,45 @@ class ClassificationService:
                 with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
                     futures = {}
 
-                    # Start processing only uncached pages
-                    for page_id, page in pages_to_classify.items():
-                        future = executor.submit(
-                            self.classify_page,
-                            page_id=page_id,
-                            text_uri=page.parsed_text_uri,
-                            image_uri=page.image_uri,
-                            raw_text_uri=page.raw_text_uri,
-                        )
-                        futures[future] = page_id
+                    if self.page_batch_size > 1:
+                        # Start processing uncached pages in batches of consecutive pages
+                        prefix_content = self._build_page_batch_prefix_content()
+                        for batch_page_ids in self._build_page_batches(
+                            list(pages_to_classify.keys())
+                        ):
+                            future = executor.submit(
+                                self._classify_page_batch,
+                                {
+                                    page_id: pages_to_classify[page_id]
+                                    for page_id in batch_page_ids
+                                },
+                                prefix_content,
+                            )
+                            futures[future] = batch_page_ids
+                    else:
+                        # Start processing only uncached pages
+                        for page_id, page in pages_to_classify.items():
+                            future = executor.submit(
+                                self.classify_page,
+                                page_id=page_id,
+                                text_uri=page.parsed_text_uri,
+                                image_uri=page.image_uri,
+                                raw_text_uri=page.raw_text_uri,
+                            )
+                            futures[future] = [page_id]
 
                     # Process results as they complete
                     for future in as_completed(futures):
-                        page_id = futures[future]
                         try:
-                            page_result = future.result()
+                            result = future.result()
+                        except Exception as e:
+                            result = ([], {page_id: e for page_id in futures[future]})
+                        if isinstance(result, PageClassification):
+                            result = ([result], {})
+                        page_results, page_exceptions = result
+
+                        for page_result in page_results:
+                            page_id = page_result.page_id
                             all_page_results.append(page_result)
 
                             # Check if there was an error in the classification
@@ -438,7 +499,8 @@ class ClassificationService:
                             combined_metering = utils.merge_metering_data(
                                 combined_metering, page_metering
                             )
-                        except Exception as e:
+
+                        for page_id, e in page_exceptions.items():
                             # Capture exception details in the document object instead of raising
                             error_msg = f"Error classifying page {page_id}: {str(e)}"
                             logger.error(error_msg)
@@ -597,11 +659,15 @@ class ClassificationService:
 
     def _format_classes_list(self) -> str:
         """Format document classes as a simple list for the prompt."""
-        return "\n".join(
-            [
-                f"{doc_type.type_name}  \t[ {doc_type.description} ]"
-                for doc_type in self.document_types
-            ]
+        return bedrock.get_prompt_sections(self.config).get(
+            "",
+            "classification.classes_list",
+            lambda: "\n".join(
+                [
+                    f"{doc_type.type_name}  \t[ {doc_type.description} ]"
+                    for doc_type in self.document_types
+                ]
+            ),
         )
 
     def _get_classification_config(self) -> Dict[str, Any]:
@@ -635,7 +701,11 @@ class ClassificationService:
         task_prompt = classification_config.get("task_prompt")
         if not task_prompt:
             raise ValueError("No task_prompt found in classification configuration")
-        config["task_prompt"] = task_prompt
+        config["task_prompt"] = bedrock.apply_cache_points(
+            task_prompt,
+            self.bedrock_model,
+            enabled=classification_config.get("auto_cachepoint", True),
+        )
 
         return config
 
@@ -659,9 +729,9 @@ class ClassificationService:
         Raises:
             ValueError: If a required placeholder is missing from the template
         """
-        from idp_common.bedrock import format_prompt
-
-        return format_prompt(prompt_template, substitutions, required_placeholders)
+        return bedrock.render_prompt(
+            prompt_template, substitutions, required_placeholders
+        )
 
     def _build_content_with_or_without_image_placeholder(
         self,
@@ -1005,26 +1075,23 @@ class ClassificationService:
                     "No CONFIGURATION_BUCKET or ROOT_DIR set. Cannot read example images from local filesystem."
                 )
 
-    def classify_page_bedrock(
+    def _load_page_content(
         self,
-        page_id: str,
-        text_uri: Optional[str] = None,
-        image_uri: Optional[str] = None,
-        raw_text_uri: Optional[str] = None,
-    ) -> PageClassification:
+        text_uri: Optional[str],
+        image_uri: Optional[str],
+        image_config: Dict[str, Any],
+    ) -> Tuple[Optional[str], Optional[bytes]]:
         """
-        Classify a single page using Bedrock LLMs.
+        Load the text and image content of a page.
 
         Args:
-            page_id: ID of the page
             text_uri: URI of the text content
             image_uri: URI of the image content
-            raw_text_uri: URI of the raw text content
+            image_config: Image settings with optional target_width and target_height
 
         Returns:
-            PageClassification: Classification result for the page
+            Tuple of (text_content, image_content); either is None if unavailable
         """
-        # Initialize content variables
         text_content = None
         image_content = None
 
@@ -1039,7 +1106,6 @@ class ClassificationService:
         # Load image content from URI with configurable dimensions
         if image_uri:
             try:
-                image_config = self.config.get("classification", {}).get("image", {})
                 target_width = image_config.get("target_width")
                 target_height = image_config.get("target_height")
 
@@ -1051,6 +1117,292 @@ class ClassificationService:
                 logger.warning(f"Failed to load image content from {image_uri}: {e}")
                 # Continue without image content
 
+        return text_content, image_content
+
+    def _create_regex_matched_result(
+        self,
+        page_id: str,
+        doc_type: str,
+        image_uri: Optional[str] = None,
+        text_uri: Optional[str] = None,
+        raw_text_uri: Optional[str] = None,
+    ) -> PageClassification:
+        """Create the classification result for a page matched by content regex."""
+        return PageClassification(
+            page_id=page_id,
+            classification=DocumentClassification(
+                doc_type=doc_type,
+                confidence=1.0,  # High confidence for regex matches
+                metadata={
+                    "regex_matched": True,
+                    "document_boundary": "continue",  # Default boundary
+                },
+            ),
+            image_uri=image_uri,
+            text_uri=text_uri,
+            raw_text_uri=raw_text_uri,
+        )
+
+    def _build_page_batches(self, page_ids: List[str]) -> List[List[str]]:
+        """
+        Split page IDs into batches of consecutive pages.
+
+        A batch ends at page_batch_size pages or at a gap in the page numbers (for
+        example pages served from the cache), since the batch prompt tells the model
+        the pages are consecutive. Non-numeric page IDs are classified one per batch.
+
+        Args:
+            page_ids: IDs of the pages to classify
+
+        Returns:
+            List of page ID lists with at most page_batch_size pages each
+        """
+        try:
+            ordered = sorted(page_ids, key=int)
+        except (ValueError, TypeError):
+            return [[page_id] for page_id in sorted(page_ids)]
+        batches: List[List[str]] = []
+        for page_id in ordered:
+            if (
+                batches
+                and len(batches[-1]) < self.page_batch_size
+                and int(page_id) == int(batches[-1][-1]) + 1
+            ):
+                batches[-1].append(page_id)
+            else:
+                batches.append([page_id])
+        return batches
+
+    def _build_page_batch_prefix_content(self) -> List[Dict[str, Any]]:
+        """
+        Build the prompt content shared by every page batch of a document.
+
+        The class list and few-shot examples are built once per document and end with
+        a <<CACHEPOINT>>, so models that support prompt caching only process them once.
+
+        Returns:
+            List of content items for the batch task prompt
+        """
+        content = self._build_content(
+            self.page_batch_task_prompt, "", self._format_classes_list()
+        )
+        has_cachepoint = any(
+            "<<CACHEPOINT>>" in item.get("text", "") for item in content
+        )
+        if not has_cachepoint:
+            if content and "text" in content[-1]:
+                content[-1] = {"text": content[-1]["text"] + "\n<<CACHEPOINT>>"}
+            else:
+                content.append({"text": "<<CACHEPOINT>>"})
+        return content
+
+    def _parse_page_batch_response(
+        self, response_text: str, page_ids: List[str]
+    ) -> Dict[str, Dict[str, str]]:
+        """
+        Parse per-page labels from a batched classification response.
+
+        Args:
+            response_text: Model response text
+            page_ids: IDs of the pages in the batch, in order
+
+        Returns:
+            Dictionary mapping page_id to its entry ("class", "document_boundary") for
+            every page with a parseable entry
+        """
+        try:
+            data, _ = extract_structured_data_from_text(response_text)
+        except Exception as e:
+            logger.warning(f"Failed to parse batched classification response: {e}")
+            return {}
+
+        entries = data.get("pages") if isinstance(data, dict) else data
+        if not isinstance(entries, list):
+            return {}
+
+        labels = {}
+        for position, entry in enumerate(entries):
+            if not isinstance(entry, dict):
+                continue
+            page_id = str(entry.get("page_id", ""))
+            if page_id not in page_ids:
+                # Fall back to position when the model omits or renames page IDs
+                if position >= len(page_ids) or len(entries) != len(page_ids):
+                    continue
+                page_id = page_ids[position]
+            labels.setdefault(page_id, entry)
+        return labels
+
+    def _classify_page_batch(
+        self, pages: Dict[str, Page], prefix_content: List[Dict[str, Any]]
+    ) -> Tuple[List[PageClassification], Dict[str, Exception]]:
+        """
+        Classify consecutive pages with a single Bedrock request.
+
+        Pages matched by content regex are classified without the model. Pages that
+        have no content, are missing from the response or get a label that is not a
+        known document type are classified individually with classify_page. The
+        metering of the batch request is recorded on the first page of the batch.
+
+        Args:
+            pages: Pages of the batch by page ID, in page order
+            prefix_content: Shared prompt content from _build_page_batch_prefix_content
+
+        Returns:
+            Tuple of (page classification results, exceptions by page ID for pages
+            that could not be classified)
+        """
+        results: Dict[str, PageClassification] = {}
+        exceptions: Dict[str, Exception] = {}
+        fallback_page_ids = []
+        batch_page_ids = []
+        page_content = []
+
+        for page_id, page in pages.items():
+            text_content, image_content = self._load_page_content(
+                page.parsed_text_uri, page.image_uri, self.page_batch_image_config
+            )
+            regex_matched_class = (
+                self._check_page_content_regex(text_content) if text_content else None
+            )
+            if regex_matched_class:
+                logger.info(
+                    f"Page {page_id} classified as '{regex_matched_class}' based on content regex match. Skipping LLM classification."
+                )
+                results[page_id] = self._create_regex_matched_result(
+                    page_id,
+                    regex_matched_class,
+                    page.image_uri,
+                    page.parsed_text_uri,
+                    page.raw_text_uri,
+                )
+            elif not text_content and not image_content:
+                fallback_page_ids.append(page_id)
+            else:
+                batch_page_ids.append(page_id)
+                page_content.append(
+                    {
+                        "text": f'<page page_id="{page_id}">\n<page-ocr-text>\n{text_content or ""}\n</page-ocr-text>'
+                    }
+                )
+                if image_content:
+                    page_content.append(
+                        image.prepare_bedrock_image_attachment(image_content)
+                    )
+                page_content.append({"text": "</page>"})
+
+        batch_metering = {}
+        if len(batch_page_ids) == 1:
+            # A single page uses the configured per-page prompt
+            fallback_page_ids.extend(batch_page_ids)
+        elif batch_page_ids:
+            config = self._get_classification_config()
+            content = (
+                prefix_content
+                + page_content
+                + [
+                    {
+                        "text": f"Classify the {len(batch_page_ids)} pages above. Return one entry for each page_id: {', '.join(batch_page_ids)}."
+                    }
+                ]
+            )
+            logger.info(
+                f"Classifying pages {', '.join(batch_page_ids)} with one Bedrock request"
+            )
+            t0 = time.time()
+            try:
+                response_with_metering = self._invoke_bedrock_model(
+                    content=content, config=config
+                )
+            except Exception as e:
+                logger.error(
+                    f"Error classifying page batch {', '.join(batch_page_ids)}: {str(e)}"
+                )
+                exceptions.update({page_id: e for page_id in batch_page_ids})
+                batch_page_ids = []
+            else:
+                logger.info(
+                    f"Time taken for classification of {len(batch_page_ids)} pages: {time.time() - t0:.2f} seconds"
+                )
+                batch_metering = response_with_metering["metering"]
+                response_text = response_with_metering["response"]["output"]["message"][
+                    "content"
+                ][0].get("text", "")
+                labels = self._parse_page_batch_response(response_text, batch_page_ids)
+
+                for page_id in batch_page_ids:
+                    entry = labels.get(page_id, {})
+                    doc_type = str(entry.get("class") or "").strip()
+                    if doc_type not in self.valid_doc_types:
+                        logger.warning(
+                            f"No valid class for page {page_id} in batched response ({doc_type!r}), classifying it individually"
+                        )
+                        fallback_page_ids.append(page_id)
+                        continue
+                    page = pages[page_id]
+                    results[page_id] = PageClassification(
+                        page_id=page_id,
+                        classification=DocumentClassification(
+                            doc_type=doc_type,
+                            confidence=1.0,  # Default confidence
+                            metadata={
+                                "metering": {},
+                                "document_boundary": str(
+                                    entry.get("document_boundary") or "continue"
+                                ).lower(),
+                                "classification_batch": batch_page_ids,
+                            },
+                        ),
+                        image_uri=page.image_uri,
+                        text_uri=page.parsed_text_uri,
+                        raw_text_uri=page.raw_text_uri,
+                    )
+                    logger.info(f"Page {page_id} classified as {doc_type}")
+
+        for page_id in fallback_page_ids:
+            page = pages[page_id]
+            try:
+                results[page_id] = self.classify_page(
+                    page_id=page_id,
+                    text_uri=page.parsed_text_uri,
+                    image_uri=page.image_uri,
+                    raw_text_uri=page.raw_text_uri,
+                )
+            except Exception as e:
+                exceptions[page_id] = e
+
+        ordered_results = [results[page_id] for page_id in pages if page_id in results]
+        if batch_metering and ordered_results:
+            metadata = ordered_results[0].classification.metadata
+            metadata["metering"] = utils.merge_metering_data(
+                metadata.get("metering", {}), batch_metering
+            )
+        return ordered_results, exceptions
+
+    def classify_page_bedrock(
+        self,
+        page_id: str,
+        text_uri: Optional[str] = None,
+        image_uri: Optional[str] = None,
+        raw_text_uri: Optional[str] = None,
+    ) -> PageClassification:
+        """
+        Classify a single page using Bedrock LLMs.
+
+        Args:
+            page_id: ID of the page
+            text_uri: URI of the text content
+            image_uri: URI of the image content
+            raw_text_uri: URI of the raw text content
+
+        Returns:
+            PageClassification: Classification result for the page
+        """
+        # Load text and image content from URIs
+        text_content, image_content = self._load_page_content(
+            text_uri, image_uri, self.config.get("classification", {}).get("image", {})
+        )
+
         # Check for page content regex match (multi-modal page-level classification only)
         if text_content:
             regex_matched_class = self._check_page_content_regex(text_content)
@@ -1060,19 +1412,8 @@ class ClassificationService:
                 )
 
                 # Create and return classification result with regex match
-                return PageClassification(
-                    page_id=page_id,
-                    classification=DocumentClassification(
-                        doc_type=regex_matched_class,
-                        confidence=1.0,  # High confidence for regex matches
-                        metadata={
-                            "regex_matched": True,
-                            "document_boundary": "continue",  # Default boundary
-                        },
-                    ),
-                    image_uri=image_uri,
-                    text_uri=text_uri,
-                    raw_text_uri=raw_text_uri,
+                return self._create_regex_matched_result(
+                    page_id, regex_matched_class, image_uri, text_uri, raw_text_uri
                 )
 
         # Verify we have at least some content to classify
@@ -1385,9 +1726,15 @@ class ClassificationService:
         Returns:
             Dictionary with response and metering data
         """
-        return bedrock.invoke_model(
+        system_prompt, content, cache_plan = bedrock.plan_prompt_cache(
+            config["model_id"],
+            config["system_prompt"],
+            content,
+            context="Classification",
+        )
+        response_with_metering = bedrock.invoke_model(
             model_id=config["model_id"],
-            system_prompt=config["system_prompt"],
+            system_prompt=system_prompt,
             content=content,
             temperature=config["temperature"],
             top_k=config["top_k"],
@@ -1395,6 +1742,8 @@ class ClassificationService:
             max_tokens=config["max_tokens"],
             context="Classification",
         )
+        bedrock.record_prompt_cache_usage(cache_plan, response_with_metering)
+        return response_with_metering
 
     def _create_unclassified_result(
         self,
@@ -1885,6 +2234,14 @@ class ClassificationService:
 
     def _format_classes_and_descriptions(self) -> str:
         """Format document classes and descriptions as a markdown table for classification."""
+        return bedrock.get_prompt_sections(self.config).get(
+            "",
+            "classification.classes_table",
+            self._build_classes_table,
+        )
+
+    def _build_classes_table(self) -> str:
+        """Build the markdown table returned by _format_classes_and_descriptions."""
         # Convert list of DocumentType to list of dicts for markdown table formatting
         classes_dicts = [
             {"type": dt.type_name, "description": dt.description}
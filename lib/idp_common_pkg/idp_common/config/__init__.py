@@ -3,14 +3,50 @@
 
 import boto3
 import os
-from typing import Dict, Any, Optional
+import threading
+import time
+from typing import Dict, Any, Optional, Tuple
 from botocore.exceptions import ClientError
 from boto3.dynamodb.types import TypeDeserializer
 import logging
 from copy import deepcopy
+from datetime import datetime, timezone
 
 logger = logging.getLogger(__name__)
 
+# Item bumped by bump_configuration_version on every configuration change
+CONFIGURATION_VERSION_KEY = 'ConfigurationVersion'
+
+# Seconds a merged configuration is served from memory before its version is checked
+DEFAULT_CONFIG_CACHE_TTL_SECONDS = 60
+
+# Seconds after which a cached configuration is read again even if the version is
+# unchanged, so writers that do not bump the version are picked up eventually
+DEFAULT_CONFIG_CACHE_MAX_AGE_SECONDS = 900
+
+
+def bump_configuration_version(table) -> None:
+    """
+    Increment the configuration version marker read by get_config, so Lambdas with a
+    cached configuration reload it on their next version check
+
+    Call this after every write to the Default or Custom configuration item. Errors
+    are logged, not raised: the configuration itself was written, and cached readers
+    still pick it up once the cache reaches its maximum age.
+
+    Args:
+        table: boto3 DynamoDB Table resource of the configuration table
+    """
+    try:
+        table.update_item(
+            Key={'Configuration': CONFIGURATION_VERSION_KEY},
+            UpdateExpression='ADD #v :one SET #u = :now',
+            ExpressionAttributeNames={'#v': 'Version', '#u': 'UpdatedAt'},
+            ExpressionAttributeValues={':one': 1, ':now': datetime.now(timezone.utc).isoformat()}
+        )
+    except ClientError as e:
+        logger.error(f"Error updating configuration version: {str(e)}")
+
 class ConfigurationReader:
     def __init__(self, table_name=None, region_name=None):
         """
@@ -65,6 +101,24 @@ class ConfigurationReader:
             logger.error(f"Error retrieving configuration {config_type}: {str(e)}")
             raise
 
+    def get_configuration_version(self) -> Optional[Tuple[Any, Any]]:
+        """
+        Read the version marker written by bump_configuration_version
+
+        Returns:
+            (Version, UpdatedAt) tuple, or None if no marker has been written
+        """
+        response = self.client.get_item(
+            TableName=self.table_name,
+            Key={'Configuration': {'S': CONFIGURATION_VERSION_KEY}},
+            ProjectionExpression='#v, #u',
+            ExpressionAttributeNames={'#v': 'Version', '#u': 'UpdatedAt'}
+        )
+        if 'Item' not in response:
+            return None
+        item = self._deserialize_item(response['Item'])
+        return item.get('Version'), item.get('UpdatedAt')
+
     def deep_merge(self, default: Dict[str, Any], custom: Dict[str, Any]) -> Dict[str, Any]:
         """
         Recursively merge two dictionaries, with custom values taking precedence
@@ -124,16 +178,85 @@ class ConfigurationReader:
             logger.error(f"Error getting merged configuration: {str(e)}")
             raise
 
+_config_cache: Dict[Tuple[str, Optional[str]], Dict[str, Any]] = {}
+_config_cache_lock = threading.Lock()
+
+
+def _get_seconds_from_env(name: str, default: float) -> float:
+    value = os.environ.get(name, '')
+    try:
+        return float(value) if value.strip() else default
+    except ValueError:
+        logger.warning(f"Invalid {name} '{value}', using {default}")
+        return default
+
+
+def clear_config_cache() -> None:
+    """Drop all cached configurations so the next get_config() call reads DynamoDB"""
+    with _config_cache_lock:
+        _config_cache.clear()
+
+
 def get_config(table_name=None, region_name=None) -> Dict[str, Any]:
     """
     Get the merged configuration using the environment variable for table name
 
+    The merged configuration is cached at module level, so warm Lambda invocations
+    reuse it. Within CONFIGURATION_CACHE_TTL_SECONDS (default 60) no DynamoDB
+    reads are made. After that a single read of the version marker written by
+    ConfigurationManager decides whether Default and Custom are read and merged
+    again; without a marker the configuration is always re-read. Once a cached
+    configuration is CONFIGURATION_CACHE_MAX_AGE_SECONDS (default 900) old it is
+    re-read even if the version is unchanged, which bounds how long writers that
+    do not bump the marker go unnoticed. Set CONFIGURATION_CACHE_TTL_SECONDS=0 to
+    disable caching.
+
     Args:
         table_name: Optional override for configuration table name
         region_name: Optional AWS region override (defaults to AWS_REGION env var)
 
     Returns:
-        Merged configuration dictionary
+        Merged configuration dictionary (a copy the caller may modify)
     """
-    reader = ConfigurationReader(table_name, region_name)
-    return reader.get_merged_configuration()
\ No newline at end of file
+    ttl = _get_seconds_from_env('CONFIGURATION_CACHE_TTL_SECONDS', DEFAULT_CONFIG_CACHE_TTL_SECONDS)
+    if ttl <= 0:
+        reader = ConfigurationReader(table_name, region_name)
+        return reader.get_merged_configuration()
+
+    cache_key = (table_name or os.environ.get('CONFIGURATION_TABLE_NAME'), region_name)
+    with _config_cache_lock:
+        entry = _config_cache.get(cache_key)
+        if entry and time.monotonic() < entry['expires_at']:
+            return deepcopy(entry['config'])
+
+    reader = entry['reader'] if entry else ConfigurationReader(table_name, region_name)
+    version = None
+    try:
+        version = reader.get_configuration_version()
+    except Exception as e:
+        logger.warning(f"Could not read configuration version, reloading configuration: {str(e)}")
+
+    max_age = _get_seconds_from_env('CONFIGURATION_CACHE_MAX_AGE_SECONDS', DEFAULT_CONFIG_CACHE_MAX_AGE_SECONDS)
+    now = time.monotonic()
+    if (
+        entry
+        and version is not None
+        and version == entry['version']
+        and now - entry['loaded_at'] < max_age
+    ):
+        logger.debug("Configuration version unchanged, reusing cached configuration")
+        config = entry['config']
+        loaded_at = entry['loaded_at']
+    else:
+        config = reader.get_merged_configuration()
+        loaded_at = now
+
+    with _config_cache_lock:
+        _config_cache[cache_key] = {
+            'reader': reader,
+            'config': config,
+            'version': version,
+            'loaded_at': loaded_at,
+            'expires_at': now + ttl,
+        }
+    return deepcopy(config)
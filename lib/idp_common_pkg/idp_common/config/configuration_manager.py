@@ -9,6 +9,8 @@ from botocore.exceptions import ClientError
 import logging
 from copy import deepcopy
 
+from . import bump_configuration_version
+
 logger = logging.getLogger(__name__)
 
 class ConfigurationManager:
@@ -88,6 +90,7 @@ class ConfigurationManager:
                     **converted_data
                 }
             )
+            bump_configuration_version(self.table)
         except ClientError as e:
             logger.error(f"Error updating configuration {configuration_type}: {str(e)}")
             raise
@@ -102,6 +105,7 @@ class ConfigurationManager:
                     'Configuration': configuration_type
                 }
             )
+            bump_configuration_version(self.table)
         except ClientError as e:
             logger.error(f"Error deleting configuration {configuration_type}: {str(e)}")
             raise
@@ -122,6 +126,7 @@ class ConfigurationManager:
                         'Configuration': 'Custom'
                     }
                 )
+                bump_configuration_version(self.table)
                 logger.info("Stored empty Custom configuration")
                 return True
             
@@ -140,6 +145,7 @@ class ConfigurationManager:
                     **stringified_config
                 }
             )
+            bump_configuration_version(self.table)
             
             logger.info(f"Updated Custom configuration")
             
@@ -9,6 +9,11 @@ dynamic business rules/criteria using LLMs for healthcare/insurance prior
 authorization validation.
 """
 
+from idp_common.criteria_validation.async_client import (
+    AsyncBedrockS3Client,
+    gather_bounded,
+)
+from idp_common.criteria_validation.chunking import ChunkManifest, chunk_text
 from idp_common.criteria_validation.models import (
     BedrockInput,
     CriteriaValidationResult,
@@ -18,6 +23,10 @@ from idp_common.criteria_validation.service import CriteriaValidationService
 
 __all__ = [
     "CriteriaValidationService",
+    "AsyncBedrockS3Client",
+    "gather_bounded",
+    "ChunkManifest",
+    "chunk_text",
     "BedrockInput",
     "LLMResponse",
     "CriteriaValidationResult",
@@ -0,0 +1,262 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Async Bedrock and S3 access for criteria validation.
+
+The Bedrock and S3 helpers in idp_common are synchronous (retries, metering,
+rate limiting and response caching live in BedrockClient). This module runs
+them from asyncio without the default executor:
+
+- each model ID gets a lane: an asyncio.Semaphore and a thread pool of the
+  same size, so the configured per-model concurrency is exactly the number of
+  calls in flight, independent of the event loop's default executor
+- S3 reads and writes go through a separate lane so they never block the loop
+  and never compete with model calls for threads
+- gather_bounded() admits work lazily with a fixed window, so fanning out
+  thousands of questions keeps at most `limit` of them alive at once
+
+A call waiting for a lane slot is cancelled cleanly. A call already running in
+a thread cannot be interrupted: cancelling it returns immediately and its
+result is discarded, but the thread stays busy until the call returns, so the
+lane's thread pool still bounds real concurrency. close() cancels calls that
+have not started yet.
+"""
+
+import asyncio
+import functools
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    TypeVar,
+    Union,
+)
+
+from idp_common import bedrock, s3
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_MODEL_CONCURRENCY = 5
+DEFAULT_S3_CONCURRENCY = 10
+
+
+class _Lane:
+    """A semaphore and a thread pool of the same size."""
+
+    def __init__(self, name: str, limit: int):
+        self.name = name
+        self.limit = max(1, int(limit))
+        self.semaphore = asyncio.Semaphore(self.limit)
+        self.executor = ThreadPoolExecutor(
+            max_workers=self.limit, thread_name_prefix=f"cv-{name}"
+        )
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.calls = 0
+        self.cancelled = 0
+
+    async def run(self, func: Callable[..., T], *args, **kwargs) -> T:
+        loop = asyncio.get_running_loop()
+        try:
+            async with self.semaphore:
+                self.in_flight += 1
+                self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+                try:
+                    return await loop.run_in_executor(
+                        self.executor, functools.partial(func, *args, **kwargs)
+                    )
+                finally:
+                    self.in_flight -= 1
+                    self.calls += 1
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "limit": self.limit,
+            "calls": self.calls,
+            "in_flight": self.in_flight,
+            "peak_in_flight": self.peak_in_flight,
+            "cancelled": self.cancelled,
+        }
+
+    def shutdown(self) -> None:
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+class AsyncBedrockS3Client:
+    """
+    Async facade over bedrock.invoke_model and the idp_common.s3 helpers.
+
+    Create it inside the event loop that uses it (lanes hold asyncio
+    semaphores) and close it when done, e.g. ``async with AsyncBedrockS3Client()``.
+    """
+
+    def __init__(
+        self,
+        model_concurrency: int = DEFAULT_MODEL_CONCURRENCY,
+        model_limits: Optional[Dict[str, int]] = None,
+        s3_concurrency: int = DEFAULT_S3_CONCURRENCY,
+        invoke: Optional[Callable[..., Dict[str, Any]]] = None,
+    ):
+        """
+        Args:
+            model_concurrency: Concurrent Bedrock calls per model ID
+            model_limits: Per-model overrides of model_concurrency
+            s3_concurrency: Concurrent S3 requests
+            invoke: Function used for model calls (default bedrock.invoke_model)
+        """
+        self.model_concurrency = max(1, int(model_concurrency))
+        self.model_limits = {
+            model_id: int(limit) for model_id, limit in (model_limits or {}).items()
+        }
+        self._invoke = invoke or bedrock.invoke_model
+        self._models: Dict[str, _Lane] = {}
+        self._s3 = _Lane("s3", s3_concurrency)
+        self._closed = False
+
+    async def __aenter__(self) -> "AsyncBedrockS3Client":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.close()
+
+    def _model_lane(self, model_id: str) -> _Lane:
+        if self._closed:
+            raise RuntimeError("AsyncBedrockS3Client is closed")
+        lane = self._models.get(model_id)
+        if lane is None:
+            limit = self.model_limits.get(model_id, self.model_concurrency)
+            lane = self._models[model_id] = _Lane(f"model-{len(self._models)}", limit)
+        return lane
+
+    async def invoke_model(
+        self,
+        model_id: str,
+        system_prompt: str,
+        content: str,
+        temperature: float = 0.0,
+        top_k: int = 5,
+        top_p: float = 0.1,
+        max_tokens: Optional[int] = None,
+        context: str = "Unspecified",
+    ) -> Dict[str, Any]:
+        """Invoke a model with a text prompt, waiting for a slot in its lane."""
+        return await self._model_lane(model_id).run(
+            self._invoke,
+            model_id,
+            system_prompt,
+            [{"text": content}],
+            temperature,
+            top_k,
+            top_p,
+            max_tokens,
+            None,
+            context,
+        )
+
+    async def run_io(self, func: Callable[..., T], *args, **kwargs) -> T:
+        """Run a blocking S3 call (or similar I/O) in the S3 lane."""
+        if self._closed:
+            raise RuntimeError("AsyncBedrockS3Client is closed")
+        return await self._s3.run(func, *args, **kwargs)
+
+    async def get_text_content(self, s3_uri: str) -> str:
+        return await self.run_io(s3.get_text_content, s3_uri)
+
+    async def get_json_content(self, s3_uri: str) -> Dict[str, Any]:
+        return await self.run_io(s3.get_json_content, s3_uri)
+
+    async def write_content(
+        self,
+        content: Union[str, bytes, Dict[str, Any], List[Any]],
+        bucket: str,
+        key: str,
+        content_type: Optional[str] = None,
+    ) -> None:
+        await self.run_io(s3.write_content, content, bucket, key, content_type)
+
+    def stats(self) -> Dict[str, Any]:
+        """Call counts and peak concurrency per model and for S3."""
+        return {
+            "models": {
+                model_id: lane.stats() for model_id, lane in self._models.items()
+            },
+            "s3": self._s3.stats(),
+        }
+
+    def close(self) -> None:
+        """Shut down the lanes, cancelling calls that have not started."""
+        if self._closed:
+            return
+        self._closed = True
+        for lane in [*self._models.values(), self._s3]:
+            lane.shutdown()
+
+
+async def gather_bounded(
+    factories: Iterable[Callable[[], Awaitable[T]]], limit: int
+) -> List[T]:
+    """
+    Run coroutines with at most `limit` alive at once, returning results in order.
+
+    Factories are called lazily as earlier coroutines finish, so nothing beyond
+    the window (prompts, tasks) is built ahead of time. If one coroutine raises
+    or the caller is cancelled, the others are cancelled and the error propagates.
+
+    Args:
+        factories: Zero-argument callables returning awaitables
+        limit: Maximum number of coroutines in flight
+
+    Returns:
+        Results in the order of factories
+    """
+    limit = max(1, int(limit))
+    results: Dict[int, T] = {}
+    pending: Dict[asyncio.Task, int] = {}
+    iterator = iter(enumerate(factories))
+    exhausted = False
+
+    def admit() -> None:
+        nonlocal exhausted
+        while not exhausted and len(pending) < limit:
+            try:
+                index, factory = next(iterator)
+            except StopIteration:
+                exhausted = True
+                return
+            pending[asyncio.ensure_future(factory())] = index
+
+    try:
+        admit()
+        while pending:
+            done, _ = await asyncio.wait(
+                pending.keys(), return_when=asyncio.FIRST_COMPLETED
+            )
+            error: Optional[BaseException] = None
+            for task in done:
+                index = pending.pop(task)
+                try:
+                    results[index] = task.result()
+                except BaseException as e:
+                    error = error or e
+            if error is not None:
+                raise error
+            admit()
+    finally:
+        if pending:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    return [results[index] for index in range(len(results))]
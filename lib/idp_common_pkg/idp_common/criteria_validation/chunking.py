@@ -0,0 +1,300 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Token-budgeted chunking of user history text for criteria validation.
+
+Text is split into pages (form feeds or <page-number> tags) and pages into
+sentences (sentence-ending punctuation or line breaks). Sentences are packed
+into chunks of at most max_tokens estimated tokens, preferring to end a chunk
+at a page boundary once it is half full, and consecutive chunks share trailing
+sentences worth up to overlap_percentage of the budget. A sentence longer than
+the budget is split between words.
+
+Token counts come from estimate_tokens, which counts word pieces, digit groups
+and punctuation the way BPE tokenizers split them instead of assuming a fixed
+number of characters per token, so number- and symbol-heavy records (dates,
+codes, dosages) are not undercounted.
+
+Chunks are character spans of the source text. A ChunkManifest stores them
+with the SHA-256 of the text and the chunking parameters, so a file validated
+again is sliced from its manifest instead of being re-chunked.
+"""
+
+import hashlib
+import json
+import logging
+import re
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from idp_common import s3
+
+logger = logging.getLogger(__name__)
+
+# Bump when the estimator or the splitting rules change so old manifests are rebuilt
+CHUNKER_VERSION = 1
+
+PAGE_BREAK_PATTERN = re.compile(r"\f|(?=<page-number>\d+</page-number>)")
+SENTENCE_BREAK_PATTERN = re.compile(r"(?<=[.!?])[\"')\]]*\s+|\n+")
+WORD_PATTERN = re.compile(r"\S+\s*")
+# Letter runs, digit runs, other non-space characters (punctuation, symbols)
+TOKEN_PIECE_PATTERN = re.compile(r"[^\W\d_]+|\d+|[^\w\s]|_")
+
+# Letters per token piece in long words and digits per token in numbers
+LETTERS_PER_TOKEN = 6
+DIGITS_PER_TOKEN = 3
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate the token count of text.
+
+    A letter run is one token per started group of 6 letters, a digit run one
+    per started group of 3 digits, and every other non-space character one
+    token. Whitespace is free (BPE vocabularies merge it into the next piece).
+    """
+    tokens = 0
+    for match in TOKEN_PIECE_PATTERN.finditer(text):
+        piece = match.group()
+        if piece[0].isdigit():
+            tokens += -(-len(piece) // DIGITS_PER_TOKEN)
+        elif piece[0].isalpha():
+            tokens += -(-len(piece) // LETTERS_PER_TOKEN)
+        else:
+            tokens += 1
+    return tokens
+
+
+@dataclass
+class TextChunk:
+    """A span of the source text."""
+
+    start: int
+    end: int
+    tokens: int
+    first_page: int
+    last_page: int
+
+
+@dataclass
+class ChunkManifest:
+    """Chunks of one source text and the inputs they were computed from."""
+
+    content_sha256: str
+    params: Dict[str, Any]
+    chunks: List[TextChunk] = field(default_factory=list)
+    version: int = CHUNKER_VERSION
+
+    def texts(self, text: str) -> List[str]:
+        """Slice the chunk texts out of the source text."""
+        return [text[chunk.start : chunk.end] for chunk in self.chunks]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ChunkManifest":
+        return cls(
+            content_sha256=data["content_sha256"],
+            params=data["params"],
+            chunks=[TextChunk(**chunk) for chunk in data["chunks"]],
+            version=data.get("version", 0),
+        )
+
+    def matches(self, content_sha256: str, params: Dict[str, Any]) -> bool:
+        """Check the manifest was built from this text with these parameters."""
+        return (
+            self.version == CHUNKER_VERSION
+            and self.content_sha256 == content_sha256
+            and self.params == params
+        )
+
+
+def content_hash(text: str) -> str:
+    """SHA-256 hex digest of the UTF-8 text."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def chunk_params(max_tokens: int, overlap_percentage: float) -> Dict[str, Any]:
+    """Parameters a manifest depends on."""
+    return {"max_tokens": int(max_tokens), "overlap_percentage": overlap_percentage}
+
+
+def manifest_key(prefix: str, content_sha256: str, params: Dict[str, Any]) -> str:
+    """S3 key of the manifest for a text and chunking parameters."""
+    digest = hashlib.sha256(
+        f"{CHUNKER_VERSION}:{params['max_tokens']}:{params['overlap_percentage']}".encode()
+    ).hexdigest()[:12]
+    return f"{prefix.strip('/')}/{content_sha256}-{digest}.json"
+
+
+def _units(text: str, max_tokens: int) -> List[Tuple[int, int, int, int]]:
+    """Split text into (start, end, tokens, page) sentence units of at most max_tokens."""
+    units = []
+    page_starts = [0] + [
+        match.start() for match in PAGE_BREAK_PATTERN.finditer(text) if match.start()
+    ]
+    page_bounds = zip(page_starts, page_starts[1:] + [len(text)])
+    for page, (page_start, page_end) in enumerate(page_bounds, start=1):
+        position = page_start
+        breaks = [
+            match.end()
+            for match in SENTENCE_BREAK_PATTERN.finditer(text, page_start, page_end)
+        ]
+        for end in breaks + [page_end]:
+            if end <= position:
+                continue
+            sentence = text[position:end]
+            tokens = estimate_tokens(sentence)
+            if tokens <= max_tokens:
+                units.append((position, end, tokens, page))
+            else:
+                units.extend(_split_words(text, position, end, max_tokens, page))
+            position = end
+    return units
+
+
+def _split_words(
+    text: str, start: int, end: int, max_tokens: int, page: int
+) -> List[Tuple[int, int, int, int]]:
+    """Split an oversized sentence between words (or inside a word if need be)."""
+    pieces = []
+    piece_start = start
+    piece_tokens = 0
+    for match in WORD_PATTERN.finditer(text, start, end):
+        tokens = estimate_tokens(match.group())
+        if piece_tokens and piece_tokens + tokens > max_tokens:
+            pieces.append((piece_start, match.start(), piece_tokens, page))
+            piece_start, piece_tokens = match.start(), 0
+        if tokens > max_tokens:
+            # A single "word" over budget (e.g. a long run without spaces)
+            step = max(1, max_tokens * LETTERS_PER_TOKEN // 2)
+            for offset in range(match.start(), match.end(), step):
+                stop = min(offset + step, match.end())
+                pieces.append((offset, stop, estimate_tokens(text[offset:stop]), page))
+            piece_start, piece_tokens = match.end(), 0
+            continue
+        piece_tokens += tokens
+    if piece_start < end:
+        pieces.append((piece_start, end, estimate_tokens(text[piece_start:end]), page))
+    return pieces
+
+
+def chunk_text(
+    text: str, max_tokens: int, overlap_percentage: float = 10
+) -> List[TextChunk]:
+    """
+    Split text into overlapping chunks on sentence and page boundaries.
+
+    Args:
+        text: Source text
+        max_tokens: Maximum estimated tokens per chunk
+        overlap_percentage: Share of max_tokens repeated from the previous chunk
+
+    Returns:
+        Chunks in text order (one chunk if the text fits)
+    """
+    max_tokens = max(1, int(max_tokens))
+    if not text:
+        return [TextChunk(0, 0, 0, 1, 1)]
+    units = _units(text, max_tokens)
+    total = sum(unit[2] for unit in units)
+    if total <= max_tokens:
+        return [TextChunk(0, len(text), total, 1, units[-1][3] if units else 1)]
+
+    overlap_tokens = int(max_tokens * overlap_percentage / 100)
+    chunks: List[TextChunk] = []
+    current: List[Tuple[int, int, int, int]] = []
+    current_tokens = 0
+
+    def flush() -> None:
+        nonlocal current, current_tokens
+        chunks.append(
+            TextChunk(
+                current[0][0],
+                current[-1][1],
+                current_tokens,
+                current[0][3],
+                current[-1][3],
+            )
+        )
+        # Carry trailing sentences into the next chunk, never the whole chunk
+        carried: List[Tuple[int, int, int, int]] = []
+        carried_tokens = 0
+        for unit in reversed(current[1:]):
+            if carried_tokens + unit[2] > overlap_tokens:
+                break
+            carried.insert(0, unit)
+            carried_tokens += unit[2]
+        current, current_tokens = carried, carried_tokens
+
+    page_tokens: Dict[int, int] = {}
+    for unit in units:
+        page_tokens[unit[3]] = page_tokens.get(unit[3], 0) + unit[2]
+
+    previous_page = None
+    for unit in units:
+        page = unit[3]
+        if (
+            page != previous_page
+            and current
+            and current_tokens >= max_tokens // 2
+            and current_tokens + page_tokens[page] > max_tokens
+        ):
+            # The next page does not fit: end this chunk at the page boundary
+            flush()
+        if current and current_tokens + unit[2] > max_tokens:
+            flush()
+            while current and current_tokens + unit[2] > max_tokens:
+                # Overlap plus this sentence is over budget: drop overlap
+                current_tokens -= current.pop(0)[2]
+        current.append(unit)
+        current_tokens += unit[2]
+        previous_page = page
+    if current and (not chunks or current[-1][1] > chunks[-1].end):
+        chunks.append(
+            TextChunk(
+                current[0][0],
+                current[-1][1],
+                current_tokens,
+                current[0][3],
+                current[-1][3],
+            )
+        )
+    return chunks
+
+
+def build_manifest(
+    text: str, max_tokens: int, overlap_percentage: float = 10
+) -> ChunkManifest:
+    """Chunk text and record the result with its content hash."""
+    return ChunkManifest(
+        content_sha256=content_hash(text),
+        params=chunk_params(max_tokens, overlap_percentage),
+        chunks=chunk_text(text, max_tokens, overlap_percentage),
+    )
+
+
+def load_manifest(
+    data: Optional[Dict[str, Any]], content_sha256: str, params: Dict[str, Any]
+) -> Optional[ChunkManifest]:
+    """Parse stored manifest data, returning None unless it matches the text and parameters."""
+    if not data:
+        return None
+    try:
+        manifest = ChunkManifest.from_dict(data)
+    except (KeyError, TypeError) as e:
+        logger.warning(f"Ignoring malformed chunk manifest: {e}")
+        return None
+    return manifest if manifest.matches(content_sha256, params) else None
+
+
+def read_manifest_data(bucket: str, key: str) -> Optional[Dict[str, Any]]:
+    """Read stored manifest data, returning None if there is none (a cache miss)."""
+    client = s3.get_s3_client()
+    try:
+        response = client.get_object(Bucket=bucket, Key=key)
+    except client.exceptions.NoSuchKey:
+        return None
+    return json.loads(response["Body"].read().decode("utf-8"))
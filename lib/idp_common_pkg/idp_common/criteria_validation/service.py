@@ -10,16 +10,22 @@ chunking, and cost tracking.
 """
 
 import asyncio
+import functools
 import json
 import logging
 import os
 import time
+from contextvars import ContextVar
 from datetime import datetime
-from typing import Any, Dict, List, Optional
-
-import s3fs
-
-from idp_common import bedrock, s3, utils
+from typing import Any, Dict, List, Optional, Tuple
+
+from idp_common import bedrock, utils
+from idp_common.criteria_validation import chunking
+from idp_common.criteria_validation.async_client import (
+    DEFAULT_S3_CONCURRENCY,
+    AsyncBedrockS3Client,
+    gather_bounded,
+)
 from idp_common.criteria_validation.models import (
     CriteriaValidationResult,
     LLMResponse,
@@ -27,6 +33,13 @@ from idp_common.criteria_validation.models import (
 
 logger = logging.getLogger(__name__)
 
+# Async client and admission semaphore of the validation run in progress. Tasks
+# inherit the context of the run that created them, so concurrent
+# validate_request_async calls on one service each see their own.
+_current_run: ContextVar[Optional[Tuple[AsyncBedrockS3Client, asyncio.Semaphore]]] = (
+    ContextVar("criteria_validation_run", default=None)
+)
+
 
 class CriteriaValidationService:
     """Service for validating documents against criteria using LLMs."""
@@ -64,9 +77,18 @@ class CriteriaValidationService:
             "criteria_processing_time": [],
         }
 
-        # Get async processing config
-        self.semaphore = asyncio.Semaphore(
-            self.config.get("criteria_validation", {}).get("semaphore", 5)
+        # Get async processing config. Semaphores and thread pools are created
+        # per validation run, inside the event loop that uses them.
+        cv_config = self.config.get("criteria_validation", {})
+        self.model_concurrency = max(1, int(cv_config.get("semaphore", 5)))
+        self.model_limits = cv_config.get("model_concurrency") or {}
+        self.s3_concurrency = max(
+            1, int(cv_config.get("s3_concurrency", DEFAULT_S3_CONCURRENCY))
+        )
+        self.file_concurrency = max(1, int(cv_config.get("file_concurrency", 4)))
+        self.max_pending_questions = max(
+            1,
+            int(cv_config.get("max_pending_questions", 2 * self.model_concurrency)),
         )
         self.max_chunk_size = self.config.get("criteria_validation", {}).get(
             "max_chunk_size", 10000
@@ -77,6 +99,22 @@ class CriteriaValidationService:
         self.overlap_percentage = self.config.get("criteria_validation", {}).get(
             "overlap_percentage", 10
         )
+        # Chunk manifests are stored under this prefix of the output bucket;
+        # an empty value turns persistence off
+        manifest_prefix = cv_config.get("chunk_manifest_prefix", "chunk_manifests")
+        self.chunk_manifest_prefix = (
+            str(manifest_prefix).strip("/") if manifest_prefix else None
+        )
+
+    @property
+    def _client(self) -> Optional[AsyncBedrockS3Client]:
+        run = _current_run.get()
+        return run[0] if run else None
+
+    @property
+    def _admission(self) -> Optional[asyncio.Semaphore]:
+        run = _current_run.get()
+        return run[1] if run else None
 
     def _chunk_text_with_overlap(
         self,
@@ -88,42 +126,70 @@ class CriteriaValidationService:
         """
         Chunk text with overlap for better context preservation.
 
+        Chunks end on sentence and page boundaries and are sized with
+        chunking.estimate_tokens (see idp_common.criteria_validation.chunking).
+
         Args:
             text: Text to chunk
             max_chunk_size: Maximum chunk size in tokens
-            token_size: Average token size
+            token_size: Unused; kept for compatibility (tokens are estimated from the text)
             overlap_percentage: Percentage of overlap between chunks
 
         Returns:
             List of text chunks
         """
-        # Simple token estimation
-        estimated_tokens = len(text) // token_size
-
-        if estimated_tokens <= max_chunk_size:
-            return [text]
+        return [
+            text[chunk.start : chunk.end]
+            for chunk in chunking.chunk_text(text, max_chunk_size, overlap_percentage)
+        ]
 
-        # Calculate chunk size in characters
-        chunk_size_chars = max_chunk_size * token_size
-        overlap_chars = int(chunk_size_chars * (overlap_percentage / 100))
+    async def _get_chunks(
+        self, txt_file: str, content: str, output_bucket: Optional[str]
+    ) -> List[str]:
+        """
+        Chunk a user history file, reusing its stored manifest when the content is unchanged.
 
-        chunks = []
-        start = 0
+        Args:
+            txt_file: S3 URI of the text file (for logging)
+            content: Text of the file
+            output_bucket: Bucket holding chunk manifests
 
-        while start < len(text):
-            end = start + chunk_size_chars
-            if end > len(text):
-                end = len(text)
+        Returns:
+            List of text chunks
+        """
+        if not self.chunk_manifest_prefix or not output_bucket:
+            return self._chunk_text_with_overlap(
+                content, self.max_chunk_size, self.token_size, self.overlap_percentage
+            )
 
-            chunk = text[start:end]
-            chunks.append(chunk)
+        content_sha256 = chunking.content_hash(content)
+        params = chunking.chunk_params(self.max_chunk_size, self.overlap_percentage)
+        key = chunking.manifest_key(self.chunk_manifest_prefix, content_sha256, params)
+        try:
+            data = await self._client.run_io(
+                chunking.read_manifest_data, output_bucket, key
+            )
+        except Exception as e:
+            logger.warning(f"Failed to read chunk manifest for {txt_file}: {e}")
+            data = None
 
-            # Move start position with overlap
-            start = end - overlap_chars
-            if start >= len(text):
-                break
+        manifest = chunking.load_manifest(data, content_sha256, params)
+        if manifest:
+            logger.info(
+                f"Reusing {len(manifest.chunks)} chunks of {txt_file} from manifest"
+            )
+            return manifest.texts(content)
 
-        return chunks
+        manifest = chunking.build_manifest(
+            content, self.max_chunk_size, self.overlap_percentage
+        )
+        try:
+            await self._client.write_content(
+                manifest.to_dict(), output_bucket, key, content_type="application/json"
+            )
+        except Exception as e:
+            logger.warning(f"Failed to store chunk manifest for {txt_file}: {e}")
+        return manifest.texts(content)
 
     def _prepare_prompt(
         self,
@@ -158,30 +224,24 @@ class CriteriaValidationService:
         context: str = "CriteriaValidation",
     ) -> Dict[str, Any]:
         """
-        Async wrapper for bedrock.invoke_model.
+        Invoke a model through the per-model lane of the run's async client.
 
-        Since the common bedrock client is synchronous, we run it in an executor
-        to maintain async compatibility.
+        At most `semaphore` (or `model_concurrency[model_id]`) calls per model
+        are in flight; further calls wait for a slot without holding a thread.
         """
-        loop = asyncio.get_event_loop()
-
-        # Run the synchronous bedrock.invoke_model in an executor
-        response = await loop.run_in_executor(
-            None,
-            bedrock.invoke_model,
+        if self._client is None:
+            raise RuntimeError("No async client; call validate_request_async")
+        return await self._client.invoke_model(
             model_id,
             system_prompt,
-            [{"text": content}],  # content as list
-            temperature,
-            top_k,
-            top_p,
-            max_tokens,
-            None,
-            context,
+            content,
+            temperature=temperature,
+            top_k=top_k,
+            top_p=top_p,
+            max_tokens=max_tokens,
+            context=context,
         )
 
-        return response
-
     async def _process_criteria_question(
         self,
         question: str,
@@ -203,7 +263,8 @@ class CriteriaValidationService:
         Returns:
             Validated response dictionary
         """
-        async with self.semaphore:
+        # Admission bounds the questions with a prompt built, queued or in flight
+        async with self._admission:
             try:
                 # Prepare the prompt
                 prompt = self._prepare_prompt(
@@ -305,6 +366,7 @@ class CriteriaValidationService:
         user_history: str,
         txt_file_uri: str,
         config: Dict[str, Any],
+        questions: List[str],
     ) -> List[Dict[str, Any]]:
         """
         Process all criteria questions for a specific criteria type.
@@ -314,6 +376,7 @@ class CriteriaValidationService:
             user_history: The user history text
             txt_file_uri: Source file URI
             config: Configuration for the validation
+            questions: Criteria questions of the type (see _load_criteria)
 
         Returns:
             List of validation responses
@@ -321,29 +384,22 @@ class CriteriaValidationService:
         start_time = time.time()
 
         try:
-            # Get criteria questions
-            criteria_bucket = config.get("criteria_bucket")
-            criteria_uri = f"s3://{criteria_bucket}/{criteria_type}.json"
-
-            # Read criteria file
-            criteria_data = s3.get_json_content(criteria_uri)
-            if not criteria_data or "criteria" not in criteria_data:
-                raise ValueError(f"Invalid criteria file: {criteria_uri}")
-
-            # Process all questions concurrently
-            tasks = []
-            for question in criteria_data["criteria"]:
-                task = self._process_criteria_question(
-                    question=question,
-                    user_history=user_history,
-                    txt_file_uri=txt_file_uri,
-                    criteria_type=criteria_type,
-                    config=config,
-                )
-                tasks.append(task)
-
-            # Wait for all tasks to complete
-            responses = await asyncio.gather(*tasks)
+            # Process questions concurrently; admission and the model lane
+            # bound how many are actually running
+            responses = await gather_bounded(
+                (
+                    functools.partial(
+                        self._process_criteria_question,
+                        question=question,
+                        user_history=user_history,
+                        txt_file_uri=txt_file_uri,
+                        criteria_type=criteria_type,
+                        config=config,
+                    )
+                    for question in questions
+                ),
+                self.max_pending_questions,
+            )
 
             # Track timing
             duration = time.time() - start_time
@@ -361,12 +417,64 @@ class CriteriaValidationService:
             logger.error(f"Error processing criteria type {criteria_type}: {str(e)}")
             raise
 
+    async def _summarize_question(
+        self,
+        criteria_type: str,
+        question: str,
+        question_responses: List[Dict[str, Any]],
+        config: Dict[str, Any],
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Summarize the responses to one question across files.
+
+        Returns:
+            Validated summary, or None if the summary could not be parsed
+        """
+        summary_config = config["summary"]
+        async with self._admission:
+            # Prepare summary prompt
+            prompt = self._prepare_prompt(
+                summary_config["task_prompt"],
+                {
+                    "initial_response": json.dumps(question_responses),
+                    "question": question,
+                    "criteria_type": criteria_type,
+                    "recommendation_options": config["recommendation_options"],
+                },
+            )
+
+            # Invoke model for summary
+            response = await self._invoke_model_async(
+                model_id=config["model_id"],
+                system_prompt=summary_config["system_prompt"],
+                content=prompt,
+                temperature=summary_config.get("temperature", 0.0),
+                context="CriteriaValidationSummary",
+            )
+
+        # Parse response
+        response_text = bedrock.extract_text_from_response(response)
+        try:
+            if "```json" in response_text:
+                start_idx = response_text.find("```json") + 7
+                end_idx = response_text.find("```", start_idx)
+                response_text = response_text[start_idx:end_idx].strip()
+
+            summary_dict = json.loads(response_text)
+            return LLMResponse(**summary_dict).dict()
+        except Exception as e:
+            logger.error(f"Error parsing summary response: {str(e)}")
+            return None
+
     async def _summarize_responses(
         self, responses: Dict[str, Any], config: Dict[str, Any]
     ) -> Dict[str, Any]:
         """
         Summarize validation responses across multiple files.
 
+        Questions are summarized concurrently under the same admission limit
+        as criteria questions.
+
         Args:
             responses: Initial responses to summarize
             config: Configuration for summarization
@@ -379,48 +487,23 @@ class CriteriaValidationService:
             return responses
 
         try:
-            final_responses = {}
-
-            for criteria_type, criteria_content in responses.items():
-                criteria_summaries = []
-
-                for question, question_responses in criteria_content.items():
-                    # Prepare summary prompt
-                    prompt = self._prepare_prompt(
-                        summary_config["task_prompt"],
-                        {
-                            "initial_response": json.dumps(question_responses),
-                            "question": question,
-                            "criteria_type": criteria_type,
-                            "recommendation_options": config["recommendation_options"],
-                        },
-                    )
-
-                    # Invoke model for summary
-                    response = await self._invoke_model_async(
-                        model_id=config["model_id"],
-                        system_prompt=summary_config["system_prompt"],
-                        content=prompt,
-                        temperature=summary_config.get("temperature", 0.0),
-                        context="CriteriaValidationSummary",
-                    )
-
-                    # Parse response
-                    response_text = bedrock.extract_text_from_response(response)
-                    try:
-                        if "```json" in response_text:
-                            start_idx = response_text.find("```json") + 7
-                            end_idx = response_text.find("```", start_idx)
-                            response_text = response_text[start_idx:end_idx].strip()
-
-                        summary_dict = json.loads(response_text)
-                        validated_summary = LLMResponse(**summary_dict)
-                        criteria_summaries.append(validated_summary.dict())
-                    except Exception as e:
-                        logger.error(f"Error parsing summary response: {str(e)}")
+            items = [
+                (criteria_type, question, question_responses)
+                for criteria_type, criteria_content in responses.items()
+                for question, question_responses in criteria_content.items()
+            ]
+            summaries = await gather_bounded(
+                (
+                    functools.partial(self._summarize_question, *item, config)
+                    for item in items
+                ),
+                self.max_pending_questions,
+            )
 
-                if criteria_type not in final_responses:
-                    final_responses[criteria_type] = criteria_summaries
+            final_responses = {criteria_type: [] for criteria_type in responses}
+            for (criteria_type, _, _), summary in zip(items, summaries):
+                if summary is not None:
+                    final_responses[criteria_type].append(summary)
 
             return final_responses
 
@@ -428,12 +511,88 @@ class CriteriaValidationService:
             logger.error(f"Error in summarization: {str(e)}")
             return responses
 
+    async def _load_criteria(self, config: Dict[str, Any]) -> Dict[str, List[str]]:
+        """
+        Read the criteria file of every criteria type once per request.
+
+        Args:
+            config: Configuration for the validation
+
+        Returns:
+            Criteria questions by criteria type
+        """
+        criteria_bucket = config.get("criteria_bucket")
+        criteria_types = config.get("criteria_types", [])
+        uris = [f"s3://{criteria_bucket}/{t}.json" for t in criteria_types]
+        criteria_files = await gather_bounded(
+            (functools.partial(self._client.get_json_content, uri) for uri in uris),
+            self.s3_concurrency,
+        )
+        criteria = {}
+        for criteria_type, uri, criteria_data in zip(
+            criteria_types, uris, criteria_files
+        ):
+            if not criteria_data or "criteria" not in criteria_data:
+                raise ValueError(f"Invalid criteria file: {uri}")
+            criteria[criteria_type] = criteria_data["criteria"]
+        return criteria
+
+    async def _process_text_file(
+        self,
+        txt_file: str,
+        config: Dict[str, Any],
+        criteria: Dict[str, List[str]],
+    ) -> List[List[List[Dict[str, Any]]]]:
+        """
+        Validate one user history file against all criteria types.
+
+        Args:
+            txt_file: S3 URI of the text file
+            config: Configuration for the validation
+            criteria: Criteria questions by criteria type
+
+        Returns:
+            Responses per chunk, then per criteria type
+        """
+        # Read file content without blocking the event loop
+        content = await self._client.get_text_content(txt_file)
+
+        # Chunk on sentence and page boundaries, or reuse the stored chunk manifest
+        chunks = await self._get_chunks(
+            txt_file,
+            content,
+            config.get("output_bucket", config.get("request_bucket")),
+        )
+
+        criteria_types = config.get("criteria_types", [])
+        responses = await gather_bounded(
+            (
+                functools.partial(
+                    self._process_criteria_type,
+                    criteria_type=criteria_type,
+                    user_history=chunk,
+                    txt_file_uri=txt_file,
+                    config=config,
+                    questions=criteria[criteria_type],
+                )
+                for chunk in chunks
+                for criteria_type in criteria_types
+            ),
+            max(1, len(chunks) * len(criteria_types)),
+        )
+        width = len(criteria_types)
+        return [responses[i : i + width] for i in range(0, len(responses), width)]
+
     async def validate_request_async(
         self, request_id: str, config: Dict[str, Any]
     ) -> CriteriaValidationResult:
         """
         Validate a request against criteria asynchronously.
 
+        Files are processed `file_concurrency` at a time; S3 calls run in the
+        async client's S3 lane and model calls in per-model lanes. If the run
+        fails or is cancelled, outstanding questions are cancelled.
+
         Args:
             request_id: The request ID to validate
             config: Configuration for the validation
@@ -443,6 +602,14 @@ class CriteriaValidationService:
         """
         self.timing_metrics["start_time"] = datetime.now()
 
+        client = AsyncBedrockS3Client(
+            model_concurrency=self.model_concurrency,
+            model_limits=self.model_limits,
+            s3_concurrency=self.s3_concurrency,
+        )
+        run_token = _current_run.set(
+            (client, asyncio.Semaphore(self.max_pending_questions))
+        )
         try:
             # Get user history files
             request_bucket = config.get("request_bucket")
@@ -452,45 +619,30 @@ class CriteriaValidationService:
             )
 
             # List all text files
-            fs = s3fs.S3FileSystem()
-            txt_files = [
-                f"s3://{file}" for file in fs.ls(data_location) if file.endswith(".txt")
-            ]
+            txt_files = await client.run_io(self._list_text_files, data_location)
 
             if not txt_files:
                 raise ValueError(f"No text files found for request {request_id}")
 
-            # Process each file
-            all_responses = {}
-            multiple_files = len(txt_files) > 1
-
-            for txt_file in txt_files:
-                # Read file content
-                content = s3.get_text_content(txt_file)
+            # Read each criteria file once for all files and chunks
+            criteria = await self._load_criteria(config)
 
-                # Check if chunking is needed
-                chunks = self._chunk_text_with_overlap(
-                    content,
-                    self.max_chunk_size,
-                    self.token_size,
-                    self.overlap_percentage,
-                )
+            # Process files concurrently; results come back in file order
+            file_responses = await gather_bounded(
+                (
+                    functools.partial(
+                        self._process_text_file, txt_file, config, criteria
+                    )
+                    for txt_file in txt_files
+                ),
+                self.file_concurrency,
+            )
 
-                for chunk_idx, chunk in enumerate(chunks):
-                    # Process each criteria type concurrently
-                    tasks = []
-                    for criteria_type in config.get("criteria_types", []):
-                        task = self._process_criteria_type(
-                            criteria_type=criteria_type,
-                            user_history=chunk,
-                            txt_file_uri=txt_file,
-                            config=config,
-                        )
-                        tasks.append(task)
-
-                    # Wait for all criteria types to complete
-                    responses = await asyncio.gather(*tasks)
+            all_responses = {}
+            multiple_files = len(txt_files) > 1
 
+            for chunk_responses in file_responses:
+                for responses in chunk_responses:
                     # Organize responses
                     for criteria_idx, criteria_type in enumerate(
                         config.get("criteria_types", [])
@@ -515,22 +667,29 @@ class CriteriaValidationService:
 
             # Save results
             output_bucket = config.get("output_bucket", request_bucket)
-            output_uris = []
-
-            for criteria_type, responses in all_responses.items():
-                output_key = (
-                    f"responses/request_id_{request_id}_{criteria_type}_responses.json"
-                )
-                output_uri = f"s3://{output_bucket}/{output_key}"
-
-                # Save to S3
-                s3.write_content(
+            outputs = [
+                (
                     responses,
-                    output_bucket,
-                    output_key,
-                    content_type="application/json",
+                    f"responses/request_id_{request_id}_{criteria_type}_responses.json",
                 )
-                output_uris.append(output_uri)
+                for criteria_type, responses in all_responses.items()
+            ]
+            await gather_bounded(
+                (
+                    functools.partial(
+                        client.write_content,
+                        responses,
+                        output_bucket,
+                        output_key,
+                        content_type="application/json",
+                    )
+                    for responses, output_key in outputs
+                ),
+                self.s3_concurrency,
+            )
+            output_uris = [
+                f"s3://{output_bucket}/{output_key}" for _, output_key in outputs
+            ]
 
             # Calculate timing
             self.timing_metrics["end_time"] = datetime.now()
@@ -553,6 +712,7 @@ class CriteriaValidationService:
                     "timing": self.timing_metrics,
                     "files_processed": len(txt_files),
                     "output_uris": output_uris,
+                    "concurrency": client.stats(),
                 },
             )
 
@@ -563,6 +723,19 @@ class CriteriaValidationService:
         except Exception as e:
             logger.error(f"Error validating request {request_id}: {str(e)}")
             raise
+        finally:
+            client.close()
+            _current_run.reset(run_token)
+
+    @staticmethod
+    def _list_text_files(data_location: str) -> List[str]:
+        """List the .txt files under an S3 prefix (blocking)."""
+        import s3fs
+
+        fs = s3fs.S3FileSystem()
+        return [
+            f"s3://{file}" for file in fs.ls(data_location) if file.endswith(".txt")
+        ]
 
     def validate_request(
         self, request_id: str, config: Dict[str, Any]
@@ -13,13 +13,28 @@ import logging
 import math
 import re
 from abc import ABC, abstractmethod
-from typing import Any, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from munkres import Munkres, make_cost_matrix
 
 from idp_common import bedrock
 from idp_common.evaluation.models import EvaluationMethod
 
+# NumPy and SciPy speed up Hungarian matching of large lists when available
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    from scipy.optimize import linear_sum_assignment
+
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
@@ -40,6 +55,24 @@ class Comparator(ABC):
         """
         pass
 
+    def compare_matrix(self, values1: Sequence[Any], values2: Sequence[Any]) -> Any:
+        """
+        Compare every value in values1 with every value in values2.
+
+        Subclasses override this to normalize each value once and fill the matrix
+        in bulk; the result must equal calling compare() for each pair.
+
+        Args:
+            values1: Row values
+            values2: Column values
+
+        Returns:
+            Similarity matrix as a NumPy array when NumPy is available, otherwise
+            a list of lists
+        """
+        matrix = [[self.compare(v1, v2) for v2 in values2] for v1 in values1]
+        return np.array(matrix, dtype=float) if NUMPY_AVAILABLE else matrix
+
 
 class ExactComparator(Comparator):
     """Exact string match comparator."""
@@ -50,6 +83,14 @@ class ExactComparator(Comparator):
         value2_norm = strip_punctuation_space(str(value2))
         return 1.0 if value1_norm == value2_norm else 0.0
 
+    def compare_matrix(self, values1: Sequence[Any], values2: Sequence[Any]) -> Any:
+        """Compare all pairs, normalizing each value once."""
+        norm1 = [strip_punctuation_space(str(v)) for v in values1]
+        norm2 = [strip_punctuation_space(str(v)) for v in values2]
+        if not NUMPY_AVAILABLE:
+            return [[1.0 if a == b else 0.0 for b in norm2] for a in norm1]
+        return _equality_matrix(norm1, norm2)
+
 
 class NumericComparator(Comparator):
     """Numeric exact match comparator."""
@@ -64,6 +105,32 @@ class NumericComparator(Comparator):
             # Fall back to string comparison if numeric conversion fails
             return ExactComparator().compare(value1, value2)
 
+    def compare_matrix(self, values1: Sequence[Any], values2: Sequence[Any]) -> Any:
+        """Compare all pairs, normalizing each value once."""
+        if not NUMPY_AVAILABLE:
+            return super().compare_matrix(values1, values2)
+
+        def numeric(values):
+            nums, valid = [], []
+            for v in values:
+                try:
+                    nums.append(normalize_numeric(v))
+                    valid.append(True)
+                except ValueError:
+                    nums.append(0.0)
+                    valid.append(False)
+            return np.array(nums, dtype=float), np.array(valid, dtype=bool)
+
+        nums1, valid1 = numeric(values1)
+        nums2, valid2 = numeric(values2)
+        numeric_match = nums1[:, None] == nums2[None, :]
+        both_numeric = valid1[:, None] & valid2[None, :]
+        if both_numeric.all():
+            return numeric_match.astype(float)
+        # Pairs where either value is not numeric fall back to exact string matching
+        string_match = ExactComparator().compare_matrix(values1, values2)
+        return np.where(both_numeric, numeric_match, string_match).astype(float)
+
 
 class FuzzyComparator(Comparator):
     """Fuzzy string match comparator."""
@@ -82,6 +149,33 @@ class FuzzyComparator(Comparator):
         score = fuzz_score(str(value1), str(value2))
         return score
 
+    def compare_matrix(self, values1: Sequence[Any], values2: Sequence[Any]) -> Any:
+        """Compare all pairs, normalizing each value and building its bit masks once."""
+        norm2 = [strip_punctuation_space(str(v)) for v in values2]
+        matrix = []
+        for value in values1:
+            s1 = strip_punctuation_space(str(value))
+            masks = _char_masks(s1) if s1 else {}
+            row = []
+            for s2 in norm2:
+                if s1 == s2:
+                    row.append(1.0)
+                elif not s1 or not s2:
+                    row.append(0.0)
+                else:
+                    distance = _bit_parallel_distance(s1, masks, s2)
+                    row.append(1.0 - distance / max(len(s1), len(s2)))
+            matrix.append(row)
+        return np.array(matrix, dtype=float) if NUMPY_AVAILABLE else matrix
+
+
+def _equality_matrix(values1: List[str], values2: List[str]) -> Any:
+    """Build a 0/1 equality matrix by mapping strings to integer codes and broadcasting."""
+    codes: Dict[str, int] = {}
+    codes1 = np.array([codes.setdefault(v, len(codes)) for v in values1])
+    codes2 = np.array([codes.setdefault(v, len(codes)) for v in values2])
+    return (codes1[:, None] == codes2[None, :]).astype(float)
+
 
 def strip_punctuation_space(text: str) -> str:
     """
@@ -262,23 +356,14 @@ def compare_hungarian(
     if not actual_list:
         return 0, 0, 0.0
 
-    # Create similarity matrix for Hungarian algorithm
-    matrix = [[0 for _ in range(len(actual_list))] for _ in range(len(expected_list))]
-
-    # Fill matrix with comparison scores from the provided comparator
-    for i, exp_val in enumerate(expected_list):
-        for j, act_val in enumerate(actual_list):
-            matrix[i][j] = comparator.compare(exp_val, act_val)
-
-    # Convert to cost matrix (Hungarian algorithm minimizes cost)
-    cost_matrix = make_cost_matrix(matrix, lambda x: 1 - x)
+    # Similarity matrix from the provided comparator
+    matrix = comparator.compare_matrix(expected_list, actual_list)
 
     # Compute the optimal assignment
-    m = Munkres()
-    indexes = m.compute(cost_matrix)
+    indexes = solve_assignment(matrix)
 
     # Count matches and calculate average score
-    matches = [(i, j, matrix[i][j]) for i, j in indexes]
+    matches = [(i, j, float(matrix[i][j])) for i, j in indexes]
     true_positives = sum(1 for _, _, score in matches if score >= threshold)
     false_positives = len(actual_list) - true_positives
 
@@ -287,12 +372,101 @@ def compare_hungarian(
     return true_positives, false_positives, avg_score
 
 
+def solve_assignment(matrix: Any) -> List[Tuple[int, int]]:
+    """
+    Find the row/column assignment that maximizes total similarity.
+
+    Uses scipy.optimize.linear_sum_assignment when SciPy is installed and the
+    pure-Python Munkres implementation otherwise. Both minimize the same
+    1 - similarity cost over min(rows, columns) pairs.
+
+    Args:
+        matrix: Similarity matrix (NumPy array or list of lists)
+
+    Returns:
+        List of (row, column) pairs sorted by row
+    """
+    if SCIPY_AVAILABLE and NUMPY_AVAILABLE:
+        rows, cols = linear_sum_assignment(1.0 - np.asarray(matrix, dtype=float))
+        return [(int(i), int(j)) for i, j in zip(rows, cols)]
+
+    rows = (
+        matrix.tolist()
+        if NUMPY_AVAILABLE and isinstance(matrix, np.ndarray)
+        else matrix
+    )
+    cost_matrix = make_cost_matrix(rows, lambda x: 1 - x)
+    return Munkres().compute(cost_matrix)
+
+
+def _char_masks(pattern: str) -> Dict[str, int]:
+    """Bit mask of the positions of each character in pattern."""
+    masks: Dict[str, int] = {}
+    for i, char in enumerate(pattern):
+        masks[char] = masks.get(char, 0) | (1 << i)
+    return masks
+
+
+def _bit_parallel_distance(pattern: str, masks: Dict[str, int], text: str) -> int:
+    """
+    Levenshtein distance using Hyyrö's bit-parallel algorithm.
+
+    Python integers act as arbitrary-width bit vectors, so each character of text
+    costs a handful of integer operations regardless of the pattern length.
+
+    Args:
+        pattern: Non-empty string whose masks were built with _char_masks()
+        masks: Character position masks for pattern
+        text: String to compare against pattern
+
+    Returns:
+        Edit distance between pattern and text
+    """
+    m = len(pattern)
+    full = (1 << m) - 1
+    last = 1 << (m - 1)
+    pv, mv, score = full, 0, m
+    for char in text:
+        eq = masks.get(char, 0)
+        xv = eq | mv
+        xh = ((((eq & pv) + pv) & full) ^ pv) | eq
+        ph = (mv | ~(xh | pv)) & full
+        mh = pv & xh
+        if ph & last:
+            score += 1
+        elif mh & last:
+            score -= 1
+        ph = ((ph << 1) | 1) & full
+        mh = (mh << 1) & full
+        pv = (mh | ~(xv | ph)) & full
+        mv = ph & xv
+    return score
+
+
+def levenshtein_distance(s1: str, s2: str) -> int:
+    """
+    Calculate the Levenshtein (edit) distance between two strings.
+
+    Args:
+        s1: First string
+        s2: Second string
+
+    Returns:
+        Minimum number of single-character insertions, deletions and substitutions
+    """
+    if not s1:
+        return len(s2)
+    if not s2:
+        return len(s1)
+    return _bit_parallel_distance(s1, _char_masks(s1), s2)
+
+
 def fuzz_score(s1: str, s2: str) -> float:
     """
     Calculate fuzzy match score between two strings.
 
-    This is a simplified implementation. For a real implementation,
-    you might want to use a dedicated library like python-Levenshtein or fuzzywuzzy.
+    The score is 1 - (Levenshtein distance / length of the longer string) after
+    normalizing punctuation, whitespace and case.
 
     Args:
         s1: First string
@@ -313,27 +487,9 @@ def fuzz_score(s1: str, s2: str) -> float:
     if not s1 or not s2:
         return 0.0
 
-    # Calculate Levenshtein distance (simplified implementation)
-    len_s1, len_s2 = len(s1), len(s2)
-    d = [[0 for _ in range(len_s2 + 1)] for _ in range(len_s1 + 1)]
-
-    for i in range(len_s1 + 1):
-        d[i][0] = i
-    for j in range(len_s2 + 1):
-        d[0][j] = j
-
-    for i in range(1, len_s1 + 1):
-        for j in range(1, len_s2 + 1):
-            cost = 0 if s1[i - 1] == s2[j - 1] else 1
-            d[i][j] = min(
-                d[i - 1][j] + 1,  # deletion
-                d[i][j - 1] + 1,  # insertion
-                d[i - 1][j - 1] + cost,  # substitution
-            )
-
     # Convert to similarity score (1.0 for identical, approaching 0.0 for very different)
-    max_len = max(len_s1, len_s2)
-    return 1.0 - (d[len_s1][len_s2] / max_len if max_len > 0 else 0.0)
+    max_len = max(len(s1), len(s2))
+    return 1.0 - levenshtein_distance(s1, s2) / max_len
 
 
 def compare_fuzzy(
@@ -391,9 +547,16 @@ def cosine_similarity(v1: List[float], v2: List[float]) -> float:
         v2 = v2[:min_len]
 
     # Calculate dot product and magnitudes
-    dot_product = sum(a * b for a, b in zip(v1, v2))
-    magnitude1 = math.sqrt(sum(a * a for a in v1))
-    magnitude2 = math.sqrt(sum(b * b for b in v2))
+    if NUMPY_AVAILABLE:
+        a = np.asarray(v1, dtype=np.float64)
+        b = np.asarray(v2, dtype=np.float64)
+        dot_product = float(a @ b)
+        magnitude1 = float(np.sqrt(a @ a))
+        magnitude2 = float(np.sqrt(b @ b))
+    else:
+        dot_product = sum(a * b for a, b in zip(v1, v2))
+        magnitude1 = math.sqrt(sum(a * a for a in v1))
+        magnitude2 = math.sqrt(sum(b * b for b in v2))
 
     # Avoid division by zero
     if magnitude1 == 0 or magnitude2 == 0:
@@ -408,15 +571,20 @@ def compare_semantic(
     actual: Any,
     threshold: float = 0.8,
     model_id: str = "amazon.titan-embed-text-v1",
+    embedding_service: Optional[bedrock.EmbeddingService] = None,
 ) -> Tuple[bool, float]:
     """
     Compare values using semantic embedding similarity.
 
+    Embeddings are looked up through the shared embedding service, so values seen
+    before (or prefetched with embed_many) do not call Bedrock again.
+
     Args:
         expected: Expected value
         actual: Actual value
         threshold: Minimum similarity score to consider a match (0.0 to 1.0)
         model_id: The embedding model to use
+        embedding_service: Embedding service (defaults to the process-wide service)
 
     Returns:
         Tuple of (matched, score)
@@ -453,8 +621,9 @@ def compare_semantic(
         )
 
         # Generate embeddings
-        expected_embedding = bedrock.generate_embedding(expected_str, model_id)
-        actual_embedding = bedrock.generate_embedding(actual_str, model_id)
+        embedding_service = embedding_service or bedrock.get_embedding_service()
+        expected_embedding = embedding_service.embed(expected_str, model_id)
+        actual_embedding = embedding_service.embed(actual_str, model_id)
 
         # If either embedding is empty, fall back to fuzzy matching
         if not expected_embedding or not actual_embedding:
@@ -79,10 +79,12 @@ class DocumentEvaluationResult:
     overall_metrics: Dict[str, float] = field(default_factory=dict)
     execution_time: float = 0.0
     output_uri: Optional[str] = None
+    # Embedding cache statistics for SEMANTIC comparisons made during this run
+    embedding_stats: Optional[Dict[str, Any]] = None
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary representation."""
-        return {
+        result = {
             "document_id": self.document_id,
             "overall_metrics": self.overall_metrics,
             "execution_time": self.execution_time,
@@ -113,6 +115,9 @@ class DocumentEvaluationResult:
                 for sr in self.section_results
             ],
         }
+        if self.embedding_stats is not None:
+            result["embedding_stats"] = self.embedding_stats
+        return result
 
     def to_markdown(self) -> str:
         """Convert evaluation results to markdown format."""
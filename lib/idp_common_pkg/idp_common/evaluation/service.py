@@ -16,7 +16,7 @@ import traceback
 from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional, Tuple
 
-from idp_common import s3
+from idp_common import bedrock, s3
 from idp_common.evaluation.comparator import compare_values
 from idp_common.evaluation.metrics import calculate_metrics
 from idp_common.evaluation.models import (
@@ -511,6 +511,36 @@ IMPORTANT: Respond ONLY with a valid JSON object and nothing else. Here's the ex
 
         return attribute_result, metrics
 
+    def _prefetch_embeddings(self, tasks: List[Dict[str, Any]]) -> None:
+        """
+        Embed the expected and actual values of SEMANTIC tasks in one batch.
+
+        Values are deduplicated and cache misses fetched concurrently, so the
+        compare_semantic calls made by the evaluation threads read from the cache.
+        Failures are logged; compare_semantic then retries or falls back as before.
+
+        Args:
+            tasks: Attribute evaluation tasks for a section
+        """
+        texts = []
+        for task in tasks:
+            if task["evaluation_method"] != EvaluationMethod.SEMANTIC:
+                continue
+            expected, actual = task["expected_value"], task["actual_value"]
+            if expected is None or actual is None:
+                continue
+            expected_str, actual_str = str(expected), str(actual)
+            # Only values that reach compare_semantic (both non-empty)
+            if expected_str.strip() and actual_str.strip():
+                texts.extend([expected_str, actual_str])
+
+        if not texts:
+            return
+        try:
+            bedrock.get_embedding_service().embed_many(texts, prefetch=True)
+        except Exception as e:
+            logger.warning(f"Error prefetching embeddings: {str(e)}")
+
     def evaluate_section(
         self,
         section: Section,
@@ -700,6 +730,9 @@ IMPORTANT: Respond ONLY with a valid JSON object and nothing else. Here's the ex
                     f"Error evaluating attribute {task['attr_name']}: {traceback.format_exc()}"
                 )
 
+        # Embed all SEMANTIC values in one batch so each comparison is a cache hit
+        self._prefetch_embeddings(parallel_tasks)
+
         # Then, process slow parallel tasks with ThreadPoolExecutor if there are any
         if parallel_tasks:
             # Only create threads for operations that benefit from parallelization
@@ -914,6 +947,8 @@ IMPORTANT: Respond ONLY with a valid JSON object and nothing else. Here's the ex
         try:
             # Start timing
             start_time = time.time()
+            embedding_service = bedrock.get_embedding_service()
+            embedding_stats_before = embedding_service.get_stats()
 
             # Track overall metrics
             total_tp = total_fp = total_fn = total_tn = total_fp1 = total_fp2 = 0
@@ -998,12 +1033,28 @@ IMPORTANT: Respond ONLY with a valid JSON object and nothing else. Here's the ex
 
             execution_time = time.time() - start_time
 
+            # Report embedding reuse for SEMANTIC comparisons in this run
+            embedding_stats = embedding_service.stats_delta(
+                embedding_stats_before, embedding_service.get_stats()
+            )
+            if embedding_stats["requests"]:
+                logger.info(
+                    f"Embedding cache for document {actual_document.id}: "
+                    f"{embedding_stats['requests']} lookups, "
+                    f"hit rate {embedding_stats['hit_rate']:.1%}, "
+                    f"{embedding_stats['bedrock_calls']} Bedrock calls, "
+                    f"{embedding_stats['calls_saved']} calls saved"
+                )
+            else:
+                embedding_stats = None
+
             # Create evaluation result
             evaluation_result = DocumentEvaluationResult(
                 document_id=actual_document.id,
                 section_results=section_results,
                 overall_metrics=overall_metrics,
                 execution_time=execution_time,
+                embedding_stats=embedding_stats,
             )
 
             # Store results if requested
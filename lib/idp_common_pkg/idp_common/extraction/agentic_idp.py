@@ -43,6 +43,7 @@ from strands.types.media import (
 )
 
 from idp_common.bedrock.client import CACHEPOINT_SUPPORTED_MODELS
+from idp_common.extraction.schema_cache import get_model_json_schema
 
 # Use AWS Lambda Powertools Logger for structured logging
 # Automatically logs as JSON with Lambda context, request_id, timestamp, etc.
@@ -242,7 +243,7 @@ def create_dynamic_extraction_tool_and_patch_tool(model_class: Type[TargetModel]
         Use this tool to return the requested data extraction.
         When you call this tool it overwrites the previous extraction, if you want to expand the extraction use jsonpatch.
         This tool needs to be Successfully invoked before the patch tool can be used.
-        required extraction schema is: {model_class.model_json_schema()}"""
+        required extraction schema is: {get_model_json_schema(model_class)}"""
     return extraction_tool, apply_json_patches
 
 
@@ -401,7 +402,7 @@ async def structured_output_async(
     tools = [extraction_tool, apply_json_patches, view_existing_extraction]
 
     # Create agent with system prompt and tools
-    schema_json = json.dumps(data_format.model_json_schema(), indent=2)
+    schema_json = json.dumps(get_model_json_schema(data_format), indent=2)
     tool_names = [getattr(tool, "__name__", str(tool)) for tool in tools]
     logger.debug(
         "Created agent with tools",
@@ -0,0 +1,132 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Process-wide cache of the Pydantic models and JSON schemas used for agentic extraction.
+
+Agentic extraction builds a Pydantic model for the section's class with
+pydantic.create_model (recursively for group and list item attributes) and the
+agent renders its JSON schema several times per section. Both are derived only
+from the class label and its attribute configuration, so they are kept here,
+keyed by the class label and a digest of the attribute tree, and reused across
+sections and warm Lambda invocations.
+
+Cached models and schemas are shared: callers must not modify them.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Set, Tuple, Type
+
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+# Generated models kept in memory (least recently used are dropped first)
+MAX_CACHED_MODELS = 512
+
+_STAT_FIELDS = ("hits", "misses", "evictions")
+
+_models: "OrderedDict[Tuple[str, str], Type[BaseModel]]" = OrderedDict()
+_cached_models: Set[Type[BaseModel]] = set()
+_schemas: Dict[Type[BaseModel], Dict[str, Any]] = {}
+_stats = dict.fromkeys(_STAT_FIELDS, 0)
+_lock = threading.Lock()
+
+
+def attributes_digest(attributes: List[Dict[str, Any]]) -> str:
+    """
+    Digest of an attribute tree.
+
+    Args:
+        attributes: Attribute configurations of a class
+
+    Returns:
+        Hex SHA-256 digest of the canonical JSON form
+    """
+    payload = json.dumps(
+        attributes or [], sort_keys=True, default=str, separators=(",", ":")
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def get_extraction_model(
+    class_label: str,
+    digest: str,
+    build: Callable[[], Type[BaseModel]],
+) -> Type[BaseModel]:
+    """
+    Get the extraction model of a class, building it on first use.
+
+    Args:
+        class_label: The document class name (the model name depends on it)
+        digest: attributes_digest() of the class attributes
+        build: Function creating the model from the attributes
+
+    Returns:
+        The Pydantic model class
+    """
+    key = (class_label, digest)
+    with _lock:
+        model = _models.get(key)
+        if model is not None:
+            _models.move_to_end(key)
+            _stats["hits"] += 1
+            return model
+        _stats["misses"] += 1
+
+    # Build outside the lock; concurrent misses for the same key build equivalent models
+    model = build()
+    with _lock:
+        model = _models.setdefault(key, model)
+        _models.move_to_end(key)
+        _cached_models.add(model)
+        while len(_models) > MAX_CACHED_MODELS:
+            _, evicted = _models.popitem(last=False)
+            _cached_models.discard(evicted)
+            _schemas.pop(evicted, None)
+            _stats["evictions"] += 1
+    return model
+
+
+def get_model_json_schema(model: Type[BaseModel]) -> Dict[str, Any]:
+    """
+    Get model.model_json_schema(), generated once per model class.
+
+    Only schemas of cached extraction models are kept; other models are
+    generated on every call.
+    """
+    with _lock:
+        schema = _schemas.get(model)
+        cached = model in _cached_models
+    if schema is not None:
+        return schema
+
+    schema = model.model_json_schema()
+    if cached:
+        with _lock:
+            if model in _cached_models:
+                schema = _schemas.setdefault(model, schema)
+    return schema
+
+
+def get_schema_cache_stats() -> Dict[str, int]:
+    """Hit/miss/eviction counts and number of cached models and schemas."""
+    with _lock:
+        stats = dict(_stats)
+        stats["models"] = len(_models)
+        stats["schemas"] = len(_schemas)
+    return stats
+
+
+def clear_schema_cache() -> None:
+    """Drop all cached models and schemas."""
+    with _lock:
+        _models.clear()
+        _cached_models.clear()
+        _schemas.clear()
+        for field in _STAT_FIELDS:
+            _stats[field] = 0
@@ -17,6 +17,7 @@ from typing import Any, Dict, List, Optional, Type
 from pydantic import BaseModel, Field, create_model
 
 from idp_common import bedrock, image, metrics, s3, utils
+from idp_common.extraction import schema_cache
 from idp_common.models import Document
 
 # Conditional import for agentic extraction (requires Python 3.10+ dependencies)
@@ -27,6 +28,7 @@ try:
 except ImportError:
     AGENTIC_AVAILABLE = False
 from idp_common.utils import extract_json_from_text
+from idp_common.utils.page_loader import get_page_read_workers, load_section_pages
 
 logger = logging.getLogger(__name__)
 
@@ -56,6 +58,29 @@ class ExtractionService:
         )
         logger.info(f"Initialized extraction service with model {model_id}")
 
+        agentic_config = self.config.get("extraction", {}).get("agentic", {})
+        if agentic_config.get("enabled", False) and str(
+            agentic_config.get("prewarm_schemas", False)
+        ).lower() in ("true", "1"):
+            self._prewarm_extraction_models()
+
+    def _prewarm_extraction_models(self) -> None:
+        """Build the agentic extraction model and schema of every configured class."""
+        start_time = time.time()
+        for class_obj in self.config.get("classes", []):
+            class_label = class_obj.get("name")
+            if not class_label:
+                continue
+            model = self._get_extraction_model(
+                class_label, self._get_class_attributes(class_label)
+            )
+            schema_cache.get_model_json_schema(model)
+        stats = schema_cache.get_schema_cache_stats()
+        logger.info(
+            f"Prewarmed extraction schemas in {time.time() - start_time:.3f}s "
+            f"({stats['misses']} built, {stats['hits']} cached)"
+        )
+
     def _get_class_attributes(self, class_label: str) -> List[Dict[str, Any]]:
         """
         Get attributes for a specific document class from configuration.
@@ -66,14 +91,8 @@ class ExtractionService:
         Returns:
             List of attribute configurations
         """
-        classes_config = self.config.get("classes", [])
-        class_config = next(
-            (
-                class_obj
-                for class_obj in classes_config
-                if class_obj.get("name", "").lower() == class_label.lower()
-            ),
-            None,
+        class_config = bedrock.get_prompt_sections(self.config).class_config(
+            class_label
         )
         if class_config is None:
             return []
@@ -82,6 +101,33 @@ class ExtractionService:
         attributes = class_config.get("attributes", [])
         return attributes if attributes is not None else []
 
+    def _get_extraction_model(
+        self, class_label: str, attributes: List[Dict[str, Any]]
+    ) -> Type[BaseModel]:
+        """
+        Get the agentic extraction model of a class from the process-wide schema cache.
+
+        Args:
+            class_label: The document class name
+            attributes: List of attribute configurations
+
+        Returns:
+            Pydantic model class, shared with other sections of the same class
+        """
+        # The digest is memoized per configuration, so a cache hit does not rehash the tree
+        digest = bedrock.get_prompt_sections(self.config).get(
+            class_label,
+            "extraction.attributes_digest",
+            lambda: schema_cache.attributes_digest(attributes),
+        )
+        return schema_cache.get_extraction_model(
+            class_label,
+            digest,
+            lambda: self._create_pydantic_model_from_attributes(
+                class_label, attributes
+            ),
+        )
+
     def _create_pydantic_model_from_attributes(
         self, class_label: str, attributes: List[Dict[str, Any]]
     ) -> Type[BaseModel]:
@@ -361,9 +407,9 @@ class ExtractionService:
         Raises:
             ValueError: If a required placeholder is missing from the template
         """
-        from idp_common.bedrock import format_prompt
-
-        return format_prompt(prompt_template, substitutions, required_placeholders)
+        return bedrock.render_prompt(
+            prompt_template, substitutions, required_placeholders
+        )
 
     def _build_content_with_or_without_image_placeholder(
         self,
@@ -1001,46 +1047,26 @@ class ExtractionService:
         metrics.put_metric("InputDocumentPages", len(section.page_ids))
 
         try:
-            # Read document text from all pages in order
+            # Read document text and page images with configurable dimensions,
+            # fetching all pages concurrently
             t0 = time.time()
-            document_texts = []
-            for page_id in sorted_page_ids:
-                if page_id not in document.pages:
-                    error_msg = f"Page {page_id} not found in document"
-                    logger.error(error_msg)
-                    document.errors.append(error_msg)
-                    continue
-
-                page = document.pages[page_id]
-                text_path = page.parsed_text_uri
-                page_text = s3.get_text_content(text_path)
-                document_texts.append(page_text)
-
-            document_text = "\n".join(document_texts)
-            t1 = time.time()
-            logger.info(f"Time taken to read text content: {t1 - t0:.2f} seconds")
-
-            # Read page images with configurable dimensions
             extraction_config = self.config.get("extraction", {})
             image_config = extraction_config.get("image", {})
-            target_width = image_config.get("target_width")
-            target_height = image_config.get("target_height")
-
-            page_images = []
-            for page_id in sorted_page_ids:
-                if page_id not in document.pages:
-                    continue
-
-                page = document.pages[page_id]
-                image_uri = page.image_uri
-                # Just pass the values directly - prepare_image handles empty strings/None
-                image_content = image.prepare_image(
-                    image_uri, target_width, target_height
-                )
-                page_images.append(image_content)
-
-            t2 = time.time()
-            logger.info(f"Time taken to read images: {t2 - t1:.2f} seconds")
+            section_pages = load_section_pages(
+                document,
+                sorted_page_ids,
+                target_width=image_config.get("target_width"),
+                target_height=image_config.get("target_height"),
+                max_workers=get_page_read_workers(extraction_config),
+            )
+            document_text = "\n".join(section_pages.texts)
+            page_images = section_pages.images
+            logger.info(
+                f"Time taken to read text content: {section_pages.text_seconds:.2f} seconds"
+            )
+            logger.info(
+                f"Time taken to read images: {section_pages.image_seconds:.2f} seconds"
+            )
 
             # Get extraction configuration
             model_id = self.config.get("model_id") or extraction_config.get("model")
@@ -1056,7 +1082,11 @@ class ExtractionService:
 
             # Get attributes for this document class
             attributes = self._get_class_attributes(class_label)
-            attribute_descriptions = self._format_attribute_descriptions(attributes)
+            attribute_descriptions = bedrock.get_prompt_sections(self.config).get(
+                class_label,
+                "extraction.attributes",
+                lambda: self._format_attribute_descriptions(attributes),
+            )
 
             # Check if attributes list is empty - if so, skip LLM invocation entirely
             if not attributes or not attribute_descriptions.strip():
@@ -1243,7 +1273,11 @@ class ExtractionService:
                 logger.info(
                     "No custom prompt Lambda configured - using default prompt generation"
                 )
-                prompt_template = extraction_config.get("task_prompt", "")
+                prompt_template = bedrock.apply_cache_points(
+                    extraction_config.get("task_prompt", ""),
+                    model_id,
+                    enabled=extraction_config.get("auto_cachepoint", True),
+                )
 
                 if not prompt_template:
                     # Default prompt if template not found
@@ -1335,13 +1369,15 @@ class ExtractionService:
                         "Install with: pip install 'idp_common[agents]' or use agentic=False"
                     )
 
-                # Create dynamic Pydantic model from configuration attributes
-                dynamic_model = self._create_pydantic_model_from_attributes(
-                    class_label, attributes
-                )
+                # Get the Pydantic model generated from the configuration attributes
+                setup_start_time = time.time()
+                dynamic_model = self._get_extraction_model(class_label, attributes)
 
                 # Log the Pydantic model schema for debugging
-                model_schema = dynamic_model.model_json_schema()
+                model_schema = schema_cache.get_model_json_schema(dynamic_model)
+                logger.info(
+                    f"Time taken to prepare extraction model: {time.time() - setup_start_time:.3f} seconds"
+                )
                 logger.debug(f"Pydantic model schema for {class_label}:")
                 logger.debug(json.dumps(model_schema, indent=2))
 
@@ -1372,6 +1408,9 @@ class ExtractionService:
 
             else:
                 # Invoke Bedrock with the common library
+                system_prompt, content, cache_plan = bedrock.plan_prompt_cache(
+                    model_id, system_prompt, content, context="Extraction"
+                )
                 response_with_metering = bedrock.invoke_model(
                     model_id=model_id,
                     system_prompt=system_prompt,
@@ -1382,6 +1421,7 @@ class ExtractionService:
                     max_tokens=max_tokens,
                     context="Extraction",
                 )
+                bedrock.record_prompt_cache_usage(cache_plan, response_with_metering)
                 # For non-agentic approach, response_with_metering is BedrockInvokeModelResponse
                 # Extract text from response for non-agentic approach
                 extracted_text = bedrock.extract_text_from_response(
@@ -2,10 +2,13 @@
 # SPDX-License-Identifier: MIT-0
 
 import boto3
+import functools
 import os
 import logging
 import threading
-from typing import List, Dict, Any, Optional
+from typing import Any, Callable, Dict, List, Optional
+
+from .buffered import MetricsBuffer, register_shutdown_flush
 
 logger = logging.getLogger(__name__)
 
@@ -14,6 +17,11 @@ _cloudwatch_client = None
 _client_lock = threading.Lock()
 _metric_lock = threading.Lock()
 
+# Optional buffered emitter, enabled with METRICS_BUFFER_ENABLED=true or configure_buffering()
+_metrics_buffer = None
+_buffer_lock = threading.Lock()
+_buffer_configured = False
+
 def get_cloudwatch_client():
     """
     Get or initialize the CloudWatch client in a thread-safe manner
@@ -27,6 +35,110 @@ def get_cloudwatch_client():
             _cloudwatch_client = boto3.client('cloudwatch')
         return _cloudwatch_client
 
+def configure_buffering(enabled: bool = True, mode: Optional[str] = None,
+                        flush_interval: Optional[float] = None,
+                        max_buffered_datums: Optional[int] = None) -> Optional[MetricsBuffer]:
+    """
+    Enable or disable buffered, asynchronous metric publishing.
+
+    When enabled, put_metric and create_client_performance_metrics only update an
+    in-memory aggregate; a background thread publishes batched MetricData requests
+    (or EMF log lines) and a final flush runs on process exit or SIGTERM.
+
+    Defaults are read from the METRICS_BUFFER_MODE ('api' or 'emf'),
+    METRICS_FLUSH_INTERVAL_SECONDS and METRICS_BUFFER_MAX_DATUMS environment variables.
+
+    Args:
+        enabled: Whether to buffer metrics
+        mode: 'api' to batch put_metric_data calls, 'emf' to write EMF log lines
+        flush_interval: Seconds between background flushes
+        max_buffered_datums: Buffered value count that triggers an early flush
+
+    Returns:
+        The active MetricsBuffer, or None when buffering is disabled
+    """
+    with _buffer_lock:
+        previous = _metrics_buffer
+        buffer = _create_buffer_locked(enabled, mode, flush_interval, max_buffered_datums)
+    if previous is not None:
+        previous.shutdown(1.0)
+    return buffer
+
+def _create_buffer_locked(enabled: bool, mode: Optional[str] = None,
+                          flush_interval: Optional[float] = None,
+                          max_buffered_datums: Optional[int] = None) -> Optional[MetricsBuffer]:
+    """Create (or clear) the module buffer. Caller must hold _buffer_lock."""
+    global _metrics_buffer, _buffer_configured
+    _metrics_buffer = None
+    if enabled:
+        if flush_interval is None:
+            flush_interval = float(os.environ.get('METRICS_FLUSH_INTERVAL_SECONDS', '5'))
+        if max_buffered_datums is None:
+            max_buffered_datums = int(os.environ.get('METRICS_BUFFER_MAX_DATUMS', '5000'))
+        _metrics_buffer = MetricsBuffer(
+            client_factory=get_cloudwatch_client,
+            mode=mode or os.environ.get('METRICS_BUFFER_MODE', 'api').lower(),
+            flush_interval=flush_interval,
+            max_buffered_datums=max_buffered_datums,
+        )
+        register_shutdown_flush(_metrics_buffer)
+    _buffer_configured = True
+    return _metrics_buffer
+
+def get_metrics_buffer() -> Optional[MetricsBuffer]:
+    """
+    Get the active metrics buffer, initializing it from the environment on first use.
+
+    Returns:
+        The active MetricsBuffer, or None when buffering is disabled
+    """
+    if not _buffer_configured:
+        with _buffer_lock:
+            if not _buffer_configured:
+                enabled = os.environ.get('METRICS_BUFFER_ENABLED', 'false').lower() == 'true'
+                _create_buffer_locked(enabled)
+    return _metrics_buffer
+
+def flush_metrics() -> int:
+    """
+    Publish any buffered metrics immediately.
+
+    Lambda handlers using buffered metrics should call this before returning (or be
+    wrapped with flush_metrics_after_invocation), since the execution environment is
+    frozen between invocations and SIGTERM is only delivered when extensions are
+    registered.
+
+    Returns:
+        Number of metric datums published (0 when buffering is disabled)
+    """
+    buffer = _metrics_buffer
+    if buffer is None:
+        return 0
+    return buffer.flush()
+
+def flush_metrics_after_invocation(handler: Callable[[Any, Any], Any]) -> Callable[[Any, Any], Any]:
+    """
+    Decorate a Lambda handler so buffered metrics are flushed before it returns or raises.
+
+    A no-op apart from the call overhead when buffering is disabled.
+
+    Args:
+        handler: Lambda handler taking (event, context)
+
+    Returns:
+        The wrapped handler
+    """
+    @functools.wraps(handler)
+    def wrapper(event, context):
+        try:
+            return handler(event, context)
+        finally:
+            try:
+                flush_metrics()
+            except Exception as e:
+                logger.error(f"Error flushing buffered metrics: {e}")
+    return wrapper
+
 def put_metric(name: str, value: float, unit: str = 'Count', 
               dimensions: Optional[List[Dict[str, str]]] = None,
               namespace: Optional[str] = None) -> None:
@@ -46,6 +158,11 @@ def put_metric(name: str, value: float, unit: str = 'Count',
     if namespace is None:
         namespace = os.environ.get('METRIC_NAMESPACE', 'GENAIDP')
     
+    buffer = get_metrics_buffer()
+    if buffer is not None:
+        buffer.put(name, value, unit, dimensions, namespace)
+        return
+    
     # Use thread lock to ensure thread safety when publishing metrics
     with _metric_lock:
         logger.debug(f"Publishing metric {name}: {value}")
@@ -75,6 +192,18 @@ def create_client_performance_metrics(name: str, duration_ms: float,
         is_success: Whether the operation succeeded
         error_type: Optional error type for failures
     """
+    buffer = get_metrics_buffer()
+    if buffer is not None:
+        group = [(f"{name}Latency", duration_ms, 'Milliseconds', None)]
+        if is_success:
+            group.append((f"{name}Success", 1, 'Count', None))
+        else:
+            group.append((f"{name}Failure", 1, 'Count', None))
+            if error_type:
+                group.append((f"{name}Error.{error_type}", 1, 'Count', None))
+        buffer.put_many(os.environ.get('METRIC_NAMESPACE', 'GENAIDP'), group)
+        return
+    
     # Use a single lock for all metrics to ensure they are published as a group
     with _metric_lock:
         # Get namespace from environment
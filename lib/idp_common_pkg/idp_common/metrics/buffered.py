@@ -0,0 +1,308 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Buffered, asynchronous CloudWatch metrics emitter.
+
+Metric data points are aggregated in memory per (namespace, name, unit, dimensions)
+and flushed from a background thread, either as batched ``put_metric_data`` calls
+or as CloudWatch Embedded Metric Format (EMF) log lines. Callers only pay for a
+short critical section that updates the in-memory aggregate.
+"""
+
+import atexit
+import json
+import logging
+import signal
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# CloudWatch PutMetricData limits
+MAX_DATUMS_PER_REQUEST = 1000
+MAX_VALUES_PER_DATUM = 150
+
+# EMF limits
+MAX_METRICS_PER_EMF_LINE = 100
+MAX_VALUES_PER_EMF_METRIC = 100
+
+DEFAULT_FLUSH_INTERVAL = 5.0  # seconds
+DEFAULT_MAX_BUFFERED_DATUMS = 5000
+
+MODE_API = 'api'
+MODE_EMF = 'emf'
+
+MetricKey = Tuple[str, str, str, Tuple[Tuple[str, str], ...]]
+
+
+class MetricsBuffer:
+    """
+    Thread-safe metrics buffer with a background flusher.
+
+    Values recorded for the same metric key are aggregated into a value -> count
+    map, which is published using the CloudWatch ``Values``/``Counts`` arrays so
+    that percentile statistics remain available.
+    """
+
+    def __init__(
+        self,
+        client_factory: Callable[[], Any],
+        mode: str = MODE_API,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        max_buffered_datums: int = DEFAULT_MAX_BUFFERED_DATUMS,
+        emf_writer: Optional[Callable[[str], None]] = None,
+    ):
+        """
+        Initialize the metrics buffer.
+
+        Args:
+            client_factory: Callable returning a boto3 CloudWatch client (API mode)
+            mode: 'api' to call put_metric_data, 'emf' to emit EMF log lines
+            flush_interval: Seconds between background flushes
+            max_buffered_datums: Number of distinct buffered values that triggers
+                an early flush
+            emf_writer: Optional writer for EMF lines (defaults to stdout)
+        """
+        if mode not in (MODE_API, MODE_EMF):
+            raise ValueError(f"Unsupported metrics buffer mode: {mode}")
+        self.client_factory = client_factory
+        self.mode = mode
+        self.flush_interval = flush_interval
+        self.max_buffered_datums = max_buffered_datums
+        self.emf_writer = emf_writer or _write_stdout
+
+        self._buffer: Dict[MetricKey, Dict[float, int]] = {}
+        self._buffered_values = 0
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._thread_lock = threading.Lock()
+
+    def put(
+        self,
+        name: str,
+        value: float,
+        unit: str = 'Count',
+        dimensions: Optional[List[Dict[str, str]]] = None,
+        namespace: str = 'GENAIDP',
+    ) -> None:
+        """
+        Record a single metric value.
+
+        Args:
+            name: The name of the metric
+            value: The value of the metric
+            unit: The unit of the metric
+            dimensions: Optional list of {'Name': ..., 'Value': ...} dimensions
+            namespace: Metric namespace
+        """
+        self.put_many(namespace, [(name, value, unit, dimensions)])
+
+    def put_many(
+        self,
+        namespace: str,
+        metrics: List[Tuple[str, float, str, Optional[List[Dict[str, str]]]]],
+    ) -> None:
+        """
+        Record several metric values in one critical section.
+
+        Args:
+            namespace: Metric namespace
+            metrics: List of (name, value, unit, dimensions) tuples
+        """
+        self._ensure_started()
+        trigger_flush = False
+        with self._lock:
+            for name, value, unit, dimensions in metrics:
+                key = (namespace, name, unit, _dimensions_key(dimensions))
+                values = self._buffer.setdefault(key, {})
+                if value not in values:
+                    self._buffered_values += 1
+                    values[value] = 0
+                values[value] += 1
+            if self._buffered_values >= self.max_buffered_datums:
+                trigger_flush = True
+        if trigger_flush:
+            self._wakeup.set()
+
+    def flush(self) -> int:
+        """
+        Publish all buffered metrics synchronously.
+
+        Returns:
+            Number of metric datums (or EMF metric entries) published
+        """
+        with self._flush_lock:
+            with self._lock:
+                if not self._buffer:
+                    return 0
+                snapshot = self._buffer
+                self._buffer = {}
+                self._buffered_values = 0
+
+            if self.mode == MODE_EMF:
+                return self._flush_emf(snapshot)
+            return self._flush_api(snapshot)
+
+    def shutdown(self, timeout: Optional[float] = None) -> None:
+        """
+        Stop the background thread and flush remaining metrics.
+
+        Args:
+            timeout: Optional time to wait for the background thread to exit
+        """
+        self._stopped.set()
+        self._wakeup.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+        self.flush()
+
+    @property
+    def pending(self) -> int:
+        """Number of distinct buffered values awaiting publication."""
+        with self._lock:
+            return self._buffered_values
+
+    def _ensure_started(self) -> None:
+        """Start the background flusher thread on first use."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._thread_lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stopped.clear()
+            self._thread = threading.Thread(
+                target=self._run, name='idp-metrics-flusher', daemon=True
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        """Background loop flushing on interval or when the buffer fills up."""
+        while not self._stopped.is_set():
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"Error flushing buffered metrics: {e}")
+
+    def _flush_api(self, snapshot: Dict[MetricKey, Dict[float, int]]) -> int:
+        """Publish a buffer snapshot with batched put_metric_data calls."""
+        by_namespace: Dict[str, List[Dict[str, Any]]] = {}
+        for (namespace, name, unit, dims), values in snapshot.items():
+            datums = by_namespace.setdefault(namespace, [])
+            items = list(values.items())
+            for i in range(0, len(items), MAX_VALUES_PER_DATUM):
+                chunk = items[i:i + MAX_VALUES_PER_DATUM]
+                datums.append({
+                    'MetricName': name,
+                    'Values': [v for v, _ in chunk],
+                    'Counts': [float(c) for _, c in chunk],
+                    'Unit': unit,
+                    'Dimensions': [{'Name': n, 'Value': v} for n, v in dims],
+                })
+
+        published = 0
+        cloudwatch = self.client_factory()
+        for namespace, datums in by_namespace.items():
+            for i in range(0, len(datums), MAX_DATUMS_PER_REQUEST):
+                batch = datums[i:i + MAX_DATUMS_PER_REQUEST]
+                try:
+                    cloudwatch.put_metric_data(Namespace=namespace, MetricData=batch)
+                    published += len(batch)
+                except Exception as e:
+                    logger.error(f"Error publishing {len(batch)} buffered metrics to {namespace}: {e}")
+        logger.debug(f"Flushed {published} buffered metric datums")
+        return published
+
+    def _flush_emf(self, snapshot: Dict[MetricKey, Dict[float, int]]) -> int:
+        """Publish a buffer snapshot as Embedded Metric Format log lines."""
+        groups: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], List[Tuple[str, str, Dict[float, int]]]] = {}
+        for (namespace, name, unit, dims), values in snapshot.items():
+            groups.setdefault((namespace, dims), []).append((name, unit, values))
+
+        published = 0
+        timestamp = int(time.time() * 1000)
+        for (namespace, dims), metrics in groups.items():
+            for i in range(0, len(metrics), MAX_METRICS_PER_EMF_LINE):
+                # EMF has no counts array, so repeat each value by its count and
+                # spread metrics with more values than EMF allows over several lines
+                chunk = [
+                    (name, unit, [v for v, c in values.items() for _ in range(c)])
+                    for name, unit, values in metrics[i:i + MAX_METRICS_PER_EMF_LINE]
+                ]
+                longest = max(len(expanded) for _, _, expanded in chunk)
+                for start in range(0, longest, MAX_VALUES_PER_EMF_METRIC):
+                    line = [
+                        (name, unit, expanded[start:start + MAX_VALUES_PER_EMF_METRIC])
+                        for name, unit, expanded in chunk
+                        if len(expanded) > start
+                    ]
+                    record: Dict[str, Any] = {
+                        '_aws': {
+                            'Timestamp': timestamp,
+                            'CloudWatchMetrics': [{
+                                'Namespace': namespace,
+                                'Dimensions': [[n for n, _ in dims]],
+                                'Metrics': [{'Name': name, 'Unit': unit} for name, unit, _ in line],
+                            }],
+                        }
+                    }
+                    for dim_name, dim_value in dims:
+                        record[dim_name] = dim_value
+                    for name, _, values in line:
+                        record[name] = values[0] if len(values) == 1 else values
+                    self.emf_writer(json.dumps(record))
+                    published += len(line)
+        return published
+
+
+def _dimensions_key(dimensions: Optional[List[Dict[str, str]]]) -> Tuple[Tuple[str, str], ...]:
+    """Convert a CloudWatch dimensions list into a hashable, order-independent key."""
+    if not dimensions:
+        return ()
+    return tuple(sorted((d['Name'], d['Value']) for d in dimensions))
+
+
+def _write_stdout(line: str) -> None:
+    """Write an EMF line to stdout, where the Lambda runtime ships it to CloudWatch Logs."""
+    sys.stdout.write(line + '\n')
+    sys.stdout.flush()
+
+
+def register_shutdown_flush(buffer: MetricsBuffer) -> None:
+    """
+    Flush the buffer when the process exits or the Lambda runtime sends SIGTERM.
+
+    Args:
+        buffer: The metrics buffer to flush on shutdown
+    """
+    atexit.register(buffer.shutdown, 1.0)
+
+    if threading.current_thread() is not threading.main_thread():
+        return
+    try:
+        previous = signal.getsignal(signal.SIGTERM)
+    except (ValueError, AttributeError):
+        return
+
+    def _handle_sigterm(signum, frame):
+        try:
+            buffer.shutdown(1.0)
+        finally:
+            if callable(previous):
+                previous(signum, frame)
+            elif previous == signal.SIG_DFL:
+                signal.signal(signal.SIGTERM, signal.SIG_DFL)
+                signal.raise_signal(signal.SIGTERM)
+
+    try:
+        signal.signal(signal.SIGTERM, _handle_sigterm)
+    except ValueError:
+        logger.debug("Unable to install SIGTERM handler for metrics flush")
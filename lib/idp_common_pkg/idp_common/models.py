@@ -9,10 +9,16 @@ as it moves through the processing pipeline.
 """
 
 import json
+import sys
 import time
+from collections.abc import MutableMapping, MutableSequence
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Union
+
+# Page and Section use __slots__ where dataclasses support it (Python 3.10+);
+# documents from bulk-scanned archives hold tens of thousands of pages
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
 
 class Status(Enum):
@@ -31,7 +37,7 @@ class Status(Enum):
     FAILED = "FAILED"  # Processing failed
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Page:
     """Represents a single page in a document."""
 
@@ -44,9 +50,128 @@ class Page:
     confidence: float = 0.0
     tables: List[Dict[str, Any]] = field(default_factory=list)
     forms: Dict[str, str] = field(default_factory=dict)
+    # Classification metadata set during classification (not serialized)
+    metadata: Optional[Dict[str, Any]] = field(default=None, repr=False, compare=False)
 
+    @classmethod
+    def from_dict(cls, page_id: str, data: Dict[str, Any]) -> "Page":
+        """Create a Page from its dictionary representation."""
+        return cls(
+            page_id=page_id,
+            image_uri=data.get("image_uri"),
+            raw_text_uri=data.get("raw_text_uri"),
+            parsed_text_uri=data.get("parsed_text_uri"),
+            text_confidence_uri=data.get("text_confidence_uri"),
+            classification=data.get("classification"),
+            confidence=data.get("confidence", 0.0),
+            tables=data.get("tables", []),
+            forms=data.get("forms", {}),
+        )
 
-@dataclass
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert page to dictionary representation."""
+        return {
+            "page_id": self.page_id,
+            "image_uri": self.image_uri,
+            "raw_text_uri": self.raw_text_uri,
+            "parsed_text_uri": self.parsed_text_uri,
+            "text_confidence_uri": self.text_confidence_uri,
+            "classification": self.classification,
+            "confidence": self.confidence,
+            "tables": self.tables,
+            "forms": self.forms,
+        }
+
+
+def _page_dict(page_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
+    """Normalize a page payload to the Page.to_dict() format without building a Page."""
+    return {
+        "page_id": page_id,
+        "image_uri": data.get("image_uri"),
+        "raw_text_uri": data.get("raw_text_uri"),
+        "parsed_text_uri": data.get("parsed_text_uri"),
+        "text_confidence_uri": data.get("text_confidence_uri"),
+        "classification": data.get("classification"),
+        "confidence": data.get("confidence", 0.0),
+        "tables": data.get("tables", []),
+        "forms": data.get("forms", {}),
+    }
+
+
+class PageMap(MutableMapping):
+    """
+    Ordered mapping of page ID to Page that parses page payloads on first access.
+
+    Document.from_dict() stores each page's dictionary as is; the Page is built
+    the first time the page is read and replaces the payload. Serializing pages
+    that were never read reuses their payloads, so steps that only work on some
+    pages (e.g. one section) do not pay for building the others.
+    """
+
+    __slots__ = ("_entries",)
+
+    def __init__(self, pages: Optional[Dict[str, Page]] = None):
+        self._entries: Dict[str, Union[Page, Dict[str, Any]]] = {}
+        if pages:
+            self.update(pages)
+
+    @classmethod
+    def from_payloads(cls, payloads: Dict[str, Dict[str, Any]]) -> "PageMap":
+        """Create a PageMap from page dictionaries, deferring Page creation."""
+        pages = cls()
+        pages._entries = dict(payloads)
+        return pages
+
+    def __getitem__(self, page_id: str) -> Page:
+        entry = self._entries[page_id]
+        if not isinstance(entry, Page):
+            entry = Page.from_dict(page_id, entry)
+            self._entries[page_id] = entry
+        return entry
+
+    def __setitem__(self, page_id: str, page: Page) -> None:
+        self._entries[page_id] = page
+
+    def __delitem__(self, page_id: str) -> None:
+        del self._entries[page_id]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, page_id: object) -> bool:
+        return page_id in self._entries
+
+    def __repr__(self) -> str:
+        return f"PageMap({len(self._entries)} pages)"
+
+    def copy(self) -> "PageMap":
+        pages = PageMap()
+        pages._entries = dict(self._entries)
+        return pages
+
+    def sort(self) -> None:
+        """Order pages by numeric page ID (non-numeric IDs last) without parsing them."""
+        order = sorted(
+            self._entries,
+            key=lambda page_id: (0, int(page_id)) if page_id.isdigit() else (1, 0),
+        )
+        if order != list(self._entries):
+            self._entries = {page_id: self._entries[page_id] for page_id in order}
+
+    def to_dict(self) -> Dict[str, Dict[str, Any]]:
+        """Convert pages to their dictionary representation."""
+        return {
+            page_id: entry.to_dict()
+            if isinstance(entry, Page)
+            else _page_dict(page_id, entry)
+            for page_id, entry in self._entries.items()
+        }
+
+
+@dataclass(**_SLOTS)
 class Section:
     """Represents a section of pages with the same classification."""
 
@@ -87,6 +212,116 @@ class Section:
         }
 
 
+def _section_from_dict(data: Dict[str, Any]) -> Section:
+    """Build a Section from its Document.to_dict() payload, as Document.from_dict() does."""
+    return Section(
+        section_id=data.get("section_id"),
+        classification=data.get("classification"),
+        confidence=data.get("confidence", 1.0),
+        page_ids=data.get("page_ids", []),
+        extraction_result_uri=data.get("extraction_result_uri"),
+        attributes=data.get("attributes"),
+        confidence_threshold_alerts=data.get("confidence_threshold_alerts", []),
+    )
+
+
+def _section_dict(section: Union[Section, Dict[str, Any]]) -> Dict[str, Any]:
+    """Document.to_dict() format of a Section, or of a section payload without parsing it."""
+    if isinstance(section, dict):
+        section_dict = {
+            "section_id": section.get("section_id"),
+            "classification": section.get("classification"),
+            "confidence": section.get("confidence", 1.0),
+            "page_ids": section.get("page_ids", []),
+            "extraction_result_uri": section.get("extraction_result_uri"),
+            "confidence_threshold_alerts": section.get(
+                "confidence_threshold_alerts", []
+            ),
+        }
+        attributes = section.get("attributes")
+    else:
+        section_dict = {
+            "section_id": section.section_id,
+            "classification": section.classification,
+            "confidence": section.confidence,
+            "page_ids": section.page_ids,
+            "extraction_result_uri": section.extraction_result_uri,
+            "confidence_threshold_alerts": section.confidence_threshold_alerts,
+        }
+        attributes = section.attributes
+    if attributes:
+        section_dict["attributes"] = attributes
+    return section_dict
+
+
+class SectionList(MutableSequence):
+    """
+    List of Sections that parses section payloads on first access.
+
+    The section counterpart of PageMap: Document.from_dict() stores each
+    section's dictionary as is and the Section is built when it is read, so a
+    step working on one section of a document with many sections does not build
+    the others. Serializing sections that were never read reuses their payloads.
+    """
+
+    __slots__ = ("_entries",)
+
+    def __init__(self, sections: Optional[List[Section]] = None):
+        self._entries: List[Union[Section, Dict[str, Any]]] = list(sections or [])
+
+    @classmethod
+    def from_payloads(cls, payloads: List[Dict[str, Any]]) -> "SectionList":
+        """Create a SectionList from section dictionaries, deferring Section creation."""
+        sections = cls()
+        sections._entries = list(payloads)
+        return sections
+
+    def _section(self, index: int) -> Section:
+        entry = self._entries[index]
+        if not isinstance(entry, Section):
+            entry = _section_from_dict(entry)
+            self._entries[index] = entry
+        return entry
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._section(i) for i in range(*index.indices(len(self._entries)))]
+        return self._section(index)
+
+    def __setitem__(self, index, section) -> None:
+        self._entries[index] = section
+
+    def __delitem__(self, index) -> None:
+        del self._entries[index]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def insert(self, index: int, section: Section) -> None:
+        self._entries.insert(index, section)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (SectionList, list)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"SectionList({len(self._entries)} sections)"
+
+    def copy(self) -> "SectionList":
+        sections = SectionList()
+        sections._entries = list(self._entries)
+        return sections
+
+    def sort(self, *, key=None, reverse: bool = False) -> None:
+        """Sort sections in place like list.sort() (parses all sections)."""
+        self._entries = sorted(self, key=key, reverse=reverse)
+
+    def to_list(self) -> List[Dict[str, Any]]:
+        """Convert sections to their Document.to_dict() representation."""
+        return [_section_dict(entry) for entry in self._entries]
+
+
 @dataclass
 class HitlMetadata:
     """Represents HITL (Human-In-The-Loop) metadata for a document."""
@@ -190,8 +425,8 @@ class Document:
 
     # Document content details
     num_pages: int = 0
-    pages: Dict[str, Page] = field(default_factory=dict)
-    sections: List[Section] = field(default_factory=list)
+    pages: Dict[str, Page] = field(default_factory=PageMap)
+    sections: List[Section] = field(default_factory=SectionList)
     summary_report_uri: Optional[str] = None
 
     # Processing metadata
@@ -207,6 +442,11 @@ class Document:
     # HITL metadata
     hitl_metadata: List[HitlMetadata] = field(default_factory=list)
 
+    # Delta state this document was loaded from or last saved as (not serialized)
+    state_base: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert document to dictionary representation."""
         # First convert basic attributes
@@ -231,35 +471,19 @@ class Document:
             # We don't include evaluation_result or summarization_result in the dict since they're objects
         }
 
-        # Convert pages
-        result["pages"] = {}
-        for page_id, page in self.pages.items():
-            result["pages"][page_id] = {
-                "page_id": page.page_id,
-                "image_uri": page.image_uri,
-                "raw_text_uri": page.raw_text_uri,
-                "parsed_text_uri": page.parsed_text_uri,
-                "text_confidence_uri": page.text_confidence_uri,
-                "classification": page.classification,
-                "confidence": page.confidence,
-                "tables": page.tables,
-                "forms": page.forms,
+        # Convert pages (pages that were never accessed are not parsed)
+        if isinstance(self.pages, PageMap):
+            result["pages"] = self.pages.to_dict()
+        else:
+            result["pages"] = {
+                page_id: page.to_dict() for page_id, page in self.pages.items()
             }
 
-        # Convert sections
-        result["sections"] = []
-        for section in self.sections:
-            section_dict = {
-                "section_id": section.section_id,
-                "classification": section.classification,
-                "confidence": section.confidence,
-                "page_ids": section.page_ids,
-                "extraction_result_uri": section.extraction_result_uri,
-                "confidence_threshold_alerts": section.confidence_threshold_alerts,
-            }
-            if section.attributes:
-                section_dict["attributes"] = section.attributes
-            result["sections"].append(section_dict)
+        # Convert sections (sections that were never accessed are not parsed)
+        if isinstance(self.sections, SectionList):
+            result["sections"] = self.sections.to_list()
+        else:
+            result["sections"] = [_section_dict(section) for section in self.sections]
 
         # Add HITL metadata if it has any values
         if self.hitl_metadata:
@@ -299,37 +523,11 @@ class Document:
                 # If the status isn't a valid enum value, use QUEUED as default
                 document.status = Status.QUEUED
 
-        # Convert pages
-        pages_data = data.get("pages", {})
-        for page_id, page_data in pages_data.items():
-            document.pages[page_id] = Page(
-                page_id=page_id,
-                image_uri=page_data.get("image_uri"),
-                raw_text_uri=page_data.get("raw_text_uri"),
-                parsed_text_uri=page_data.get("parsed_text_uri"),
-                text_confidence_uri=page_data.get("text_confidence_uri"),
-                classification=page_data.get("classification"),
-                confidence=page_data.get("confidence", 0.0),
-                tables=page_data.get("tables", []),
-                forms=page_data.get("forms", {}),
-            )
+        # Pages are parsed on first access
+        document.pages = PageMap.from_payloads(data.get("pages", {}))
 
-        # Convert sections
-        sections_data = data.get("sections", [])
-        for section_data in sections_data:
-            document.sections.append(
-                Section(
-                    section_id=section_data.get("section_id"),
-                    classification=section_data.get("classification"),
-                    confidence=section_data.get("confidence", 1.0),
-                    page_ids=section_data.get("page_ids", []),
-                    extraction_result_uri=section_data.get("extraction_result_uri"),
-                    attributes=section_data.get("attributes"),
-                    confidence_threshold_alerts=section_data.get(
-                        "confidence_threshold_alerts", []
-                    ),
-                )
-            )
+        # Sections are parsed on first access
+        document.sections = SectionList.from_payloads(data.get("sections", []))
 
         # Convert HITL metadata if present
         hitl_metadata_data = data.get("hitl_metadata", [])
@@ -517,13 +715,21 @@ class Document:
             logger.error(f"Error building document from S3: {str(e)}")
             raise
 
-    def compress(self, bucket: str, step_name: str = "processing") -> Dict[str, Any]:
+    def compress(
+        self,
+        bucket: str,
+        step_name: str = "processing",
+        state_format: Optional[str] = None,
+    ) -> Dict[str, Any]:
         """
         Store full document in S3 and return lightweight wrapper for Step Functions.
 
         Args:
             bucket: S3 bucket to store the full document
             step_name: Name of the processing step (for unique S3 key)
+            state_format: "json" (single JSON object) or "delta" (compressed parts
+                written only when changed, see idp_common.utils.document_state).
+                Defaults to the DOCUMENT_STATE_FORMAT environment variable, then "json".
 
         Returns:
             Lightweight wrapper containing essential fields and section IDs for Map step
@@ -532,7 +738,21 @@ class Document:
 
         import boto3
 
+        from idp_common.utils.document_state import (
+            DELTA_STATE_FORMAT,
+            DocumentStateStore,
+            get_state_format,
+        )
+
         logger = logging.getLogger(__name__)
+
+        if get_state_format(state_format) == DELTA_STATE_FORMAT:
+            try:
+                return DocumentStateStore(bucket).save(self, step_name)
+            except Exception as e:
+                logger.error(f"Error compressing document {self.id}: {str(e)}")
+                raise
+
         s3_client = boto3.client("s3")
 
         # Generate unique S3 key with timestamp
@@ -571,13 +791,24 @@ class Document:
             raise
 
     @classmethod
-    def decompress(cls, bucket: str, compressed_data: Dict[str, Any]) -> "Document":
+    def decompress(
+        cls,
+        bucket: str,
+        compressed_data: Dict[str, Any],
+        section_id: Optional[str] = None,
+        keep_unloaded: bool = True,
+    ) -> "Document":
         """
         Restore full Document from S3 using compressed wrapper data.
 
         Args:
             bucket: S3 bucket containing the compressed document
             compressed_data: Lightweight wrapper from compress() method
+            section_id: Optional section to load; for delta state only this
+                section and its pages are read (ignored for JSON state). Compressing
+                the result again keeps the pages and sections that were not read.
+            keep_unloaded: Set to False to compress such a document with only
+                the section and pages that were read (delta state only).
 
         Returns:
             Full Document object with all content restored
@@ -587,7 +818,22 @@ class Document:
 
         import boto3
 
+        from idp_common.utils.document_state import (
+            DELTA_STATE_FORMAT,
+            DocumentStateStore,
+        )
+
         logger = logging.getLogger(__name__)
+
+        if compressed_data.get("state_format") == DELTA_STATE_FORMAT:
+            try:
+                return DocumentStateStore(bucket).load(
+                    compressed_data, section_id, keep_unloaded
+                )
+            except Exception as e:
+                logger.error(f"Error decompressing document: {str(e)}")
+                raise
+
         s3_client = boto3.client("s3")
 
         try:
@@ -613,6 +859,53 @@ class Document:
             logger.error(f"Error decompressing document: {str(e)}")
             raise
 
+    @classmethod
+    def update_compressed_fields(
+        cls,
+        bucket: str,
+        compressed_data: Dict[str, Any],
+        update: Callable[[Dict[str, Any]], None],
+    ) -> None:
+        """
+        Change document-level fields of a compressed document in place.
+
+        The stored state keeps its S3 key, so later steps reading the same
+        wrapper see the change. Works with both state formats.
+
+        Args:
+            bucket: S3 bucket containing the compressed document
+            compressed_data: Lightweight wrapper from compress() method
+            update: Function modifying the document dict (as in to_dict(); for
+                delta state without pages, sections and metering) in place
+        """
+        from urllib.parse import urlparse
+
+        import boto3
+
+        from idp_common.utils.document_state import (
+            DELTA_STATE_FORMAT,
+            DocumentStateStore,
+        )
+
+        if compressed_data.get("state_format") == DELTA_STATE_FORMAT:
+            DocumentStateStore(bucket).update_fields(compressed_data, update)
+            return
+
+        s3_uri = compressed_data.get("s3_uri")
+        if not s3_uri:
+            raise ValueError("No s3_uri found in compressed data")
+        s3_key = urlparse(s3_uri).path.lstrip("/")
+        s3_client = boto3.client("s3")
+        response = s3_client.get_object(Bucket=bucket, Key=s3_key)
+        data = json.loads(response["Body"].read().decode("utf-8"))
+        update(data)
+        s3_client.put_object(
+            Bucket=bucket,
+            Key=s3_key,
+            Body=json.dumps(data, separators=(",", ":")).encode("utf-8"),
+            ContentType="application/json",
+        )
+
     @classmethod
     def from_compressed_or_dict(cls, data, bucket=None):
         """
@@ -633,7 +926,14 @@ class Document:
             return cls.from_dict(data)
 
     @classmethod
-    def load_document(cls, event_data, working_bucket, logger=None):
+    def load_document(
+        cls,
+        event_data,
+        working_bucket,
+        logger=None,
+        section_id=None,
+        keep_unloaded=True,
+    ):
         """
         Utility method to handle document input from Lambda events.
         Automatically handles both compressed and uncompressed documents.
@@ -642,6 +942,10 @@ class Document:
             event_data: The document data from the Lambda event
             working_bucket: S3 bucket for decompression
             logger: Optional logger for debug messages
+            section_id: Optional section the caller works on; delta state then
+                only loads this section and its pages
+            keep_unloaded: Whether compressing the document again keeps the
+                pages and sections not loaded (see decompress)
 
         Returns:
             Document: The document instance
@@ -649,7 +953,7 @@ class Document:
         if isinstance(event_data, dict) and event_data.get("compressed") is True:
             if logger:
                 logger.info("Decompressed document from S3")
-            return cls.decompress(working_bucket, event_data)
+            return cls.decompress(working_bucket, event_data, section_id, keep_unloaded)
         else:
             if logger:
                 logger.info("Loaded uncompressed document")
@@ -0,0 +1,217 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Packed per-page OCR artifacts.
+
+By default OcrService writes four S3 objects per page (image, rawText.json,
+textConfidence.json and result.json). In bundle mode the same artifacts are
+appended to a few pack objects under {prefix}/pages/bundle/ instead, and a JSON
+index maps each artifact to its pack, offset and length:
+
+    {
+        "version": 1,
+        "packs": ["doc.pdf/pages/bundle/pack-00000.bin", ...],
+        "entries": {
+            "1/image.jpg": {"pack": 0, "offset": 0, "length": 81234,
+                            "content_type": "image/jpeg"},
+            ...
+        }
+    }
+
+Page URIs then reference byte ranges of the packs
+(s3://bucket/doc.pdf/pages/bundle/pack-00000.bin#range=0-81233&name=1/image.jpg),
+which the idp_common.s3 readers fetch with ranged GETs. Artifact bytes are
+identical to the per-page objects.
+"""
+
+import json
+import logging
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from idp_common import s3
+
+logger = logging.getLogger(__name__)
+
+# Packs are uploaded once they reach this size
+DEFAULT_PACK_SIZE_MB = 32
+
+INDEX_VERSION = 1
+
+
+def encode_artifact(content: Union[str, bytes, Dict[str, Any], List[Any]]) -> bytes:
+    """Serialize content exactly as s3.write_content() does."""
+    if isinstance(content, (dict, list)):
+        return json.dumps(content).encode("utf-8")
+    if isinstance(content, str):
+        return content.encode("utf-8")
+    return content
+
+
+class PageBundleWriter:
+    """
+    Appends page artifacts of one document to pack objects.
+
+    Thread-safe: page workers add artifacts concurrently. Offsets are assigned
+    when an artifact is added, so range URIs are known before the pack is
+    uploaded; they become readable once close() has returned.
+    """
+
+    def __init__(
+        self,
+        bucket: str,
+        prefix: str,
+        pack_size_bytes: int = DEFAULT_PACK_SIZE_MB * 1024 * 1024,
+        write: Optional[Callable[..., None]] = None,
+    ):
+        """
+        Args:
+            bucket: Output bucket
+            prefix: Document prefix (page artifacts are under {prefix}/pages/)
+            pack_size_bytes: Size at which a pack is uploaded and a new one started
+            write: Function used to upload packs and the index (default s3.write_content)
+        """
+        self.bucket = bucket
+        self.pages_prefix = f"{prefix}/pages/"
+        self.bundle_prefix = f"{prefix}/pages/bundle"
+        self.index_key = f"{self.bundle_prefix}/index.json"
+        self.pack_size_bytes = max(1, pack_size_bytes)
+        self._write = write or s3.write_content
+        self._lock = threading.Lock()
+        self._packs: List[str] = []
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._chunks: List[bytes] = []
+        self._size = 0
+        self._closed = False
+        self.bytes_written = 0
+
+    def add(
+        self,
+        content: Union[str, bytes, Dict[str, Any], List[Any]],
+        key: str,
+        content_type: Optional[str] = None,
+    ) -> str:
+        """
+        Append an artifact that would otherwise be written to s3://bucket/key.
+
+        Args:
+            content: Artifact content (serialized like s3.write_content)
+            key: Per-page S3 key of the artifact
+            content_type: Content type of the artifact
+
+        Returns:
+            Range URI of the artifact
+        """
+        body = encode_artifact(content)
+        name = self._entry_name(key)
+        full_pack: Optional[Tuple[str, List[bytes]]] = None
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Page bundle is already closed")
+            if not self._chunks:
+                self._packs.append(
+                    f"{self.bundle_prefix}/pack-{len(self._packs):05d}.bin"
+                )
+            pack_index = len(self._packs) - 1
+            entry = {
+                "pack": pack_index,
+                "offset": self._size,
+                "length": len(body),
+                "content_type": content_type,
+            }
+            # A rewritten artifact (e.g. after a fallback) replaces the earlier entry
+            self._entries[name] = entry
+            self._chunks.append(body)
+            self._size += len(body)
+            if self._size >= self.pack_size_bytes:
+                full_pack = self._take_pack()
+        if full_pack:
+            self._upload(*full_pack)
+        return self._range_uri(name, entry)
+
+    def uri(self, s3_uri: Optional[str]) -> Optional[str]:
+        """
+        Translate a per-page artifact URI to its range URI.
+
+        Args:
+            s3_uri: s3://bucket/key URI of a per-page artifact
+
+        Returns:
+            The range URI if the artifact is in the bundle, else s3_uri unchanged
+        """
+        if not s3_uri:
+            return s3_uri
+        prefix = f"s3://{self.bucket}/{self.pages_prefix}"
+        if not s3_uri.startswith(prefix):
+            return s3_uri
+        name = s3_uri[len(prefix) :]
+        with self._lock:
+            entry = self._entries.get(name)
+        return self._range_uri(name, entry) if entry else s3_uri
+
+    def close(self) -> Dict[str, int]:
+        """
+        Upload the last pack and the index.
+
+        Returns:
+            Counts of packs, artifacts and bytes written
+        """
+        with self._lock:
+            if self._closed:
+                return self.stats()
+            self._closed = True
+            last_pack = self._take_pack() if self._chunks else None
+        if last_pack:
+            self._upload(*last_pack)
+        if self._entries:
+            index = {
+                "version": INDEX_VERSION,
+                "packs": self._packs,
+                "entries": self._entries,
+            }
+            self._write(
+                index, self.bucket, self.index_key, content_type="application/json"
+            )
+        stats = self.stats()
+        logger.info(
+            f"Wrote {stats['artifacts']} page artifacts to {stats['packs']} packs "
+            f"({stats['bytes']} bytes) under s3://{self.bucket}/{self.bundle_prefix}"
+        )
+        return stats
+
+    def stats(self) -> Dict[str, int]:
+        """Counts of packs, artifacts and bytes written so far."""
+        with self._lock:
+            return {
+                "packs": len(self._packs),
+                "artifacts": len(self._entries),
+                "bytes": self.bytes_written,
+            }
+
+    def _entry_name(self, key: str) -> str:
+        if not key.startswith(self.pages_prefix):
+            raise ValueError(f"Key {key} is not under {self.pages_prefix}")
+        return key[len(self.pages_prefix) :]
+
+    def _take_pack(self) -> Tuple[str, List[bytes]]:
+        # Caller holds the lock
+        pack = (self._packs[-1], self._chunks)
+        self._chunks = []
+        self._size = 0
+        return pack
+
+    def _upload(self, key: str, chunks: List[bytes]) -> None:
+        body = b"".join(chunks)
+        self._write(body, self.bucket, key, content_type="application/octet-stream")
+        with self._lock:
+            self.bytes_written += len(body)
+
+    def _range_uri(self, name: str, entry: Dict[str, Any]) -> str:
+        return s3.build_range_uri(
+            self.bucket,
+            self._packs[entry["pack"]],
+            entry["offset"],
+            entry["length"],
+            name,
+        )
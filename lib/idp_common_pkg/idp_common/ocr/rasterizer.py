@@ -0,0 +1,426 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Page rasterization for OCR processing.
+
+PyMuPDF rendering and JPEG encoding are CPU-bound and hold the GIL, so rendering
+from OcrService worker threads uses at most one core. ProcessPoolRasterizer renders
+PDF pages in separate processes instead; each job opens the PDF from its local file
+once, renders a contiguous range of pages and returns their encoded JPEG bytes.
+
+Process pools need POSIX semaphores, which AWS Lambda does not provide (there is
+no /dev/shm), so creating the pool fails there. ProcessPoolRasterizer then raises
+RasterizerUnavailableError and callers render in their own thread instead.
+"""
+
+import concurrent.futures
+import concurrent.futures.process
+import logging
+import math
+import multiprocessing
+import os
+import threading
+from typing import Any, Dict, List, Optional, Set, Union
+
+import fitz  # PyMuPDF
+
+logger = logging.getLogger(__name__)
+
+RASTERIZER_BACKENDS = ["thread", "process"]
+
+# Upper bound on the pages one worker job renders, which bounds how many rendered
+# pages wait in memory for the OcrService threads to pick them up
+DEFAULT_PAGES_PER_JOB = 8
+
+
+class RasterizerUnavailableError(RuntimeError):
+    """The worker process pool cannot be started or has stopped working."""
+
+
+def render_page_image(
+    page: fitz.Page,
+    is_pdf: bool,
+    page_id: int,
+    dpi: Optional[int] = None,
+    resize_config: Optional[Dict[str, Any]] = None,
+) -> bytes:
+    """
+    Extract image bytes from a page at optimal size to prevent memory issues.
+
+    If resize config is provided, images are extracted directly at target dimensions
+    to avoid creating oversized images that cause OutOfMemory errors.
+
+    Args:
+        page: PyMuPDF page object
+        is_pdf: Whether the document is a PDF file
+        page_id: Page number for logging
+        dpi: DPI for PDF page extraction (default 150)
+        resize_config: Optional dictionary with target_width and target_height
+
+    Returns:
+        Image bytes in JPEG format (at target size if resize config exists)
+    """
+    pix = None
+    try:
+        # Check if we should extract at target size to avoid memory issues
+        if resize_config:
+            target_width = resize_config.get("target_width")
+            target_height = resize_config.get("target_height")
+
+            if target_width and target_height:
+                # Get page dimensions to calculate scaling
+                page_rect = page.rect
+
+                if is_pdf:
+                    # For PDF files, calculate dimensions at specified DPI (default to 150 if None)
+                    dpi = dpi or 150
+                    original_width = int(page_rect.width * (dpi / 72))
+                    original_height = int(page_rect.height * (dpi / 72))
+                else:
+                    # For image files, use actual dimensions
+                    original_width = int(page_rect.width)
+                    original_height = int(page_rect.height)
+
+                # Apply same logic as image.resize_image - preserve aspect ratio, never upscale
+                width_ratio = target_width / original_width
+                height_ratio = target_height / original_height
+                scale_factor = min(width_ratio, height_ratio)  # Preserve aspect ratio
+
+                # Only resize if scale_factor < 1.0 (never upscale)
+                if scale_factor < 1.0:
+                    # Extract at reduced size using matrix transformation
+                    if is_pdf:
+                        # For PDF, combine DPI scaling with size reduction
+                        dpi = dpi or 150
+                        base_scale = dpi / 72  # Convert PDF points to pixels
+                        final_scale = base_scale * scale_factor
+                        matrix = fitz.Matrix(final_scale, final_scale)
+                    else:
+                        # For images, just apply the scale factor
+                        matrix = fitz.Matrix(scale_factor, scale_factor)
+
+                    pix = page.get_pixmap(matrix=matrix)
+
+                    actual_width, actual_height = pix.width, pix.height
+                    logger.info(
+                        f"Extracted page {page_id} at target size: {actual_width}x{actual_height} (scale: {scale_factor:.3f})"
+                    )
+
+                else:
+                    # No resize needed - image is already smaller than targets
+                    if is_pdf:
+                        dpi = dpi or 150
+                        pix = page.get_pixmap(dpi=dpi)
+                    else:
+                        pix = page.get_pixmap()
+
+                    # Log actual extracted dimensions
+                    actual_width, actual_height = pix.width, pix.height
+                    logger.info(
+                        f"Page {page_id} already fits target size, extracted at: {actual_width}x{actual_height}"
+                    )
+            else:
+                # No valid target dimensions - use original extraction
+                if is_pdf:
+                    dpi = dpi or 150
+                    pix = page.get_pixmap(dpi=dpi)
+                else:
+                    pix = page.get_pixmap()
+
+                # Log actual extracted dimensions
+                actual_width, actual_height = pix.width, pix.height
+                logger.info(
+                    f"Page {page_id} extracted at original size: {actual_width}x{actual_height}"
+                )
+        else:
+            # No resize config - extract at original size
+            if is_pdf:
+                dpi = dpi or 150
+                pix = page.get_pixmap(dpi=dpi)
+            else:
+                pix = page.get_pixmap()
+
+            # Log actual extracted dimensions
+            actual_width, actual_height = pix.width, pix.height
+            logger.info(
+                f"Page {page_id} extracted at original size: {actual_width}x{actual_height}"
+            )
+
+        image_bytes = pix.tobytes("jpeg")
+        return image_bytes
+    finally:
+        # Aggressive cleanup of PyMuPDF pixmap to prevent memory leaks
+        if pix is not None:
+            pix = None
+
+
+def _render_range_in_worker(
+    path: str,
+    start: int,
+    stop: int,
+    dpi: Optional[int],
+    resize_config: Optional[Dict[str, Any]],
+) -> List[Union[bytes, Exception]]:
+    """
+    Render pages start to stop - 1 of the PDF at path inside a worker process.
+
+    The document is opened once for the range and closed when the job ends: a
+    handle cached across jobs would keep the spooled file open after OcrService
+    deletes it, or serve stale pages if a later file reuses the path. A page that
+    fails to render is returned as its exception, so the other pages of the range
+    are still used.
+    """
+    pdf_document = fitz.open(path, filetype="pdf")
+    try:
+        images: List[Union[bytes, Exception]] = []
+        for page_index in range(start, min(stop, len(pdf_document))):
+            try:
+                page = pdf_document.load_page(page_index)
+                images.append(
+                    render_page_image(page, True, page_index + 1, dpi, resize_config)
+                )
+            except Exception as e:
+                images.append(e)
+        return images
+    finally:
+        pdf_document.close()
+
+
+def available_cpu_count() -> int:
+    """Number of CPUs this process may run on."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+class ProcessPoolRasterizer:
+    """
+    Render PDF pages in a pool of worker processes.
+
+    Workers are started with the 'spawn' method, because OcrService calls render()
+    from threads and forking a multithreaded process is unsafe. The pool is created
+    on first use and reused across documents.
+
+    If the pool cannot be created or a worker dies (for example on AWS Lambda, which
+    has no /dev/shm for the semaphores multiprocessing needs), the rasterizer marks
+    itself unavailable and render() raises RasterizerUnavailableError, so callers
+    can render in-thread.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        dpi: Optional[int] = None,
+        resize_config: Optional[Dict[str, Any]] = None,
+    ):
+        self.max_workers = max_workers or available_cpu_count()
+        self.dpi = dpi
+        self.resize_config = resize_config
+        self._executor: Optional[concurrent.futures.ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self.available = True
+
+    def _get_executor(self) -> concurrent.futures.ProcessPoolExecutor:
+        with self._lock:
+            if not self.available:
+                raise RasterizerUnavailableError(
+                    "Rasterization process pool is disabled"
+                )
+            if self._executor is None:
+                self._executor = concurrent.futures.ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+                logger.info(
+                    f"Started rasterization process pool with {self.max_workers} workers"
+                )
+            return self._executor
+
+    def _disable(self, error: BaseException) -> None:
+        with self._lock:
+            if self.available:
+                logger.warning(
+                    f"Rasterization process pool unavailable, rendering in threads instead: {error}"
+                )
+            self.available = False
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def submit(self, path: str, start: int, stop: int) -> concurrent.futures.Future:
+        """
+        Submit a job rendering pages start to stop - 1 of the PDF at path.
+
+        Raises:
+            RasterizerUnavailableError: If the process pool cannot be used
+        """
+        try:
+            return self._get_executor().submit(
+                _render_range_in_worker,
+                path,
+                start,
+                stop,
+                self.dpi,
+                self.resize_config,
+            )
+        except RasterizerUnavailableError:
+            raise
+        except (OSError, ImportError, NotImplementedError, RuntimeError) as e:
+            # Pool creation or worker start-up failed, e.g. no /dev/shm on Lambda
+            self._disable(e)
+            raise RasterizerUnavailableError(str(e)) from e
+
+    def result(
+        self, future: concurrent.futures.Future
+    ) -> List[Union[bytes, Exception]]:
+        """
+        Wait for a job submitted with submit().
+
+        Raises:
+            RasterizerUnavailableError: If a worker process died
+        """
+        try:
+            return future.result()
+        except concurrent.futures.process.BrokenProcessPool as e:
+            self._disable(e)
+            raise RasterizerUnavailableError(str(e)) from e
+
+    def render(self, path: str, page_index: int) -> bytes:
+        """
+        Render a single PDF page to JPEG bytes in a worker process.
+
+        Documents rendered page by page should use open_document(), which renders
+        contiguous page ranges with one open per range.
+
+        Args:
+            path: Local path of the PDF, readable by the worker processes
+            page_index: Zero-based index of the page
+
+        Returns:
+            Image bytes in JPEG format
+
+        Raises:
+            RasterizerUnavailableError: If the process pool cannot be used
+        """
+        images = self.result(self.submit(path, page_index, page_index + 1))
+        if not images:
+            raise IndexError(f"Page index {page_index} out of range for {path}")
+        if isinstance(images[0], Exception):
+            # Errors raised while rendering the page propagate as-is
+            raise images[0]
+        return images[0]
+
+    def open_document(
+        self, path: str, num_pages: int, pages_per_job: Optional[int] = None
+    ) -> "RasterizedDocument":
+        """
+        Start rendering the pages of one PDF in contiguous ranges.
+
+        Args:
+            path: Local path of the PDF, readable by the worker processes
+            num_pages: Number of pages in the PDF
+            pages_per_job: Pages per worker job (default: the pages split evenly
+                across the workers, at most DEFAULT_PAGES_PER_JOB)
+
+        Returns:
+            RasterizedDocument to render the pages with; close it when done
+        """
+        if not pages_per_job:
+            pages_per_job = min(
+                DEFAULT_PAGES_PER_JOB, math.ceil(num_pages / self.max_workers)
+            )
+        return RasterizedDocument(self, path, num_pages, max(1, pages_per_job))
+
+    def shutdown(self) -> None:
+        """Stop the worker processes."""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+
+
+class RasterizedDocument:
+    """
+    Pages of one PDF rendered by a ProcessPoolRasterizer in contiguous ranges.
+
+    The pages are split into ranges of pages_per_job pages, and each worker job
+    opens the PDF once and renders one range. Requesting a page submits its
+    range and the following ones, up to one range per worker, so the workers
+    stay busy while OcrService consumes pages in order. A range's images are
+    kept until each of its pages has been taken once.
+    """
+
+    def __init__(
+        self,
+        rasterizer: ProcessPoolRasterizer,
+        path: str,
+        num_pages: int,
+        pages_per_job: int,
+    ):
+        self.rasterizer = rasterizer
+        self.path = path
+        self.num_pages = num_pages
+        self.pages_per_job = pages_per_job
+        self._jobs: Dict[int, concurrent.futures.Future] = {}
+        self._remaining: Dict[int, int] = {}
+        self._submitted: Set[int] = set()
+        self._lock = threading.Lock()
+
+    def _submit_from(self, start: int) -> concurrent.futures.Future:
+        """Submit the range at start and read ahead; return the range's job."""
+        with self._lock:
+            read_ahead = start + self.rasterizer.max_workers * self.pages_per_job
+            for range_start in range(
+                start, min(read_ahead, self.num_pages), self.pages_per_job
+            ):
+                if range_start in self._submitted:
+                    continue
+                range_stop = min(range_start + self.pages_per_job, self.num_pages)
+                self._jobs[range_start] = self.rasterizer.submit(
+                    self.path, range_start, range_stop
+                )
+                self._remaining[range_start] = range_stop - range_start
+                self._submitted.add(range_start)
+            return self._jobs.get(start)
+
+    def render(self, page_index: int) -> bytes:
+        """
+        Render a page to JPEG bytes.
+
+        Args:
+            page_index: Zero-based index of the page
+
+        Returns:
+            Image bytes in JPEG format
+
+        Raises:
+            RasterizerUnavailableError: If the process pool cannot be used
+        """
+        start = page_index - page_index % self.pages_per_job
+        future = self._submit_from(start)
+        if future is None:
+            # The page was already taken; render it again on its own
+            return self.rasterizer.render(self.path, page_index)
+        images = self.rasterizer.result(future)
+        with self._lock:
+            self._remaining[start] -= 1
+            if self._remaining[start] <= 0:
+                self._jobs.pop(start, None)
+                self._remaining.pop(start, None)
+        if page_index - start >= len(images):
+            raise IndexError(f"Page index {page_index} out of range for {self.path}")
+        image = images[page_index - start]
+        if isinstance(image, Exception):
+            # Errors raised while rendering the page propagate as-is
+            raise image
+        return image
+
+    def close(self) -> None:
+        """Cancel range jobs that have not started and release rendered pages."""
+        with self._lock:
+            jobs, self._jobs = self._jobs, {}
+            self._remaining = {}
+        for future in jobs.values():
+            future.cancel()
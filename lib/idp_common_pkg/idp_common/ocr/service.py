@@ -12,19 +12,42 @@ processing of multiple pages.
 import concurrent.futures
 import logging
 import os
+import tempfile
 import time
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 import boto3
 import fitz  # PyMuPDF
 from botocore.config import Config
 
 from idp_common import bedrock, image, s3, utils
-from idp_common.models import Document, Page, Status
+from idp_common.models import Document, Page, PageMap, Status
 from idp_common.ocr.document_converter import DocumentConverter
+from idp_common.ocr.page_bundle import DEFAULT_PACK_SIZE_MB, PageBundleWriter
+from idp_common.ocr.rasterizer import (
+    RASTERIZER_BACKENDS,
+    ProcessPoolRasterizer,
+    RasterizedDocument,
+    RasterizerUnavailableError,
+    render_page_image,
+)
 
 logger = logging.getLogger(__name__)
 
+# Chunk size used when spooling source documents from S3 to local disk
+S3_DOWNLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+
+# File types opened by PyMuPDF directly from the spooled file instead of memory
+SPOOLED_FILE_TYPES = ["pdf"]
+
+# Defaults for the asynchronous Textract mode used for large PDFs
+TEXTRACT_ASYNC_POLL_INTERVAL_SECONDS = 5.0
+# Well under the 900 second Lambda limit so the per-page fallback still has time to run
+TEXTRACT_ASYNC_MAX_WAIT_SECONDS = 600.0
+# Time kept back from the caller's deadline for storing results or falling back
+TEXTRACT_ASYNC_FALLBACK_RESERVE_SECONDS = 300.0
+TEXTRACT_ASYNC_MAX_RESULTS = 1000
+
 
 class OcrService:
     """Service for OCR processing of documents using AWS Textract or Amazon Bedrock."""
@@ -78,6 +101,11 @@ class OcrService:
             # Use old parameters
             self.region = region or os.environ.get("AWS_REGION", "us-east-1")
             self.max_workers = max_workers or 20
+            self.max_pages_in_flight = self.max_workers * 2
+            self.textract_async_config = self._parse_textract_async_config({})
+            self.page_bundle_config = self._parse_page_bundle_config({})
+            self.rasterizer_backend = "thread"
+            self.rasterizer_workers = None
             self.dpi = dpi
             self.resize_config = resize_config
             self.backend = (backend or "textract").lower()
@@ -96,8 +124,57 @@ class OcrService:
             # Extract max_workers
             self.max_workers = max_workers or ocr_config.get("max_workers", 20)
 
+            # Extract the page window for the streaming pipeline (<= 0 means unbounded)
+            max_pages_in_flight = ocr_config.get("max_pages_in_flight")
+            try:
+                self.max_pages_in_flight = (
+                    int(max_pages_in_flight)
+                    if max_pages_in_flight not in (None, "")
+                    else self.max_workers * 2
+                )
+            except (ValueError, TypeError):
+                logger.warning(
+                    f"Invalid max_pages_in_flight value '{max_pages_in_flight}', "
+                    f"using default {self.max_workers * 2}"
+                )
+                self.max_pages_in_flight = self.max_workers * 2
+
+            # Extract asynchronous Textract settings for large PDFs
+            self.textract_async_config = self._parse_textract_async_config(
+                ocr_config.get("textract_async") or {}
+            )
+
+            # Extract the packed page artifact output settings
+            self.page_bundle_config = self._parse_page_bundle_config(
+                ocr_config.get("page_bundle") or {}
+            )
+
             # Extract DPI from image configuration
             image_config = ocr_config.get("image", {})
+
+            # Extract the page rasterization backend ("thread" or "process")
+            self.rasterizer_backend = str(
+                image_config.get("rasterizer") or "thread"
+            ).lower()
+            if self.rasterizer_backend not in RASTERIZER_BACKENDS:
+                logger.warning(
+                    f"Invalid rasterizer '{self.rasterizer_backend}', using 'thread'. "
+                    f"Valid options: {RASTERIZER_BACKENDS}"
+                )
+                self.rasterizer_backend = "thread"
+            rasterizer_workers = image_config.get("rasterizer_workers")
+            try:
+                self.rasterizer_workers = (
+                    int(rasterizer_workers)
+                    if rasterizer_workers not in (None, "")
+                    else None
+                )
+            except (ValueError, TypeError):
+                logger.warning(
+                    f"Invalid rasterizer_workers value '{rasterizer_workers}', "
+                    "using the number of available CPUs"
+                )
+                self.rasterizer_workers = None
             dpi_value = image_config.get("dpi", 150)
 
             # Convert DPI to integer if it's a string
@@ -313,25 +390,58 @@ class OcrService:
         # Initialize document converter for non-PDF formats
         self.document_converter = DocumentConverter(dpi=self.dpi or 150)
 
-    def process_document(self, document: Document) -> Document:
+        # Render PDF pages in worker processes when configured; the pool starts lazily
+        self.rasterizer = (
+            ProcessPoolRasterizer(
+                max_workers=self.rasterizer_workers,
+                dpi=self.dpi,
+                resize_config=self.resize_config,
+            )
+            if self.rasterizer_backend == "process"
+            else None
+        )
+
+        # Pack writer for the document being processed when page_bundle is enabled
+        self._page_bundle: Optional[PageBundleWriter] = None
+
+        # Page ranges of the PDF being processed, rendered by the process pool
+        self._rasterized_document: Optional[RasterizedDocument] = None
+
+    def close(self) -> None:
+        """
+        Release resources held across documents.
+
+        Stops the rasterization worker processes of the "process" rasterizer, which
+        are otherwise kept for the next document. Call it when processing finishes;
+        a later process_document() call starts the pool again.
+        """
+        if self.rasterizer is not None:
+            self.rasterizer.shutdown()
+
+    def process_document(
+        self, document: Document, deadline: Optional[float] = None
+    ) -> Document:
         """
         Process a document with OCR and update the Document model.
         Supports PDF, images, text, CSV, Excel, and Word documents.
 
         Args:
             document: Document model object to update with OCR results
+            deadline: Optional epoch time (time.time()) by which processing must end,
+                e.g. derived from the Lambda context's remaining time. Bounds how long
+                an asynchronous Textract job is waited for.
 
         Returns:
             Updated Document object with OCR results
         """
         t0 = time.time()
 
-        # Get the document from S3
+        # Spool the document from S3 to local disk so large PDFs are never held in memory
+        spooled_path = None
         try:
-            response = self.s3_client.get_object(
-                Bucket=document.input_bucket, Key=document.input_key
+            spooled_path, header = self._download_to_temp_file(
+                document.input_bucket, document.input_key
             )
-            file_content = response["Body"].read()
             t1 = time.time()
             logger.debug(f"Time taken for S3 GetObject: {t1 - t0:.6f} seconds")
         except Exception as e:
@@ -344,14 +454,29 @@ class OcrService:
             document.status = Status.FAILED
             return document
 
+        # Page artifacts are appended to pack objects instead of per-page objects
+        if self.page_bundle_config["enabled"]:
+            self._page_bundle = PageBundleWriter(
+                document.output_bucket,
+                document.input_key,
+                pack_size_bytes=self.page_bundle_config["pack_size_bytes"],
+            )
+
         # Detect file type and process accordingly
         try:
-            file_type = self._detect_file_type(document.input_key, file_content)
+            file_type = self._detect_file_type(
+                document.input_key,
+                header
+                if self._has_known_extension(document.input_key)
+                else self._read_file(spooled_path),
+            )
             logger.info(f"Detected file type: {file_type}")
 
             if file_type in ["txt", "csv", "xlsx", "docx"]:
                 # Process non-PDF documents
+                file_content = self._read_file(spooled_path)
                 pages_data = self._process_non_pdf_document(file_type, file_content)
+                file_content = None
                 document.num_pages = len(pages_data)
 
                 # Process each page
@@ -388,88 +513,110 @@ class OcrService:
                         logger.error(f"{error_msg}\nStack trace:\n{stack_trace}")
                         document.errors.append(f"{error_msg} (see logs for full trace)")
             else:
-                # Process PDF/image documents using existing logic
-                pdf_document = fitz.open(stream=file_content, filetype=file_type)
-                num_pages = len(pdf_document)
-                document.num_pages = num_pages
-
-                with concurrent.futures.ThreadPoolExecutor(
-                    max_workers=self.max_workers
-                ) as executor:
+                # Process PDF/image documents. PDFs are opened from the spooled file so
+                # PyMuPDF loads page data lazily; images are small and read into memory.
+                if file_type in SPOOLED_FILE_TYPES:
+                    original_content = None
+                    pdf_document = fitz.open(spooled_path, filetype=file_type)
+                else:
+                    file_content = self._read_file(spooled_path)
+                    pdf_document = fitz.open(stream=file_content, filetype=file_type)
                     # Pass original file content for image files
                     original_content = file_content if not pdf_document.is_pdf else None
+                num_pages = len(pdf_document)
+                document.num_pages = num_pages
 
-                    future_to_page = {
-                        executor.submit(
-                            self._process_single_page,
-                            i,
-                            pdf_document,
-                            document.output_bucket,
-                            document.input_key,
-                            original_content,
-                        ): i
-                        for i in range(num_pages)
-                    }
+                # Spooled PDFs are rendered in contiguous page ranges by the process
+                # pool, one open of the file per range
+                if (
+                    self.rasterizer is not None
+                    and self.rasterizer.available
+                    and file_type in SPOOLED_FILE_TYPES
+                ):
+                    self._rasterized_document = self.rasterizer.open_document(
+                        spooled_path, num_pages
+                    )
 
-                    # Start memory monitoring in background thread
-                    memory_monitor_shutdown = self._start_memory_monitoring()
-                    completed_pages = 0
+                # Large PDFs can be OCRed with one asynchronous Textract job instead
+                # of one synchronous call per page
+                processed_async = self._use_textract_async(
+                    file_type, num_pages
+                ) and self._process_document_textract_async(
+                    document, pdf_document, deadline
+                )
 
-                    try:
-                        for future in concurrent.futures.as_completed(future_to_page):
-                            page_index = future_to_page[future]
-                            page_id = str(page_index + 1)
-                            try:
-                                ocr_result, page_metering = future.result()
-
-                                # Create Page object and add to document
-                                document.pages[page_id] = Page(
-                                    page_id=page_id,
-                                    image_uri=ocr_result["image_uri"],
-                                    raw_text_uri=ocr_result["raw_text_uri"],
-                                    parsed_text_uri=ocr_result["parsed_text_uri"],
-                                    text_confidence_uri=ocr_result[
-                                        "text_confidence_uri"
-                                    ],
-                                )
-
-                                # Merge metering data
-                                document.metering = utils.merge_metering_data(
-                                    document.metering, page_metering
-                                )
-
-                                completed_pages += 1
-
-                            except Exception as e:
-                                import traceback
-
-                                error_msg = (
-                                    f"Error processing page {page_index + 1}: {str(e)}"
-                                )
-                                stack_trace = traceback.format_exc()
-                                logger.error(
-                                    f"{error_msg}\nStack trace:\n{stack_trace}"
-                                )
-                                document.errors.append(
-                                    f"{error_msg} (see logs for full trace)"
-                                )
-                    finally:
-                        # Stop memory monitoring
-                        memory_monitor_shutdown.set()
+                if not processed_async:
+                    with concurrent.futures.ThreadPoolExecutor(
+                        max_workers=self.max_workers
+                    ) as executor:
+                        # Start memory monitoring in background thread
+                        memory_monitor_shutdown = self._start_memory_monitoring()
+                        completed_pages = 0
+
+                        try:
+                            # Pages are rendered lazily by the workers, and at most
+                            # max_pages_in_flight pages are submitted at any time
+                            for page_index, future in self._run_bounded(
+                                executor,
+                                lambda i: self._process_single_page(
+                                    i,
+                                    pdf_document,
+                                    document.output_bucket,
+                                    document.input_key,
+                                    original_content,
+                                ),
+                                range(num_pages),
+                                self.max_pages_in_flight,
+                            ):
+                                page_id = str(page_index + 1)
+                                try:
+                                    ocr_result, page_metering = future.result()
+
+                                    # Create Page object and add to document
+                                    document.pages[page_id] = Page(
+                                        page_id=page_id,
+                                        image_uri=ocr_result["image_uri"],
+                                        raw_text_uri=ocr_result["raw_text_uri"],
+                                        parsed_text_uri=ocr_result["parsed_text_uri"],
+                                        text_confidence_uri=ocr_result[
+                                            "text_confidence_uri"
+                                        ],
+                                    )
+
+                                    # Merge metering data
+                                    document.metering = utils.merge_metering_data(
+                                        document.metering, page_metering
+                                    )
+
+                                    completed_pages += 1
+
+                                except Exception as e:
+                                    import traceback
+
+                                    error_msg = f"Error processing page {page_index + 1}: {str(e)}"
+                                    stack_trace = traceback.format_exc()
+                                    logger.error(
+                                        f"{error_msg}\nStack trace:\n{stack_trace}"
+                                    )
+                                    document.errors.append(
+                                        f"{error_msg} (see logs for full trace)"
+                                    )
+                        finally:
+                            # Stop memory monitoring
+                            memory_monitor_shutdown.set()
 
                 pdf_document.close()
 
+            if self._page_bundle:
+                self._close_page_bundle(document)
+
             # Sort the pages dictionary by ascending page number
             logger.info(f"Sorting {len(document.pages)} pages by page number")
 
-            # Create a new ordered dictionary with sorted pages
-            sorted_pages = {}
-            # Convert page_id to int for sorting, then back to string for the keys
-            for page_id in sorted(document.pages.keys(), key=lambda x: int(x)):
-                sorted_pages[page_id] = document.pages[page_id]
-
-            # Replace the original pages dictionary with the sorted one
-            document.pages = sorted_pages
+            # Reorder in place; pages are not copied or parsed
+            if not isinstance(document.pages, PageMap):
+                document.pages = PageMap(document.pages)
+            document.pages.sort()
 
             if document.errors:
                 document.status = Status.FAILED
@@ -482,6 +629,12 @@ class OcrService:
             logger.error(f"{error_msg}\nStack trace:\n{stack_trace}")
             document.errors.append(f"{error_msg} (see logs for full trace)")
             document.status = Status.FAILED
+        finally:
+            self._page_bundle = None
+            if self._rasterized_document is not None:
+                self._rasterized_document.close()
+                self._rasterized_document = None
+            self._remove_temp_file(spooled_path)
 
         t2 = time.time()
         logger.info(f"OCR processing completed in {t2 - t0:.2f} seconds")
@@ -490,6 +643,191 @@ class OcrService:
         )
         return document
 
+    def _write_page_artifact(
+        self,
+        content: Union[str, bytes, Dict[str, Any], List[Any]],
+        bucket: str,
+        key: str,
+        content_type: Optional[str] = None,
+    ) -> None:
+        """
+        Write a page artifact to its own S3 object, or to the page bundle if enabled.
+
+        Takes the same arguments as s3.write_content. In bundle mode the per-page
+        URIs returned by the page processors are rewritten to range URIs by
+        _close_page_bundle.
+        """
+        page_bundle = self._page_bundle
+        # Page images stay per-page objects unless page_bundle.include_images is
+        # set: the web UI shows them through presigned URLs, which cannot carry
+        # a byte range
+        is_image = (content_type or "").startswith("image/")
+        if (
+            page_bundle is not None
+            and bucket == page_bundle.bucket
+            and (self.page_bundle_config["include_images"] or not is_image)
+        ):
+            page_bundle.add(content, key, content_type=content_type)
+        else:
+            s3.write_content(content, bucket, key, content_type=content_type)
+
+    def _close_page_bundle(self, document: Document) -> None:
+        """Upload the remaining pack and index, and point the pages at their byte ranges."""
+        page_bundle = self._page_bundle
+        page_bundle.close()
+        for page in document.pages.values():
+            page.image_uri = page_bundle.uri(page.image_uri)
+            page.raw_text_uri = page_bundle.uri(page.raw_text_uri)
+            page.parsed_text_uri = page_bundle.uri(page.parsed_text_uri)
+            page.text_confidence_uri = page_bundle.uri(page.text_confidence_uri)
+
+    @staticmethod
+    def _parse_page_bundle_config(bundle_config: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Parse the ocr.page_bundle configuration block.
+
+        Args:
+            bundle_config: Dictionary with enabled, pack_size_mb and include_images
+
+        Returns:
+            Normalized settings with enabled, pack_size_bytes and include_images
+        """
+        enabled = bundle_config.get("enabled", False)
+        if isinstance(enabled, str):
+            enabled = enabled.lower() == "true"
+        include_images = bundle_config.get("include_images", False)
+        if isinstance(include_images, str):
+            include_images = include_images.lower() == "true"
+        pack_size_mb = bundle_config.get("pack_size_mb")
+        try:
+            pack_size_mb = (
+                float(pack_size_mb)
+                if pack_size_mb not in (None, "")
+                else DEFAULT_PACK_SIZE_MB
+            )
+        except (ValueError, TypeError):
+            logger.warning(
+                f"Invalid page_bundle.pack_size_mb value '{pack_size_mb}', "
+                f"using default {DEFAULT_PACK_SIZE_MB}"
+            )
+            pack_size_mb = DEFAULT_PACK_SIZE_MB
+        return {
+            "enabled": bool(enabled),
+            "pack_size_bytes": int(pack_size_mb * 1024 * 1024),
+            "include_images": bool(include_images),
+        }
+
+    def _download_to_temp_file(self, bucket: str, key: str) -> Tuple[str, bytes]:
+        """
+        Stream an S3 object to a local temporary file in fixed-size chunks.
+
+        Args:
+            bucket: Source S3 bucket
+            key: Source S3 key
+
+        Returns:
+            Tuple of (temporary file path, first bytes of the object for type detection)
+        """
+        response = self.s3_client.get_object(Bucket=bucket, Key=key)
+        body = response["Body"]
+        suffix = os.path.splitext(key)[1]
+        header = b""
+        fd, path = tempfile.mkstemp(prefix="ocr-", suffix=suffix)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                while True:
+                    chunk = body.read(S3_DOWNLOAD_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    if len(header) < 4096:
+                        header += chunk[: 4096 - len(header)]
+                    f.write(chunk)
+        except Exception:
+            self._remove_temp_file(path)
+            raise
+        return path, header
+
+    @staticmethod
+    def _read_file(path: str) -> bytes:
+        """Read a spooled file fully into memory."""
+        with open(path, "rb") as f:
+            return f.read()
+
+    @staticmethod
+    def _remove_temp_file(path: Optional[str]) -> None:
+        """Remove a spooled temporary file, ignoring errors."""
+        if not path:
+            return
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    @staticmethod
+    def _has_known_extension(filename: str) -> bool:
+        """Check whether _detect_file_type can decide from the extension alone."""
+        ext = filename.lower().split(".")[-1] if "." in filename else ""
+        return ext in [
+            "txt",
+            "csv",
+            "xlsx",
+            "xls",
+            "docx",
+            "doc",
+            "pdf",
+            "jpg",
+            "jpeg",
+            "png",
+            "gif",
+            "bmp",
+            "tiff",
+            "tif",
+            "webp",
+        ]
+
+    @staticmethod
+    def _run_bounded(
+        executor: concurrent.futures.Executor,
+        fn: Callable[[Any], Any],
+        items: Iterable[Any],
+        max_in_flight: int,
+    ) -> Iterator[Tuple[Any, concurrent.futures.Future]]:
+        """
+        Submit fn(item) for each item while keeping at most max_in_flight futures
+        pending, yielding (item, future) pairs as they complete.
+
+        Args:
+            executor: Executor to submit work to
+            fn: Function applied to each item
+            items: Items to process, consumed lazily
+            max_in_flight: Maximum pending futures (<= 0 submits everything at once)
+
+        Yields:
+            Tuples of (item, completed future)
+        """
+        iterator = iter(items)
+        pending: Dict[concurrent.futures.Future, Any] = {}
+
+        def submit_next() -> bool:
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return False
+            pending[executor.submit(fn, item)] = item
+            return True
+
+        while (max_in_flight <= 0 or len(pending) < max_in_flight) and submit_next():
+            pass
+
+        while pending:
+            done, _ = concurrent.futures.wait(
+                pending, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for future in done:
+                item = pending.pop(future)
+                submit_next()
+                yield item, future
+
     def _feature_combo(self):
         """Return the pricing feature combination string based on enhanced_features.
 
@@ -801,7 +1139,9 @@ class OcrService:
 
         # Store image with appropriate format
         image_key = f"{prefix}/pages/{page_id}/image.{img_ext}"
-        s3.write_content(img_data, output_bucket, image_key, content_type=content_type)
+        self._write_page_artifact(
+            img_data, output_bucket, image_key, content_type=content_type
+        )
 
         t1 = time.time()
         logger.debug(
@@ -818,7 +1158,7 @@ class OcrService:
 
             # Store empty raw OCR response
             raw_text_key = f"{prefix}/pages/{page_id}/rawText.json"
-            s3.write_content(
+            self._write_page_artifact(
                 empty_ocr_response,
                 output_bucket,
                 raw_text_key,
@@ -831,7 +1171,7 @@ class OcrService:
             }
 
             text_confidence_key = f"{prefix}/pages/{page_id}/textConfidence.json"
-            s3.write_content(
+            self._write_page_artifact(
                 text_confidence_data,
                 output_bucket,
                 text_confidence_key,
@@ -841,7 +1181,7 @@ class OcrService:
             # Store empty parsed text result
             parsed_result = {"text": ""}
             parsed_text_key = f"{prefix}/pages/{page_id}/result.json"
-            s3.write_content(
+            self._write_page_artifact(
                 parsed_result,
                 output_bucket,
                 parsed_text_key,
@@ -884,7 +1224,7 @@ class OcrService:
 
             # Store raw Bedrock response
             raw_text_key = f"{prefix}/pages/{page_id}/rawText.json"
-            s3.write_content(
+            self._write_page_artifact(
                 response_with_metering["response"],
                 output_bucket,
                 raw_text_key,
@@ -897,7 +1237,7 @@ class OcrService:
             }
 
             text_confidence_key = f"{prefix}/pages/{page_id}/textConfidence.json"
-            s3.write_content(
+            self._write_page_artifact(
                 text_confidence_data,
                 output_bucket,
                 text_confidence_key,
@@ -907,7 +1247,7 @@ class OcrService:
             # Store parsed text result
             parsed_result = {"text": extracted_text}
             parsed_text_key = f"{prefix}/pages/{page_id}/result.json"
-            s3.write_content(
+            self._write_page_artifact(
                 parsed_result,
                 output_bucket,
                 parsed_text_key,
@@ -942,7 +1282,7 @@ class OcrService:
 
             # Store raw Textract response
             raw_text_key = f"{prefix}/pages/{page_id}/rawText.json"
-            s3.write_content(
+            self._write_page_artifact(
                 textract_result,
                 output_bucket,
                 raw_text_key,
@@ -952,7 +1292,7 @@ class OcrService:
             # Generate and store text confidence data
             text_confidence_data = self._generate_text_confidence_data(textract_result)
             text_confidence_key = f"{prefix}/pages/{page_id}/textConfidence.json"
-            s3.write_content(
+            self._write_page_artifact(
                 text_confidence_data,
                 output_bucket,
                 text_confidence_key,
@@ -962,7 +1302,7 @@ class OcrService:
             # Parse and store text content
             parsed_result = self._parse_textract_response(textract_result, page_id)
             parsed_text_key = f"{prefix}/pages/{page_id}/result.json"
-            s3.write_content(
+            self._write_page_artifact(
                 parsed_result,
                 output_bucket,
                 parsed_text_key,
@@ -1050,12 +1390,13 @@ class OcrService:
         page_id = page_index + 1
 
         # Extract page image - now returns image at optimal size directly
-        page = pdf_document.load_page(page_index)
-        img_bytes = self._extract_page_image(page, pdf_document.is_pdf, page_id)
+        img_bytes = self._render_page(pdf_document, page_index)
 
         # Upload processed image to S3 (already at target size if resize config exists)
         image_key = f"{prefix}/pages/{page_id}/image.jpg"
-        s3.write_content(img_bytes, output_bucket, image_key, content_type="image/jpeg")
+        self._write_page_artifact(
+            img_bytes, output_bucket, image_key, content_type="image/jpeg"
+        )
 
         t1 = time.time()
         logger.debug(
@@ -1099,9 +1440,40 @@ class OcrService:
             }
         }
 
+        # Store raw response, text confidence data and parsed text
+        result = self._store_textract_page_results(
+            textract_result, page_id, output_bucket, prefix
+        )
+
+        t2 = time.time()
+        logger.debug(f"Time for Textract (page {page_id}): {t2 - t1:.6f} seconds")
+
+        result["image_uri"] = f"s3://{output_bucket}/{image_key}"
+
+        return result, metering
+
+    def _store_textract_page_results(
+        self,
+        textract_result: Dict[str, Any],
+        page_id: int,
+        output_bucket: str,
+        prefix: str,
+    ) -> Dict[str, str]:
+        """
+        Write the raw Textract response, text confidence data and parsed text for a page.
+
+        Args:
+            textract_result: Single-page Textract response
+            page_id: One-based page number
+            output_bucket: S3 bucket to store results
+            prefix: S3 prefix for storing results
+
+        Returns:
+            Dictionary with raw_text_uri, parsed_text_uri and text_confidence_uri
+        """
         # Store raw Textract response
         raw_text_key = f"{prefix}/pages/{page_id}/rawText.json"
-        s3.write_content(
+        self._write_page_artifact(
             textract_result,
             output_bucket,
             raw_text_key,
@@ -1111,7 +1483,7 @@ class OcrService:
         # Generate and store text confidence data for efficient assessment
         text_confidence_data = self._generate_text_confidence_data(textract_result)
         text_confidence_key = f"{prefix}/pages/{page_id}/textConfidence.json"
-        s3.write_content(
+        self._write_page_artifact(
             text_confidence_data,
             output_bucket,
             text_confidence_key,
@@ -1121,135 +1493,395 @@ class OcrService:
         # Parse and store text content with markdown
         parsed_result = self._parse_textract_response(textract_result, page_id)
         parsed_text_key = f"{prefix}/pages/{page_id}/result.json"
-        s3.write_content(
+        self._write_page_artifact(
             parsed_result,
             output_bucket,
             parsed_text_key,
             content_type="application/json",
         )
 
-        t2 = time.time()
-        logger.debug(f"Time for Textract (page {page_id}): {t2 - t1:.6f} seconds")
-
-        # Create and return page result
-        result = {
+        return {
             "raw_text_uri": f"s3://{output_bucket}/{raw_text_key}",
             "parsed_text_uri": f"s3://{output_bucket}/{parsed_text_key}",
             "text_confidence_uri": f"s3://{output_bucket}/{text_confidence_key}",
-            "image_uri": f"s3://{output_bucket}/{image_key}",
         }
 
-        return result, metering
+    @staticmethod
+    def _parse_textract_async_config(async_config: Dict[str, Any]) -> Dict[str, float]:
+        """
+        Parse the ocr.textract_async configuration block.
 
-    def _extract_page_image(self, page: fitz.Page, is_pdf: bool, page_id: int) -> bytes:
+        Args:
+            async_config: Dictionary with page_threshold, poll_interval_seconds,
+                max_wait_seconds and fallback_reserve_seconds
+
+        Returns:
+            Normalized settings; a page_threshold of 0 disables asynchronous mode
         """
-        Extract image bytes from a page at optimal size to prevent memory issues.
+        defaults = {
+            "page_threshold": 0,
+            "poll_interval_seconds": TEXTRACT_ASYNC_POLL_INTERVAL_SECONDS,
+            "max_wait_seconds": TEXTRACT_ASYNC_MAX_WAIT_SECONDS,
+            "fallback_reserve_seconds": TEXTRACT_ASYNC_FALLBACK_RESERVE_SECONDS,
+        }
+        settings = dict(defaults)
+        for name, cast in (
+            ("page_threshold", int),
+            ("poll_interval_seconds", float),
+            ("max_wait_seconds", float),
+            ("fallback_reserve_seconds", float),
+        ):
+            value = async_config.get(name)
+            if value in (None, ""):
+                continue
+            try:
+                settings[name] = cast(value)
+            except (ValueError, TypeError):
+                logger.warning(
+                    f"Invalid textract_async.{name} value '{value}', "
+                    f"using default {defaults[name]}"
+                )
+        return settings
+
+    def _use_textract_async(self, file_type: str, num_pages: int) -> bool:
+        """Check whether a document should be OCRed with an asynchronous Textract job."""
+        threshold = self.textract_async_config["page_threshold"]
+        if (
+            self.backend != "textract"
+            or file_type != "pdf"
+            or threshold <= 0
+            or num_pages < threshold
+        ):
+            return False
+        if self.preprocessing_config and self.preprocessing_config.get("enabled"):
+            # Asynchronous jobs read the original PDF, so page preprocessing cannot apply
+            logger.info(
+                "Image preprocessing is enabled, using per-page Textract instead of "
+                "asynchronous mode"
+            )
+            return False
+        return True
 
-        If resize config is provided, images are extracted directly at target dimensions
-        to avoid creating oversized images that cause OutOfMemory errors.
+    def _textract_async_wait_deadline(self, deadline: Optional[float]) -> float:
+        """
+        Epoch time until which an asynchronous Textract job may be waited for.
+
+        This is max_wait_seconds from now, capped at the caller's deadline minus
+        fallback_reserve_seconds so results can still be stored, or per-page OCR
+        run, before the caller (e.g. the Lambda function) times out.
+        """
+        wait_deadline = time.time() + self.textract_async_config["max_wait_seconds"]
+        if deadline is not None:
+            wait_deadline = min(
+                wait_deadline,
+                deadline - self.textract_async_config["fallback_reserve_seconds"],
+            )
+        return wait_deadline
+
+    def _process_document_textract_async(
+        self,
+        document: Document,
+        pdf_document: fitz.Document,
+        deadline: Optional[float] = None,
+    ) -> bool:
+        """
+        OCR a PDF with a single asynchronous Textract job.
+
+        The original PDF is submitted from its input S3 location while page images are
+        rendered and uploaded, then the job results are split back into the same
+        per-page rawText.json, textConfidence.json and result.json outputs produced by
+        the per-page path.
 
         Args:
-            page: PyMuPDF page object
-            is_pdf: Whether the document is a PDF file
-            page_id: Page number for logging
+            document: Document being processed; pages, metering and errors are updated
+                only when the job succeeds
+            pdf_document: Opened PyMuPDF document used to render page images
+            deadline: Optional epoch time by which processing must end
 
         Returns:
-            Image bytes in JPEG format (at target size if resize config exists)
+            True if the document was processed, False if the caller should fall back
+            to per-page OCR
         """
-        pix = None
+        t0 = time.time()
+        output_bucket = document.output_bucket
+        prefix = document.input_key
+        num_pages = len(pdf_document)
+
+        wait_deadline = self._textract_async_wait_deadline(deadline)
+        if wait_deadline <= t0:
+            logger.info(
+                "Not enough time left to wait for an asynchronous Textract job, "
+                "using per-page OCR"
+            )
+            return False
+
         try:
-            # Check if we should extract at target size to avoid memory issues
-            if self.resize_config:
-                target_width = self.resize_config.get("target_width")
-                target_height = self.resize_config.get("target_height")
+            job_id = self._start_textract_job(document.input_bucket, document.input_key)
+        except Exception as e:
+            logger.warning(
+                f"Could not start asynchronous Textract job, falling back to "
+                f"per-page OCR: {str(e)}"
+            )
+            return False
+        logger.info(f"Started asynchronous Textract job {job_id} for {num_pages} pages")
+
+        image_uris: Dict[int, str] = {}
+        errors: List[str] = []
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.max_workers
+        ) as executor:
+            # Render and upload page images while Textract works on the job
+            for page_index, future in self._run_bounded(
+                executor,
+                lambda i: self._upload_page_image(
+                    i, pdf_document, output_bucket, prefix
+                ),
+                range(num_pages),
+                self.max_pages_in_flight,
+            ):
+                try:
+                    image_uris[page_index + 1] = future.result()
+                except Exception as e:
+                    errors.append(
+                        f"Error processing page {page_index + 1}: {str(e)} "
+                        f"(see logs for full trace)"
+                    )
+                    logger.error(
+                        f"Error uploading image for page {page_index + 1}: {e}"
+                    )
 
-                if target_width and target_height:
-                    # Get page dimensions to calculate scaling
-                    page_rect = page.rect
+            try:
+                page_responses = self._get_textract_job_pages(job_id, wait_deadline)
+            except Exception as e:
+                logger.warning(
+                    f"Asynchronous Textract job {job_id} did not complete, falling "
+                    f"back to per-page OCR: {str(e)}"
+                )
+                return False
+            t1 = time.time()
+            logger.info(
+                f"Asynchronous Textract job {job_id} completed in {t1 - t0:.2f} seconds"
+            )
 
-                    if is_pdf:
-                        # For PDF files, calculate dimensions at specified DPI (default to 150 if None)
-                        dpi = self.dpi or 150
-                        original_width = int(page_rect.width * (dpi / 72))
-                        original_height = int(page_rect.height * (dpi / 72))
-                    else:
-                        # For image files, use actual dimensions
-                        original_width = int(page_rect.width)
-                        original_height = int(page_rect.height)
-
-                    # Apply same logic as image.resize_image - preserve aspect ratio, never upscale
-                    width_ratio = target_width / original_width
-                    height_ratio = target_height / original_height
-                    scale_factor = min(
-                        width_ratio, height_ratio
-                    )  # Preserve aspect ratio
-
-                    # Only resize if scale_factor < 1.0 (never upscale)
-                    if scale_factor < 1.0:
-                        # Extract at reduced size using matrix transformation
-                        if is_pdf:
-                            # For PDF, combine DPI scaling with size reduction
-                            dpi = self.dpi or 150
-                            base_scale = dpi / 72  # Convert PDF points to pixels
-                            final_scale = base_scale * scale_factor
-                            matrix = fitz.Matrix(final_scale, final_scale)
-                        else:
-                            # For images, just apply the scale factor
-                            matrix = fitz.Matrix(scale_factor, scale_factor)
+            pages: Dict[str, Page] = {}
+            for page_id, future in self._run_bounded(
+                executor,
+                lambda page_id: self._store_textract_page_results(
+                    page_responses.pop(page_id), page_id, output_bucket, prefix
+                ),
+                [
+                    page_id
+                    for page_id in range(1, num_pages + 1)
+                    if page_id in image_uris
+                ],
+                self.max_pages_in_flight,
+            ):
+                try:
+                    result = future.result()
+                    pages[str(page_id)] = Page(
+                        page_id=str(page_id),
+                        image_uri=image_uris[page_id],
+                        raw_text_uri=result["raw_text_uri"],
+                        parsed_text_uri=result["parsed_text_uri"],
+                        text_confidence_uri=result["text_confidence_uri"],
+                    )
+                except Exception as e:
+                    import traceback
+
+                    error_msg = f"Error processing page {page_id}: {str(e)}"
+                    logger.error(f"{error_msg}\nStack trace:\n{traceback.format_exc()}")
+                    errors.append(f"{error_msg} (see logs for full trace)")
+
+        document.pages.update(pages)
+        document.errors.extend(errors)
+        document.metering = utils.merge_metering_data(
+            document.metering,
+            {
+                f"OCR/textract/{self._get_api_name()}{self._feature_combo()}": {
+                    "pages": num_pages
+                }
+            },
+        )
+        logger.info(
+            f"Stored asynchronous Textract results for {len(pages)} pages in "
+            f"{time.time() - t1:.2f} seconds"
+        )
+        return True
 
-                        pix = page.get_pixmap(matrix=matrix)
+    def _upload_page_image(
+        self,
+        page_index: int,
+        pdf_document: fitz.Document,
+        output_bucket: str,
+        prefix: str,
+    ) -> str:
+        """Render a page image, upload it to S3 and return its URI."""
+        page_id = page_index + 1
+        img_bytes = self._render_page(pdf_document, page_index)
+        image_key = f"{prefix}/pages/{page_id}/image.jpg"
+        self._write_page_artifact(
+            img_bytes, output_bucket, image_key, content_type="image/jpeg"
+        )
+        return f"s3://{output_bucket}/{image_key}"
 
-                        actual_width, actual_height = pix.width, pix.height
-                        logger.info(
-                            f"Extracted page {page_id} at target size: {actual_width}x{actual_height} (scale: {scale_factor:.3f})"
-                        )
+    def _start_textract_job(self, bucket: str, key: str) -> str:
+        """
+        Start an asynchronous Textract job for a document stored in S3.
 
-                    else:
-                        # No resize needed - image is already smaller than targets
-                        if is_pdf:
-                            dpi = self.dpi or 150
-                            pix = page.get_pixmap(dpi=dpi)
-                        else:
-                            pix = page.get_pixmap()
+        Args:
+            bucket: S3 bucket of the source document
+            key: S3 key of the source document
 
-                        # Log actual extracted dimensions
-                        actual_width, actual_height = pix.width, pix.height
-                        logger.info(
-                            f"Page {page_id} already fits target size, extracted at: {actual_width}x{actual_height}"
-                        )
-                else:
-                    # No valid target dimensions - use original extraction
-                    if is_pdf:
-                        dpi = self.dpi or 150
-                        pix = page.get_pixmap(dpi=dpi)
-                    else:
-                        pix = page.get_pixmap()
+        Returns:
+            Textract job ID
+        """
+        document_location = {"S3Object": {"Bucket": bucket, "Name": key}}
+        if isinstance(self.enhanced_features, list) and self.enhanced_features:
+            response = self.textract_client.start_document_analysis(
+                DocumentLocation=document_location,
+                FeatureTypes=self.enhanced_features,
+            )
+        else:
+            response = self.textract_client.start_document_text_detection(
+                DocumentLocation=document_location
+            )
+        return response["JobId"]
 
-                    # Log actual extracted dimensions
-                    actual_width, actual_height = pix.width, pix.height
-                    logger.info(
-                        f"Page {page_id} extracted at original size: {actual_width}x{actual_height}"
-                    )
-            else:
-                # No resize config - extract at original size
-                if is_pdf:
-                    dpi = self.dpi or 150
-                    pix = page.get_pixmap(dpi=dpi)
-                else:
-                    pix = page.get_pixmap()
+    def _get_textract_job_pages(
+        self, job_id: str, deadline: Optional[float] = None
+    ) -> Dict[int, Dict[str, Any]]:
+        """
+        Wait for an asynchronous Textract job and split its results by page.
 
-                # Log actual extracted dimensions
-                actual_width, actual_height = pix.width, pix.height
-                logger.info(
-                    f"Page {page_id} extracted at original size: {actual_width}x{actual_height}"
+        Args:
+            job_id: Textract job ID from _start_textract_job()
+            deadline: Epoch time after which waiting stops (default: max_wait_seconds
+                from now)
+
+        Returns:
+            Dictionary mapping one-based page numbers to single-page responses in the
+            same shape as the synchronous API returns
+
+        Raises:
+            TimeoutError: If the job does not finish before the deadline
+            RuntimeError: If the job fails
+        """
+        if isinstance(self.enhanced_features, list) and self.enhanced_features:
+            get_results = self.textract_client.get_document_analysis
+        else:
+            get_results = self.textract_client.get_document_text_detection
+
+        poll_interval = self.textract_async_config["poll_interval_seconds"]
+        if deadline is None:
+            deadline = self._textract_async_wait_deadline(None)
+        started = time.time()
+        delay = min(1.0, poll_interval)
+        while True:
+            response = get_results(JobId=job_id, MaxResults=TEXTRACT_ASYNC_MAX_RESULTS)
+            status = response.get("JobStatus")
+            if status != "IN_PROGRESS":
+                break
+            if time.time() + delay > deadline:
+                raise TimeoutError(
+                    f"Textract job {job_id} still in progress after "
+                    f"{time.time() - started:.0f} seconds"
                 )
+            time.sleep(delay)
+            # Back off towards the configured poll interval
+            delay = min(delay * 2, poll_interval)
 
-            image_bytes = pix.tobytes("jpeg")
-            return image_bytes
-        finally:
-            # Aggressive cleanup of PyMuPDF pixmap to prevent memory leaks
-            if pix is not None:
-                pix = None
+        if status == "FAILED":
+            raise RuntimeError(
+                f"Textract job {job_id} failed: {response.get('StatusMessage')}"
+            )
+        if status == "PARTIAL_SUCCESS":
+            logger.warning(
+                f"Textract job {job_id} partially succeeded: {response.get('Warnings')}"
+            )
+
+        model_versions = {
+            key: value
+            for key, value in response.items()
+            if key.endswith("ModelVersion")
+        }
+        page_blocks: Dict[int, List[Dict[str, Any]]] = {}
+        num_pages = response.get("DocumentMetadata", {}).get("Pages", 0)
+        while True:
+            for block in response.get("Blocks", []):
+                # Blocks are renumbered to page 1, matching single-page API responses
+                page_blocks.setdefault(block.get("Page", 1), []).append(
+                    dict(block, Page=1)
+                )
+            next_token = response.get("NextToken")
+            if not next_token:
+                break
+            response = get_results(
+                JobId=job_id,
+                MaxResults=TEXTRACT_ASYNC_MAX_RESULTS,
+                NextToken=next_token,
+            )
+
+        page_responses = {}
+        for page_id in range(1, max([num_pages, *page_blocks.keys()]) + 1):
+            page_responses[page_id] = {
+                "DocumentMetadata": {"Pages": 1},
+                "Blocks": page_blocks.pop(page_id, []),
+                **model_versions,
+            }
+        return page_responses
+
+    def _render_page(self, pdf_document: fitz.Document, page_index: int) -> bytes:
+        """
+        Render a page to JPEG bytes with the configured rasterizer.
+
+        PDFs opened from a local file are rendered in the process pool when the
+        "process" rasterizer is configured, in page ranges when the document was
+        opened with the pool by process_document; everything else is rendered in the
+        calling thread, as are all pages once the pool turns out to be unusable
+        (for example on AWS Lambda, which has no /dev/shm).
+
+        Args:
+            pdf_document: PyMuPDF document object
+            page_index: Zero-based index of the page
+
+        Returns:
+            Image bytes in JPEG format
+        """
+        if (
+            self.rasterizer is not None
+            and self.rasterizer.available
+            and pdf_document.is_pdf
+            and pdf_document.name
+        ):
+            try:
+                rasterized_document = self._rasterized_document
+                if (
+                    rasterized_document is not None
+                    and rasterized_document.path == pdf_document.name
+                ):
+                    return rasterized_document.render(page_index)
+                return self.rasterizer.render(pdf_document.name, page_index)
+            except RasterizerUnavailableError:
+                pass
+        page = pdf_document.load_page(page_index)
+        return self._extract_page_image(page, pdf_document.is_pdf, page_index + 1)
+
+    def _extract_page_image(self, page: fitz.Page, is_pdf: bool, page_id: int) -> bytes:
+        """
+        Extract image bytes from a page at optimal size to prevent memory issues.
+
+        If resize config is provided, images are extracted directly at target dimensions
+        to avoid creating oversized images that cause OutOfMemory errors.
+
+        Args:
+            page: PyMuPDF page object
+            is_pdf: Whether the document is a PDF file
+            page_id: Page number for logging
+
+        Returns:
+            Image bytes in JPEG format (at target size if resize config exists)
+        """
+        return render_page_image(page, is_pdf, page_id, self.dpi, self.resize_config)
 
     def _process_single_page_bedrock(
         self,
@@ -1274,12 +1906,13 @@ class OcrService:
         page_id = page_index + 1
 
         # Extract page image - now returns image at optimal size directly
-        page = pdf_document.load_page(page_index)
-        img_bytes = self._extract_page_image(page, pdf_document.is_pdf, page_id)
+        img_bytes = self._render_page(pdf_document, page_index)
 
         # Upload processed image to S3 (already at target size if resize config exists)
         image_key = f"{prefix}/pages/{page_id}/image.jpg"
-        s3.write_content(img_bytes, output_bucket, image_key, content_type="image/jpeg")
+        self._write_page_artifact(
+            img_bytes, output_bucket, image_key, content_type="image/jpeg"
+        )
 
         t1 = time.time()
         logger.debug(
@@ -1325,7 +1958,7 @@ class OcrService:
 
         # Store raw Bedrock response
         raw_text_key = f"{prefix}/pages/{page_id}/rawText.json"
-        s3.write_content(
+        self._write_page_artifact(
             response_with_metering["response"],
             output_bucket,
             raw_text_key,
@@ -1339,7 +1972,7 @@ class OcrService:
         }
 
         text_confidence_key = f"{prefix}/pages/{page_id}/textConfidence.json"
-        s3.write_content(
+        self._write_page_artifact(
             text_confidence_data,
             output_bucket,
             text_confidence_key,
@@ -1349,7 +1982,7 @@ class OcrService:
         # Store parsed text result
         parsed_result = {"text": extracted_text}
         parsed_text_key = f"{prefix}/pages/{page_id}/result.json"
-        s3.write_content(
+        self._write_page_artifact(
             parsed_result,
             output_bucket,
             parsed_text_key,
@@ -1389,12 +2022,13 @@ class OcrService:
         page_id = page_index + 1
 
         # Extract page image at specified DPI (consistent with other backends)
-        page = pdf_document.load_page(page_index)
-        img_bytes = self._extract_page_image(page, pdf_document.is_pdf, page_id)
+        img_bytes = self._render_page(pdf_document, page_index)
 
         # Upload image to S3
         image_key = f"{prefix}/pages/{page_id}/image.jpg"
-        s3.write_content(img_bytes, output_bucket, image_key, content_type="image/jpeg")
+        self._write_page_artifact(
+            img_bytes, output_bucket, image_key, content_type="image/jpeg"
+        )
 
         t1 = time.time()
         logger.debug(
@@ -1406,7 +2040,7 @@ class OcrService:
 
         # Store empty raw OCR response
         raw_text_key = f"{prefix}/pages/{page_id}/rawText.json"
-        s3.write_content(
+        self._write_page_artifact(
             empty_ocr_response,
             output_bucket,
             raw_text_key,
@@ -1419,7 +2053,7 @@ class OcrService:
         }
 
         text_confidence_key = f"{prefix}/pages/{page_id}/textConfidence.json"
-        s3.write_content(
+        self._write_page_artifact(
             text_confidence_data,
             output_bucket,
             text_confidence_key,
@@ -1429,7 +2063,7 @@ class OcrService:
         # Store empty parsed text result
         parsed_result = {"text": ""}
         parsed_text_key = f"{prefix}/pages/{page_id}/result.json"
-        s3.write_content(
+        self._write_page_artifact(
             parsed_result,
             output_bucket,
             parsed_text_key,
@@ -1753,7 +2387,7 @@ class OcrService:
 
         # Upload image to S3
         image_key = f"{prefix}/pages/{page_id}/image.jpg"
-        s3.write_content(
+        self._write_page_artifact(
             image_bytes, output_bucket, image_key, content_type="image/jpeg"
         )
 
@@ -1774,7 +2408,7 @@ class OcrService:
 
         # Store raw OCR response
         raw_text_key = f"{prefix}/pages/{page_id}/rawText.json"
-        s3.write_content(
+        self._write_page_artifact(
             ocr_response,
             output_bucket,
             raw_text_key,
@@ -1793,7 +2427,7 @@ class OcrService:
         text_confidence_data = {"text": markdown_table}
 
         text_confidence_key = f"{prefix}/pages/{page_id}/textConfidence.json"
-        s3.write_content(
+        self._write_page_artifact(
             text_confidence_data,
             output_bucket,
             text_confidence_key,
@@ -1803,7 +2437,7 @@ class OcrService:
         # Store parsed text result
         parsed_result = {"text": page_text}
         parsed_text_key = f"{prefix}/pages/{page_id}/result.json"
-        s3.write_content(
+        self._write_page_artifact(
             parsed_result,
             output_bucket,
             parsed_text_key,
@@ -5,7 +5,8 @@ import boto3
 import json
 import logging
 import os
-from typing import Dict, Any, Optional, Union, List
+from typing import Dict, Any, Optional, Union, List, Tuple
+from urllib.parse import parse_qs, quote
 from ..utils import parse_s3_uri
 
 logger = logging.getLogger(__name__)
@@ -25,24 +26,76 @@ def get_s3_client():
         _s3_client = boto3.client('s3')
     return _s3_client
 
+def build_range_uri(bucket: str, key: str, start: int, length: int, name: Optional[str] = None) -> str:
+    """
+    Build a URI referencing a byte range of an S3 object
+    
+    Args:
+        bucket: The S3 bucket
+        key: The S3 key of the object holding the range
+        start: Offset of the first byte
+        length: Number of bytes
+        name: Optional file name of the content (used to recognize JSON content)
+        
+    Returns:
+        URI in format s3://bucket/key#range=start-end (end inclusive, as in HTTP Range)
+    """
+    uri = f"s3://{bucket}/{key}#range={start}-{start + length - 1}"
+    if name:
+        uri += f"&name={quote(name, safe='/')}"
+    return uri
+
+def parse_range_uri(s3_uri: str) -> Tuple[str, str, Optional[str], str]:
+    """
+    Parse an S3 URI that may reference a byte range
+    
+    Args:
+        s3_uri: URI in format s3://bucket/key or s3://bucket/key#range=start-end[&name=...]
+        
+    Returns:
+        Tuple of (bucket, key, HTTP Range header value or None, content name)
+    """
+    # S3 keys may contain '#', so only a trailing range fragment is split off
+    uri, _, fragment = s3_uri.rpartition('#')
+    if not fragment.startswith('range='):
+        bucket, key = parse_s3_uri(s3_uri)
+        return bucket, key, None, key
+    bucket, key = parse_s3_uri(uri)
+    params = parse_qs(fragment)
+    name = params.get('name', [key])[0]
+    return bucket, key, f"bytes={params['range'][0]}", name
+
+def _get_object_body(s3_uri: str) -> Tuple[bytes, str]:
+    """
+    Read an S3 object, or the byte range referenced by the URI
+    
+    Returns:
+        Tuple of (content, content name)
+    """
+    bucket, key, byte_range, name = parse_range_uri(s3_uri)
+    s3 = get_s3_client()
+    if byte_range:
+        response = s3.get_object(Bucket=bucket, Key=key, Range=byte_range)
+    else:
+        response = s3.get_object(Bucket=bucket, Key=key)
+    return response['Body'].read(), name
+
 def get_text_content(s3_uri: str) -> str:
     """
     Read text content from an S3 URI
     
     Args:
-        s3_uri: The S3 URI in format s3://bucket/key
+        s3_uri: The S3 URI in format s3://bucket/key, or a byte range URI (see build_range_uri)
         
     Returns:
         Text content from the S3 object
     """
     try:
-        bucket, key = parse_s3_uri(s3_uri)
-        s3 = get_s3_client()
-        response = s3.get_object(Bucket=bucket, Key=key)
-        content_str = response['Body'].read().decode('utf-8')
+        body, name = _get_object_body(s3_uri)
+        content_str = body.decode('utf-8')
         
         # Check if the content is JSON or plain text
-        if s3_uri.endswith('.json'):
+        if name.endswith('.json'):
             try:
                 content = json.loads(content_str)
                 return content.get('text', content_str)
@@ -61,16 +114,14 @@ def get_json_content(s3_uri: str) -> Dict[str, Any]:
     Read JSON content from an S3 URI
     
     Args:
-        s3_uri: The S3 URI in format s3://bucket/key
+        s3_uri: The S3 URI in format s3://bucket/key, or a byte range URI (see build_range_uri)
         
     Returns:
         Parsed JSON content
     """
     try:
-        bucket, key = parse_s3_uri(s3_uri)
-        s3 = get_s3_client()
-        response = s3.get_object(Bucket=bucket, Key=key)
-        return json.loads(response['Body'].read().decode('utf-8'))
+        body, _ = _get_object_body(s3_uri)
+        return json.loads(body.decode('utf-8'))
     except Exception as e:
         logger.error(f"Error reading JSON from {s3_uri}: {e}")
         raise
@@ -80,16 +131,14 @@ def get_binary_content(s3_uri: str) -> bytes:
     Read binary content from an S3 URI
     
     Args:
-        s3_uri: The S3 URI in format s3://bucket/key
+        s3_uri: The S3 URI in format s3://bucket/key, or a byte range URI (see build_range_uri)
         
     Returns:
         Binary content from the S3 object
     """
     try:
-        bucket, key = parse_s3_uri(s3_uri)
-        s3 = get_s3_client()
-        response = s3.get_object(Bucket=bucket, Key=key)
-        return response['Body'].read()
+        body, _ = _get_object_body(s3_uri)
+        return body
     except Exception as e:
         logger.error(f"Error reading binary content from {s3_uri}: {e}")
         raise
@@ -0,0 +1,292 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Map-reduce summarization for documents that do not fit in one prompt.
+
+Pages are packed in order into chunks of at most chunk_tokens estimated tokens
+(a page longer than the budget is split). Each chunk is summarized with the
+configured task prompt, chunks in parallel on max_workers threads. Partial
+summaries are then merged in a tree: groups of up to reduce_fan_in partials
+(and at most chunk_tokens) are summarized again, level by level, until one
+summary is left. The final call gets the extraction results and produces the
+same JSON structure as a single-prompt summary, so DocumentSummary and the
+markdown formatter are unchanged.
+
+Chunk text keeps the <page-number> tags and partial summaries keep their page
+range, so page citations survive the reduction.
+"""
+
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from idp_common import utils
+from idp_common.summarization.models import DocumentSummary
+
+logger = logging.getLogger(__name__)
+
+CHARS_PER_TOKEN = 4
+DEFAULT_CHUNK_TOKENS = 30000
+DEFAULT_MAX_WORKERS = 4
+DEFAULT_REDUCE_FAN_IN = 4
+
+# summarize(text, extraction_results, task_prompt) -> DocumentSummary
+SummarizeFn = Callable[[str, Optional[Dict[str, Any]], Optional[str]], DocumentSummary]
+
+
+@dataclass
+class HierarchicalConfig:
+    """Settings of summarization.hierarchical."""
+
+    enabled: bool = False
+    chunk_tokens: int = DEFAULT_CHUNK_TOKENS
+    # Documents estimated at or below this many tokens use a single prompt
+    threshold_tokens: int = DEFAULT_CHUNK_TOKENS
+    max_workers: int = DEFAULT_MAX_WORKERS
+    reduce_fan_in: int = DEFAULT_REDUCE_FAN_IN
+    # Task prompt for reduce calls; defaults to the summarization task_prompt
+    reduce_task_prompt: Optional[str] = None
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict[str, Any]]) -> "HierarchicalConfig":
+        """Create a config from the summarization.hierarchical block."""
+        data = data or {}
+        config = cls()
+        enabled = data.get("enabled", False)
+        if isinstance(enabled, str):
+            enabled = enabled.lower() == "true"
+        config.enabled = bool(enabled)
+        for key, minimum in (
+            ("chunk_tokens", 1000),
+            ("max_workers", 1),
+            ("reduce_fan_in", 2),
+        ):
+            value = data.get(key)
+            if value in (None, ""):
+                continue
+            try:
+                setattr(config, key, max(minimum, int(value)))
+            except (TypeError, ValueError):
+                logger.warning(
+                    f"Invalid summarization.hierarchical.{key} value '{value}', "
+                    f"using default {getattr(config, key)}"
+                )
+        threshold = data.get("threshold_tokens")
+        try:
+            config.threshold_tokens = (
+                int(threshold) if threshold not in (None, "") else config.chunk_tokens
+            )
+        except (TypeError, ValueError):
+            logger.warning(
+                f"Invalid summarization.hierarchical.threshold_tokens value "
+                f"'{threshold}', using chunk_tokens {config.chunk_tokens}"
+            )
+            config.threshold_tokens = config.chunk_tokens
+        config.reduce_task_prompt = data.get("reduce_task_prompt") or None
+        return config
+
+
+@dataclass
+class TextChunk:
+    """Text of consecutive pages (or a partial summary) and the pages it covers."""
+
+    text: str
+    first_page: str
+    last_page: str
+    tokens: int = 0
+    summaries: List[DocumentSummary] = field(default_factory=list)
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate tokens at about 4 characters per token."""
+    return len(text) // CHARS_PER_TOKEN
+
+
+def format_page(page_id: str, text: str) -> str:
+    """Format page text as it appears in the summarization prompt."""
+    return f"<page-number>{page_id}</page-number>\n{text}\n\n"
+
+
+def chunk_pages(pages: Sequence[Tuple[str, str]], chunk_tokens: int) -> List[TextChunk]:
+    """
+    Pack pages in order into chunks of at most chunk_tokens estimated tokens.
+
+    Args:
+        pages: (page_id, text) pairs in page order
+        chunk_tokens: Token budget of a chunk
+
+    Returns:
+        Chunks in page order
+    """
+    budget_chars = chunk_tokens * CHARS_PER_TOKEN
+    chunks: List[TextChunk] = []
+    parts: List[str] = []
+    size = 0
+    first_page = last_page = None
+
+    def flush() -> None:
+        nonlocal parts, size, first_page
+        if parts:
+            text = "".join(parts)
+            chunks.append(TextChunk(text, first_page, last_page, estimate_tokens(text)))
+        parts, size, first_page = [], 0, None
+
+    for page_id, text in pages:
+        # A page longer than the budget is split into pieces that each fit
+        step = max(1, budget_chars - len(format_page(page_id, "")))
+        for start in range(0, max(len(text), 1), step):
+            page_text = format_page(page_id, text[start : start + step])
+            if size and size + len(page_text) > budget_chars:
+                flush()
+            if first_page is None:
+                first_page = page_id
+            last_page = page_id
+            parts.append(page_text)
+            size += len(page_text)
+    flush()
+    return chunks
+
+
+def _summary_text(summary: DocumentSummary) -> str:
+    content = summary.content or {}
+    if isinstance(content.get("summary"), str):
+        return content["summary"]
+    # Unparseable responses keep the raw model output under "content"
+    if "error" in content and isinstance(content.get("content"), str):
+        return content["content"]
+    return json.dumps(content)
+
+
+def _partial(chunk: TextChunk, summary: DocumentSummary) -> TextChunk:
+    text = (
+        f'<partial-summary pages="{chunk.first_page}-{chunk.last_page}">\n'
+        f"{_summary_text(summary)}\n</partial-summary>\n\n"
+    )
+    return TextChunk(
+        text,
+        chunk.first_page,
+        chunk.last_page,
+        estimate_tokens(text),
+        chunk.summaries + [summary],
+    )
+
+
+def _group(
+    chunks: List[TextChunk], fan_in: int, chunk_tokens: int
+) -> List[List[TextChunk]]:
+    """Group consecutive partials by fan-in and token budget (at least two per group)."""
+    groups: List[List[TextChunk]] = []
+    current: List[TextChunk] = []
+    tokens = 0
+    for chunk in chunks:
+        if len(current) >= 2 and (
+            len(current) >= fan_in or tokens + chunk.tokens > chunk_tokens
+        ):
+            groups.append(current)
+            current, tokens = [], 0
+        current.append(chunk)
+        tokens += chunk.tokens
+    if current:
+        if len(current) == 1 and groups:
+            groups[-1].append(current[0])
+        else:
+            groups.append(current)
+    return groups
+
+
+def _merge(group: List[TextChunk]) -> TextChunk:
+    text = "".join(chunk.text for chunk in group)
+    return TextChunk(
+        text,
+        group[0].first_page,
+        group[-1].last_page,
+        estimate_tokens(text),
+        [summary for chunk in group for summary in chunk.summaries],
+    )
+
+
+def summarize_hierarchically(
+    pages: Sequence[Tuple[str, str]],
+    summarize: SummarizeFn,
+    config: HierarchicalConfig,
+    extraction_results: Optional[Dict[str, Any]] = None,
+) -> DocumentSummary:
+    """
+    Summarize pages with parallel chunk summaries reduced in a tree.
+
+    Args:
+        pages: (page_id, text) pairs in page order
+        summarize: Function making one summarization call
+        config: Hierarchical summarization settings
+        extraction_results: Extraction results, passed to the final call only
+
+    Returns:
+        Final summary; metadata has the merged metering of all calls and a
+        "hierarchical" entry with chunk, level and call counts
+    """
+    chunks = chunk_pages(pages, config.chunk_tokens)
+    if not chunks:
+        raise ValueError("No page text to summarize")
+    reduce_prompt = config.reduce_task_prompt
+    calls = 0
+    levels = 0
+
+    with ThreadPoolExecutor(max_workers=config.max_workers) as executor:
+        if len(chunks) > 1:
+            logger.info(
+                f"Summarizing {len(chunks)} chunks of up to {config.chunk_tokens} "
+                f"tokens with {config.max_workers} workers"
+            )
+            summaries = list(
+                executor.map(lambda chunk: summarize(chunk.text, None, None), chunks)
+            )
+            calls += len(chunks)
+            levels += 1
+            nodes = [_partial(c, s) for c, s in zip(chunks, summaries)]
+
+            # Reduce until the remaining partials fit in one final call
+            while len(nodes) > config.reduce_fan_in or (
+                sum(node.tokens for node in nodes) > config.chunk_tokens
+                and len(nodes) > 1
+            ):
+                groups = [
+                    _merge(group)
+                    for group in _group(
+                        nodes, config.reduce_fan_in, config.chunk_tokens
+                    )
+                ]
+                summaries = list(
+                    executor.map(
+                        lambda group: summarize(group.text, None, reduce_prompt),
+                        groups,
+                    )
+                )
+                calls += len(groups)
+                levels += 1
+                nodes = [_partial(g, s) for g, s in zip(groups, summaries)]
+                logger.info(f"Reduced to {len(nodes)} partial summaries")
+            final_input = _merge(nodes)
+            final_prompt = reduce_prompt
+        else:
+            final_input = chunks[0]
+            final_prompt = None
+
+    summary = summarize(final_input.text, extraction_results, final_prompt)
+    calls += 1
+    levels += 1
+
+    metering: Dict[str, Any] = {}
+    for partial in final_input.summaries + [summary]:
+        metering = utils.merge_metering_data(
+            metering, partial.metadata.get("metering") or {}
+        )
+    summary.metadata["metering"] = metering
+    summary.metadata["hierarchical"] = {
+        "chunks": len(chunks),
+        "levels": levels,
+        "calls": calls,
+    }
+    return summary
@@ -21,13 +21,28 @@ from typing import Any, Dict, List, Optional, Tuple
 
 from idp_common import bedrock, s3, utils
 from idp_common.models import Document, Status
+from idp_common.summarization.hierarchical import (
+    HierarchicalConfig,
+    estimate_tokens,
+    format_page,
+    summarize_hierarchically,
+)
 from idp_common.summarization.markdown_formatter import SummaryMarkdownFormatter
 from idp_common.summarization.models import DocumentSummarizationResult, DocumentSummary
 from idp_common.utils import extract_json_from_text
+from idp_common.utils.page_loader import get_page_read_workers, load_section_pages
 
 logger = logging.getLogger(__name__)
 
 
+def _page_order(page_id: str) -> Tuple[int, Any]:
+    """Sort key placing numeric page IDs in numeric order (2 before 10)."""
+    try:
+        return (0, int(page_id))
+    except (TypeError, ValueError):
+        return (1, str(page_id))
+
+
 class SummarizationService:
     """Service for summarizing documents using various backends."""
 
@@ -71,6 +86,10 @@ class SummarizationService:
         else:
             raise ValueError(f"Unsupported backend: {self.backend}")
 
+        self.hierarchical_config = HierarchicalConfig.from_dict(
+            self.config.get("summarization", {}).get("hierarchical")
+        )
+
     def _get_summarization_config(self) -> Dict[str, Any]:
         """
         Get and validate the summarization configuration.
@@ -148,7 +167,10 @@ class SummarizationService:
         )
 
     def process_text(
-        self, text: str, extraction_results: Dict[str, Any] = None
+        self,
+        text: str,
+        extraction_results: Dict[str, Any] = None,
+        task_prompt: Optional[str] = None,
     ) -> DocumentSummary:
         """
         Summarize text content using the configured backend.
@@ -156,6 +178,7 @@ class SummarizationService:
         Args:
             text: Text content to summarize
             extraction_results: Optional extraction results to include in the summary
+            task_prompt: Optional task prompt overriding the configured one
 
         Returns:
             DocumentSummary: Summary of the text content with flexible structure
@@ -166,6 +189,8 @@ class SummarizationService:
 
         # Get summarization configuration
         config = self._get_summarization_config()
+        if task_prompt:
+            config["task_prompt"] = task_prompt
 
         # Build placeholders for the prompt
         placeholders = {"DOCUMENT_TEXT": text}
@@ -237,6 +262,41 @@ class SummarizationService:
             logger.error(f"Error summarizing text: {str(e)}")
             raise
 
+    def _summarize_pages(
+        self,
+        pages: List[Tuple[str, str]],
+        extraction_results: Dict[str, Any] = None,
+        all_text: Optional[str] = None,
+    ) -> DocumentSummary:
+        """
+        Summarize page texts in one prompt, or map-reduce when they exceed the budget.
+
+        Hierarchical summarization (summarization.hierarchical) is used when it is
+        enabled and the text is estimated above its threshold_tokens.
+
+        Args:
+            pages: (page_id, text) pairs in page order
+            extraction_results: Optional extraction results to include in the summary
+            all_text: The pages already joined for the prompt, if available
+
+        Returns:
+            DocumentSummary of the pages
+        """
+        if all_text is None:
+            all_text = "".join(format_page(page_id, text) for page_id, text in pages)
+        hierarchical = self.hierarchical_config
+        if hierarchical.enabled and estimate_tokens(all_text) > (
+            hierarchical.threshold_tokens
+        ):
+            logger.info(
+                f"Text of {len(pages)} pages is about {estimate_tokens(all_text)} "
+                "tokens, using hierarchical summarization"
+            )
+            return summarize_hierarchically(
+                pages, self.process_text, hierarchical, extraction_results
+            )
+        return self.process_text(all_text, extraction_results)
+
     def process_document_section(
         self, document: Document, section_id: str
     ) -> Tuple[Document, Dict[str, Any]]:
@@ -314,19 +374,20 @@ class SummarizationService:
                         f"Failed to load extraction results for section {section_id}: {e}"
                     )
 
-            # Read document text from all pages in order
-            all_text = ""
-            for page_id in sorted_page_ids:
-                if page_id not in document.pages:
-                    error_msg = f"Page {page_id} not found in document"
-                    logger.error(error_msg)
-                    document.errors.append(error_msg)
-                    continue
-
-                page = document.pages[page_id]
-                text_path = page.parsed_text_uri
-                page_text = s3.get_text_content(text_path)
-                all_text += f"<page-number>{page_id}</page-number>\n{page_text}\n\n"
+            # Read document text from all pages in order, fetching pages concurrently
+            section_pages = load_section_pages(
+                document,
+                sorted_page_ids,
+                load_images=False,
+                max_workers=get_page_read_workers(self.config.get("summarization", {})),
+            )
+            logger.info(
+                f"Time taken to read text content: {section_pages.text_seconds:.2f} seconds"
+            )
+            pages = list(zip(section_pages.page_ids, section_pages.texts))
+            all_text = "".join(
+                format_page(page_id, page_text) for page_id, page_text in pages
+            )
 
             if not all_text:
                 logger.warning(f"No text content found in section {section_id}")
@@ -338,7 +399,7 @@ class SummarizationService:
                 return document, {}
 
             # Generate summary with extraction results
-            summary = self.process_text(all_text, extraction_results)
+            summary = self._summarize_pages(pages, extraction_results, all_text)
 
             # TODO: Uncomment this when needed
             # Calculate execution time
@@ -697,19 +758,42 @@ class SummarizationService:
         Returns:
             str: Combined text content from all pages
         """
-        all_text = ""
-        for page_id, page in sorted(document.pages.items()):
-            if page.parsed_text_uri:
-                try:
-                    page_text = s3.get_text_content(page.parsed_text_uri)
-                    all_text += f"<page-number>{page_id}</page-number>\n{page_text}\n\n"
-                except Exception as e:
-                    logger.warning(
-                        f"Failed to load text content from {page.parsed_text_uri}: {e}"
-                    )
-                    # Continue with other pages
+        return "".join(
+            format_page(page_id, page_text)
+            for page_id, page_text in self._get_page_texts(document)
+        )
 
-        return all_text
+    def _get_page_texts(self, document: Document) -> List[Tuple[str, str]]:
+        """
+        Read the text of a document's pages concurrently, in page number order.
+
+        Args:
+            document: Document object to process
+
+        Returns:
+            (page_id, text) pairs; pages whose text cannot be read are skipped
+        """
+        page_ids = sorted(
+            (
+                page_id
+                for page_id, page in document.pages.items()
+                if page.parsed_text_uri
+            ),
+            key=_page_order,
+        )
+        # Pages whose text cannot be read are logged and skipped
+        section_pages = load_section_pages(
+            document,
+            page_ids,
+            load_images=False,
+            max_workers=get_page_read_workers(self.config.get("summarization", {})),
+            ignore_errors=True,
+        )
+        return [
+            (page_id, page_text)
+            for page_id, page_text in zip(section_pages.page_ids, section_pages.texts)
+            if page_text is not None
+        ]
 
     def _process_document_as_whole(
         self, document: Document, store_results: bool = True
@@ -761,7 +845,10 @@ class SummarizationService:
                             )
 
             # Combine text from all pages
-            all_text = self._get_all_text(document)
+            pages = self._get_page_texts(document)
+            all_text = "".join(
+                format_page(page_id, page_text) for page_id, page_text in pages
+            )
 
             if not all_text:
                 logger.warning("No text content found in document pages")
@@ -772,7 +859,7 @@ class SummarizationService:
                 )
 
             # Generate summary with extraction results
-            summary = self.process_text(all_text, extraction_results)
+            summary = self._summarize_pages(pages, extraction_results, all_text)
 
             # Calculate execution time
             execution_time = time.time() - start_time
@@ -0,0 +1,449 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Compressed, delta-encoded Document state for Step Functions hops.
+
+Document.compress() normally writes the whole document JSON to S3 at every step.
+With DOCUMENT_STATE_FORMAT=delta, DocumentStateStore writes instead:
+
+- one compressed "part" object per kind of content a step changed (pages,
+  sections, metering). Every page and section is its own gzip member or zstd
+  frame inside the object, so a single item can be read with a ranged GET.
+- a small compressed manifest holding the document's scalar fields and, for
+  every page, section and the metering data, the object, byte range and digest
+  of its current content.
+
+Items whose digest matches the state the document was loaded from are not
+written again; the manifest keeps pointing at the earlier object. When the items
+are spread over more than MAX_PART_OBJECTS objects, the next save writes a new
+base snapshot. Loading with a section_id only reads that section and its pages;
+the manifest entries of everything else are kept on the document and carried
+over unchanged when it is saved again, so the new manifest stays complete.
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import boto3
+
+logger = logging.getLogger(__name__)
+
+STATE_FORMAT_ENV = "DOCUMENT_STATE_FORMAT"
+STATE_ENCODING_ENV = "DOCUMENT_STATE_ENCODING"
+
+# Value of "state_format" in the Step Functions wrapper
+DELTA_STATE_FORMAT = "delta"
+MANIFEST_VERSION = 1
+
+ENCODINGS = ("gzip", "zstd")
+DEFAULT_ENCODING = "gzip"
+GZIP_LEVEL = 6
+ZSTD_LEVEL = 3
+
+# Compact into a new base snapshot once items live in more objects than this
+MAX_PART_OBJECTS = 8
+
+PARTS = ("pages", "sections", "metering")
+
+
+_s3_client = None
+
+
+def _get_s3_client():
+    """S3 client shared by stores in this container (created on first use)."""
+    global _s3_client
+    if _s3_client is None:
+        _s3_client = boto3.client("s3")
+    return _s3_client
+
+
+def get_state_format(state_format: Optional[str] = None) -> str:
+    """
+    Resolve the document state format ("json" or "delta").
+
+    Args:
+        state_format: Explicit format; falls back to DOCUMENT_STATE_FORMAT
+
+    Returns:
+        "delta" if delta state is selected, otherwise "json"
+    """
+    value = (state_format or os.environ.get(STATE_FORMAT_ENV) or "json").lower()
+    return DELTA_STATE_FORMAT if value == DELTA_STATE_FORMAT else "json"
+
+
+def _zstd():
+    try:
+        import zstandard
+    except ImportError:
+        return None
+    return zstandard
+
+
+def resolve_encoding(encoding: Optional[str] = None) -> str:
+    """
+    Resolve the compression encoding, falling back to gzip if zstandard is missing.
+
+    Args:
+        encoding: "gzip" or "zstd"; falls back to DOCUMENT_STATE_ENCODING
+
+    Returns:
+        The encoding to use
+    """
+    value = (encoding or os.environ.get(STATE_ENCODING_ENV) or DEFAULT_ENCODING).lower()
+    if value not in ENCODINGS:
+        logger.warning(f"Unknown document state encoding '{value}', using {DEFAULT_ENCODING}")
+        return DEFAULT_ENCODING
+    if value == "zstd" and _zstd() is None:
+        logger.warning("zstandard is not installed, using gzip for document state")
+        return DEFAULT_ENCODING
+    return value
+
+
+def compress_bytes(data: bytes, encoding: str) -> bytes:
+    """Compress data as one self-contained gzip member or zstd frame."""
+    if encoding == "zstd":
+        return _zstd().ZstdCompressor(level=ZSTD_LEVEL).compress(data)
+    return gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+def decompress_bytes(data: bytes, encoding: str) -> bytes:
+    """Decompress one or more concatenated gzip members or zstd frames."""
+    if encoding == "zstd":
+        zstandard = _zstd()
+        if zstandard is None:
+            raise ImportError("zstandard is required to read zstd document state")
+        return zstandard.ZstdDecompressor().decompressobj().decompress(data)
+    return gzip.decompress(data)
+
+
+def _merge_unloaded(part_entries: List[list], unloaded: List[tuple]) -> List[list]:
+    """
+    Merge the entries written for a partially loaded document into its manifest order.
+
+    Args:
+        part_entries: Entries for the items the document holds
+        unloaded: Manifest entries in order; (item_id, None) marks an item that
+            was loaded, whose current entry (if any) takes its place
+
+    Returns:
+        Entries in manifest order, followed by items added since the load
+    """
+    current = {entry[0]: entry for entry in part_entries}
+    merged = []
+    for entry in unloaded:
+        if entry[0] in current:
+            merged.append(current.pop(entry[0]))
+        elif entry[1] is not None:
+            merged.append(list(entry))
+        # else: loaded, then removed from the document
+    merged.extend(entry for entry in part_entries if entry[0] in current)
+    return merged
+
+
+def _unloaded_entries(entries: Dict[str, List[list]], items: Dict[str, list]) -> Dict[str, List[tuple]]:
+    """Manifest order after a save, marking the items the document holds."""
+    held = {part: {item_id for item_id, _ in items[part]} for part in items}
+    return {
+        part: [
+            (entry[0], None) if entry[0] in held[part] else tuple(entry)
+            for entry in entries[part]
+        ]
+        for part in ("pages", "sections")
+    }
+
+
+def _digest(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=8).hexdigest()
+
+
+def _dumps(value: Any) -> bytes:
+    return json.dumps(value, default=str).encode("utf-8")
+
+
+class DocumentStateStore:
+    """Writes and reads delta-encoded Document state in the working bucket."""
+
+    def __init__(self, bucket: str, encoding: Optional[str] = None, s3_client=None):
+        """
+        Args:
+            bucket: Working bucket for document state
+            encoding: "gzip" or "zstd" (default from DOCUMENT_STATE_ENCODING, then gzip)
+            s3_client: Optional boto3 S3 client
+        """
+        self.bucket = bucket
+        self.encoding = resolve_encoding(encoding)
+        self.s3_client = s3_client or _get_s3_client()
+
+    def save(self, document, step_name: str = "processing") -> Dict[str, Any]:
+        """
+        Write the document's changed parts and a new manifest.
+
+        Args:
+            document: Document to store
+            step_name: Name of the processing step (for unique S3 keys)
+
+        Returns:
+            Lightweight wrapper for Step Functions, as returned by Document.compress()
+        """
+        timestamp = str(int(time.time() * 1000))
+        prefix = f"compressed_documents/{document.id}/{timestamp}_{step_name}"
+
+        data = document.to_dict()
+        items = {
+            "pages": [(page_id, _dumps(page)) for page_id, page in data.pop("pages").items()],
+            "sections": [(section["section_id"], _dumps(section)) for section in data.pop("sections")],
+            "metering": [("metering", _dumps(data.pop("metering")))],
+        }
+
+        base = getattr(document, "state_base", None) or {}
+        # Pages and sections a section-only load did not read, in manifest order
+        unloaded = base.get("unloaded")
+        base_objects = {
+            entry[1] for part in PARTS for entry in base.get(part, {}).values()
+        }
+        if len(base_objects) > MAX_PART_OBJECTS:
+            logger.info(f"Document state spans {len(base_objects)} objects, writing a new base snapshot")
+            base = {}
+
+        entries: Dict[str, List[list]] = {}
+        bytes_written = 0
+        for part in PARTS:
+            part_base = base.get(part, {})
+            part_entries = []
+            members = []
+            offset = 0
+            for item_id, payload in items[part]:
+                digest = _digest(payload)
+                previous = part_base.get(item_id)
+                if previous and previous[4] == digest:
+                    part_entries.append(list(previous))
+                    continue
+                member = compress_bytes(payload, self.encoding)
+                members.append(member)
+                part_entries.append([item_id, None, offset, len(member), digest])
+                offset += len(member)
+
+            if members:
+                key = f"{prefix}_{part}.{self.encoding}"
+                body = b"".join(members)
+                self._put(key, body, "application/x-ndjson")
+                bytes_written += len(body)
+                for entry in part_entries:
+                    if entry[1] is None:
+                        entry[1] = key
+            if unloaded and part in unloaded:
+                part_entries = _merge_unloaded(part_entries, unloaded[part])
+            entries[part] = part_entries
+
+        # Intern object keys so the manifest stays small for large documents
+        objects: List[str] = []
+        object_index: Dict[str, int] = {}
+        for part in PARTS:
+            for entry in entries[part]:
+                key = entry[1]
+                if key not in object_index:
+                    object_index[key] = len(objects)
+                    objects.append(key)
+
+        manifest = {
+            "version": MANIFEST_VERSION,
+            "encoding": self.encoding,
+            "document": data,
+            "objects": objects,
+        }
+        for part in PARTS:
+            manifest[part] = [
+                [item_id, object_index[key], offset, length, digest]
+                for item_id, key, offset, length, digest in entries[part]
+            ]
+
+        manifest_key = f"{prefix}_manifest.json.gz"
+        manifest_body = gzip.compress(_dumps(manifest), compresslevel=GZIP_LEVEL, mtime=0)
+        self._put(manifest_key, manifest_body, "application/json", encoding="gzip")
+        bytes_written += len(manifest_body)
+
+        document.state_base = {
+            part: {entry[0]: tuple(entry) for entry in entries[part]} for part in PARTS
+        }
+        if unloaded:
+            document.state_base["unloaded"] = _unloaded_entries(entries, items)
+
+        s3_uri = f"s3://{self.bucket}/{manifest_key}"
+        logger.info(
+            f"Stored delta state for document {document.id} at {s3_uri} "
+            f"({bytes_written} bytes written, {len(objects)} part objects)"
+        )
+        return {
+            "document_id": document.id,
+            "s3_uri": s3_uri,
+            "timestamp": timestamp,
+            "status": document.status.value,
+            "num_pages": document.num_pages,
+            "sections": [entry[0] for entry in entries["sections"]],
+            "compressed": True,
+            "state_format": DELTA_STATE_FORMAT,
+            "bytes_written": bytes_written,
+        }
+
+    def load(self, wrapper: Dict[str, Any], section_id: Optional[str] = None, keep_unloaded: bool = True):
+        """
+        Restore a Document from a delta state wrapper.
+
+        Args:
+            wrapper: Wrapper returned by save()
+            section_id: If set, only this section and its pages are loaded
+            keep_unloaded: With section_id, whether saving the document again
+                carries over the pages and sections that were not loaded (set to
+                False for section-level steps returning only their section)
+
+        Returns:
+            Document (containing only the requested section and its pages when
+            section_id is given; saving it keeps the other pages and sections)
+        """
+        from urllib.parse import urlparse
+
+        from idp_common.models import Document
+
+        s3_uri = wrapper.get("s3_uri")
+        if not s3_uri:
+            raise ValueError("No s3_uri found in compressed data")
+        manifest_key = urlparse(s3_uri).path.lstrip("/")
+        response = self.s3_client.get_object(Bucket=self.bucket, Key=manifest_key)
+        manifest = json.loads(gzip.decompress(response["Body"].read()))
+        encoding = manifest.get("encoding", DEFAULT_ENCODING)
+        objects = manifest["objects"]
+
+        def resolve(part):
+            return [
+                (item_id, objects[index], offset, length, digest)
+                for item_id, index, offset, length, digest in manifest.get(part, [])
+            ]
+
+        pages = resolve("pages")
+        sections = resolve("sections")
+        metering = resolve("metering")
+        unloaded = None
+
+        if section_id is not None:
+            all_entries = {"pages": pages, "sections": sections}
+            sections = [entry for entry in sections if entry[0] == section_id]
+            section_data = self._read_items(sections, encoding)
+            page_ids = set()
+            for section in section_data.values():
+                page_ids.update(section.get("page_ids", []))
+            pages = [entry for entry in pages if entry[0] in page_ids]
+            loaded = self._read_items(pages + metering, encoding)
+            loaded.update(section_data)
+            loaded_ids = {
+                "pages": {entry[0] for entry in pages},
+                "sections": {entry[0] for entry in sections},
+            }
+            if keep_unloaded:
+                unloaded = {
+                    part: [
+                        entry if entry[0] not in loaded_ids[part] else (entry[0], None)
+                        for entry in part_entries
+                    ]
+                    for part, part_entries in all_entries.items()
+                }
+        else:
+            loaded = self._read_items(pages + sections + metering, encoding)
+
+        data = dict(manifest["document"])
+        data["pages"] = {entry[0]: loaded[entry[0], entry[2], entry[1]] for entry in pages}
+        data["sections"] = [loaded[entry[0], entry[2], entry[1]] for entry in sections]
+        data["metering"] = loaded[metering[0][0], metering[0][2], metering[0][1]] if metering else {}
+
+        document = Document.from_dict(data)
+        document.state_base = {
+            "pages": {entry[0]: entry for entry in pages},
+            "sections": {entry[0]: entry for entry in sections},
+            "metering": {entry[0]: entry for entry in metering},
+        }
+        if unloaded is not None:
+            document.state_base["unloaded"] = unloaded
+        logger.info(
+            f"Loaded delta state for document {document.id} from {s3_uri}"
+            + (f" (section {section_id} only)" if section_id is not None else "")
+        )
+        return document
+
+    def update_fields(self, wrapper: Dict[str, Any], update: Callable[[Dict[str, Any]], None]) -> None:
+        """
+        Change the document's scalar fields and rewrite the manifest in place.
+
+        For steps that only touch document-level fields (such as hitl_metadata)
+        and whose caller keeps using the wrapper it was given; pages, sections
+        and metering are neither read nor written.
+
+        Args:
+            wrapper: Wrapper returned by save()
+            update: Function modifying the document fields dict in place
+        """
+        from urllib.parse import urlparse
+
+        s3_uri = wrapper.get("s3_uri")
+        if not s3_uri:
+            raise ValueError("No s3_uri found in compressed data")
+        manifest_key = urlparse(s3_uri).path.lstrip("/")
+        response = self.s3_client.get_object(Bucket=self.bucket, Key=manifest_key)
+        manifest = json.loads(gzip.decompress(response["Body"].read()))
+        update(manifest["document"])
+        manifest_body = gzip.compress(_dumps(manifest), compresslevel=GZIP_LEVEL, mtime=0)
+        self._put(manifest_key, manifest_body, "application/json", encoding="gzip")
+        logger.info(f"Updated document fields of delta state at {s3_uri}")
+
+    def _read_items(self, entries: List[tuple], encoding: str) -> Dict[Tuple[str, int, str], Any]:
+        """
+        Read and decode items, one GET (or ranged GET) per object.
+
+        Returns:
+            {(item_id, offset, key): decoded JSON}
+        """
+        by_object: Dict[str, List[tuple]] = {}
+        for entry in entries:
+            by_object.setdefault(entry[1], []).append(entry)
+
+        def read_object(key):
+            object_entries = by_object[key]
+            start = min(entry[2] for entry in object_entries)
+            end = max(entry[2] + entry[3] for entry in object_entries)
+            body = self._get(key, start, end)
+            return {
+                (item_id, offset, key): json.loads(
+                    decompress_bytes(body[offset - start:offset - start + length], encoding)
+                )
+                for item_id, _, offset, length, _ in object_entries
+            }
+
+        results: Dict[Tuple[str, int, str], Any] = {}
+        if len(by_object) <= 1:
+            for key in by_object:
+                results.update(read_object(key))
+        else:
+            with ThreadPoolExecutor(max_workers=min(8, len(by_object))) as executor:
+                for result in executor.map(read_object, list(by_object)):
+                    results.update(result)
+        return results
+
+    def _get(self, key: str, start: int, end: int) -> bytes:
+        """Read bytes [start, end) of an object."""
+        response = self.s3_client.get_object(Bucket=self.bucket, Key=key, Range=f"bytes={start}-{end - 1}")
+        return response["Body"].read()
+
+    def _put(self, key: str, body: bytes, content_type: str, encoding: Optional[str] = None) -> None:
+        self.s3_client.put_object(
+            Bucket=self.bucket,
+            Key=key,
+            Body=body,
+            ContentType=content_type,
+            ContentEncoding=encoding or self.encoding,
+            Metadata={"idp-document-state": f"{DELTA_STATE_FORMAT}-{MANIFEST_VERSION}"},
+        )
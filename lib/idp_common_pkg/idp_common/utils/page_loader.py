@@ -0,0 +1,136 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Concurrent loading of page text and images for a document section.
+
+Extraction, assessment, granular assessment and summarization all read the parsed
+text and the resized image of every page in a section before calling Bedrock.
+load_section_pages fetches them through one bounded thread pool instead of two
+sequential loops. Each image task downloads and resizes a single page, so resizing
+overlaps the downloads still in flight, and results are returned in page order.
+"""
+
+import logging
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, List, Optional, Sequence
+
+from idp_common import image, s3
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PAGE_READ_WORKERS = 8
+
+
+@dataclass
+class SectionPages:
+    """Page content of a section, in the order the pages were requested."""
+
+    page_ids: List[str] = field(default_factory=list)
+    # None marks a text that could not be read when ignore_errors is set
+    texts: List[Optional[str]] = field(default_factory=list)
+    images: List[bytes] = field(default_factory=list)
+    text_seconds: float = 0.0
+    image_seconds: float = 0.0
+
+
+def get_page_read_workers(service_config: Optional[dict]) -> int:
+    """
+    Read the page_read_workers setting from a service configuration section.
+
+    Args:
+        service_config: Service configuration (e.g. config["extraction"])
+
+    Returns:
+        Number of concurrent page reads, at least 1
+    """
+    value = (service_config or {}).get("page_read_workers")
+    try:
+        return max(1, int(value)) if value not in (None, "") else DEFAULT_PAGE_READ_WORKERS
+    except (TypeError, ValueError):
+        logger.warning(f"Invalid page_read_workers value '{value}', using {DEFAULT_PAGE_READ_WORKERS}")
+        return DEFAULT_PAGE_READ_WORKERS
+
+
+def load_section_pages(document: Any,
+                       page_ids: Sequence[str],
+                       load_images: bool = True,
+                       target_width: Optional[int] = None,
+                       target_height: Optional[int] = None,
+                       max_workers: int = DEFAULT_PAGE_READ_WORKERS,
+                       ignore_errors: bool = False) -> SectionPages:
+    """
+    Read the text and (optionally) the prepared image of each page.
+
+    Page IDs not present in the document are logged and recorded in
+    document.errors, then skipped. With max_workers <= 1 pages are read
+    sequentially in the calling thread.
+
+    Args:
+        document: Document whose pages are read
+        page_ids: Page IDs in the order results should be returned
+        load_images: Also fetch and resize page images via image.prepare_image
+        target_width: Target image width (None or empty string = no resize)
+        target_height: Target image height (None or empty string = no resize)
+        max_workers: Maximum concurrent S3 reads
+        ignore_errors: Log failed text reads and return None for them instead of raising
+
+    Returns:
+        SectionPages with texts and images aligned with page_ids
+
+    Raises:
+        Exception: The first failed read in page order (text reads before image reads)
+    """
+    result = SectionPages()
+    pages = []
+    for page_id in page_ids:
+        if page_id not in document.pages:
+            error_msg = f"Page {page_id} not found in document"
+            logger.error(error_msg)
+            document.errors.append(error_msg)
+            continue
+        result.page_ids.append(page_id)
+        pages.append(document.pages[page_id])
+
+    def read_text(page) -> Optional[str]:
+        try:
+            return s3.get_text_content(page.parsed_text_uri)
+        except Exception as e:
+            if not ignore_errors:
+                raise
+            logger.warning(f"Failed to load text content from {page.parsed_text_uri}: {e}")
+            return None
+
+    def read_image(page) -> bytes:
+        # prepare_image handles empty strings/None for the target dimensions
+        return image.prepare_image(page.image_uri, target_width, target_height)
+
+    t0 = time.time()
+    if max_workers <= 1 or len(pages) <= 1:
+        result.texts = [read_text(page) for page in pages]
+        t1 = time.time()
+        if load_images:
+            result.images = [read_image(page) for page in pages]
+    else:
+        tasks: List[Callable] = [read_text] * len(pages)
+        if load_images:
+            tasks += [read_image] * len(pages)
+        executor = ThreadPoolExecutor(max_workers=min(max_workers, len(tasks)))
+        try:
+            # Text reads are queued first so they finish early; image reads
+            # (download + resize) follow on the same pool.
+            futures: List[Future] = [
+                executor.submit(task, page) for task, page in zip(tasks, pages * 2)
+            ]
+            result.texts = [future.result() for future in futures[:len(pages)]]
+            t1 = time.time()
+            result.images = [future.result() for future in futures[len(pages):]]
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+    t2 = time.time()
+
+    result.text_seconds = t1 - t0
+    result.image_seconds = t2 - t1 if load_images else 0.0
+    return result
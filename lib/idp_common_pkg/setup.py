@@ -72,6 +72,8 @@ extras_require = {
         "PyYAML==6.0.2",
         "openpyxl==3.1.5",
         "python-docx==1.2.0",
+        "moto[s3]==5.1.8",  # For mocking AWS services in tests
+        "pytest-asyncio>=1.1.0",
     ],
     # Development dependencies
     "dev": [
@@ -0,0 +1,144 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Unit tests for the Bedrock embedding service.
+"""
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+from idp_common.bedrock.embedding_cache import EmbeddingService, make_embedding_key
+from idp_common.bedrock.response_cache import DiskResponseCache
+
+
+def _client(delay=0.0):
+    """Fake BedrockClient returning a vector derived from the text."""
+    client = MagicMock()
+
+    def generate_embedding(text, model_id):
+        time.sleep(delay)
+        return [float(len(text)), float(sum(map(ord, text)) % 97), 1.0]
+
+    client.generate_embedding.side_effect = generate_embedding
+    return client
+
+
+@pytest.mark.unit
+class TestEmbeddingService:
+    """Tests for EmbeddingService."""
+
+    def test_repeated_and_whitespace_variants_call_bedrock_once(self):
+        client = _client()
+        service = EmbeddingService(client=client)
+
+        first = service.embed("Acme  Corp\n", "titan")
+        assert service.embed("Acme Corp", "titan") == first
+        assert service.embed(" Acme Corp", "titan") == first
+        client.generate_embedding.assert_called_once_with("Acme Corp", "titan")
+
+        stats = service.get_stats()
+        assert stats["requests"] == 3
+        assert stats["bedrock_calls"] == 1
+        assert stats["calls_saved"] == 2
+        assert stats["hit_rate"] == pytest.approx(2 / 3)
+
+    def test_model_id_is_part_of_the_key(self):
+        assert make_embedding_key("a", "text") != make_embedding_key("b", "text")
+
+    def test_empty_input_does_not_call_bedrock(self):
+        client = _client()
+        service = EmbeddingService(client=client)
+        assert service.embed("") == []
+        assert service.embed("   ") == []
+        client.generate_embedding.assert_not_called()
+        assert service.get_stats()["requests"] == 0
+
+    def test_concurrent_requests_are_coalesced(self):
+        client = _client(delay=0.2)
+        service = EmbeddingService(client=client)
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(service.embed("total")))
+            for _ in range(6)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(results) == 6 and all(r == results[0] for r in results)
+        assert client.generate_embedding.call_count == 1
+        stats = service.get_stats()
+        assert stats["coalesced"] + stats["memory_hits"] == 5
+
+    def test_embed_many_deduplicates_and_preserves_order(self):
+        client = _client()
+        service = EmbeddingService(client=client, max_batch_workers=4)
+        texts = ["a", "b", "a", "", "c", "b "]
+        vectors = service.embed_many(texts)
+
+        assert vectors[3] == []
+        assert vectors[0] == vectors[2] == service.embed("a")
+        assert vectors[1] == vectors[5]
+        assert client.generate_embedding.call_count == 3
+        stats = service.get_stats()
+        assert stats["requests"] == 6
+        assert stats["calls_saved"] == 3
+
+    def test_prefetch_is_not_counted_as_requests(self):
+        client = _client()
+        service = EmbeddingService(client=client)
+        service.embed_many(["a", "b", "a"], prefetch=True)
+        for text in ["a", "b", "a", "b"]:
+            service.embed(text)
+
+        stats = service.get_stats()
+        assert stats["requests"] == 4
+        assert stats["bedrock_calls"] == 2
+        assert stats["calls_saved"] == 2
+
+    def test_failures_are_not_cached(self):
+        client = MagicMock()
+        client.generate_embedding.side_effect = [RuntimeError("throttled"), [1.0]]
+        service = EmbeddingService(client=client)
+
+        assert service.embed_many(["x"]) == [[]]
+        assert service.embed("x") == [1.0]
+        stats = service.get_stats()
+        assert stats["errors"] == 1
+        assert stats["calls_saved"] == 0
+
+    def test_lru_evicts_oldest(self):
+        client = _client()
+        # One worker so entries are inserted (and evicted) in input order
+        service = EmbeddingService(client=client, max_entries=2, max_batch_workers=1)
+        service.embed_many(["a", "b", "c"])
+        service.embed("a")
+        assert client.generate_embedding.call_count == 4
+
+    def test_persistent_cache_is_shared_between_services(self, tmp_path):
+        client = _client()
+        first = EmbeddingService(
+            client=client, persistent_cache=DiskResponseCache(str(tmp_path), None)
+        )
+        vector = first.embed("invoice total")
+
+        second = EmbeddingService(
+            client=client, persistent_cache=DiskResponseCache(str(tmp_path), None)
+        )
+        assert second.embed("invoice total") == vector
+        assert client.generate_embedding.call_count == 1
+        assert second.get_stats()["persistent_hits"] == 1
+
+    def test_stats_delta(self):
+        service = EmbeddingService(client=_client())
+        service.embed("a")
+        before = service.get_stats()
+        service.embed_many(["a", "b", "b"])
+        delta = service.stats_delta(before, service.get_stats())
+        assert delta["requests"] == 3
+        assert delta["bedrock_calls"] == 1
+        assert delta["hit_rate"] == pytest.approx(2 / 3)
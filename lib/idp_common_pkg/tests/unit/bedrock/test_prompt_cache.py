@@ -0,0 +1,155 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Unit tests for prompt cache point insertion and cache usage tracking.
+"""
+
+import pytest
+from idp_common.bedrock.prompt_cache import (
+    DOCUMENT_PLACEHOLDERS,
+    TASK_PLACEHOLDERS,
+    PromptCacheTracker,
+    apply_cache_points,
+    insert_cache_points,
+    plan_prompt_cache,
+)
+
+CLAUDE = "us.anthropic.claude-3-7-sonnet-20250219-v1:0"
+UNSUPPORTED = "us.amazon.nova-micro-v1:0"
+
+TEMPLATE = (
+    "Extract fields from this {DOCUMENT_CLASS} document.\n"
+    "{ATTRIBUTE_NAMES_AND_DESCRIPTIONS}\n"
+    "<document>{DOCUMENT_TEXT}</document>\n"
+    "{DOCUMENT_IMAGE}"
+)
+
+
+def _content(instructions, document):
+    return [{"text": f"{instructions}<<CACHEPOINT>><document>{document}</document>"}]
+
+
+def _response(read=0, write=0, input_tokens=100):
+    return {
+        "response": {
+            "usage": {
+                "inputTokens": input_tokens,
+                "cacheReadInputTokens": read,
+                "cacheWriteInputTokens": write,
+            }
+        },
+        "metering": {},
+    }
+
+
+@pytest.mark.unit
+class TestCachePointInsertion:
+    def test_marker_goes_before_first_section_placeholder(self):
+        result = insert_cache_points(TEMPLATE)
+
+        assert result == TEMPLATE.replace(
+            "<document>{DOCUMENT_TEXT}", "<document><<CACHEPOINT>>{DOCUMENT_TEXT}"
+        )
+
+    def test_explicit_markers_are_respected(self):
+        template = "Instructions<<CACHEPOINT>> {ATTRIBUTE_NAMES_AND_DESCRIPTIONS} {DOCUMENT_TEXT}"
+        assert insert_cache_points(template) == template
+
+    def test_granular_tiers(self):
+        template = (
+            "Assess {DOCUMENT_CLASS}.\n<document>{DOCUMENT_TEXT}</document>\n"
+            "<attributes>{ATTRIBUTE_NAMES_AND_DESCRIPTIONS}</attributes>\n"
+            "<results>{EXTRACTION_RESULTS}</results>"
+        )
+        result = insert_cache_points(
+            template, (DOCUMENT_PLACEHOLDERS, TASK_PLACEHOLDERS)
+        )
+
+        assert result.count("<<CACHEPOINT>>") == 2
+        assert "<document><<CACHEPOINT>>{DOCUMENT_TEXT}" in result
+        assert "<attributes><<CACHEPOINT>>{ATTRIBUTE" in result
+
+    def test_no_marker_without_stable_prefix(self):
+        assert (
+            insert_cache_points("{DOCUMENT_TEXT} classify")
+            == "{DOCUMENT_TEXT} classify"
+        )
+        assert insert_cache_points("Summarize the text.") == "Summarize the text."
+
+    def test_apply_only_for_supported_models_when_enabled(self):
+        assert "<<CACHEPOINT>>" in apply_cache_points(TEMPLATE, CLAUDE)
+        assert apply_cache_points(TEMPLATE, UNSUPPORTED) == TEMPLATE
+        assert apply_cache_points(TEMPLATE, CLAUDE, enabled=False) == TEMPLATE
+
+
+@pytest.mark.unit
+class TestPromptCachePlan:
+    def test_unsupported_model_has_no_plan(self):
+        content = _content("x" * 8000, "doc")
+        system, planned, plan = plan_prompt_cache(UNSUPPORTED, "system", content)
+
+        assert plan is None
+        assert system == "system" and planned is content
+
+    def test_prefix_estimate_and_key(self):
+        _, _, first = plan_prompt_cache(CLAUDE, "system", _content("x" * 8000, "a"))
+        _, _, second = plan_prompt_cache(CLAUDE, "system", _content("x" * 8000, "b"))
+        _, _, other = plan_prompt_cache(CLAUDE, "system", _content("y" * 8000, "a"))
+
+        assert first.cacheable_tokens == 2000 + len("system") // 4
+        assert first.checkpoints == second.checkpoints
+        assert first.checkpoints != other.checkpoints
+
+    def test_long_system_prompt_gets_cache_point(self):
+        system, _, plan = plan_prompt_cache(CLAUDE, "s" * 8000, [{"text": "hi"}])
+
+        assert system == [{"text": "s" * 8000}, {"cachePoint": {"type": "default"}}]
+        assert plan.checkpoints[0][1] == 2000
+
+    def test_markers_capped_keeping_the_last(self):
+        text = "<<CACHEPOINT>>".join(f"part{i}" for i in range(7))
+        _, content, plan = plan_prompt_cache(CLAUDE, "", [{"text": text}])
+
+        assert content[0]["text"].count("<<CACHEPOINT>>") == 4
+        assert content[0]["text"].replace("<<CACHEPOINT>>", "") == text.replace(
+            "<<CACHEPOINT>>", ""
+        )
+        assert content[0]["text"].startswith("part0part1part2<<CACHEPOINT>>")
+        assert len(plan.checkpoints) == 4
+
+
+@pytest.mark.unit
+class TestPromptCacheTracker:
+    def test_predicts_write_then_read(self):
+        tracker = PromptCacheTracker()
+        _, _, plan = plan_prompt_cache(CLAUDE, "", _content("x" * 8000, "a"))
+
+        first = tracker.record(plan, _response(write=2000))
+        second = tracker.record(plan, _response(read=2000))
+
+        assert first["predicted_read_tokens"] == 0
+        assert first["predicted_write_tokens"] == 2000
+        assert second["predicted_read_tokens"] == 2000
+        assert second["observed_read_tokens"] == 2000
+        stats = tracker.stats()
+        assert stats["requests"] == 2
+        assert stats["observed_read_tokens"] == 2000
+        assert stats["observed_read_ratio"] == pytest.approx(2000 / 4200)
+
+    def test_short_and_expired_prefixes_predict_no_read(self):
+        tracker = PromptCacheTracker(ttl_seconds=10)
+        _, _, short = plan_prompt_cache(CLAUDE, "", _content("x" * 100, "a"))
+        assert tracker.predict(short, now=0) == (0, 0)
+
+        _, _, plan = plan_prompt_cache(CLAUDE, "", _content("x" * 8000, "a"))
+        assert tracker.predict(plan, now=0) == (0, 2000)
+        assert tracker.predict(plan, now=5) == (2000, 0)
+        assert tracker.predict(plan, now=30) == (0, 2000)
+
+    def test_response_cache_hits_are_not_recorded(self):
+        tracker = PromptCacheTracker()
+        _, _, plan = plan_prompt_cache(CLAUDE, "", _content("x" * 8000, "a"))
+
+        assert tracker.record(plan, {**_response(), "cache_hit": True}) is None
+        assert tracker.stats()["requests"] == 0
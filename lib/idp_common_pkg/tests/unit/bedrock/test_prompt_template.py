@@ -0,0 +1,147 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Unit tests for compiled prompt templates and memoized prompt sections.
+"""
+
+import pytest
+from idp_common.bedrock import format_prompt
+from idp_common.bedrock.prompt_template import (
+    PromptTemplate,
+    clear_prompt_template_cache,
+    compile_prompt_template,
+    get_prompt_sections,
+    get_prompt_template_stats,
+    render_prompt,
+)
+
+TEMPLATES = [
+    "Extract from this {DOCUMENT_CLASS}:\n{ATTRIBUTE_NAMES_AND_DESCRIPTIONS}\n<document>{DOCUMENT_TEXT}</document>",
+    "No placeholders at all",
+    "Repeated {DOCUMENT_TEXT} and {DOCUMENT_TEXT}, braces {{DOCUMENT_CLASS}} and {UNKNOWN}",
+    "Literal %% sign next to {DOCUMENT_TEXT}",
+    'JSON example: {"field": "value"} for {DOCUMENT_CLASS}',
+]
+
+SUBSTITUTIONS = {
+    "DOCUMENT_TEXT": "Total: 100% {DOCUMENT_CLASS} %(x)s",
+    "DOCUMENT_CLASS": "invoice",
+    "ATTRIBUTE_NAMES_AND_DESCRIPTIONS": "amount  \t[ total ]",
+}
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    clear_prompt_template_cache()
+    yield
+    clear_prompt_template_cache()
+
+
+@pytest.mark.unit
+class TestPromptTemplate:
+    @pytest.mark.parametrize("template", TEMPLATES)
+    def test_render_matches_format_prompt(self, template):
+        compiled = PromptTemplate(template)
+
+        # Rendered twice to cover the cached format string
+        for _ in range(2):
+            assert compiled.render(SUBSTITUTIONS) == format_prompt(
+                template, SUBSTITUTIONS
+            )
+
+    def test_render_with_different_key_sets(self):
+        template = TEMPLATES[0]
+        compiled = PromptTemplate(template)
+        partial = {"DOCUMENT_TEXT": "text", "DOCUMENT_CLASS": "W2"}
+
+        assert compiled.render(SUBSTITUTIONS) == format_prompt(template, SUBSTITUTIONS)
+        assert compiled.render(partial) == format_prompt(template, partial)
+
+    def test_literal_percent_errors_like_format_prompt(self):
+        template = "Score above 90% for {DOCUMENT_TEXT}"
+
+        with pytest.raises(Exception) as expected:
+            format_prompt(template, SUBSTITUTIONS)
+        with pytest.raises(type(expected.value)):
+            PromptTemplate(template).render(SUBSTITUTIONS)
+
+    def test_missing_required_placeholder(self):
+        template = "Only {DOCUMENT_TEXT}"
+
+        with pytest.raises(ValueError) as expected:
+            format_prompt(template, SUBSTITUTIONS, ["DOCUMENT_TEXT", "DOCUMENT_CLASS"])
+        with pytest.raises(ValueError) as actual:
+            render_prompt(template, SUBSTITUTIONS, ["DOCUMENT_TEXT", "DOCUMENT_CLASS"])
+        assert str(actual.value) == str(expected.value)
+
+    def test_compile_is_memoized(self):
+        first = compile_prompt_template(TEMPLATES[0])
+        second = compile_prompt_template(TEMPLATES[0])
+
+        assert first is second
+        stats = get_prompt_template_stats()["templates"]
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+
+
+@pytest.mark.unit
+class TestPromptSections:
+    @pytest.fixture
+    def config(self):
+        return {
+            "classes": [
+                {"name": "Invoice", "attributes": [{"name": "amount"}]},
+                {"name": "invoice", "attributes": [{"name": "duplicate"}]},
+                {"name": "W2", "attributes": []},
+            ]
+        }
+
+    def test_class_lookup_is_case_insensitive_first_match(self, config):
+        sections = get_prompt_sections(config)
+
+        assert sections.class_config("INVOICE") is config["classes"][0]
+        assert sections.class_config("w2") is config["classes"][2]
+        assert sections.class_config("Payslip") is None
+
+    def test_same_config_object_reuses_index(self, config):
+        assert get_prompt_sections(config) is get_prompt_sections(config)
+
+    def test_sections_are_built_once_per_config_version(self, config):
+        calls = []
+
+        def build():
+            calls.append(1)
+            return "amount  \t[ ]"
+
+        get_prompt_sections(config).get("Invoice", "attributes", build)
+        get_prompt_sections(config).get("invoice", "attributes", build)
+
+        # An equal configuration loaded separately shares the entry
+        copied = {"classes": [dict(c) for c in config["classes"]]}
+        assert get_prompt_sections(copied).get("Invoice", "attributes", build) == (
+            "amount  \t[ ]"
+        )
+        assert len(calls) == 1
+
+    def test_changed_configuration_rebuilds(self, config):
+        calls = []
+        changed = {"classes": [{"name": "Invoice", "attributes": [{"name": "tax"}]}]}
+
+        get_prompt_sections(config).get(
+            "Invoice", "attributes", lambda: calls.append(1) or "a"
+        )
+        get_prompt_sections(changed).get(
+            "Invoice", "attributes", lambda: calls.append(2) or "b"
+        )
+
+        assert calls == [1, 2]
+        assert (
+            get_prompt_sections(config).version != get_prompt_sections(changed).version
+        )
+
+    def test_missing_classes(self):
+        sections = get_prompt_sections({})
+
+        assert sections.class_config("Invoice") is None
+        assert sections.get("", "classes", lambda: "") == ""
@@ -0,0 +1,279 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Unit tests for the Bedrock client-side rate governor.
+"""
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+from botocore.exceptions import ClientError
+from idp_common.bedrock import rate_limiter
+from idp_common.bedrock.client import BedrockClient
+from idp_common.bedrock.rate_limiter import (
+    ModelRateGovernor,
+    RateLimitConfig,
+    configure_model_limits,
+    estimate_request_tokens,
+    get_governor,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_registry():
+    rate_limiter.reset_governors()
+    yield
+    rate_limiter.reset_governors()
+
+
+def _throttling_error():
+    return ClientError(
+        {"Error": {"Code": "ThrottlingException", "Message": "Rate exceeded"}},
+        "Converse",
+    )
+
+
+@pytest.mark.unit
+class TestModelRateGovernor:
+    """Tests for the AIMD concurrency limit and token buckets."""
+
+    def test_throttle_halves_limit_and_success_grows_it(self):
+        governor = ModelRateGovernor("m", RateLimitConfig(max_concurrency=8))
+        governor.on_throttle()
+        assert governor.concurrency_limit == 4
+
+        for _ in range(20):
+            governor.acquire()
+            governor.release(success=True)
+        assert governor.concurrency_limit > 4
+        assert governor.concurrency_limit <= 8
+
+    def test_repeated_throttles_within_cooldown_count_once(self):
+        governor = ModelRateGovernor("m", RateLimitConfig(max_concurrency=16))
+        for _ in range(5):
+            governor.on_throttle()
+        assert governor.concurrency_limit == 8
+        assert governor.get_state()["throttles"] == 5
+
+    def test_limit_never_below_minimum(self):
+        governor = ModelRateGovernor(
+            "m", RateLimitConfig(max_concurrency=2, min_concurrency=1)
+        )
+        with patch.object(rate_limiter, "DECREASE_COOLDOWN_SECONDS", 0):
+            for _ in range(10):
+                governor.on_throttle()
+        assert governor.concurrency_limit == 1
+
+    def test_concurrency_limit_blocks_extra_callers(self):
+        governor = ModelRateGovernor("m", RateLimitConfig(max_concurrency=1))
+        governor.acquire()
+        acquired = threading.Event()
+
+        def waiter():
+            governor.acquire()
+            acquired.set()
+
+        thread = threading.Thread(target=waiter)
+        thread.start()
+        time.sleep(0.05)
+        assert not acquired.is_set()
+        assert governor.get_state()["queue_depth"] == 1
+
+        governor.release()
+        assert acquired.wait(2)
+        thread.join()
+
+    def test_acquire_timeout(self):
+        governor = ModelRateGovernor("m", RateLimitConfig(max_concurrency=1))
+        governor.acquire()
+        with pytest.raises(TimeoutError):
+            governor.acquire(timeout=0.05)
+        assert governor.get_state()["queue_depth"] == 0
+
+    def test_requests_per_minute_budget(self):
+        governor = ModelRateGovernor("m", RateLimitConfig(requests_per_minute=2))
+        assert governor.acquire() == pytest.approx(0, abs=0.01)
+        governor.release()
+        governor.acquire()
+        governor.release()
+        with pytest.raises(TimeoutError):
+            governor.acquire(timeout=0.05)
+
+    def test_tokens_per_minute_budget_reconciles_actual_usage(self):
+        governor = ModelRateGovernor("m", RateLimitConfig(tokens_per_minute=1000))
+        governor.acquire(estimated_tokens=100)
+        # Actual usage exhausts the remaining budget
+        governor.release(estimated_tokens=100, actual_tokens=1000)
+        with pytest.raises(TimeoutError):
+            governor.acquire(estimated_tokens=100, timeout=0.05)
+
+    def test_collect_metrics_on_limit_change_or_interval(self):
+        governor = ModelRateGovernor("m", RateLimitConfig(max_concurrency=8))
+        assert governor.collect_metrics(60)["concurrency_limit"] == 8
+        governor.acquire()
+        governor.release(success=True)
+        assert governor.collect_metrics(60) is None
+
+        governor.on_throttle()
+        state = governor.collect_metrics(60)
+        assert state["concurrency_limit"] == 4
+        assert state["max_wait_seconds"] == pytest.approx(0, abs=0.01)
+        assert governor.collect_metrics(60) is None
+        assert governor.collect_metrics(0)["concurrency_limit"] == 4
+
+
+@pytest.mark.unit
+class TestGovernorRegistry:
+    """Tests for process-wide governor lookup and configuration."""
+
+    def test_governor_shared_per_model(self):
+        assert get_governor("a") is get_governor("a")
+        assert get_governor("a") is not get_governor("b")
+
+    def test_configure_model_limits(self):
+        governor = configure_model_limits(
+            "a", requests_per_minute=60, max_concurrency=4
+        )
+        assert get_governor("a") is governor
+        assert governor.config.requests_per_minute == 60
+        assert governor.concurrency_limit == 4
+
+    def test_environment_limits(self, monkeypatch):
+        monkeypatch.setenv("BEDROCK_MAX_CONCURRENCY", "10")
+        monkeypatch.setenv(
+            "BEDROCK_RATE_LIMITS", '{"model-x": {"tokens_per_minute": 5000}}'
+        )
+        governor = get_governor("model-x")
+        assert governor.concurrency_limit == 10
+        assert governor.config.tokens_per_minute == 5000
+        assert get_governor("other").config.tokens_per_minute is None
+
+    def test_estimate_request_tokens(self):
+        params = {
+            "system": [{"text": "x" * 400}],
+            "messages": [
+                {"role": "user", "content": [{"text": "y" * 800}, {"image": {}}]}
+            ],
+            "inferenceConfig": {"temperature": 0},
+            "additionalModelRequestFields": {"max_tokens": 1000},
+        }
+        assert estimate_request_tokens(params) == 100 + 200 + 1600 + 1000
+
+
+@pytest.mark.unit
+class TestBedrockClientGovernor:
+    """Tests for BedrockClient integration with the rate governor."""
+
+    def _client(self, converse):
+        client = BedrockClient(
+            region="us-east-1",
+            metrics_enabled=False,
+            rate_limiting_enabled=True,
+            initial_backoff=0,
+            max_backoff=0,
+        )
+        client._client = MagicMock()
+        client._client.converse.side_effect = converse
+        return client
+
+    def test_throttle_shrinks_governor_and_retry_succeeds(self):
+        responses = [
+            _throttling_error(),
+            {
+                "output": {"message": {"content": [{"text": "ok"}]}},
+                "usage": {"inputTokens": 1, "outputTokens": 1, "totalTokens": 2},
+            },
+        ]
+
+        def converse(**kwargs):
+            result = responses.pop(0)
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        configure_model_limits("us.amazon.nova-pro-v1:0", max_concurrency=8)
+        client = self._client(converse)
+        with patch("time.sleep"):
+            result = client.invoke_model(
+                model_id="us.amazon.nova-pro-v1:0",
+                system_prompt="system",
+                content=[{"text": "hello"}],
+            )
+
+        assert client.extract_text_from_response(result) == "ok"
+        state = get_governor("us.amazon.nova-pro-v1:0").get_state()
+        assert state["throttles"] == 1
+        assert state["concurrency_limit"] == 4
+        assert state["in_flight"] == 0
+
+    def test_disabled_governor_not_used(self):
+        client = self._client(
+            lambda **kwargs: {"output": {"message": {"content": [{"text": "ok"}]}}}
+        )
+        client.rate_limiting_enabled = False
+        with patch("idp_common.bedrock.client.get_governor") as mock_get:
+            client.invoke_model(
+                model_id="us.amazon.nova-pro-v1:0",
+                system_prompt="system",
+                content=[{"text": "hello"}],
+            )
+        mock_get.assert_not_called()
+
+    def test_governor_metrics_published(self):
+        client = self._client(
+            lambda **kwargs: {"output": {"message": {"content": [{"text": "ok"}]}}}
+        )
+        client.metrics_enabled = True
+        with patch("idp_common.metrics.put_metric") as mock_put:
+            client.invoke_model(
+                model_id="us.amazon.nova-pro-v1:0",
+                system_prompt="system",
+                content=[{"text": "hello"}],
+            )
+        names = {call.args[0] for call in mock_put.call_args_list}
+        assert {
+            "BedrockGovernorWaitTime",
+            "BedrockGovernorConcurrencyLimit",
+            "BedrockGovernorQueueDepth",
+        } <= names
+
+    def _governor_metric_calls(self, client, calls):
+        with patch("idp_common.metrics.put_metric") as mock_put:
+            for _ in range(calls):
+                client.invoke_model(
+                    model_id="us.amazon.nova-pro-v1:0",
+                    system_prompt="system",
+                    content=[{"text": "hello"}],
+                )
+        return [
+            call.args[0]
+            for call in mock_put.call_args_list
+            if call.args[0].startswith("BedrockGovernor")
+        ]
+
+    def test_unbuffered_governor_metrics_published_on_change_or_interval(self):
+        client = self._client(
+            lambda **kwargs: {"output": {"message": {"content": [{"text": "ok"}]}}}
+        )
+        client.metrics_enabled = True
+        with patch("idp_common.metrics.get_metrics_buffer", return_value=None):
+            assert len(self._governor_metric_calls(client, 5)) == 3
+
+            get_governor("us.amazon.nova-pro-v1:0").on_throttle()
+            assert len(self._governor_metric_calls(client, 5)) == 3
+
+            with patch.dict(
+                "os.environ", {"BEDROCK_GOVERNOR_METRICS_INTERVAL_SECONDS": "0"}
+            ):
+                assert len(self._governor_metric_calls(client, 2)) == 6
+
+    def test_buffered_governor_metrics_published_per_call(self):
+        client = self._client(
+            lambda **kwargs: {"output": {"message": {"content": [{"text": "ok"}]}}}
+        )
+        client.metrics_enabled = True
+        with patch("idp_common.metrics.get_metrics_buffer", return_value=MagicMock()):
+            assert len(self._governor_metric_calls(client, 5)) == 15
@@ -0,0 +1,214 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Unit tests for the Bedrock response cache.
+"""
+
+import time
+from unittest.mock import MagicMock, patch
+
+import boto3
+import pytest
+from idp_common.bedrock import response_cache
+from idp_common.bedrock.client import BedrockClient
+from idp_common.bedrock.response_cache import (
+    DiskResponseCache,
+    DynamoDBResponseCache,
+    MemoryResponseCache,
+    ResponseCache,
+    S3ResponseCache,
+    create_response_cache,
+    make_cache_key,
+)
+from moto import mock_aws
+
+RESPONSE = {
+    "output": {"message": {"role": "assistant", "content": [{"text": "invoice"}]}},
+    "usage": {"inputTokens": 120, "outputTokens": 5, "totalTokens": 125},
+    "stopReason": "end_turn",
+    "ResponseMetadata": {"RequestId": "abc"},
+}
+
+
+def _params(image=b"\x89PNG-1", temperature=0.0):
+    return {
+        "modelId": "us.amazon.nova-pro-v1:0",
+        "system": [{"text": "Classify the page"}],
+        "messages": [
+            {
+                "role": "user",
+                "content": [
+                    {"text": "page text"},
+                    {"image": {"format": "png", "source": {"bytes": image}}},
+                ],
+            }
+        ],
+        "inferenceConfig": {"temperature": temperature},
+        "additionalModelRequestFields": None,
+    }
+
+
+@pytest.mark.unit
+class TestCacheKey:
+    """Tests for make_cache_key."""
+
+    def test_key_is_stable(self):
+        assert make_cache_key(_params()) == make_cache_key(_params())
+
+    def test_key_changes_with_image_bytes(self):
+        assert make_cache_key(_params(image=b"a")) != make_cache_key(
+            _params(image=b"b")
+        )
+
+    def test_key_changes_with_inference_params(self):
+        assert make_cache_key(_params(temperature=0.0)) != make_cache_key(
+            _params(temperature=0.5)
+        )
+
+    def test_key_independent_of_dict_order(self):
+        params = _params()
+        reordered = dict(reversed(list(params.items())))
+        assert make_cache_key(params) == make_cache_key(reordered)
+
+
+@pytest.mark.unit
+class TestBackends:
+    """Round-trip and expiry tests for each backend."""
+
+    def _round_trip(self, cache):
+        assert cache.get("k1") is None
+        cache.put("k1", RESPONSE)
+        cached = cache.get("k1")
+        assert cached["output"] == RESPONSE["output"]
+        assert "ResponseMetadata" not in cached
+        assert cache.get_stats() == {"hits": 1, "misses": 1, "hit_ratio": 0.5}
+
+    def test_base_class_is_abstract(self):
+        with pytest.raises(TypeError):
+            ResponseCache()
+
+    def test_memory_round_trip(self):
+        self._round_trip(MemoryResponseCache())
+
+    def test_memory_lru_eviction(self):
+        cache = MemoryResponseCache(max_entries=2)
+        cache.put("a", RESPONSE)
+        cache.put("b", RESPONSE)
+        cache.get("a")
+        cache.put("c", RESPONSE)
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+
+    def test_memory_ttl_expiry(self):
+        cache = MemoryResponseCache(ttl_seconds=10)
+        cache.put("a", RESPONSE)
+        with patch.object(time, "time", return_value=time.time() + 20):
+            assert cache.get("a") is None
+
+    def test_disk_round_trip(self, tmp_path):
+        self._round_trip(DiskResponseCache(str(tmp_path)))
+        # A new instance pointed at the same directory sees the entry
+        assert DiskResponseCache(str(tmp_path)).get("k1") is not None
+
+    @mock_aws
+    def test_s3_round_trip(self):
+        s3 = boto3.client("s3", region_name="us-east-1")
+        s3.create_bucket(Bucket="cache-bucket")
+        self._round_trip(S3ResponseCache("cache-bucket", "prefix", client=s3))
+
+    @mock_aws
+    def test_dynamodb_round_trip(self):
+        dynamodb = boto3.resource("dynamodb", region_name="us-east-1")
+        dynamodb.create_table(
+            TableName="cache-table",
+            KeySchema=[{"AttributeName": "cache_key", "KeyType": "HASH"}],
+            AttributeDefinitions=[{"AttributeName": "cache_key", "AttributeType": "S"}],
+            BillingMode="PAY_PER_REQUEST",
+        )
+        cache = DynamoDBResponseCache("cache-table", resource=dynamodb)
+        self._round_trip(cache)
+        item = dynamodb.Table("cache-table").get_item(Key={"cache_key": "k1"})["Item"]
+        assert item["expires_at"] > time.time()
+
+    def test_backend_errors_are_misses(self):
+        cache = MemoryResponseCache()
+        with patch.object(cache, "_get_entry", side_effect=Exception("boom")):
+            assert cache.get("a") is None
+        with patch.object(cache, "_put_entry", side_effect=Exception("boom")):
+            cache.put("a", RESPONSE)
+
+    def test_create_from_spec(self, tmp_path):
+        assert create_response_cache("") is None
+        assert isinstance(create_response_cache("memory:10"), MemoryResponseCache)
+        assert isinstance(create_response_cache(f"disk:{tmp_path}"), DiskResponseCache)
+        with patch.object(response_cache.boto3, "client"):
+            cache = create_response_cache("s3://bucket/some/prefix")
+        assert (cache.bucket, cache.prefix) == ("bucket", "some/prefix")
+        with pytest.raises(ValueError):
+            create_response_cache("redis://host")
+
+
+@pytest.mark.unit
+class TestBedrockClientResponseCache:
+    """Tests for response caching in BedrockClient.invoke_model."""
+
+    def _invoke(self, client, text="hello"):
+        return client.invoke_model(
+            model_id="us.amazon.nova-pro-v1:0",
+            system_prompt="system",
+            content=[{"text": text}],
+            context="Classification",
+        )
+
+    def _client(self, cache):
+        client = BedrockClient(
+            region="us-east-1", metrics_enabled=False, response_cache=cache
+        )
+        client._client = MagicMock()
+        client._client.converse.return_value = RESPONSE
+        return client
+
+    def test_second_identical_call_served_from_cache(self):
+        client = self._client(MemoryResponseCache())
+        first = self._invoke(client)
+        second = self._invoke(client)
+
+        assert client._client.converse.call_count == 1
+        assert "cache_hit" not in first
+        assert second["cache_hit"] is True
+        assert client.extract_text_from_response(second) == "invoice"
+        metering = second["metering"]["Classification/bedrock/us.amazon.nova-pro-v1:0"]
+        assert metering == {"inputTokens": 0, "outputTokens": 0, "totalTokens": 0}
+
+    def test_different_content_misses(self):
+        client = self._client(MemoryResponseCache())
+        self._invoke(client, "a")
+        self._invoke(client, "b")
+        assert client._client.converse.call_count == 2
+
+    def test_no_cache_by_default(self, monkeypatch):
+        monkeypatch.delenv("BEDROCK_RESPONSE_CACHE", raising=False)
+        client = self._client(None)
+        self._invoke(client)
+        self._invoke(client)
+        assert client._client.converse.call_count == 2
+
+    def test_cache_from_environment(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("BEDROCK_RESPONSE_CACHE", f"disk:{tmp_path}")
+        client = self._client(None)
+        self._invoke(client)
+        assert self._invoke(client)["cache_hit"] is True
+
+    def test_hit_ratio_metric(self):
+        client = self._client(MemoryResponseCache())
+        client.metrics_enabled = True
+        with patch("idp_common.metrics.put_metric") as mock_put:
+            self._invoke(client)
+            self._invoke(client)
+        ratios = [
+            call.args[1]
+            for call in mock_put.call_args_list
+            if call.args[0] == "BedrockResponseCacheHitRatio"
+        ]
+        assert ratios == [0, 100]
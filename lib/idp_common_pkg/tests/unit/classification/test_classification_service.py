@@ -208,7 +208,7 @@ class TestClassificationService:
             "CLASS_LIST": "invoice, receipt, letter",
         }
 
-        with patch("idp_common.bedrock.format_prompt", return_value="Formatted prompt"):
+        with patch("idp_common.bedrock.render_prompt", return_value="Formatted prompt"):
             result = service._prepare_prompt_from_template(
                 template,
                 substitutions,
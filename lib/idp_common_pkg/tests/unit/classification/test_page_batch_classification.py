@@ -0,0 +1,220 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Unit tests for batched page classification in ClassificationService.
+"""
+
+import json
+from unittest.mock import patch
+
+import pytest
+from idp_common.classification.models import (
+    DocumentClassification,
+    PageClassification,
+)
+from idp_common.classification.service import ClassificationService
+from idp_common.models import Document, Page, Status
+
+
+def _config(batch_size=4):
+    return {
+        "classes": [
+            {"name": "invoice", "description": "An invoice document"},
+            {"name": "receipt", "description": "A receipt document"},
+            {"name": "letter", "description": "A letter document"},
+        ],
+        "classification": {
+            "model": "us.amazon.nova-pro-v1:0",
+            "system_prompt": "You are a document classification assistant.",
+            "task_prompt": "{CLASS_NAMES_AND_DESCRIPTIONS}\n{DOCUMENT_TEXT}",
+            "classificationMethod": "multimodalPageLevelClassification",
+            "page_batch": {"size": batch_size},
+        },
+    }
+
+
+def _document(page_count):
+    doc = Document(id="doc", input_key="packet.pdf", status=Status.CLASSIFYING)
+    for i in range(1, page_count + 1):
+        doc.pages[str(i)] = Page(
+            page_id=str(i), parsed_text_uri=f"s3://bucket/{i}/result.json"
+        )
+    return doc
+
+
+def _response(pages, tokens=1000):
+    return {
+        "response": {
+            "output": {"message": {"content": [{"text": json.dumps({"pages": pages})}]}}
+        },
+        "metering": {
+            "Classification/bedrock/us.amazon.nova-pro-v1:0": {"inputTokens": tokens}
+        },
+    }
+
+
+@pytest.fixture
+def service():
+    return ClassificationService(region="us-west-2", config=_config())
+
+
+@pytest.mark.unit
+class TestPageBatchClassification:
+    """Tests for classification.page_batch."""
+
+    def test_batches_consecutive_pages(self, service):
+        assert service._build_page_batches(["10", "2", "1", "3", "4", "5"]) == [
+            ["1", "2", "3", "4"],
+            ["5"],
+            ["10"],
+        ]
+
+    def test_batches_split_at_page_gaps(self, service):
+        # Pages 4-6 were served from the cache; 3 and 7 are not consecutive
+        assert service._build_page_batches(["1", "2", "3", "7", "8", "12"]) == [
+            ["1", "2", "3"],
+            ["7", "8"],
+            ["12"],
+        ]
+        assert service._build_page_batches(["b", "a"]) == [["a"], ["b"]]
+
+    def test_disabled_by_default(self):
+        config = _config()
+        del config["classification"]["page_batch"]
+        assert (
+            ClassificationService(region="us-west-2", config=config).page_batch_size
+            == 1
+        )
+
+    def test_prefix_content_ends_with_cachepoint(self, service):
+        content = service._build_page_batch_prefix_content()
+        text = "".join(item.get("text", "") for item in content)
+        assert "invoice  \t[ An invoice document ]" in text
+        assert text.rstrip().endswith("<<CACHEPOINT>>")
+
+    @patch("idp_common.s3.get_text_content", side_effect=lambda uri: f"text of {uri}")
+    def test_one_request_per_batch(self, mock_get_text, service):
+        doc = _document(6)
+        responses = {
+            ("1", "2", "3", "4"): _response(
+                [
+                    {"page_id": "1", "class": "invoice", "document_boundary": "start"},
+                    {
+                        "page_id": "2",
+                        "class": "invoice",
+                        "document_boundary": "continue",
+                    },
+                    {"page_id": "3", "class": "letter", "document_boundary": "start"},
+                    {"page_id": "4", "class": "invoice", "document_boundary": "start"},
+                ]
+            ),
+            ("5", "6"): _response(
+                [
+                    {
+                        "page_id": "5",
+                        "class": "invoice",
+                        "document_boundary": "continue",
+                    },
+                    {"page_id": "6", "class": "receipt", "document_boundary": "start"},
+                ],
+                tokens=500,
+            ),
+        }
+
+        def invoke(content, config):
+            page_ids = tuple(
+                item["text"].split('"')[1]
+                for item in content
+                if item.get("text", "").startswith("<page page_id=")
+            )
+            assert "<<CACHEPOINT>>" in "".join(
+                item.get("text", "") for item in content[:3]
+            )
+            return responses[page_ids]
+
+        with (
+            patch.object(
+                service, "_invoke_bedrock_model", side_effect=invoke
+            ) as mock_invoke,
+            patch.object(service, "classify_page") as mock_classify_page,
+        ):
+            result = service.classify_document(doc)
+
+        assert mock_invoke.call_count == 2
+        mock_classify_page.assert_not_called()
+        assert [s.classification for s in result.sections] == [
+            "invoice",
+            "letter",
+            "invoice",
+            "receipt",
+        ]
+        assert [s.page_ids for s in result.sections] == [
+            ["1", "2"],
+            ["3"],
+            ["4", "5"],
+            ["6"],
+        ]
+        # Batch metering is recorded once, on the first page of each batch
+        assert result.pages["1"].metadata["metering"] != {}
+        assert result.pages["2"].metadata["metering"] == {}
+        assert result.metering["Classification/bedrock/us.amazon.nova-pro-v1:0"] == {
+            "inputTokens": 1500
+        }
+
+    @patch("idp_common.s3.get_text_content", return_value="page text")
+    def test_unparseable_labels_fall_back_to_single_pages(self, mock_get_text, service):
+        doc = _document(3)
+
+        def classify_page(page_id, **kwargs):
+            return PageClassification(
+                page_id=page_id,
+                classification=DocumentClassification(
+                    doc_type="receipt", metadata={"metering": {}}
+                ),
+            )
+
+        with (
+            patch.object(
+                service,
+                "_invoke_bedrock_model",
+                return_value=_response(
+                    [
+                        {"page_id": "1", "class": "invoice"},
+                        {"page_id": "2", "class": "not-a-class"},
+                    ]
+                ),
+            ),
+            patch.object(
+                service, "classify_page", side_effect=classify_page
+            ) as mock_single,
+        ):
+            results, exceptions = service._classify_page_batch(
+                doc.pages, service._build_page_batch_prefix_content()
+            )
+
+        assert exceptions == {}
+        assert [(r.page_id, r.classification.doc_type) for r in results] == [
+            ("1", "invoice"),
+            ("2", "receipt"),
+            ("3", "receipt"),
+        ]
+        # Page 2 has an unknown class and page 3 is missing from the response
+        assert [call.kwargs["page_id"] for call in mock_single.call_args_list] == [
+            "2",
+            "3",
+        ]
+        assert results[0].classification.metadata["metering"] != {}
+
+    @patch("idp_common.s3.get_text_content", return_value="page text")
+    def test_request_failure_marks_batch_pages_failed(self, mock_get_text, service):
+        doc = _document(3)
+        error = RuntimeError("ThrottlingException")
+        with patch.object(service, "_invoke_bedrock_model", side_effect=error):
+            result = service.classify_document(doc)
+
+        assert set(result.metadata["failed_page_exceptions"]) == {"1", "2", "3"}
+        assert all(
+            page.classification == "error (backoff/retry)"
+            for page in result.pages.values()
+        )
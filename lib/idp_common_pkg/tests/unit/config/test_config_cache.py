@@ -0,0 +1,140 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Unit tests for the cached configuration loader.
+"""
+
+from unittest.mock import patch
+
+import boto3
+import pytest
+from idp_common import config
+from idp_common.config import (
+    bump_configuration_version,
+    clear_config_cache,
+    get_config,
+)
+from idp_common.config.configuration_manager import ConfigurationManager
+from moto import mock_aws
+
+TABLE = "config-table"
+
+
+@pytest.fixture
+def table(monkeypatch):
+    """Moto configuration table with Default and Custom items; counts GetItem calls."""
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+    monkeypatch.setenv("AWS_REGION", "us-east-1")
+    monkeypatch.setenv("CONFIGURATION_TABLE_NAME", TABLE)
+    monkeypatch.delenv("CONFIGURATION_CACHE_TTL_SECONDS", raising=False)
+    clear_config_cache()
+    with mock_aws():
+        boto3.setup_default_session()
+        reads = []
+        boto3.DEFAULT_SESSION.events.register(
+            "provide-client-params.dynamodb.GetItem",
+            lambda params, **kwargs: reads.append(params["Key"]),
+        )
+        dynamodb = boto3.resource("dynamodb")
+        dynamodb.create_table(
+            TableName=TABLE,
+            KeySchema=[{"AttributeName": "Configuration", "KeyType": "HASH"}],
+            AttributeDefinitions=[
+                {"AttributeName": "Configuration", "AttributeType": "S"}
+            ],
+            BillingMode="PAY_PER_REQUEST",
+        )
+        manager = ConfigurationManager(TABLE)
+        manager.update_configuration(
+            "Default", {"extraction": {"model": "default-model", "temperature": "0"}}
+        )
+        manager.update_configuration("Custom", {"extraction": {"model": "custom"}})
+        reads.clear()
+        yield manager, reads
+    clear_config_cache()
+
+
+@pytest.mark.unit
+class TestConfigCache:
+    """Tests for get_config caching."""
+
+    def test_warm_invocations_do_not_read_dynamodb(self, table):
+        _, reads = table
+        for _ in range(1000):
+            result = get_config()
+        assert result == {"extraction": {"model": "custom", "temperature": "0"}}
+        # Version marker plus Default and Custom on the first call only
+        assert len(reads) == 3
+
+    def test_callers_get_independent_copies(self, table):
+        get_config()["extraction"]["model"] = "mutated"
+        assert get_config()["extraction"]["model"] == "custom"
+
+    def test_unchanged_version_skips_reload_after_ttl(self, table):
+        _, reads = table
+        get_config()
+        after_ttl = config.time.monotonic() + 61
+        with patch.object(config.time, "monotonic", return_value=after_ttl):
+            get_config()
+        assert [key["Configuration"]["S"] for key in reads] == [
+            "ConfigurationVersion",
+            "Default",
+            "Custom",
+            "ConfigurationVersion",
+        ]
+
+    def test_update_is_picked_up_after_ttl(self, table):
+        manager, _ = table
+        get_config()
+        manager.update_configuration("Custom", {"extraction": {"model": "new"}})
+        assert get_config()["extraction"]["model"] == "custom"
+        with patch.object(config.time, "monotonic", return_value=1e12):
+            assert get_config()["extraction"]["model"] == "new"
+
+    def test_ttl_zero_disables_cache(self, table, monkeypatch):
+        _, reads = table
+        monkeypatch.setenv("CONFIGURATION_CACHE_TTL_SECONDS", "0")
+        get_config()
+        get_config()
+        assert len(reads) == 4
+
+    def test_missing_version_marker_reloads_after_ttl(self, table):
+        manager, reads = table
+        manager.table.delete_item(Key={"Configuration": "ConfigurationVersion"})
+        get_config()
+        with patch.object(config.time, "monotonic", return_value=1e12):
+            get_config()
+        assert len(reads) == 6
+
+    def test_unversioned_write_is_picked_up_after_max_age(self, table, monkeypatch):
+        manager, _ = table
+        monkeypatch.setenv("CONFIGURATION_CACHE_MAX_AGE_SECONDS", "600")
+        get_config()
+        # A writer that does not bump the version marker, like a raw put_item
+        manager.table.put_item(
+            Item={"Configuration": "Custom", "extraction": {"model": "unversioned"}}
+        )
+        with patch.object(config.time, "monotonic", return_value=1e12):
+            assert get_config()["extraction"]["model"] == "unversioned"
+
+    def test_max_age_counts_from_last_full_load(self, table, monkeypatch):
+        _, reads = table
+        monkeypatch.setenv("CONFIGURATION_CACHE_MAX_AGE_SECONDS", "600")
+        start = config.time.monotonic()
+        with patch.object(config.time, "monotonic") as mock_monotonic:
+            for offset in (0, 120, 240, 360, 480, 610):
+                mock_monotonic.return_value = start + offset
+                get_config()
+        names = [key["Configuration"]["S"] for key in reads]
+        # Version checks at each TTL, full reloads on the first call and after 600s
+        assert names.count("ConfigurationVersion") == 6
+        assert names.count("Default") == 2
+
+    def test_bump_configuration_version(self, table):
+        manager, _ = table
+        before = manager.get_configuration("ConfigurationVersion")["Version"]
+        bump_configuration_version(manager.table)
+        after = manager.get_configuration("ConfigurationVersion")
+        assert after["Version"] == before + 1
+        assert after["UpdatedAt"]
@@ -0,0 +1,33 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Shared fixtures for criteria validation tests.
+"""
+
+import json
+from unittest.mock import patch
+
+import boto3
+import pytest
+from idp_common import s3
+from moto import mock_aws
+
+BUCKET = "criteria-bucket"
+
+
+@pytest.fixture
+def s3_client():
+    with mock_aws():
+        client = boto3.client("s3", region_name="us-east-1")
+        client.create_bucket(Bucket=BUCKET)
+        for criteria_type in ("administration", "necessity"):
+            client.put_object(
+                Bucket=BUCKET,
+                Key=f"{criteria_type}.json",
+                Body=json.dumps(
+                    {"criteria": [f"{criteria_type} question {i}" for i in range(6)]}
+                ),
+            )
+        with patch.object(s3, "_s3_client", client):
+            yield client
@@ -0,0 +1,272 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Unit tests for the criteria validation async client and service concurrency.
+"""
+
+import asyncio
+import json
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+from idp_common import bedrock
+from idp_common.criteria_validation import CriteriaValidationService
+from idp_common.criteria_validation.async_client import (
+    AsyncBedrockS3Client,
+    gather_bounded,
+)
+
+from .conftest import BUCKET
+
+
+class SlowModel:
+    """Stand-in for bedrock.invoke_model that sleeps and tracks concurrency."""
+
+    def __init__(self, latency=0.02, text=None):
+        self.latency = latency
+        self.text = text
+        self.lock = threading.Lock()
+        self.in_flight = {}
+        self.peak = {}
+        self.calls = 0
+
+    def __call__(self, model_id, system_prompt, content, *args):
+        with self.lock:
+            self.calls += 1
+            self.in_flight[model_id] = self.in_flight.get(model_id, 0) + 1
+            self.peak[model_id] = max(
+                self.peak.get(model_id, 0), self.in_flight[model_id]
+            )
+        time.sleep(self.latency)
+        with self.lock:
+            self.in_flight[model_id] -= 1
+        text = self.text or json.dumps(
+            {"Recommendation": "Pass", "Reasoning": "Found in history"}
+        )
+        return {
+            "response": {"output": {"message": {"content": [{"text": text}]}}},
+            "metering": {
+                f"CriteriaValidation/bedrock/{model_id}": {
+                    "inputTokens": 10,
+                    "outputTokens": 5,
+                }
+            },
+        }
+
+
+@pytest.mark.unit
+class TestAsyncBedrockS3Client:
+    def test_per_model_concurrency_limits(self):
+        model = SlowModel()
+
+        async def run():
+            async with AsyncBedrockS3Client(
+                model_concurrency=3, model_limits={"b": 1}, invoke=model
+            ) as client:
+                await asyncio.gather(
+                    *[client.invoke_model("a", "sys", "q") for _ in range(12)],
+                    *[client.invoke_model("b", "sys", "q") for _ in range(4)],
+                )
+                return client.stats()
+
+        stats = asyncio.run(run())
+
+        assert model.peak == {"a": 3, "b": 1}
+        assert stats["models"]["a"]["peak_in_flight"] == 3
+        assert stats["models"]["a"]["calls"] == 12
+        assert stats["models"]["b"]["limit"] == 1
+
+    def test_cancelled_waiter_releases_no_slot(self):
+        model = SlowModel(latency=0.05)
+
+        async def run():
+            async with AsyncBedrockS3Client(model_concurrency=1, invoke=model) as c:
+                first = asyncio.ensure_future(c.invoke_model("a", "sys", "q"))
+                waiter = asyncio.ensure_future(c.invoke_model("a", "sys", "q"))
+                await asyncio.sleep(0.01)
+                waiter.cancel()
+                await first
+                with pytest.raises(asyncio.CancelledError):
+                    await waiter
+                await c.invoke_model("a", "sys", "q")
+                return c.stats()["models"]["a"]
+
+        stats = asyncio.run(run())
+
+        assert stats["cancelled"] == 1
+        assert stats["in_flight"] == 0
+        assert model.calls == 2
+
+    def test_closed_client_rejects_calls(self):
+        async def run():
+            client = AsyncBedrockS3Client(invoke=SlowModel())
+            client.close()
+            await client.invoke_model("a", "sys", "q")
+
+        with pytest.raises(RuntimeError):
+            asyncio.run(run())
+
+
+@pytest.mark.unit
+class TestGatherBounded:
+    def test_results_in_order_with_bounded_window(self):
+        alive = 0
+        peak = 0
+        started = []
+
+        async def work(i):
+            nonlocal alive, peak
+            alive += 1
+            peak = max(peak, alive)
+            await asyncio.sleep(0.001 * (i % 3))
+            alive -= 1
+            return i
+
+        def factory(i):
+            started.append(i)
+            return work(i)
+
+        results = asyncio.run(
+            gather_bounded((lambda i=i: factory(i) for i in range(20)), 4)
+        )
+
+        assert results == list(range(20))
+        assert peak == 4
+        assert started == list(range(20))
+
+    def test_error_cancels_pending(self):
+        cancelled = []
+
+        async def work(i):
+            if i == 1:
+                raise ValueError("boom")
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                cancelled.append(i)
+                raise
+
+        with pytest.raises(ValueError):
+            asyncio.run(gather_bounded((lambda i=i: work(i) for i in range(10)), 3))
+
+        # Only the window was admitted; the others were never started
+        assert sorted(cancelled) == [0, 2]
+
+
+def make_config(summary=False):
+    config = {
+        "model_id": "model-a",
+        "system_prompt": "You evaluate criteria.",
+        "task_prompt": "{question} {criteria_type} {content} {source_filepath} "
+        "{recommendation_options}",
+        "recommendation_options": "Pass/Fail/Information Not Found",
+        "request_bucket": BUCKET,
+        "request_history_prefix": "prior-auth",
+        "criteria_bucket": BUCKET,
+        "criteria_types": ["administration", "necessity"],
+    }
+    if summary:
+        config["summary"] = {
+            "system_prompt": "You summarize.",
+            "task_prompt": "{question} {criteria_type} {initial_response} "
+            "{recommendation_options}",
+        }
+    return config
+
+
+def write_history(client, files):
+    uris = []
+    for i in range(files):
+        key = f"prior-auth-req1/extracted_text/file{i}.txt"
+        client.put_object(Bucket=BUCKET, Key=key, Body=f"History {i}")
+        uris.append(f"s3://{BUCKET}/{key}")
+    return uris
+
+
+@pytest.mark.unit
+class TestCriteriaValidationConcurrency:
+    def run_service(self, uris, config, semaphore=2):
+        model = SlowModel(latency=0.01)
+        service = CriteriaValidationService(
+            config={"criteria_validation": {"semaphore": semaphore}}
+        )
+        with (
+            patch.object(bedrock, "invoke_model", model),
+            patch.object(service, "_list_text_files", return_value=uris),
+        ):
+            result = service.validate_request("req1", config)
+        return result, model
+
+    def test_single_file_responses_and_model_limit(self, s3_client):
+        uris = write_history(s3_client, 1)
+
+        result, model = self.run_service(uris, make_config())
+
+        assert model.calls == 12
+        assert model.peak["model-a"] == 2
+        administration, necessity = result.validation_responses
+        assert [r["question"] for r in administration] == [
+            f"administration question {i}" for i in range(6)
+        ]
+        assert all(r["Recommendation"] == "Pass" for r in administration + necessity)
+        assert result.metering["CriteriaValidation/bedrock/model-a"] == {
+            "inputTokens": 120,
+            "outputTokens": 60,
+        }
+        stats = result.metadata["concurrency"]
+        assert stats["models"]["model-a"]["peak_in_flight"] == 2
+        written = json.loads(
+            s3_client.get_object(
+                Bucket=BUCKET, Key="responses/request_id_req1_necessity_responses.json"
+            )["Body"].read()
+        )
+        assert written == necessity
+
+    def test_multiple_files_are_summarized_per_question(self, s3_client):
+        uris = write_history(s3_client, 3)
+
+        result, model = self.run_service(uris, make_config(summary=True))
+
+        # 3 files x 12 questions, then one summary per question
+        assert model.calls == 36 + 12
+        administration, _ = result.validation_responses
+        assert len(administration) == 6
+        assert result.metadata["files_processed"] == 3
+
+    def test_missing_criteria_file_fails_request(self, s3_client):
+        uris = write_history(s3_client, 2)
+        config = make_config()
+        config["criteria_types"] = ["administration", "missing"]
+
+        with pytest.raises(Exception):
+            self.run_service(uris, config)
+
+    def test_concurrent_runs_on_one_service(self, s3_client):
+        uris = write_history(s3_client, 1)
+        service = CriteriaValidationService(config={})
+
+        async def run():
+            return await asyncio.gather(
+                service.validate_request_async("req1", make_config()),
+                service.validate_request_async("req1", make_config()),
+            )
+
+        with (
+            patch.object(bedrock, "invoke_model", SlowModel()),
+            patch.object(service, "_list_text_files", return_value=uris),
+        ):
+            results = asyncio.run(run())
+
+        for result in results:
+            assert result.metadata["concurrency"]["models"]["model-a"]["calls"] == 12
+
+    def test_chunking_terminates_at_end_of_text(self):
+        service = CriteriaValidationService(config={})
+
+        # One 1,000-token "word" split at a 100-token budget
+        chunks = service._chunk_text_with_overlap("x" * 6000, 100, 4, 10)
+
+        assert [len(chunk) for chunk in chunks] == [600] * 10
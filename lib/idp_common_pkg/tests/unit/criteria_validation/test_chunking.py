@@ -0,0 +1,181 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Unit tests for criteria validation chunking and chunk manifests.
+"""
+
+import json
+from unittest.mock import patch
+
+import pytest
+from idp_common import bedrock
+from idp_common.criteria_validation import CriteriaValidationService, chunking
+
+from .conftest import BUCKET
+from .test_async_client import SlowModel, make_config
+
+
+def history(pages=5, sentences=30):
+    return "".join(
+        f"<page-number>{page}</page-number>\n"
+        + f"The patient was seen on 2024-01-0{page} for review. " * sentences
+        + "\n"
+        for page in range(1, pages + 1)
+    )
+
+
+@pytest.mark.unit
+class TestEstimateTokens:
+    def test_words_digits_and_symbols(self):
+        assert chunking.estimate_tokens("") == 0
+        assert chunking.estimate_tokens("the patient") == 3
+        # Digits group by three, each symbol is a token
+        assert chunking.estimate_tokens("2024-03-15") == 6
+        assert chunking.estimate_tokens("250mg, twice") == 4
+
+    def test_numeric_text_counts_more_than_characters_suggest(self):
+        text = "12-34-56-78 " * 100
+        assert chunking.estimate_tokens(text) > len(text) // 4
+
+
+@pytest.mark.unit
+class TestChunkText:
+    def test_short_text_is_one_chunk(self):
+        text = "Short history. Two sentences."
+
+        chunks = chunking.chunk_text(text, 1000)
+
+        assert len(chunks) == 1
+        assert (chunks[0].start, chunks[0].end) == (0, len(text))
+
+    def test_chunks_respect_budget_and_sentences(self):
+        text = history()
+
+        chunks = chunking.chunk_text(text, 400, overlap_percentage=10)
+
+        assert len(chunks) > 1
+        for chunk in chunks:
+            piece = text[chunk.start : chunk.end]
+            assert chunking.estimate_tokens(piece) == chunk.tokens <= 400
+            assert piece.endswith((". ", "\n"))
+        assert chunks[0].start == 0 and chunks[-1].end == len(text)
+
+    def test_consecutive_chunks_overlap_without_gaps(self):
+        text = history()
+
+        chunks = chunking.chunk_text(text, 400, overlap_percentage=10)
+
+        for previous, chunk in zip(chunks, chunks[1:]):
+            assert previous.start < chunk.start < previous.end
+            assert chunking.estimate_tokens(text[chunk.start : previous.end]) <= 40
+
+    def test_prefers_page_boundaries(self):
+        text = history(pages=4, sentences=10)
+        page_starts = [text.index(f"<page-number>{p}<") for p in range(2, 5)]
+
+        chunks = chunking.chunk_text(text, 350, overlap_percentage=0)
+
+        assert [chunk.end for chunk in chunks[:-1]] == [page_starts[1]]
+        assert [(c.first_page, c.last_page) for c in chunks] == [
+            (1, 2),
+            (3, 4),
+        ]
+
+    def test_manifest_round_trip(self):
+        text = history()
+        manifest = chunking.build_manifest(text, 400, 10)
+        data = json.loads(json.dumps(manifest.to_dict()))
+        params = chunking.chunk_params(400, 10)
+
+        loaded = chunking.load_manifest(data, chunking.content_hash(text), params)
+
+        assert loaded.texts(text) == manifest.texts(text)
+        assert chunking.load_manifest(data, "other", params) is None
+        assert (
+            chunking.load_manifest(
+                data, manifest.content_sha256, chunking.chunk_params(500, 10)
+            )
+            is None
+        )
+        assert chunking.load_manifest({"chunks": []}, "x", params) is None
+
+
+@pytest.mark.unit
+class TestServiceChunkManifests:
+    def run_service(self, s3_client, config, uris):
+        model = SlowModel(latency=0)
+        service = CriteriaValidationService(
+            config={"criteria_validation": {"max_chunk_size": 400}}
+        )
+        reads = []
+        s3_client.meta.events.register(
+            "before-parameter-build.s3.GetObject",
+            lambda params, **kwargs: reads.append(params["Key"]),
+        )
+        with (
+            patch.object(bedrock, "invoke_model", model),
+            patch.object(service, "_list_text_files", return_value=uris),
+        ):
+            service.validate_request("req1", config)
+        return model, reads
+
+    def write_file(self, s3_client, text):
+        key = "prior-auth-req1/extracted_text/file0.txt"
+        s3_client.put_object(Bucket=BUCKET, Key=key, Body=text)
+        return [f"s3://{BUCKET}/{key}"]
+
+    def manifest_keys(self, s3_client):
+        listed = s3_client.list_objects_v2(Bucket=BUCKET, Prefix="chunk_manifests/")
+        return [item["Key"] for item in listed.get("Contents", [])]
+
+    def test_manifest_is_written_then_reused(self, s3_client):
+        text = history()
+        uris = self.write_file(s3_client, text)
+        chunks = len(chunking.chunk_text(text, 400, 10))
+
+        model, reads = self.run_service(s3_client, make_config(), uris)
+
+        # 2 criteria types x 6 questions per chunk
+        assert model.calls == chunks * 12
+        keys = self.manifest_keys(s3_client)
+        assert len(keys) == 1
+        # Each criteria file is read once per request, not per chunk
+        assert reads.count("administration.json") == 1
+
+        with patch.object(
+            chunking, "chunk_text", side_effect=AssertionError("re-chunked")
+        ):
+            model, reads = self.run_service(s3_client, make_config(), uris)
+
+        assert model.calls == chunks * 12
+        assert keys[0] in reads
+
+    def test_changed_text_gets_new_manifest(self, s3_client):
+        uris = self.write_file(s3_client, history())
+        self.run_service(s3_client, make_config(), uris)
+
+        self.write_file(s3_client, history(pages=6))
+        self.run_service(s3_client, make_config(), uris)
+
+        assert len(self.manifest_keys(s3_client)) == 2
+
+    def test_manifests_can_be_disabled(self, s3_client):
+        uris = self.write_file(s3_client, history())
+        model = SlowModel(latency=0)
+        service = CriteriaValidationService(
+            config={
+                "criteria_validation": {
+                    "max_chunk_size": 400,
+                    "chunk_manifest_prefix": "",
+                }
+            }
+        )
+        with (
+            patch.object(bedrock, "invoke_model", model),
+            patch.object(service, "_list_text_files", return_value=uris),
+        ):
+            service.validate_request("req1", make_config())
+
+        assert self.manifest_keys(s3_client) == []
+        assert model.calls == len(chunking.chunk_text(history(), 400, 10)) * 12
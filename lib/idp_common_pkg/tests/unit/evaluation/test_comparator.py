@@ -0,0 +1,161 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Unit tests for the evaluation comparator module.
+"""
+
+import random
+from unittest.mock import MagicMock, patch
+
+import pytest
+from idp_common.bedrock.embedding_cache import EmbeddingService
+from idp_common.evaluation import comparator
+from idp_common.evaluation.comparator import (
+    ExactComparator,
+    FuzzyComparator,
+    NumericComparator,
+    compare_hungarian,
+    compare_semantic,
+    cosine_similarity,
+    fuzz_score,
+    levenshtein_distance,
+    solve_assignment,
+)
+
+
+def reference_levenshtein(s1, s2):
+    """Full-matrix dynamic programming edit distance."""
+    d = [[0] * (len(s2) + 1) for _ in range(len(s1) + 1)]
+    for i in range(len(s1) + 1):
+        d[i][0] = i
+    for j in range(len(s2) + 1):
+        d[0][j] = j
+    for i in range(1, len(s1) + 1):
+        for j in range(1, len(s2) + 1):
+            cost = 0 if s1[i - 1] == s2[j - 1] else 1
+            d[i][j] = min(d[i - 1][j] + 1, d[i][j - 1] + 1, d[i - 1][j - 1] + cost)
+    return d[len(s1)][len(s2)]
+
+
+def reference_hungarian(expected, actual, comp, threshold):
+    """Pairwise compare() calls and brute-force optimal assignment."""
+    from itertools import permutations
+
+    matrix = [[comp.compare(e, a) for a in actual] for e in expected]
+    rows, cols = len(expected), len(actual)
+    if rows <= cols:
+        best = max(
+            permutations(range(cols), rows),
+            key=lambda p: sum(matrix[i][j] for i, j in enumerate(p)),
+        )
+        scores = [matrix[i][j] for i, j in enumerate(best)]
+    else:
+        best = max(
+            permutations(range(rows), cols),
+            key=lambda p: sum(matrix[i][j] for j, i in enumerate(p)),
+        )
+        scores = [matrix[i][j] for j, i in enumerate(best)]
+    tp = sum(1 for score in scores if score >= threshold)
+    return tp, cols - tp, sum(scores) / len(scores)
+
+
+def random_string(rng, max_length):
+    return "".join(
+        rng.choice("abcde fg,.$1230") for _ in range(rng.randint(0, max_length))
+    )
+
+
+@pytest.mark.unit
+class TestComparator:
+    """Tests for the comparator engine."""
+
+    def test_levenshtein_matches_dynamic_programming(self):
+        """Test the bit-parallel distance equals the full-matrix result."""
+        rng = random.Random(7)
+        for _ in range(2000):
+            s1 = random_string(rng, rng.choice([4, 30, 100]))
+            s2 = random_string(rng, rng.choice([4, 30, 100]))
+            assert levenshtein_distance(s1, s2) == reference_levenshtein(s1, s2)
+
+    def test_fuzz_score(self):
+        """Test fuzzy scores for known pairs."""
+        assert fuzz_score("Hello, World", "hello world") == 1.0
+        assert fuzz_score("", "abc") == 0.0
+        assert fuzz_score("kitten", "sitting") == 1.0 - 3 / 7
+
+    @pytest.mark.parametrize(
+        "comp",
+        [ExactComparator(), NumericComparator(), FuzzyComparator(0.7)],
+        ids=["exact", "numeric", "fuzzy"],
+    )
+    def test_compare_matrix_matches_pairwise_compare(self, comp):
+        """Test bulk matrices equal calling compare() for each pair."""
+        values1 = ["1", "$1.00", "(3)", "abc", "A.B.C", "nan", "", "1,000"]
+        values2 = ["1.0", "3", "abc", "xyz", "nan", "1000", " "]
+        expected = [[comp.compare(a, b) for b in values2] for a in values1]
+        assert [list(row) for row in comp.compare_matrix(values1, values2)] == expected
+
+        with patch.object(comparator, "NUMPY_AVAILABLE", False):
+            assert comp.compare_matrix(values1, values2) == expected
+
+    @pytest.mark.parametrize("scipy_available", [True, False])
+    def test_compare_hungarian_finds_optimal_assignment(self, scipy_available):
+        """Test Hungarian matching against a brute-force optimum."""
+        if scipy_available and not comparator.SCIPY_AVAILABLE:
+            pytest.skip("scipy is not installed")
+        rng = random.Random(11)
+        with patch.object(comparator, "SCIPY_AVAILABLE", scipy_available):
+            for _ in range(200):
+                expected = [random_string(rng, 8) for _ in range(rng.randint(2, 5))]
+                actual = [random_string(rng, 8) for _ in range(rng.randint(2, 5))]
+                comp = FuzzyComparator(0.5)
+                tp, fp, avg = compare_hungarian(expected, actual, comp, 0.5)
+                ref_tp, ref_fp, ref_avg = reference_hungarian(
+                    expected, actual, comp, 0.5
+                )
+                # Equally optimal assignments may pair items differently
+                assert avg == pytest.approx(ref_avg, abs=1e-12)
+                assert (tp, fp) == (ref_tp, ref_fp)
+
+    def test_compare_hungarian_exact_lists(self):
+        """Test list matching with exact comparison."""
+        expected = ["apple", "Banana", "cherry"]
+        actual = ["banana", "cherry!", "durian", "apple"]
+        assert compare_hungarian(expected, actual, ExactComparator()) == (3, 1, 1.0)
+
+    def test_solve_assignment_rectangular(self):
+        """Test the solvers return min(rows, columns) pairs sorted by row."""
+        matrix = [[0.1, 0.9, 0.0], [0.8, 0.2, 0.3]]
+        assert solve_assignment(matrix) == [(0, 1), (1, 0)]
+        with patch.object(comparator, "SCIPY_AVAILABLE", False):
+            assert solve_assignment(matrix) == [(0, 1), (1, 0)]
+
+    @pytest.mark.parametrize("numpy_available", [True, False])
+    def test_cosine_similarity(self, numpy_available):
+        """Test cosine similarity with and without NumPy."""
+        with patch.object(comparator, "NUMPY_AVAILABLE", numpy_available):
+            assert cosine_similarity([1.0, 0.0], [1.0, 0.0]) == pytest.approx(1.0)
+            assert cosine_similarity([1.0, 2.0], [-2.0, 1.0]) == pytest.approx(0.0)
+            assert cosine_similarity([3.0, 4.0], [4.0, 3.0]) == pytest.approx(0.96)
+            assert cosine_similarity([0.0, 0.0], [1.0, 1.0]) == 0.0
+            assert cosine_similarity([], [1.0]) == 0.0
+
+    def test_compare_semantic_reuses_embeddings(self):
+        """Test repeated semantic comparisons embed each distinct value once."""
+        client = MagicMock()
+        client.generate_embedding.side_effect = lambda text, model_id: (
+            [1.0, 0.0] if text.startswith("Acme") else [0.6, 0.8]
+        )
+        service = EmbeddingService(client=client)
+
+        for _ in range(3):
+            matched, score = compare_semantic(
+                "Acme Corp", "Acme Corp.", 0.9, embedding_service=service
+            )
+            assert matched and score == pytest.approx(1.0)
+        matched, score = compare_semantic(
+            "Acme Corp", "Globex", 0.9, embedding_service=service
+        )
+        assert not matched and score == pytest.approx(0.6)
+        assert client.generate_embedding.call_count == 3
@@ -588,6 +588,36 @@ class TestEvaluationService:
                 assert result.metrics["recall"] == 1.0
                 assert result.metrics["f1_score"] == 1.0
 
+    def test_prefetch_embeddings_batches_semantic_values(self, service):
+        """Test SEMANTIC values are embedded in one batch before comparison."""
+        tasks = [
+            {
+                "evaluation_method": EvaluationMethod.SEMANTIC,
+                "expected_value": "Acme Corp",
+                "actual_value": "ACME Corporation",
+            },
+            {
+                "evaluation_method": EvaluationMethod.SEMANTIC,
+                "expected_value": "Acme Corp",
+                "actual_value": "",
+            },
+            {
+                "evaluation_method": EvaluationMethod.LLM,
+                "expected_value": "$100.00",
+                "actual_value": "100",
+            },
+        ]
+        embedding_service = MagicMock()
+        with patch(
+            "idp_common.bedrock.get_embedding_service",
+            return_value=embedding_service,
+        ):
+            service._prefetch_embeddings(tasks)
+
+        embedding_service.embed_many.assert_called_once_with(
+            ["Acme Corp", "ACME Corporation"], prefetch=True
+        )
+
     @patch("idp_common.s3.get_json_content")
     @patch("idp_common.evaluation.service.EvaluationService._process_section")
     @patch("idp_common.s3.write_content")
@@ -0,0 +1,154 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Unit tests for the agentic extraction model and schema cache.
+"""
+
+from unittest.mock import patch
+
+import pytest
+from idp_common.bedrock import clear_prompt_template_cache
+from idp_common.extraction import schema_cache
+from idp_common.extraction.service import ExtractionService
+
+ATTRIBUTES = [
+    {"name": "account_number", "description": "Account identifier"},
+    {
+        "name": "address",
+        "description": "Holder address",
+        "attributeType": "group",
+        "groupAttributes": [
+            {"name": "street", "description": "Street"},
+            {"name": "city", "description": "City"},
+        ],
+    },
+    {
+        "name": "transactions",
+        "description": "Transactions",
+        "attributeType": "list",
+        "listItemTemplate": {
+            "itemDescription": "One transaction",
+            "itemAttributes": [
+                {"name": "date", "description": "Date"},
+                {"name": "amount", "description": "Amount"},
+            ],
+        },
+    },
+]
+
+
+def make_config(attributes=ATTRIBUTES, prewarm=False):
+    return {
+        "extraction": {
+            "model": "us.amazon.nova-pro-v1:0",
+            "agentic": {"enabled": True, "prewarm_schemas": prewarm},
+        },
+        "classes": [
+            {"name": "bank_statement", "attributes": attributes},
+            {"name": "invoice", "attributes": [{"name": "total"}]},
+        ],
+    }
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    schema_cache.clear_schema_cache()
+    clear_prompt_template_cache()
+    yield
+    schema_cache.clear_schema_cache()
+    clear_prompt_template_cache()
+
+
+@pytest.mark.unit
+class TestSchemaCache:
+    def test_model_is_reused_across_sections(self):
+        service = ExtractionService(config=make_config())
+
+        first = service._get_extraction_model("bank_statement", ATTRIBUTES)
+        second = service._get_extraction_model("bank_statement", ATTRIBUTES)
+
+        assert first is second
+        stats = schema_cache.get_schema_cache_stats()
+        assert stats["misses"] == 1
+        assert stats["hits"] == 1
+
+    def test_cached_model_matches_uncached_schema(self):
+        service = ExtractionService(config=make_config())
+
+        cached = service._get_extraction_model("bank_statement", ATTRIBUTES)
+        uncached = service._create_pydantic_model_from_attributes(
+            "bank_statement", ATTRIBUTES
+        )
+
+        assert (
+            schema_cache.get_model_json_schema(cached) == uncached.model_json_schema()
+        )
+
+    def test_equal_configuration_shares_model_across_invocations(self):
+        first = ExtractionService(config=make_config())._get_extraction_model(
+            "bank_statement", ATTRIBUTES
+        )
+        second = ExtractionService(config=make_config())._get_extraction_model(
+            "bank_statement", ATTRIBUTES
+        )
+
+        assert first is second
+
+    def test_changed_attributes_build_new_model(self):
+        changed = ATTRIBUTES + [{"name": "balance", "description": "Balance"}]
+
+        first = ExtractionService(config=make_config())._get_extraction_model(
+            "bank_statement", ATTRIBUTES
+        )
+        second = ExtractionService(
+            config=make_config(attributes=changed)
+        )._get_extraction_model("bank_statement", changed)
+
+        assert first is not second
+        assert "balance" in second.model_fields
+
+    def test_schema_is_generated_once(self):
+        model = ExtractionService(config=make_config())._get_extraction_model(
+            "bank_statement", ATTRIBUTES
+        )
+
+        first = schema_cache.get_model_json_schema(model)
+        second = schema_cache.get_model_json_schema(model)
+
+        assert first is second
+        assert schema_cache.get_schema_cache_stats()["schemas"] == 1
+
+    def test_uncached_model_schema_is_not_kept(self):
+        model = ExtractionService(
+            config=make_config()
+        )._create_pydantic_model_from_attributes("bank_statement", ATTRIBUTES)
+
+        assert schema_cache.get_model_json_schema(model) == model.model_json_schema()
+        assert schema_cache.get_schema_cache_stats()["schemas"] == 0
+
+    def test_lru_eviction_drops_schema(self):
+        service = ExtractionService(config=make_config())
+
+        with patch.object(schema_cache, "MAX_CACHED_MODELS", 1):
+            model = service._get_extraction_model("bank_statement", ATTRIBUTES)
+            schema_cache.get_model_json_schema(model)
+            service._get_extraction_model("invoice", [{"name": "total"}])
+
+        stats = schema_cache.get_schema_cache_stats()
+        assert stats["evictions"] == 1
+        assert stats["models"] == 1
+        assert stats["schemas"] == 0
+
+    @pytest.mark.parametrize("prewarm", [True, "true"])
+    def test_prewarm_builds_all_classes(self, prewarm):
+        ExtractionService(config=make_config(prewarm=prewarm))
+
+        stats = schema_cache.get_schema_cache_stats()
+        assert stats["models"] == 2
+        assert stats["schemas"] == 2
+
+    def test_no_prewarm_by_default(self):
+        ExtractionService(config=make_config())
+
+        assert schema_cache.get_schema_cache_stats()["models"] == 0
@@ -0,0 +1,240 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Unit tests for the buffered metrics emitter.
+"""
+
+import json
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+from idp_common import metrics
+from idp_common.metrics.buffered import MODE_EMF, MetricsBuffer
+
+
+@pytest.fixture
+def cloudwatch():
+    return MagicMock()
+
+
+@pytest.fixture
+def buffer(cloudwatch):
+    buf = MetricsBuffer(client_factory=lambda: cloudwatch, flush_interval=3600)
+    yield buf
+    buf.shutdown(1.0)
+
+
+@pytest.mark.unit
+class TestMetricsBuffer:
+    """Tests for MetricsBuffer aggregation and flushing."""
+
+    def test_aggregates_values_per_key(self, buffer, cloudwatch):
+        for _ in range(5):
+            buffer.put("InputTokens", 100, namespace="NS")
+        buffer.put("InputTokens", 200, namespace="NS")
+        buffer.put(
+            "InputTokens",
+            100,
+            namespace="NS",
+            dimensions=[{"Name": "Model", "Value": "m1"}],
+        )
+
+        assert buffer.flush() == 2
+        cloudwatch.put_metric_data.assert_called_once()
+        kwargs = cloudwatch.put_metric_data.call_args.kwargs
+        assert kwargs["Namespace"] == "NS"
+        datums = {
+            tuple(d["Value"] for d in datum["Dimensions"]): datum
+            for datum in kwargs["MetricData"]
+        }
+        assert datums[()]["Values"] == [100, 200]
+        assert datums[()]["Counts"] == [5.0, 1.0]
+        assert datums[("m1",)]["Counts"] == [1.0]
+
+    def test_flush_splits_into_api_batches(self, buffer, cloudwatch):
+        for i in range(2500):
+            buffer.put(f"Metric{i}", 1, namespace="NS")
+
+        assert buffer.flush() == 2500
+        batch_sizes = [
+            len(call.kwargs["MetricData"])
+            for call in cloudwatch.put_metric_data.call_args_list
+        ]
+        assert batch_sizes == [1000, 1000, 500]
+
+    def test_distinct_values_split_across_datums(self, buffer, cloudwatch):
+        for i in range(200):
+            buffer.put("Latency", float(i), "Milliseconds", namespace="NS")
+
+        buffer.flush()
+        datums = cloudwatch.put_metric_data.call_args.kwargs["MetricData"]
+        assert [len(d["Values"]) for d in datums] == [150, 50]
+
+    def test_flush_empty_buffer_is_noop(self, buffer, cloudwatch):
+        assert buffer.flush() == 0
+        cloudwatch.put_metric_data.assert_not_called()
+
+    def test_publish_errors_are_logged_not_raised(self, buffer, cloudwatch):
+        cloudwatch.put_metric_data.side_effect = Exception("boom")
+        buffer.put("Metric", 1)
+        assert buffer.flush() == 0
+        assert buffer.pending == 0
+
+    def test_emf_mode_writes_log_lines(self, cloudwatch):
+        lines = []
+        buf = MetricsBuffer(
+            client_factory=lambda: cloudwatch,
+            mode=MODE_EMF,
+            flush_interval=3600,
+            emf_writer=lines.append,
+        )
+        buf.put("Throttles", 1, dimensions=[{"Name": "Model", "Value": "m1"}])
+        buf.put("Throttles", 1, dimensions=[{"Name": "Model", "Value": "m1"}])
+        buf.put(
+            "Latency",
+            12.5,
+            "Milliseconds",
+            dimensions=[{"Name": "Model", "Value": "m1"}],
+        )
+        buf.shutdown(1.0)
+
+        cloudwatch.put_metric_data.assert_not_called()
+        assert len(lines) == 1
+        record = json.loads(lines[0])
+        directive = record["_aws"]["CloudWatchMetrics"][0]
+        assert directive["Dimensions"] == [["Model"]]
+        assert record["Model"] == "m1"
+        assert record["Throttles"] == [1, 1]
+        assert record["Latency"] == 12.5
+
+    def test_emf_mode_limits_values_per_metric(self, cloudwatch):
+        lines = []
+        buf = MetricsBuffer(
+            client_factory=lambda: cloudwatch,
+            mode=MODE_EMF,
+            flush_interval=3600,
+            emf_writer=lines.append,
+        )
+        for i in range(150):
+            buf.put("Latency", float(i % 3), "Milliseconds")
+        buf.put("Throttles", 1)
+        buf.flush()
+
+        records = [json.loads(line) for line in lines]
+        assert len(records) == 2
+        assert len(records[0]["Latency"]) == 100
+        assert len(records[1]["Latency"]) == 50
+        assert sorted(records[0]["Latency"] + records[1]["Latency"]) == sorted(
+            float(i % 3) for i in range(150)
+        )
+        # Metrics with fewer values only appear on the first line
+        assert records[0]["Throttles"] == 1
+        assert "Throttles" not in records[1]
+        assert [
+            m["Name"] for m in records[1]["_aws"]["CloudWatchMetrics"][0]["Metrics"]
+        ] == ["Latency"]
+
+    def test_invalid_mode_rejected(self, cloudwatch):
+        with pytest.raises(ValueError):
+            MetricsBuffer(client_factory=lambda: cloudwatch, mode="bogus")
+
+    def test_background_flush_when_buffer_full(self, cloudwatch):
+        flushed = threading.Event()
+        cloudwatch.put_metric_data.side_effect = lambda **kwargs: flushed.set()
+        buf = MetricsBuffer(
+            client_factory=lambda: cloudwatch,
+            flush_interval=3600,
+            max_buffered_datums=3,
+        )
+        try:
+            for i in range(3):
+                buf.put(f"Metric{i}", 1)
+            assert flushed.wait(5)
+        finally:
+            buf.shutdown(1.0)
+
+    def test_concurrent_puts_are_not_lost(self, buffer, cloudwatch):
+        def worker():
+            for _ in range(1000):
+                buffer.put("Requests", 1, namespace="NS")
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        buffer.flush()
+        total = sum(
+            sum(datum["Counts"])
+            for call in cloudwatch.put_metric_data.call_args_list
+            for datum in call.kwargs["MetricData"]
+        )
+        assert total == 8000
+
+
+@pytest.mark.unit
+class TestModuleLevelBuffering:
+    """Tests for buffered routing of put_metric and create_client_performance_metrics."""
+
+    @pytest.fixture(autouse=True)
+    def cloudwatch_client(self, cloudwatch):
+        with patch.object(metrics, "get_cloudwatch_client", return_value=cloudwatch):
+            yield cloudwatch
+        metrics.configure_buffering(False)
+        metrics._buffer_configured = False
+
+    def test_put_metric_is_buffered_when_enabled(self, cloudwatch_client):
+        metrics.configure_buffering(True, flush_interval=3600)
+        metrics.put_metric("InputDocuments", 1)
+        cloudwatch_client.put_metric_data.assert_not_called()
+
+        assert metrics.flush_metrics() == 1
+        cloudwatch_client.put_metric_data.assert_called_once()
+
+    def test_put_metric_is_synchronous_when_disabled(self, cloudwatch_client):
+        metrics.configure_buffering(False)
+        metrics.put_metric("InputDocuments", 1)
+        cloudwatch_client.put_metric_data.assert_called_once()
+        assert metrics.flush_metrics() == 0
+
+    def test_env_var_enables_buffering(self, cloudwatch_client, monkeypatch):
+        monkeypatch.setenv("METRICS_BUFFER_ENABLED", "true")
+        monkeypatch.setenv("METRICS_FLUSH_INTERVAL_SECONDS", "3600")
+        metrics._buffer_configured = False
+        assert metrics.get_metrics_buffer() is not None
+
+    def test_client_performance_metrics_buffered(self, cloudwatch_client):
+        metrics.configure_buffering(True, flush_interval=3600)
+        metrics.create_client_performance_metrics(
+            "S3Get", 25.0, is_success=False, error_type="NoSuchKey"
+        )
+        metrics.flush_metrics()
+
+        names = {
+            datum["MetricName"]
+            for datum in cloudwatch_client.put_metric_data.call_args.kwargs[
+                "MetricData"
+            ]
+        }
+        assert names == {"S3GetLatency", "S3GetFailure", "S3GetError.NoSuchKey"}
+
+    def test_handler_decorator_flushes_on_return_and_error(self, cloudwatch_client):
+        metrics.configure_buffering(True, flush_interval=3600)
+
+        @metrics.flush_metrics_after_invocation
+        def handler(event, context):
+            metrics.put_metric("InputDocuments", 1)
+            if event.get("fail"):
+                raise ValueError("failed")
+            return {"ok": True}
+
+        assert handler({}, None) == {"ok": True}
+        assert cloudwatch_client.put_metric_data.call_count == 1
+
+        with pytest.raises(ValueError):
+            handler({"fail": True}, None)
+        assert cloudwatch_client.put_metric_data.call_count == 2
+        assert metrics.get_metrics_buffer().pending == 0
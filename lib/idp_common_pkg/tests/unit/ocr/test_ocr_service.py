@@ -12,6 +12,7 @@ import pytest
 
 # Import standard library modules first
 import sys
+import time
 from io import BytesIO
 from unittest.mock import ANY, MagicMock, patch
 
@@ -892,3 +893,733 @@ class TestOcrService:
 
                 mock_none.assert_called_once_with(0, ANY, "bucket", "prefix")
                 assert result == ("result", "metering")
+
+    def test_max_pages_in_flight_config(self):
+        """Test max_pages_in_flight defaults to twice max_workers and honors config."""
+        with patch("boto3.client"):
+            service = OcrService(config={"ocr": {"max_workers": 4}})
+            assert service.max_pages_in_flight == 8
+
+            service = OcrService(config={"ocr": {"max_pages_in_flight": "3"}})
+            assert service.max_pages_in_flight == 3
+
+            service = OcrService(config={"ocr": {"max_pages_in_flight": "bad"}})
+            assert service.max_pages_in_flight == 40
+
+    def test_run_bounded_limits_in_flight_pages(self):
+        """Test the bounded pipeline never has more than the window pending."""
+        import concurrent.futures
+        import threading
+
+        lock = threading.Lock()
+        state = {"active": 0, "peak": 0}
+
+        def work(i):
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            try:
+                return i * 2
+            finally:
+                with lock:
+                    state["active"] -= 1
+
+        submitted = []
+
+        def items():
+            for i in range(50):
+                submitted.append(i)
+                yield i
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+            results = {}
+            for item, future in OcrService._run_bounded(executor, work, items(), 3):
+                # Items are pulled lazily: besides the item being yielded, never
+                # more than the window is outstanding
+                assert len(submitted) - len(results) - 1 <= 3
+                results[item] = future.result()
+
+        assert results == {i: i * 2 for i in range(50)}
+        assert state["peak"] <= 3
+
+    def test_download_to_temp_file_streams_in_chunks(self, mock_pdf_content):
+        """Test the source document is spooled to disk and the header captured."""
+        import os
+
+        with patch("boto3.client") as mock_boto_client:
+            mock_s3_client = MagicMock()
+            mock_s3_client.get_object.return_value = {"Body": BytesIO(mock_pdf_content)}
+            mock_boto_client.return_value = mock_s3_client
+            service = OcrService()
+
+            with patch("idp_common.ocr.service.S3_DOWNLOAD_CHUNK_SIZE", 16):
+                path, header = service._download_to_temp_file("bucket", "doc.pdf")
+
+        try:
+            assert path.endswith(".pdf")
+            assert header.startswith(b"%PDF")
+            with open(path, "rb") as f:
+                assert f.read() == mock_pdf_content
+        finally:
+            os.remove(path)
+
+    @patch("boto3.client")
+    @patch("fitz.open")
+    def test_process_document_opens_pdf_from_spooled_file(
+        self, mock_fitz_open, mock_boto_client, mock_document, mock_pdf_content
+    ):
+        """Test PDFs are opened from the spooled file, which is removed afterwards."""
+        import os
+
+        mock_s3_client = MagicMock()
+        mock_s3_client.get_object.return_value = {"Body": BytesIO(mock_pdf_content)}
+        mock_boto_client.return_value = mock_s3_client
+
+        mock_pdf_doc = MagicMock()
+        mock_pdf_doc.__len__.return_value = 5
+        mock_pdf_doc.is_pdf = True
+        mock_fitz_open.return_value = mock_pdf_doc
+
+        with patch(
+            "idp_common.ocr.service.OcrService._process_single_page"
+        ) as mock_process:
+            mock_process.return_value = (
+                {
+                    "raw_text_uri": "s3://output/raw.json",
+                    "parsed_text_uri": "s3://output/parsed.json",
+                    "text_confidence_uri": "s3://output/confidence.json",
+                    "image_uri": "s3://output/image.jpg",
+                },
+                {},
+            )
+            service = OcrService(config={"ocr": {"max_pages_in_flight": 2}})
+            result = service.process_document(mock_document)
+
+        spooled_path = mock_fitz_open.call_args.args[0]
+        assert mock_fitz_open.call_args.kwargs == {"filetype": "pdf"}
+        assert not os.path.exists(spooled_path)
+        assert list(result.pages.keys()) == ["1", "2", "3", "4", "5"]
+        assert mock_process.call_count == 5
+
+    def _async_job_responses(self, num_pages, lines_per_page=2, page_size=3):
+        """Build paginated GetDocumentTextDetection responses for a finished job."""
+        blocks = []
+        for page in range(1, num_pages + 1):
+            blocks.append({"BlockType": "PAGE", "Id": f"p{page}", "Page": page})
+            for line in range(lines_per_page):
+                blocks.append(
+                    {
+                        "BlockType": "LINE",
+                        "Id": f"p{page}-l{line}",
+                        "Text": f"Page {page} line {line}",
+                        "Confidence": 99.0,
+                        "Page": page,
+                    }
+                )
+        chunks = [blocks[i : i + page_size] for i in range(0, len(blocks), page_size)]
+        responses = []
+        for index, chunk in enumerate(chunks):
+            response = {
+                "JobStatus": "SUCCEEDED",
+                "DocumentMetadata": {"Pages": num_pages},
+                "DetectDocumentTextModelVersion": "1.0",
+                "Blocks": chunk,
+            }
+            if index < len(chunks) - 1:
+                response["NextToken"] = f"token-{index + 1}"
+            responses.append(response)
+        return responses
+
+    def test_textract_async_config(self):
+        """Test asynchronous Textract settings are parsed with defaults."""
+        with patch("boto3.client"):
+            service = OcrService(config={"ocr": {}})
+            assert service.textract_async_config["page_threshold"] == 0
+            assert not service._use_textract_async("pdf", 500)
+
+            service = OcrService(
+                config={
+                    "ocr": {
+                        "textract_async": {
+                            "page_threshold": "50",
+                            "poll_interval_seconds": 2,
+                            "max_wait_seconds": "invalid",
+                        }
+                    }
+                }
+            )
+            assert service.textract_async_config == {
+                "page_threshold": 50,
+                "poll_interval_seconds": 2.0,
+                "max_wait_seconds": 600.0,
+                "fallback_reserve_seconds": 300.0,
+            }
+            assert service._use_textract_async("pdf", 50)
+            assert not service._use_textract_async("pdf", 49)
+            assert not service._use_textract_async("png", 50)
+
+    def test_get_textract_job_pages_polls_and_paginates(self):
+        """Test job results are polled, paginated and split into per-page responses."""
+        with patch("boto3.client") as mock_boto_client:
+            mock_textract_client = MagicMock()
+            mock_boto_client.return_value = mock_textract_client
+            service = OcrService(
+                config={"ocr": {"textract_async": {"page_threshold": 2}}}
+            )
+
+        mock_textract_client.get_document_text_detection.side_effect = [
+            {"JobStatus": "IN_PROGRESS"},
+            *self._async_job_responses(3),
+        ]
+        with patch("idp_common.ocr.service.time.sleep") as mock_sleep:
+            pages = service._get_textract_job_pages("job-1")
+
+        mock_sleep.assert_called_once()
+        calls = mock_textract_client.get_document_text_detection.call_args_list
+        assert calls[0].kwargs == {"JobId": "job-1", "MaxResults": 1000}
+        assert calls[2].kwargs["NextToken"] == "token-1"
+        assert list(pages.keys()) == [1, 2, 3]
+        for page_id, response in pages.items():
+            assert response["DocumentMetadata"] == {"Pages": 1}
+            assert response["DetectDocumentTextModelVersion"] == "1.0"
+            assert [b["Id"] for b in response["Blocks"]] == [
+                f"p{page_id}",
+                f"p{page_id}-l0",
+                f"p{page_id}-l1",
+            ]
+            # Blocks are renumbered like single-page synchronous responses
+            assert {b["Page"] for b in response["Blocks"]} == {1}
+
+    def test_textract_async_wait_respects_caller_deadline(self):
+        """Test the job wait is capped at the caller's deadline minus the reserve."""
+        with patch("boto3.client") as mock_boto_client:
+            mock_textract_client = MagicMock()
+            mock_boto_client.return_value = mock_textract_client
+            service = OcrService(
+                config={
+                    "ocr": {
+                        "textract_async": {
+                            "page_threshold": 2,
+                            "poll_interval_seconds": 1,
+                            "fallback_reserve_seconds": 100,
+                        }
+                    }
+                }
+            )
+
+        with patch("idp_common.ocr.service.time.time", return_value=1000.0):
+            # A 900 second Lambda with 880 seconds left waits at most 780 seconds,
+            # and max_wait_seconds (600) applies when it is shorter
+            assert service._textract_async_wait_deadline(1880.0) == 1600.0
+            assert service._textract_async_wait_deadline(1500.0) == 1400.0
+            assert service._textract_async_wait_deadline(None) == 1600.0
+
+        mock_textract_client.get_document_text_detection.return_value = {
+            "JobStatus": "IN_PROGRESS"
+        }
+        clock = iter(range(1000, 2000))
+        with (
+            patch(
+                "idp_common.ocr.service.time.time",
+                side_effect=lambda: float(next(clock)),
+            ),
+            patch("idp_common.ocr.service.time.sleep"),
+            pytest.raises(TimeoutError),
+        ):
+            service._get_textract_job_pages("job-1", deadline=1010.0)
+
+        assert mock_textract_client.get_document_text_detection.call_count <= 10
+
+    @patch("boto3.client")
+    @patch("fitz.open")
+    def test_process_document_textract_async_skipped_near_deadline(
+        self, mock_fitz_open, mock_boto_client, mock_document, mock_pdf_content
+    ):
+        """Test no job is started when the deadline leaves no time to wait for it."""
+        mock_client = MagicMock()
+        mock_client.get_object.return_value = {"Body": BytesIO(mock_pdf_content)}
+        mock_boto_client.return_value = mock_client
+
+        mock_pdf_doc = MagicMock()
+        mock_pdf_doc.__len__.return_value = 3
+        mock_pdf_doc.is_pdf = True
+        mock_fitz_open.return_value = mock_pdf_doc
+
+        service = OcrService(config={"ocr": {"textract_async": {"page_threshold": 3}}})
+        with patch.object(service, "_process_single_page") as mock_process:
+            mock_process.return_value = (
+                {
+                    "raw_text_uri": "s3://output/raw.json",
+                    "parsed_text_uri": "s3://output/parsed.json",
+                    "text_confidence_uri": "s3://output/confidence.json",
+                    "image_uri": "s3://output/image.jpg",
+                },
+                {"OCR/textract/detect_document_text": {"pages": 1}},
+            )
+            result = service.process_document(mock_document, deadline=time.time() + 200)
+
+        mock_client.start_document_text_detection.assert_not_called()
+        assert mock_process.call_count == 3
+        assert list(result.pages.keys()) == ["1", "2", "3"]
+
+    def test_get_textract_job_pages_failed_job(self):
+        """Test a failed job raises so the caller can fall back."""
+        with patch("boto3.client") as mock_boto_client:
+            mock_textract_client = MagicMock()
+            mock_boto_client.return_value = mock_textract_client
+            service = OcrService(config={"ocr": {}})
+
+        mock_textract_client.get_document_text_detection.return_value = {
+            "JobStatus": "FAILED",
+            "StatusMessage": "Unsupported document",
+        }
+        with pytest.raises(RuntimeError, match="Unsupported document"):
+            service._get_textract_job_pages("job-1")
+
+    @patch("boto3.client")
+    @patch("fitz.open")
+    @patch("idp_common.s3.write_content")
+    def test_process_document_textract_async(
+        self,
+        mock_write_content,
+        mock_fitz_open,
+        mock_boto_client,
+        mock_document,
+        mock_pdf_content,
+    ):
+        """Test large PDFs are OCRed with one asynchronous job and split per page."""
+        mock_client = MagicMock()
+        mock_client.get_object.return_value = {"Body": BytesIO(mock_pdf_content)}
+        mock_client.start_document_text_detection.return_value = {"JobId": "job-1"}
+        mock_client.get_document_text_detection.side_effect = self._async_job_responses(
+            4
+        )
+        mock_boto_client.return_value = mock_client
+
+        mock_pdf_doc = MagicMock()
+        mock_pdf_doc.__len__.return_value = 4
+        mock_pdf_doc.is_pdf = True
+        mock_fitz_open.return_value = mock_pdf_doc
+
+        service = OcrService(config={"ocr": {"textract_async": {"page_threshold": 3}}})
+        with patch.object(service, "_extract_page_image", return_value=b"jpeg"):
+            result = service.process_document(mock_document)
+
+        mock_client.start_document_text_detection.assert_called_once_with(
+            DocumentLocation={
+                "S3Object": {
+                    "Bucket": mock_document.input_bucket,
+                    "Name": mock_document.input_key,
+                }
+            }
+        )
+        mock_client.detect_document_text.assert_not_called()
+        assert result.status != Status.FAILED
+        assert list(result.pages.keys()) == ["1", "2", "3", "4"]
+        page = result.pages["3"]
+        prefix = f"s3://{mock_document.output_bucket}/{mock_document.input_key}"
+        assert page.image_uri == f"{prefix}/pages/3/image.jpg"
+        assert page.raw_text_uri == f"{prefix}/pages/3/rawText.json"
+        assert page.parsed_text_uri == f"{prefix}/pages/3/result.json"
+        assert page.text_confidence_uri == f"{prefix}/pages/3/textConfidence.json"
+        assert result.metering == {"OCR/textract/detect_document_text": {"pages": 4}}
+        # One image plus three result files per page
+        assert mock_write_content.call_count == 16
+
+    @patch("boto3.client")
+    @patch("fitz.open")
+    def test_process_document_textract_async_falls_back(
+        self, mock_fitz_open, mock_boto_client, mock_document, mock_pdf_content
+    ):
+        """Test per-page OCR is used when the asynchronous job cannot complete."""
+        mock_client = MagicMock()
+        mock_client.get_object.return_value = {"Body": BytesIO(mock_pdf_content)}
+        mock_client.start_document_text_detection.return_value = {"JobId": "job-1"}
+        mock_client.get_document_text_detection.return_value = {
+            "JobStatus": "FAILED",
+            "StatusMessage": "Internal error",
+        }
+        mock_boto_client.return_value = mock_client
+
+        mock_pdf_doc = MagicMock()
+        mock_pdf_doc.__len__.return_value = 3
+        mock_pdf_doc.is_pdf = True
+        mock_fitz_open.return_value = mock_pdf_doc
+
+        service = OcrService(config={"ocr": {"textract_async": {"page_threshold": 3}}})
+        with (
+            patch.object(
+                service, "_upload_page_image", return_value="s3://output/image.jpg"
+            ),
+            patch.object(service, "_process_single_page") as mock_process,
+        ):
+            mock_process.return_value = (
+                {
+                    "raw_text_uri": "s3://output/raw.json",
+                    "parsed_text_uri": "s3://output/parsed.json",
+                    "text_confidence_uri": "s3://output/confidence.json",
+                    "image_uri": "s3://output/image.jpg",
+                },
+                {"OCR/textract/detect_document_text": {"pages": 1}},
+            )
+            result = service.process_document(mock_document)
+
+        assert mock_process.call_count == 3
+        assert list(result.pages.keys()) == ["1", "2", "3"]
+        assert result.metering == {"OCR/textract/detect_document_text": {"pages": 3}}
+        assert result.errors == []
+
+    def test_rasterizer_config(self):
+        """Test the rasterization backend is read from the image configuration."""
+        from idp_common.ocr.rasterizer import ProcessPoolRasterizer
+
+        with patch("boto3.client"):
+            service = OcrService(config={"ocr": {}})
+            assert service.rasterizer_backend == "thread"
+            assert service.rasterizer is None
+
+            service = OcrService(
+                config={
+                    "ocr": {
+                        "image": {
+                            "dpi": 200,
+                            "rasterizer": "process",
+                            "rasterizer_workers": "3",
+                        }
+                    }
+                }
+            )
+            assert isinstance(service.rasterizer, ProcessPoolRasterizer)
+            assert service.rasterizer.max_workers == 3
+            assert service.rasterizer.dpi == 200
+
+            service = OcrService(config={"ocr": {"image": {"rasterizer": "gpu"}}})
+            assert service.rasterizer_backend == "thread"
+
+    def test_render_page_uses_process_rasterizer_for_pdf_files(self):
+        """Test PDFs opened from disk are rendered by the process pool."""
+        with patch("boto3.client"):
+            service = OcrService(config={"ocr": {"image": {"rasterizer": "process"}}})
+        service.rasterizer = MagicMock()
+        service.rasterizer.render.return_value = b"jpeg"
+
+        pdf_document = MagicMock()
+        pdf_document.is_pdf = True
+        pdf_document.name = "/tmp/ocr-doc.pdf"
+        assert service._render_page(pdf_document, 4) == b"jpeg"
+        service.rasterizer.render.assert_called_once_with("/tmp/ocr-doc.pdf", 4)
+        pdf_document.load_page.assert_not_called()
+
+        # Image files are still rendered in the calling thread
+        image_document = MagicMock()
+        image_document.is_pdf = False
+        with patch.object(
+            service, "_extract_page_image", return_value=b"image"
+        ) as mock_extract:
+            assert service._render_page(image_document, 0) == b"image"
+        mock_extract.assert_called_once_with(
+            image_document.load_page.return_value, False, 1
+        )
+
+    def test_render_page_uses_rasterized_document_and_close_stops_pool(self):
+        """Test pages of the open document are rendered in ranges and close() stops the pool."""
+        with patch("boto3.client"):
+            service = OcrService(config={"ocr": {"image": {"rasterizer": "process"}}})
+        service.rasterizer = MagicMock()
+        service._rasterized_document = MagicMock()
+        service._rasterized_document.path = "/tmp/ocr-doc.pdf"
+        service._rasterized_document.render.return_value = b"ranged"
+
+        pdf_document = MagicMock()
+        pdf_document.is_pdf = True
+        pdf_document.name = "/tmp/ocr-doc.pdf"
+        assert service._render_page(pdf_document, 4) == b"ranged"
+        service._rasterized_document.render.assert_called_once_with(4)
+        service.rasterizer.render.assert_not_called()
+
+        service.close()
+        service.rasterizer.shutdown.assert_called_once()
+
+        with patch("boto3.client"):
+            OcrService(config={"ocr": {}}).close()
+
+    def test_render_page_falls_back_when_process_pool_unavailable(self):
+        """Test pages are rendered in-thread when the process pool cannot be used."""
+        from idp_common.ocr.rasterizer import RasterizerUnavailableError
+
+        with patch("boto3.client"):
+            service = OcrService(config={"ocr": {"image": {"rasterizer": "process"}}})
+        service.rasterizer = MagicMock()
+        service.rasterizer.available = True
+        service.rasterizer.render.side_effect = RasterizerUnavailableError("no shm")
+
+        pdf_document = MagicMock()
+        pdf_document.is_pdf = True
+        pdf_document.name = "/tmp/ocr-doc.pdf"
+        with patch.object(
+            service, "_extract_page_image", return_value=b"thread"
+        ) as mock_extract:
+            assert service._render_page(pdf_document, 2) == b"thread"
+            mock_extract.assert_called_once_with(
+                pdf_document.load_page.return_value, True, 3
+            )
+
+            # Once the pool is marked unavailable it is not tried again
+            service.rasterizer.available = False
+            assert service._render_page(pdf_document, 3) == b"thread"
+        service.rasterizer.render.assert_called_once()
+
+    def test_process_pool_rasterizer_unavailable_without_shared_memory(self):
+        """Test a pool that cannot start (no /dev/shm on Lambda) disables itself."""
+        from idp_common.ocr.rasterizer import (
+            ProcessPoolRasterizer,
+            RasterizerUnavailableError,
+        )
+
+        rasterizer = ProcessPoolRasterizer(max_workers=2)
+        with patch(
+            "concurrent.futures.ProcessPoolExecutor",
+            side_effect=OSError(38, "Function not implemented"),
+        ) as mock_pool:
+            with pytest.raises(RasterizerUnavailableError):
+                rasterizer.render("/tmp/doc.pdf", 0)
+            assert rasterizer.available is False
+            with pytest.raises(RasterizerUnavailableError):
+                rasterizer.render("/tmp/doc.pdf", 1)
+        assert mock_pool.call_count == 1
+
+    def test_process_pool_rasterizer_broken_pool(self):
+        """Test a worker crash disables the pool instead of failing every page."""
+        from concurrent.futures.process import BrokenProcessPool
+
+        from idp_common.ocr.rasterizer import (
+            ProcessPoolRasterizer,
+            RasterizerUnavailableError,
+        )
+
+        rasterizer = ProcessPoolRasterizer(max_workers=2)
+        executor = MagicMock()
+        executor.submit.return_value.result.side_effect = BrokenProcessPool("died")
+        rasterizer._executor = executor
+        with pytest.raises(RasterizerUnavailableError):
+            rasterizer.render("/tmp/doc.pdf", 0)
+        assert rasterizer.available is False
+        assert rasterizer._executor is None
+        executor.shutdown.assert_called_once_with(wait=False, cancel_futures=True)
+
+        # Errors raised while rendering a page are not treated as pool failures
+        rasterizer = ProcessPoolRasterizer(max_workers=2)
+        rasterizer._executor = MagicMock()
+        rasterizer._executor.submit.return_value.result.side_effect = ValueError(
+            "bad page"
+        )
+        with pytest.raises(ValueError):
+            rasterizer.render("/tmp/doc.pdf", 0)
+        assert rasterizer.available is True
+
+    def test_render_range_in_worker_opens_document_once(self):
+        """Test a worker job opens the PDF once for its range and closes it."""
+        from idp_common.ocr import rasterizer
+
+        error = ValueError("bad page")
+        with (
+            patch.object(rasterizer.fitz, "open") as mock_open,
+            patch.object(
+                rasterizer,
+                "render_page_image",
+                side_effect=[b"p2", error, b"p4"],
+            ) as mock_render,
+        ):
+            mock_open.return_value.__len__.return_value = 5
+            images = rasterizer._render_range_in_worker("/tmp/doc.pdf", 2, 8, 150, None)
+        # The range is clipped to the document and a failed page does not fail the rest
+        assert images == [b"p2", error, b"p4"]
+        assert [c.args[2] for c in mock_render.call_args_list] == [3, 4, 5]
+        mock_open.assert_called_once_with("/tmp/doc.pdf", filetype="pdf")
+        mock_open.return_value.close.assert_called_once()
+
+    def test_rasterized_document_renders_contiguous_ranges(self):
+        """Test pages are rendered in contiguous ranges with one range per worker ahead."""
+        from concurrent.futures import Future
+
+        from idp_common.ocr.rasterizer import ProcessPoolRasterizer
+
+        rasterizer = ProcessPoolRasterizer(max_workers=2)
+        submitted = []
+
+        def submit(path, start, stop):
+            submitted.append((start, stop))
+            future = Future()
+            future.set_result(
+                [
+                    ValueError("bad") if i == 5 else b"page%d" % i
+                    for i in range(start, stop)
+                ]
+            )
+            return future
+
+        with patch.object(rasterizer, "submit", side_effect=submit):
+            document = rasterizer.open_document("/tmp/doc.pdf", 10, pages_per_job=3)
+            assert document.render(0) == b"page0"
+            assert submitted == [(0, 3), (3, 6)]
+            assert [document.render(i) for i in (1, 2, 3)] == [
+                b"page1",
+                b"page2",
+                b"page3",
+            ]
+            # Rendered pages are released once every page of their range was taken
+            assert sorted(document._jobs) == [3, 6]
+            assert submitted == [(0, 3), (3, 6), (6, 9)]
+            with pytest.raises(ValueError):
+                document.render(5)
+            assert document.render(9) == b"page9"
+            assert submitted == [(0, 3), (3, 6), (6, 9), (9, 10)]
+            document.close()
+            assert document._jobs == {}
+
+        # By default the pages are split evenly across the workers, up to 8 per job
+        assert rasterizer.open_document("/tmp/doc.pdf", 10).pages_per_job == 5
+        assert rasterizer.open_document("/tmp/doc.pdf", 100).pages_per_job == 8
+
+    def test_process_pool_rasterizer_renders_pages(self, tmp_path):
+        """Test worker processes render real PDF pages to JPEG."""
+        from idp_common.ocr.rasterizer import ProcessPoolRasterizer
+
+        # Minimal two-page PDF; the worker processes import the real PyMuPDF
+        objects = [
+            b"<< /Type /Catalog /Pages 2 0 R >>",
+            b"<< /Type /Pages /Kids [3 0 R 4 0 R] /Count 2 >>",
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 200 300] >>",
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 300 200] >>",
+        ]
+        content = b"%PDF-1.4\n"
+        offsets = []
+        for number, body in enumerate(objects, start=1):
+            offsets.append(len(content))
+            content += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+        xref = len(content)
+        content += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+        content += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+        content += b"trailer\n<< /Size %d /Root 1 0 R >>\n" % (len(objects) + 1)
+        content += b"startxref\n%d\n%%%%EOF\n" % xref
+        pdf_path = tmp_path / "doc.pdf"
+        pdf_path.write_bytes(content)
+
+        rasterizer = ProcessPoolRasterizer(max_workers=2, dpi=72)
+        try:
+            images = [rasterizer.render(str(pdf_path), i) for i in range(2)]
+            document = rasterizer.open_document(str(pdf_path), 2, pages_per_job=2)
+            assert [document.render(i) for i in range(2)] == images
+            document.close()
+        finally:
+            rasterizer.shutdown()
+        assert rasterizer._executor is None
+
+        for image_bytes in images:
+            assert image_bytes.startswith(b"\xff\xd8")
+
+    def test_page_bundle_config(self):
+        """Test page bundle settings are parsed with defaults."""
+        with patch("boto3.client"):
+            service = OcrService(config={"ocr": {}})
+            assert service.page_bundle_config["enabled"] is False
+
+            service = OcrService(
+                config={
+                    "ocr": {"page_bundle": {"enabled": "true", "pack_size_mb": "8"}}
+                }
+            )
+            assert service.page_bundle_config == {
+                "enabled": True,
+                "pack_size_bytes": 8 * 1024 * 1024,
+                "include_images": False,
+            }
+
+            service = OcrService(
+                config={
+                    "ocr": {"page_bundle": {"enabled": True, "include_images": "true"}}
+                }
+            )
+            assert service.page_bundle_config["include_images"] is True
+
+            service = OcrService(
+                config={"ocr": {"page_bundle": {"enabled": True, "pack_size_mb": "x"}}}
+            )
+            assert service.page_bundle_config["pack_size_bytes"] == 32 * 1024 * 1024
+
+    @patch("idp_common.s3.write_content")
+    @patch("boto3.client")
+    @patch("fitz.open")
+    def test_process_document_page_bundle(
+        self,
+        mock_fitz_open,
+        mock_boto_client,
+        mock_write_content,
+        mock_document,
+        mock_pdf_content,
+    ):
+        """Test bundle mode writes packs and an index and points pages at byte ranges."""
+        mock_s3_client = MagicMock()
+        mock_s3_client.get_object.return_value = {"Body": BytesIO(mock_pdf_content)}
+        mock_boto_client.return_value = mock_s3_client
+
+        mock_pdf_doc = MagicMock()
+        mock_pdf_doc.__len__.return_value = 3
+        mock_pdf_doc.is_pdf = True
+        mock_fitz_open.return_value = mock_pdf_doc
+
+        service = OcrService(
+            config={"ocr": {"backend": "none", "page_bundle": {"enabled": True}}}
+        )
+        with patch.object(service, "_render_page", return_value=b"image"):
+            result = service.process_document(mock_document)
+
+        assert result.status != Status.FAILED
+        # Page images stay per-page objects for the web UI; the text artifacts
+        # of all pages go into one pack and the index
+        written_keys = [c.args[2] for c in mock_write_content.call_args_list]
+        assert sorted(written_keys) == [
+            "test-document.pdf/pages/1/image.jpg",
+            "test-document.pdf/pages/2/image.jpg",
+            "test-document.pdf/pages/3/image.jpg",
+            "test-document.pdf/pages/bundle/index.json",
+            "test-document.pdf/pages/bundle/pack-00000.bin",
+        ]
+        for page in result.pages.values():
+            assert page.image_uri == (
+                f"s3://output-bucket/test-document.pdf/pages/{page.page_id}/image.jpg"
+            )
+            for uri in (
+                page.raw_text_uri,
+                page.parsed_text_uri,
+                page.text_confidence_uri,
+            ):
+                assert uri.startswith(
+                    "s3://output-bucket/test-document.pdf/pages/bundle/pack-00000.bin#range="
+                )
+        assert service._page_bundle is None
+
+        # With include_images the images are packed too
+        mock_write_content.reset_mock()
+        mock_s3_client.get_object.return_value = {"Body": BytesIO(mock_pdf_content)}
+        service = OcrService(
+            config={
+                "ocr": {
+                    "backend": "none",
+                    "page_bundle": {"enabled": True, "include_images": True},
+                }
+            }
+        )
+        with patch.object(service, "_render_page", return_value=b"image"):
+            result = service.process_document(mock_document)
+
+        written_keys = [c.args[2] for c in mock_write_content.call_args_list]
+        assert written_keys == [
+            "test-document.pdf/pages/bundle/pack-00000.bin",
+            "test-document.pdf/pages/bundle/index.json",
+        ]
+        pack = mock_write_content.call_args_list[0].args[0]
+        for page in result.pages.values():
+            start, end = page.image_uri.split("#range=")[1].split("&")[0].split("-")
+            assert pack[int(start) : int(end) + 1] == b"image"
+        assert service._page_bundle is None
@@ -0,0 +1,138 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Unit tests for packed page artifacts and byte range reads.
+"""
+
+import json
+from unittest.mock import patch
+
+import boto3
+import pytest
+from idp_common import s3
+from idp_common.ocr.page_bundle import PageBundleWriter
+from moto import mock_aws
+
+BUCKET = "output-bucket"
+PREFIX = "doc#1.pdf"
+
+RAW = {"DocumentMetadata": {"Pages": 1}, "Blocks": []}
+PARSED = {"text": "Page text"}
+
+
+@pytest.fixture
+def s3_client():
+    with mock_aws():
+        client = boto3.client("s3", region_name="us-east-1")
+        client.create_bucket(Bucket=BUCKET)
+        with patch.object(s3, "_s3_client", client):
+            yield client
+
+
+def write_pages(writer, pages):
+    uris = {}
+    for page_id in range(1, pages + 1):
+        key = f"{PREFIX}/pages/{page_id}"
+        uris[page_id] = {
+            "image": writer.add(
+                b"\xff\xd8image" * page_id, f"{key}/image.jpg", "image/jpeg"
+            ),
+            "raw": writer.add(RAW, f"{key}/rawText.json", "application/json"),
+            "parsed": writer.add(
+                {"text": f"Page {page_id}"}, f"{key}/result.json", "application/json"
+            ),
+        }
+    return uris
+
+
+@pytest.mark.unit
+class TestRangeUris:
+    def test_round_trip(self):
+        uri = s3.build_range_uri(BUCKET, "a/pack.bin", 10, 5, "1/result.json")
+
+        assert uri == f"s3://{BUCKET}/a/pack.bin#range=10-14&name=1/result.json"
+        assert s3.parse_range_uri(uri) == (
+            BUCKET,
+            "a/pack.bin",
+            "bytes=10-14",
+            "1/result.json",
+        )
+
+    def test_plain_uri_keeps_hash_in_key(self):
+        assert s3.parse_range_uri(f"s3://{BUCKET}/doc#1.pdf/pages/1/result.json") == (
+            BUCKET,
+            "doc#1.pdf/pages/1/result.json",
+            None,
+            "doc#1.pdf/pages/1/result.json",
+        )
+
+
+@pytest.mark.unit
+class TestPageBundleWriter:
+    def test_artifacts_read_back_through_s3_readers(self, s3_client):
+        writer = PageBundleWriter(BUCKET, PREFIX, pack_size_bytes=64)
+        uris = write_pages(writer, 5)
+        stats = writer.close()
+
+        for page_id, page_uris in uris.items():
+            assert "#range=" in page_uris["image"]
+            assert s3.get_binary_content(page_uris["image"]) == (
+                b"\xff\xd8image" * page_id
+            )
+            assert s3.get_json_content(page_uris["raw"]) == RAW
+            # .json content is recognized from the artifact name, not the pack key
+            assert s3.get_text_content(page_uris["parsed"]) == f"Page {page_id}"
+
+        assert stats["artifacts"] == 15
+        assert stats["packs"] > 1
+        keys = [
+            obj["Key"] for obj in s3_client.list_objects_v2(Bucket=BUCKET)["Contents"]
+        ]
+        assert len(keys) == stats["packs"] + 1
+
+    def test_index_maps_artifacts_to_ranges(self, s3_client):
+        writer = PageBundleWriter(BUCKET, PREFIX)
+        uris = write_pages(writer, 2)
+        writer.close()
+
+        index = json.loads(
+            s3_client.get_object(Bucket=BUCKET, Key=writer.index_key)["Body"].read()
+        )
+        entry = index["entries"]["2/rawText.json"]
+        pack = s3_client.get_object(
+            Bucket=BUCKET,
+            Key=index["packs"][entry["pack"]],
+            Range=f"bytes={entry['offset']}-{entry['offset'] + entry['length'] - 1}",
+        )["Body"].read()
+
+        assert json.loads(pack) == RAW
+        assert entry["content_type"] == "application/json"
+        raw_uri = f"s3://{BUCKET}/{PREFIX}/pages/2/rawText.json"
+        assert writer.uri(raw_uri) == uris[2]["raw"]
+
+    def test_uri_leaves_other_uris_unchanged(self, s3_client):
+        writer = PageBundleWriter(BUCKET, PREFIX)
+        write_pages(writer, 1)
+
+        assert writer.uri(f"s3://{BUCKET}/{PREFIX}/pages/9/result.json") == (
+            f"s3://{BUCKET}/{PREFIX}/pages/9/result.json"
+        )
+        assert writer.uri("s3://other/key.json") == "s3://other/key.json"
+        assert writer.uri(None) is None
+
+    def test_rewritten_artifact_replaces_entry(self, s3_client):
+        writer = PageBundleWriter(BUCKET, PREFIX)
+        writer.add(PARSED, f"{PREFIX}/pages/1/result.json")
+        uri = writer.add({"text": "retry"}, f"{PREFIX}/pages/1/result.json")
+        writer.close()
+
+        assert writer.uri(f"s3://{BUCKET}/{PREFIX}/pages/1/result.json") == uri
+        assert s3.get_text_content(uri) == "retry"
+
+    def test_add_after_close_fails(self, s3_client):
+        writer = PageBundleWriter(BUCKET, PREFIX)
+        writer.close()
+
+        with pytest.raises(RuntimeError):
+            writer.add(PARSED, f"{PREFIX}/pages/1/result.json")
@@ -0,0 +1,162 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Unit tests for hierarchical (map-reduce) summarization.
+"""
+
+import threading
+from unittest.mock import patch
+
+import pytest
+from idp_common.models import Document, Page, Status
+from idp_common.summarization.hierarchical import (
+    HierarchicalConfig,
+    chunk_pages,
+    summarize_hierarchically,
+)
+from idp_common.summarization.models import DocumentSummary
+from idp_common.summarization.service import SummarizationService
+
+
+def make_pages(count, chars=400):
+    return [(str(i), f"Text of page {i}. " + "x" * chars) for i in range(1, count + 1)]
+
+
+class FakeSummarizer:
+    """Records calls and returns a short summary with metering."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.calls = []
+
+    def __call__(self, text, extraction_results=None, task_prompt=None):
+        with self.lock:
+            self.calls.append((text, extraction_results, task_prompt))
+            number = len(self.calls)
+        return DocumentSummary(
+            content={"summary": f"Summary {number}"},
+            metadata={"metering": {"Summarization/bedrock/model": {"inputTokens": 1}}},
+        )
+
+
+@pytest.mark.unit
+class TestChunkPages:
+    def test_pages_packed_in_order_within_budget(self):
+        chunks = chunk_pages(make_pages(10), chunk_tokens=300)
+
+        assert all(len(chunk.text) <= 300 * 4 for chunk in chunks)
+        assert [c.first_page for c in chunks][0] == "1"
+        assert chunks[-1].last_page == "10"
+        text = "".join(chunk.text for chunk in chunks)
+        assert text.index("<page-number>2</page-number>") < text.index(
+            "<page-number>10</page-number>"
+        )
+
+    def test_long_page_is_split(self):
+        chunks = chunk_pages([("1", "y" * 5000), ("2", "short")], chunk_tokens=500)
+
+        assert len(chunks) == 3
+        assert all(len(chunk.text) <= 2000 for chunk in chunks)
+        assert "".join(chunk.text for chunk in chunks).count("y") == 5000
+
+
+@pytest.mark.unit
+class TestSummarizeHierarchically:
+    def test_map_and_tree_reduce(self):
+        summarize = FakeSummarizer()
+        config = HierarchicalConfig(
+            enabled=True, chunk_tokens=1000, max_workers=4, reduce_fan_in=3
+        )
+
+        summary = summarize_hierarchically(
+            make_pages(90), summarize, config, extraction_results={"total": 1}
+        )
+
+        stats = summary.metadata["hierarchical"]
+        assert stats["chunks"] > config.reduce_fan_in**2
+        assert stats["levels"] >= 3
+        assert stats["calls"] == len(summarize.calls)
+        # Only the final call gets the extraction results
+        assert [call[1] for call in summarize.calls].count({"total": 1}) == 1
+        assert summarize.calls[-1][1] == {"total": 1}
+        assert '<partial-summary pages="1-' in summarize.calls[-1][0]
+        assert summary.metadata["metering"]["Summarization/bedrock/model"] == {
+            "inputTokens": stats["calls"]
+        }
+
+    def test_single_chunk_is_one_call(self):
+        summarize = FakeSummarizer()
+
+        summary = summarize_hierarchically(
+            make_pages(2), summarize, HierarchicalConfig(enabled=True)
+        )
+
+        assert len(summarize.calls) == 1
+        assert summary.content == {"summary": "Summary 1"}
+        assert summary.metadata["hierarchical"]["levels"] == 1
+
+    def test_config_parsing(self):
+        config = HierarchicalConfig.from_dict(
+            {"enabled": "true", "chunk_tokens": "5000", "max_workers": "bad"}
+        )
+
+        assert config.enabled is True
+        assert config.chunk_tokens == 5000
+        assert config.threshold_tokens == 5000
+        assert config.max_workers == 4
+
+
+@pytest.mark.unit
+class TestServiceHierarchicalMode:
+    def make_service(self, enabled):
+        return SummarizationService(
+            config={
+                "summarization": {
+                    "model": "us.amazon.nova-pro-v1:0",
+                    "system_prompt": "Summarize.",
+                    "task_prompt": "{DOCUMENT_TEXT}",
+                    "hierarchical": {"enabled": enabled, "chunk_tokens": 1000},
+                }
+            }
+        )
+
+    def make_document(self, pages):
+        document = Document(
+            id="doc",
+            input_key="doc.pdf",
+            output_bucket="output-bucket",
+            status=Status.SUMMARIZING,
+        )
+        document.pages = {
+            str(i): Page(page_id=str(i), parsed_text_uri=f"s3://b/doc/{i}.json")
+            for i in range(1, pages + 1)
+        }
+        return document
+
+    @pytest.mark.parametrize("enabled", [True, False])
+    def test_document_as_whole(self, enabled):
+        service = self.make_service(enabled)
+        summarize = FakeSummarizer()
+
+        with (
+            patch(
+                "idp_common.utils.page_loader.s3.get_text_content",
+                side_effect=lambda uri: "y" * 600 + uri,
+            ),
+            patch.object(service, "process_text", side_effect=summarize),
+            patch("idp_common.summarization.service.s3.write_content") as write,
+        ):
+            document = service._process_document_as_whole(self.make_document(30))
+
+        assert document.summarization_result.summary.content["summary"]
+        assert len(summarize.calls) > 1 if enabled else len(summarize.calls) == 1
+        fulltext = next(
+            call.kwargs["content"]
+            for call in write.call_args_list
+            if call.kwargs["key"].endswith("fulltext.txt")
+        )
+        # Pages are in numeric order
+        assert fulltext.index("<page-number>2</page-number>") < fulltext.index(
+            "<page-number>10</page-number>"
+        )
@@ -0,0 +1,267 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Unit tests for delta-encoded Document state.
+"""
+
+import gzip
+import json
+
+import boto3
+import pytest
+from idp_common.models import Document, HitlMetadata, Page, Section, Status
+from idp_common.utils import document_state
+from idp_common.utils.document_state import DocumentStateStore, resolve_encoding
+from moto import mock_aws
+
+BUCKET = "test-working-bucket"
+
+
+def _document(page_count=6):
+    doc = Document(
+        id="doc-1",
+        input_bucket="input-bucket",
+        input_key="doc-1.pdf",
+        output_bucket="output-bucket",
+        status=Status.CLASSIFYING,
+        num_pages=page_count,
+        metering={"ocr": {"pages": page_count}},
+    )
+    for i in range(1, page_count + 1):
+        doc.pages[str(i)] = Page(
+            page_id=str(i),
+            image_uri=f"s3://{BUCKET}/doc-1/pages/{i}/image.jpg",
+            classification="invoice" if i <= page_count // 2 else "letter",
+            tables=[{"rows": [["Item", "Price"], [f"Widget {i}", "$10.00"]]}],
+        )
+    doc.sections = [
+        Section(
+            section_id="1",
+            classification="invoice",
+            page_ids=[str(i) for i in range(1, page_count // 2 + 1)],
+        ),
+        Section(
+            section_id="2",
+            classification="letter",
+            page_ids=[str(i) for i in range(page_count // 2 + 1, page_count + 1)],
+        ),
+    ]
+    return doc
+
+
+@pytest.fixture
+def s3_client():
+    with mock_aws():
+        client = boto3.client("s3", region_name="us-east-1")
+        client.create_bucket(Bucket=BUCKET)
+        yield client
+
+
+def _part_keys(client):
+    response = client.list_objects_v2(Bucket=BUCKET, Prefix="compressed_documents/")
+    return sorted(
+        obj["Key"]
+        for obj in response.get("Contents", [])
+        if not obj["Key"].endswith("_manifest.json.gz")
+    )
+
+
+@pytest.mark.unit
+class TestDocumentStateStore:
+    def test_round_trip(self, s3_client):
+        store = DocumentStateStore(BUCKET, "gzip", s3_client=s3_client)
+        document = _document()
+
+        wrapper = store.save(document, "classification")
+        restored = store.load(wrapper)
+
+        assert wrapper["compressed"] is True
+        assert wrapper["state_format"] == "delta"
+        assert wrapper["sections"] == ["1", "2"]
+        assert restored.to_dict() == document.to_dict()
+
+    def test_only_changed_parts_are_written(self, s3_client):
+        store = DocumentStateStore(BUCKET, "gzip", s3_client=s3_client)
+        first = store.save(_document(), "classification")
+        assert len(_part_keys(s3_client)) == 3
+
+        document = store.load(first)
+        document.sections[0].extraction_result_uri = "s3://output/doc-1/1/result.json"
+        second = store.save(document, "extraction")
+
+        keys = _part_keys(s3_client)
+        assert len(keys) == 4
+        assert any(key.endswith("_extraction_sections.gzip") for key in keys)
+        assert second["bytes_written"] < first["bytes_written"]
+        assert store.load(second).to_dict() == document.to_dict()
+
+    def test_compacts_after_many_deltas(self, s3_client, monkeypatch):
+        monkeypatch.setattr(document_state, "MAX_PART_OBJECTS", 3)
+        store = DocumentStateStore(BUCKET, "gzip", s3_client=s3_client)
+        wrapper = store.save(_document(), "step0")
+        for step in range(1, 6):
+            document = store.load(wrapper)
+            document.metering = {"step": step}
+            document.pages[str(step)].confidence = step / 10
+            wrapper = store.save(document, f"step{step}")
+
+        manifest_key = wrapper["s3_uri"].replace(f"s3://{BUCKET}/", "")
+        body = s3_client.get_object(Bucket=BUCKET, Key=manifest_key)["Body"].read()
+        manifest = json.loads(gzip.decompress(body))
+        assert len(manifest["objects"]) <= 5
+        assert store.load(wrapper).to_dict() == document.to_dict()
+
+    def test_section_load_reads_only_its_pages(self, s3_client):
+        store = DocumentStateStore(BUCKET, "gzip", s3_client=s3_client)
+        wrapper = store.save(_document(), "classification")
+
+        ranges = []
+
+        def record_range(params, **kwargs):
+            ranges.append(params.get("Range"))
+
+        s3_client.meta.events.register(
+            "provide-client-params.s3.GetObject", record_range
+        )
+        section_document = store.load(wrapper, section_id="2")
+
+        assert [s.section_id for s in section_document.sections] == ["2"]
+        assert sorted(section_document.pages) == ["4", "5", "6"]
+        assert section_document.metering == {"ocr": {"pages": 6}}
+        assert section_document.num_pages == 6
+        # Manifest, then one ranged read each for the section, pages and metering
+        assert ranges[0] is None
+        assert len(ranges) == 4 and all(ranges[1:])
+
+    def test_section_load_then_save_keeps_other_items(self, s3_client):
+        store = DocumentStateStore(BUCKET, "gzip", s3_client=s3_client)
+        expected = _document()
+        wrapper = store.save(_document(), "classification")
+
+        section_document = store.load(wrapper, section_id="2")
+        section_document.sections[0].extraction_result_uri = "s3://output/2.json"
+        section_document.pages["5"].confidence = 0.5
+        wrapper = store.save(section_document, "extraction")
+        expected.sections[1].extraction_result_uri = "s3://output/2.json"
+        expected.pages["5"].confidence = 0.5
+
+        assert wrapper["sections"] == ["1", "2"]
+        restored = store.load(wrapper)
+        assert list(restored.pages) == ["1", "2", "3", "4", "5", "6"]
+        assert restored.to_dict() == expected.to_dict()
+
+        # Saving the same partial document again still keeps the other section
+        section_document.metering = {"ocr": {"pages": 6}, "extraction": {"calls": 1}}
+        wrapper = store.save(section_document, "extraction_retry")
+        expected.metering = section_document.metering
+        assert store.load(wrapper).to_dict() == expected.to_dict()
+
+    def test_section_load_without_unloaded_saves_only_the_section(self, s3_client):
+        store = DocumentStateStore(BUCKET, "gzip", s3_client=s3_client)
+        wrapper = store.save(_document(), "classification")
+
+        section_document = store.load(wrapper, section_id="2", keep_unloaded=False)
+        section_document.sections[0].extraction_result_uri = "s3://output/2.json"
+        wrapper = store.save(section_document, "extraction")
+
+        assert wrapper["sections"] == ["2"]
+        restored = store.load(wrapper)
+        assert list(restored.pages) == ["4", "5", "6"]
+        assert restored.sections[0].extraction_result_uri == "s3://output/2.json"
+
+    def test_section_load_save_handles_added_and_removed_items(self, s3_client):
+        store = DocumentStateStore(BUCKET, "gzip", s3_client=s3_client)
+        wrapper = store.save(_document(), "classification")
+
+        section_document = store.load(wrapper, section_id="1")
+        del section_document.pages["3"]
+        section_document.sections[0].page_ids = ["1", "2"]
+        section_document.sections.append(
+            Section(section_id="3", classification="invoice", page_ids=["3"])
+        )
+        restored = store.load(store.save(section_document, "split"))
+
+        assert list(restored.pages) == ["1", "2", "4", "5", "6"]
+        assert [s.section_id for s in restored.sections] == ["1", "2", "3"]
+
+    def test_objects_record_encoding(self, s3_client):
+        store = DocumentStateStore(BUCKET, "gzip", s3_client=s3_client)
+        store.save(_document(), "ocr")
+
+        for key in _part_keys(s3_client):
+            head = s3_client.head_object(Bucket=BUCKET, Key=key)
+            assert head["ContentEncoding"] == "gzip"
+            assert head["Metadata"]["idp-document-state"] == "delta-1"
+
+    def test_zstd_falls_back_to_gzip_when_unavailable(self, monkeypatch):
+        monkeypatch.setattr(document_state, "_zstd", lambda: None)
+        assert resolve_encoding("zstd") == "gzip"
+        assert resolve_encoding("brotli") == "gzip"
+
+
+@pytest.mark.unit
+class TestDocumentDeltaState:
+    def test_compress_uses_environment_format(self, s3_client, monkeypatch):
+        monkeypatch.setenv("DOCUMENT_STATE_FORMAT", "delta")
+        document = _document()
+
+        wrapper = document.compress(BUCKET, "ocr")
+        restored = Document.load_document(wrapper, BUCKET, section_id="1")
+
+        assert wrapper["s3_uri"].endswith("_ocr_manifest.json.gz")
+        assert [s.section_id for s in restored.sections] == ["1"]
+        assert sorted(restored.pages) == ["1", "2", "3"]
+
+    def test_section_load_document_compress_keeps_full_document(
+        self, s3_client, monkeypatch
+    ):
+        monkeypatch.setenv("DOCUMENT_STATE_FORMAT", "delta")
+        wrapper = _document().compress(BUCKET, "classification")
+
+        section_document = Document.load_document(wrapper, BUCKET, section_id="1")
+        section_document.sections[0].extraction_result_uri = "s3://output/1.json"
+        wrapper = section_document.compress(BUCKET, "extraction")
+        restored = Document.load_document(wrapper, BUCKET)
+
+        expected = _document()
+        expected.sections[0].extraction_result_uri = "s3://output/1.json"
+        assert restored.to_dict() == expected.to_dict()
+
+    def test_json_state_is_default(self, s3_client, monkeypatch):
+        monkeypatch.delenv("DOCUMENT_STATE_FORMAT", raising=False)
+        document = _document()
+
+        wrapper = document.compress(BUCKET, "ocr")
+        restored = Document.load_document(wrapper, BUCKET, section_id="1")
+
+        assert "state_format" not in wrapper
+        assert wrapper["s3_uri"].endswith("_ocr_state.json")
+        assert len(restored.sections) == 2
+
+    @pytest.mark.parametrize("state_format", ["json", "delta"])
+    def test_update_compressed_fields_in_place(
+        self, s3_client, monkeypatch, state_format
+    ):
+        monkeypatch.setenv("DOCUMENT_STATE_FORMAT", state_format)
+        document = _document()
+        document.hitl_metadata = [HitlMetadata(record_number=1, hitl_triggered=True)]
+        wrapper = document.compress(BUCKET, "hitl")
+        keys = sorted(
+            obj["Key"] for obj in s3_client.list_objects_v2(Bucket=BUCKET)["Contents"]
+        )
+
+        def mark_completed(data):
+            for item in data.get("hitl_metadata", []):
+                item["hitl_completed"] = True
+
+        Document.update_compressed_fields(BUCKET, wrapper, mark_completed)
+        restored = Document.load_document(wrapper, BUCKET)
+
+        assert restored.hitl_metadata[0].hitl_completed is True
+        document.hitl_metadata[0].hitl_completed = True
+        assert restored.to_dict() == document.to_dict()
+        # The state keeps its keys, so later steps using the same wrapper see the update
+        assert keys == sorted(
+            obj["Key"] for obj in s3_client.list_objects_v2(Bucket=BUCKET)["Contents"]
+        )
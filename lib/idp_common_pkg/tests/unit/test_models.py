@@ -0,0 +1,195 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Unit tests for the Document model's page container and wire format.
+"""
+
+import copy
+import json
+import sys
+
+import pytest
+from idp_common.models import Document, Page, PageMap, Section, SectionList, Status
+
+
+def _payload(page_count=5):
+    return {
+        "id": "doc-1",
+        "input_key": "doc-1.pdf",
+        "status": "CLASSIFYING",
+        "num_pages": page_count,
+        "pages": {
+            str(i): {
+                "page_id": str(i),
+                "image_uri": f"s3://bucket/doc-1/pages/{i}/image.jpg",
+                "classification": "invoice",
+                "confidence": 0.9,
+                "tables": [{"rows": [["a", "b"]]}],
+            }
+            for i in range(1, page_count + 1)
+        },
+        "sections": [
+            {
+                "section_id": "1",
+                "classification": "invoice",
+                "page_ids": [str(i) for i in range(1, page_count + 1)],
+                "attributes": {"total": "$10.00"},
+            }
+        ],
+        "metering": {"ocr": {"pages": page_count}},
+    }
+
+
+@pytest.mark.unit
+class TestPageMap:
+    def test_pages_are_parsed_on_first_access(self):
+        document = Document.from_dict(_payload())
+
+        assert isinstance(document.pages, PageMap)
+        assert not any(
+            isinstance(entry, Page) for entry in document.pages._entries.values()
+        )
+
+        page = document.pages["2"]
+        assert page == Page(
+            page_id="2",
+            image_uri="s3://bucket/doc-1/pages/2/image.jpg",
+            classification="invoice",
+            confidence=0.9,
+            tables=[{"rows": [["a", "b"]]}],
+        )
+        assert document.pages["2"] is page
+        assert (
+            sum(isinstance(entry, Page) for entry in document.pages._entries.values())
+            == 1
+        )
+
+    def test_wire_format_is_unchanged(self):
+        payload = _payload()
+        document = Document.from_dict(payload)
+        document.pages["3"].classification = "letter"
+
+        eager = Document(
+            id="doc-1",
+            input_key="doc-1.pdf",
+            status=Status.CLASSIFYING,
+            num_pages=5,
+            metering={"ocr": {"pages": 5}},
+        )
+        eager.pages = {
+            page_id: Page.from_dict(page_id, page)
+            for page_id, page in payload["pages"].items()
+        }
+        eager.pages["3"].classification = "letter"
+        eager.sections = [Section.from_dict(payload["sections"][0])]
+
+        assert document.to_dict() == eager.to_dict()
+        assert Document.from_json(document.to_json()).to_dict() == eager.to_dict()
+
+    def test_mapping_behaviour(self):
+        document = Document.from_dict(_payload(3))
+        document.pages["4"] = Page(page_id="4")
+        del document.pages["1"]
+
+        assert list(document.pages) == ["2", "3", "4"]
+        assert "1" not in document.pages
+        assert [page.page_id for page in document.pages.values()] == ["2", "3", "4"]
+        assert document.pages == {
+            page_id: Page.from_dict(page_id, page)
+            for page_id, page in _payload(3)["pages"].items()
+            if page_id != "1"
+        } | {"4": Page(page_id="4")}
+        assert copy.deepcopy(document).to_dict() == document.to_dict()
+
+    def test_sort_orders_numerically_without_parsing(self):
+        payload = _payload(12)
+        payload["pages"] = dict(reversed(list(payload["pages"].items())))
+        document = Document.from_dict(payload)
+
+        document.pages.sort()
+
+        assert list(document.pages) == [str(i) for i in range(1, 13)]
+        assert not any(
+            isinstance(entry, Page) for entry in document.pages._entries.values()
+        )
+        assert json.loads(document.to_json())["pages"]["12"]["page_id"] == "12"
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need 3.10")
+    def test_page_and_section_use_slots(self):
+        assert not hasattr(Page(page_id="1"), "__dict__")
+        assert not hasattr(Section(section_id="1", classification="x"), "__dict__")
+
+
+def _sections_payload(section_count=4):
+    payload = _payload(section_count)
+    payload["sections"] = [
+        {
+            "section_id": str(i),
+            "classification": "invoice" if i % 2 else "letter",
+            "confidence": 0.8,
+            "page_ids": [str(i)],
+            "extraction_result_uri": f"s3://bucket/doc-1/sections/{i}/result.json",
+        }
+        for i in range(1, section_count + 1)
+    ]
+    payload["sections"][0]["attributes"] = {"total": "$10.00"}
+    return payload
+
+
+@pytest.mark.unit
+class TestSectionList:
+    def test_sections_are_parsed_on_first_access(self):
+        document = Document.from_dict(_sections_payload())
+
+        assert isinstance(document.sections, SectionList)
+        assert not any(
+            isinstance(entry, Section) for entry in document.sections._entries
+        )
+
+        section = document.sections[2]
+        assert section == Section(
+            section_id="3",
+            classification="invoice",
+            confidence=0.8,
+            page_ids=["3"],
+            extraction_result_uri="s3://bucket/doc-1/sections/3/result.json",
+        )
+        assert document.sections[2] is section
+        assert sum(isinstance(e, Section) for e in document.sections._entries) == 1
+
+    def test_wire_format_is_unchanged(self):
+        payload = _sections_payload()
+        payload["sections"].append({"section_id": "5"})
+        document = Document.from_dict(payload)
+        document.sections[1].classification = "memo"
+
+        eager = Document.from_dict(payload)
+        eager.sections = [
+            Section(
+                section_id=data.get("section_id"),
+                classification=data.get("classification"),
+                confidence=data.get("confidence", 1.0),
+                page_ids=data.get("page_ids", []),
+                extraction_result_uri=data.get("extraction_result_uri"),
+                attributes=data.get("attributes"),
+            )
+            for data in payload["sections"]
+        ]
+        eager.sections[1].classification = "memo"
+
+        assert document.to_dict()["sections"] == eager.to_dict()["sections"]
+        assert Document.from_json(document.to_json()).to_dict() == eager.to_dict()
+
+    def test_list_behaviour(self):
+        document = Document.from_dict(_sections_payload())
+        document.sections.append(Section(section_id="5", classification="memo"))
+        del document.sections[0]
+        document.sections.sort(key=lambda s: s.classification)
+
+        assert [s.section_id for s in document.sections] == ["3", "2", "4", "5"]
+        assert len(document.sections) == 4
+        assert [s.section_id for s in document.sections[1:3]] == ["2", "4"]
+        assert document.sections == list(document.sections)
+        assert copy.deepcopy(document).to_dict() == document.to_dict()
+        assert Document(id="d", input_key="d.pdf").sections == []
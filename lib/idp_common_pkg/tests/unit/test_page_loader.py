@@ -0,0 +1,118 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Unit tests for the concurrent section page loader.
+"""
+
+import random
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+from idp_common.models import Document, Page
+from idp_common.utils.page_loader import get_page_read_workers, load_section_pages
+
+
+def _document(page_count):
+    doc = Document(id="doc", input_key="doc.pdf")
+    for i in range(1, page_count + 1):
+        doc.pages[str(i)] = Page(
+            page_id=str(i),
+            parsed_text_uri=f"s3://bucket/{i}/result.json",
+            image_uri=f"s3://bucket/{i}/image.jpg",
+        )
+    return doc
+
+
+def _slow_text(uri):
+    time.sleep(random.uniform(0, 0.02))
+    return f"text of {uri.split('/')[3]}"
+
+
+def _slow_image(uri, width, height):
+    time.sleep(random.uniform(0, 0.02))
+    return f"image of {uri.split('/')[3]} at {width}x{height}".encode()
+
+
+@pytest.mark.unit
+class TestLoadSectionPages:
+    """Tests for load_section_pages."""
+
+    @pytest.mark.parametrize("max_workers", [1, 8])
+    @patch("idp_common.image.prepare_image", side_effect=_slow_image)
+    @patch("idp_common.s3.get_text_content", side_effect=_slow_text)
+    def test_results_follow_page_order(self, mock_text, mock_image, max_workers):
+        doc = _document(12)
+        page_ids = [str(i) for i in range(12, 0, -1)]
+
+        pages = load_section_pages(
+            doc, page_ids, target_width=800, target_height=600, max_workers=max_workers
+        )
+
+        assert pages.page_ids == page_ids
+        assert pages.texts == [f"text of {i}" for i in page_ids]
+        assert pages.images == [f"image of {i} at 800x600".encode() for i in page_ids]
+        assert doc.errors == []
+
+    @patch("idp_common.image.prepare_image", return_value=b"img")
+    @patch("idp_common.s3.get_text_content", return_value="text")
+    def test_missing_pages_are_recorded_and_skipped(self, mock_text, mock_image):
+        doc = _document(2)
+        pages = load_section_pages(doc, ["1", "7", "2"])
+
+        assert pages.page_ids == ["1", "2"]
+        assert pages.texts == ["text", "text"]
+        assert pages.images == [b"img", b"img"]
+        assert doc.errors == ["Page 7 not found in document"]
+
+    @patch("idp_common.image.prepare_image")
+    @patch("idp_common.s3.get_text_content", return_value="text")
+    def test_reads_overlap(self, mock_text, mock_image):
+        active, peak = [0], [0]
+        lock = threading.Lock()
+
+        def prepare_image(uri, width, height):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.05)
+            with lock:
+                active[0] -= 1
+            return b"img"
+
+        mock_image.side_effect = prepare_image
+        load_section_pages(_document(8), [str(i) for i in range(1, 9)], max_workers=4)
+        assert peak[0] == 4
+
+    @patch("idp_common.image.prepare_image")
+    @patch("idp_common.s3.get_text_content", return_value="text")
+    def test_text_only(self, mock_text, mock_image):
+        pages = load_section_pages(_document(3), ["1", "2", "3"], load_images=False)
+        assert pages.texts == ["text"] * 3
+        assert pages.images == []
+        mock_image.assert_not_called()
+
+    @patch("idp_common.image.prepare_image", return_value=b"img")
+    @patch("idp_common.s3.get_text_content")
+    def test_read_errors_raise_by_default(self, mock_text, mock_image):
+        def get_text_content(uri):
+            if "/2/" in uri:
+                raise RuntimeError("NoSuchKey")
+            return "ok"
+
+        mock_text.side_effect = get_text_content
+        with pytest.raises(RuntimeError, match="NoSuchKey"):
+            load_section_pages(_document(3), ["1", "2", "3"])
+
+        pages = load_section_pages(
+            _document(3), ["1", "2", "3"], load_images=False, ignore_errors=True
+        )
+        assert pages.texts == ["ok", None, "ok"]
+
+    def test_get_page_read_workers(self):
+        assert get_page_read_workers(None) == 8
+        assert get_page_read_workers({"page_read_workers": "3"}) == 3
+        assert get_page_read_workers({"page_read_workers": 0}) == 1
+        assert get_page_read_workers({"page_read_workers": "many"}) == 8
@@ -67,6 +67,7 @@ def send_task_response(task_token, job_status, job_detail):
         logger.error(f"Error sending task response: {e}")
         raise
 
+@metrics.flush_metrics_after_invocation
 def handler(event, context):
     logger.info(f"Event: {json.dumps(event)}")
     
@@ -2,12 +2,14 @@
 # SPDX-License-Identifier: MIT-0
 
 import datetime
+import functools
 import io
 import json
 import logging
 import os
 import random
 import string
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal
 from urllib.parse import urlparse
 
@@ -32,6 +34,8 @@ ssm_client = boto3.client('ssm')
 bedrock_client = boto3.client('bedrock-data-automation')
 SAGEMAKER_A2I_REVIEW_PORTAL_URL = os.environ.get('SAGEMAKER_A2I_REVIEW_PORTAL_URL', '')
 enable_hitl = os.environ.get('ENABLE_HITL', 'false').lower()
+# Threads writing per-page outputs; matches the S3 client's default connection pool
+PAGE_WRITE_WORKERS = max(1, int(os.environ.get('PAGE_WRITE_WORKERS', '10')))
 
 def get_confidence_threshold_from_config(document: Document) -> float:
     """
@@ -374,65 +378,88 @@ def add_confidence_thresholds_to_explainability(explainability_data, confidence_
         # Return primitive values as-is
         return explainability_data
 
-def extract_page_from_multipage_json(raw_json, page_index, confidence_threshold=None):
+def split_multipage_json(raw_json, confidence_threshold=None):
     """
-    Extract a single page from a multi-page result JSON
+    Split a multi-page result JSON into single page result JSONs in one pass
+    
+    Elements are bucketed by page index once, and explainability_info (with
+    confidence thresholds added) is computed once and shared by all pages.
     
     Args:
         raw_json (dict): The BDA result JSON
-        page_index (int): The page index to extract
         confidence_threshold (float, optional): Confidence threshold to add to explainability data
         
     Returns:
-        dict: A new result JSON with only the specified page
+        dict: Single page result JSON by page index, in the order of raw_json['pages']
     """
-    # Create a copy of the JSON with just metadata
-    single_page_json = {
-        "metadata": raw_json.get("metadata", {})
-    }
-    
-    # Update metadata to reflect single page
-    if "metadata" in single_page_json:
-        single_page_json["metadata"]["start_page_index"] = page_index
-        single_page_json["metadata"]["end_page_index"] = page_index
-        single_page_json["metadata"]["number_of_pages"] = 1
-    
-    # Include document level info
-    if "document" in raw_json:
-        single_page_json["document"] = raw_json["document"]
-    
-    # Add the single page from the pages array
-    single_page_json["pages"] = []
-    if "pages" in raw_json:
-        for page in raw_json["pages"]:
-            if page.get("page_index") == page_index:
-                single_page_json["pages"].append(page)
-                break
+    metadata = raw_json.get("metadata", {})
     
-    # Filter elements for only this page
-    single_page_json["elements"] = []
-    if "elements" in raw_json:
-        for element in raw_json["elements"]:
-            page_indices = element.get("page_indices", [])
-            if page_index in page_indices:
-                # Create a copy of the element with only this page
-                element_copy = element.copy()
-                element_copy["page_indices"] = [page_index]
-                single_page_json["elements"].append(element_copy)
-    
-    # Include explainability_info if present and add confidence thresholds
+    explainability_info = None
     if "explainability_info" in raw_json:
         explainability_info = raw_json["explainability_info"]
         if confidence_threshold is not None:
             # Add confidence thresholds to the explainability data
-            single_page_json["explainability_info"] = add_confidence_thresholds_to_explainability(
+            explainability_info = add_confidence_thresholds_to_explainability(
                 explainability_info, confidence_threshold
             )
-            logger.info(f"Added confidence threshold {confidence_threshold} to explainability_info for page {page_index}")
-        else:
+            logger.info(f"Added confidence threshold {confidence_threshold} to explainability_info")
+    
+    page_results = {}
+    for page in raw_json.get("pages", []):
+        page_index = page.get("page_index")
+        if page_index is None or page_index in page_results:
+            continue
+        
+        # Metadata updated to reflect single page
+        single_page_json = {
+            "metadata": {
+                **metadata,
+                "start_page_index": page_index,
+                "end_page_index": page_index,
+                "number_of_pages": 1
+            }
+        }
+        
+        # Include document level info
+        if "document" in raw_json:
+            single_page_json["document"] = raw_json["document"]
+        
+        single_page_json["pages"] = [page]
+        single_page_json["elements"] = []
+        
+        if "explainability_info" in raw_json:
             single_page_json["explainability_info"] = explainability_info
+        
+        page_results[page_index] = single_page_json
     
-    return single_page_json
+    # Bucket elements by page, each copy keeping only that page index
+    for element in raw_json.get("elements", []):
+        for page_index in dict.fromkeys(element.get("page_indices", [])):
+            single_page_json = page_results.get(page_index)
+            if single_page_json is not None:
+                element_copy = element.copy()
+                element_copy["page_indices"] = [page_index]
+                single_page_json["elements"].append(element_copy)
+    
+    return page_results
+
+def run_concurrently(tasks, max_workers=None):
+    """
+    Run S3 upload tasks on a thread pool
+    
+    Args:
+        tasks (list): Zero-argument callables
+        max_workers (int, optional): Maximum number of tasks running at once (default PAGE_WRITE_WORKERS)
+        
+    Returns:
+        list: Task results in the order of tasks; the first error is raised
+    """
+    max_workers = max_workers or PAGE_WRITE_WORKERS
+    if len(tasks) <= 1 or max_workers <= 1:
+        return [task() for task in tasks]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(tasks))) as executor:
+        futures = [executor.submit(task) for task in tasks]
+        return [future.result() for future in futures]
 
 def extract_markdown_from_single_page_json(raw_json):
     """
@@ -450,6 +477,79 @@ def extract_markdown_from_single_page_json(raw_json):
             return page["representation"]["markdown"]
     return ""
 
+def write_page_outputs(page_id, single_page_json, output_bucket, pages_output_prefix, doc_class):
+    """
+    Write a page's result.json, parsedResult.json and metadata file
+    
+    Args:
+        page_id (str): The page ID
+        single_page_json (dict): The single page result JSON
+        output_bucket (str): The output bucket
+        pages_output_prefix (str): The pages prefix in the output bucket
+        doc_class (str): The class of the page's section
+        
+    Returns:
+        Page: The page with its output URIs
+    """
+    # Determine page directory path in output bucket
+    page_path = f"{pages_output_prefix}{page_id}/"
+    page_result_path = f"{page_path}result.json"
+    
+    # Write the single page result.json to the page directory
+    write_content(
+        single_page_json,
+        output_bucket,
+        page_result_path,
+        content_type='application/json'
+    )
+    
+    # Create raw text URI
+    raw_text_uri = build_s3_uri(output_bucket, page_result_path)
+    
+    # Define image path
+    image_path = f"{page_path}image.jpg"
+    
+    # Check if image exists
+    try:
+        s3_client.head_object(Bucket=output_bucket, Key=image_path)
+        image_uri = build_s3_uri(output_bucket, image_path)
+    except ClientError:
+        image_uri = None
+        logger.warning(f"image.jpg not found for page {page_id}")
+    
+    # Extract markdown content for this page
+    markdown_text = extract_markdown_from_single_page_json(single_page_json)
+    
+    # Create parsedResult.json
+    parsed_result = {
+        "text": markdown_text
+    }
+    
+    # Write parsedResult.json to S3
+    parsed_result_path = f"{page_path}parsedResult.json"
+    write_content(
+        parsed_result,
+        output_bucket,
+        parsed_result_path,
+        content_type='application/json'
+    )
+    
+    # Create S3 URI for parsed result
+    parsed_result_uri = build_s3_uri(output_bucket, parsed_result_path)
+    
+    logger.info(f"Created parsedResult.json for page {page_id}")
+    
+    # Create metadata file for the parsed result URI
+    create_metadata_file(parsed_result_uri, doc_class, 'page')
+    
+    return Page(
+        page_id=page_id,
+        image_uri=image_uri,
+        raw_text_uri=raw_text_uri,
+        parsed_text_uri=parsed_result_uri,
+        classification=doc_class
+    )
+
 def process_bda_pages(bda_result_bucket, bda_result_prefix, output_bucket, object_key, document, confidence_threshold=0.8):
     """
     Process BDA page outputs and build pages for the Document object
@@ -502,81 +602,27 @@ def process_bda_pages(bda_result_bucket, bda_result_prefix, output_bucket, objec
                 
                 # Check if this contains pages
                 if 'pages' in raw_json and len(raw_json['pages']) > 0:
-                    # Process each page in the multi-page result
                     for page in raw_json['pages']:
-                        page_index = page.get('page_index')
-                        if page_index is None:
+                        if page.get('page_index') is None:
                             logger.warning(f"Page in {obj_key} has no page_index")
-                            continue
-                            
-                        page_id = str(page_index)
-                        
-                        # Extract a single page result.json for this page with confidence threshold
-                        single_page_json = extract_page_from_multipage_json(raw_json, page_index, confidence_threshold)
-                        
-                        # Determine page directory path in output bucket
-                        page_path = f"{pages_output_prefix}{page_id}/"
-                        page_result_path = f"{page_path}result.json"
-                        
-                        # Write the single page result.json to the page directory
-                        write_content(
+                    
+                    # Split into single page result.json files with confidence threshold
+                    page_results = split_multipage_json(raw_json, confidence_threshold)
+                    
+                    # Write each page's outputs concurrently
+                    pages = run_concurrently([
+                        functools.partial(
+                            write_page_outputs,
+                            str(page_index),
                             single_page_json,
                             output_bucket,
-                            page_result_path,
-                            content_type='application/json'
-                        )
-                        
-                        # Create raw text URI
-                        raw_text_uri = build_s3_uri(output_bucket, page_result_path)
-                        
-                        # Define image path
-                        image_path = f"{page_path}image.jpg"
-                        
-                        # Check if image exists
-                        try:
-                            s3_client.head_object(Bucket=output_bucket, Key=image_path)
-                            image_uri = build_s3_uri(output_bucket, image_path)
-                        except ClientError:
-                            image_uri = None
-                            logger.warning(f"image.jpg not found for page {page_id}")
-                        
-                        # Get the class from the section mapping
-                        doc_class = page_to_class_map.get(page_id, '')
-                        
-                        # Extract markdown content for this page
-                        markdown_text = extract_markdown_from_single_page_json(single_page_json)
-                        
-                        # Create parsedResult.json
-                        parsed_result = {
-                            "text": markdown_text
-                        }
-                        
-                        # Write parsedResult.json to S3
-                        parsed_result_path = f"{page_path}parsedResult.json"
-                        write_content(
-                            parsed_result,
-                            output_bucket,
-                            parsed_result_path,
-                            content_type='application/json'
-                        )
-                        
-                        # Create S3 URI for parsed result
-                        parsed_result_uri = build_s3_uri(output_bucket, parsed_result_path)
-                        
-                        logger.info(f"Created parsedResult.json for page {page_id}")
-                        
-                        # Create metadata file for the parsed result URI
-                        create_metadata_file(parsed_result_uri, doc_class, 'page')
-                        
-                        # Create Page object and add to document
-                        page = Page(
-                            page_id=page_id,
-                            image_uri=image_uri,
-                            raw_text_uri=raw_text_uri,
-                            parsed_text_uri=parsed_result_uri,
-                            classification=doc_class
+                            pages_output_prefix,
+                            page_to_class_map.get(str(page_index), '')
                         )
-                        document.pages[page_id] = page
+                        for page_index, single_page_json in page_results.items()
+                    ])
+                    for page in pages:
+                        document.pages[page.page_id] = page
                         
                     logger.info(f"Processed multi-page result file {obj_key}")
                 
@@ -994,6 +1040,7 @@ def process_segments(
     
     return document, overall_hitl_triggered
 
+@metrics.flush_metrics_after_invocation
 def handler(event, context):
     """
     Process the BDA results and build a Document object with pages and sections.
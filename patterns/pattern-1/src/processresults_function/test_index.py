@@ -0,0 +1,186 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+"""
+Unit tests for the processresults Lambda page splitting and page output writes.
+"""
+
+import copy
+import json
+import os
+
+os.environ.setdefault('AWS_DEFAULT_REGION', 'us-east-1')
+
+import boto3
+import pytest
+from unittest.mock import patch
+from moto import mock_aws
+from idp_common import s3
+from idp_common.models import Document, Status
+
+import index
+
+INPUT_BUCKET = 'test-bda-bucket'
+OUTPUT_BUCKET = 'test-output-bucket'
+OBJECT_KEY = 'doc.pdf'
+BDA_PREFIX = 'bda/job-1/0'
+
+
+def previous_extract_page(raw_json, page_index, confidence_threshold=None):
+    """The earlier extract_page_from_multipage_json, rescanning raw_json for one page"""
+    single_page_json = {"metadata": raw_json.get("metadata", {})}
+    if "metadata" in single_page_json:
+        single_page_json["metadata"]["start_page_index"] = page_index
+        single_page_json["metadata"]["end_page_index"] = page_index
+        single_page_json["metadata"]["number_of_pages"] = 1
+    if "document" in raw_json:
+        single_page_json["document"] = raw_json["document"]
+    single_page_json["pages"] = []
+    if "pages" in raw_json:
+        for page in raw_json["pages"]:
+            if page.get("page_index") == page_index:
+                single_page_json["pages"].append(page)
+                break
+    single_page_json["elements"] = []
+    if "elements" in raw_json:
+        for element in raw_json["elements"]:
+            if page_index in element.get("page_indices", []):
+                element_copy = element.copy()
+                element_copy["page_indices"] = [page_index]
+                single_page_json["elements"].append(element_copy)
+    if "explainability_info" in raw_json:
+        explainability_info = raw_json["explainability_info"]
+        if confidence_threshold is not None:
+            single_page_json["explainability_info"] = index.add_confidence_thresholds_to_explainability(
+                explainability_info, confidence_threshold
+            )
+        else:
+            single_page_json["explainability_info"] = explainability_info
+    return single_page_json
+
+
+def previous_outputs(raw_json, confidence_threshold=None):
+    """Per-page result.json and parsedResult.json of the earlier page loop, by page ID"""
+    raw_json = copy.deepcopy(raw_json)
+    outputs = {}
+    for page in raw_json['pages']:
+        page_index = page.get('page_index')
+        if page_index is None:
+            continue
+        single_page_json = previous_extract_page(raw_json, page_index, confidence_threshold)
+        # Serialized right away, as the earlier loop wrote each page before extracting the next
+        outputs[str(page_index)] = (
+            json.loads(json.dumps(single_page_json)),
+            {'text': index.extract_markdown_from_single_page_json(single_page_json)}
+        )
+    return outputs
+
+
+def _element(element_id, page_indices):
+    element = {
+        'id': element_id,
+        'type': 'TEXT',
+        'representation': {'markdown': f"Element {element_id}"}
+    }
+    if page_indices is not None:
+        element['page_indices'] = page_indices
+    return element
+
+
+@pytest.fixture
+def raw_json():
+    return {
+        'metadata': {'asset_id': '0', 'start_page_index': 0, 'end_page_index': 2, 'number_of_pages': 3},
+        'document': {'representation': {'markdown': 'Whole document'}},
+        'pages': [
+            {'page_index': 0, 'representation': {'markdown': '# Page 0'}},
+            {'page_index': 1, 'representation': {'markdown': '# Page 1'}},
+            {'representation': {'markdown': 'Page without page_index'}},
+            {'page_index': 2, 'representation': {'markdown': '# Page 2'}},
+        ],
+        'elements': [
+            _element('a', [0]),
+            _element('b', [0, 1]),
+            _element('c', [1, 2]),
+            _element('d', [0, 1, 2]),
+            _element('e', [1, 1]),
+            _element('f', [2, 7]),
+            _element('g', None),
+            _element('h', []),
+        ],
+        'explainability_info': [
+            {'name': {'value': 'Jane', 'confidence': 0.91}, 'nested': [{'value': 'x', 'confidence': 0.5}]}
+        ]
+    }
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize('confidence_threshold', [None, 0.8])
+def test_split_multipage_json_matches_previous_extraction(raw_json, confidence_threshold):
+    expected = previous_outputs(raw_json, confidence_threshold)
+    original = copy.deepcopy(raw_json)
+
+    page_results = index.split_multipage_json(raw_json, confidence_threshold)
+
+    assert list(page_results) == [0, 1, 2]
+    for page_index, single_page_json in page_results.items():
+        assert json.loads(json.dumps(single_page_json)) == expected[str(page_index)][0]
+    # Elements spanning several pages are copied once into each of their pages
+    assert [e['id'] for e in page_results[1]['elements']] == ['b', 'c', 'd', 'e']
+    assert page_results[2]['elements'][-1] == {**_element('f', None), 'page_indices': [2]}
+    # The input is left unchanged
+    assert raw_json == original
+
+
+@pytest.mark.unit
+def test_process_bda_pages_writes_previous_page_outputs(raw_json):
+    expected = previous_outputs(raw_json, 0.8)
+    with mock_aws():
+        client = boto3.client('s3', region_name='us-east-1')
+        for bucket in (INPUT_BUCKET, OUTPUT_BUCKET):
+            client.create_bucket(Bucket=bucket)
+        client.put_object(
+            Bucket=INPUT_BUCKET,
+            Key=f"{BDA_PREFIX}/standard_output/0/result.json",
+            Body=json.dumps(raw_json)
+        )
+        client.put_object(Bucket=OUTPUT_BUCKET, Key=f"{OBJECT_KEY}/pages/1/image.jpg", Body=b'image')
+        document = Document(
+            id=OBJECT_KEY,
+            input_key=OBJECT_KEY,
+            output_bucket=OUTPUT_BUCKET,
+            status=Status.POSTPROCESSING
+        )
+
+        with patch.object(s3, '_s3_client', client), \
+                patch.object(index, 's3_client', client), \
+                patch.object(index, 'PAGE_WRITE_WORKERS', 4):
+            index.process_bda_pages(INPUT_BUCKET, BDA_PREFIX, OUTPUT_BUCKET, OBJECT_KEY, document, 0.8)
+
+        def read_json(key):
+            return json.loads(client.get_object(Bucket=OUTPUT_BUCKET, Key=key)['Body'].read())
+
+        assert document.errors == []
+        assert sorted(document.pages) == ['0', '1', '2']
+        assert document.num_pages == 3
+        for page_id, (result, parsed_result) in expected.items():
+            page_path = f"{OBJECT_KEY}/pages/{page_id}/"
+            assert read_json(f"{page_path}result.json") == result
+            assert read_json(f"{page_path}parsedResult.json") == parsed_result
+            page = document.pages[page_id]
+            assert page.raw_text_uri == f"s3://{OUTPUT_BUCKET}/{page_path}result.json"
+            assert page.parsed_text_uri == f"s3://{OUTPUT_BUCKET}/{page_path}parsedResult.json"
+        assert document.pages['1'].image_uri == f"s3://{OUTPUT_BUCKET}/{OBJECT_KEY}/pages/1/image.jpg"
+        assert document.pages['0'].image_uri is None
+        listed = client.list_objects_v2(Bucket=OUTPUT_BUCKET, Prefix=f"{OBJECT_KEY}/pages/None/")
+        assert listed['KeyCount'] == 0
+
+
+@pytest.mark.unit
+def test_run_concurrently_keeps_task_order_and_raises_errors():
+    assert index.run_concurrently([lambda i=i: i * i for i in range(20)], max_workers=4) == [i * i for i in range(20)]
+
+    def fail():
+        raise ValueError('upload failed')
+
+    with pytest.raises(ValueError, match='upload failed'):
+        index.run_concurrently([lambda: 1, fail, lambda: 3], max_workers=2)
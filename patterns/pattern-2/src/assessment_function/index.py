@@ -6,7 +6,7 @@ import json
 import time
 import logging
 
-from idp_common import get_config, assessment
+from idp_common import get_config, assessment, metrics
 from idp_common.models import Document, Status
 from idp_common.docs_service import create_document_service
 from idp_common import s3
@@ -88,6 +88,7 @@ def check_document_for_throttling_errors(document):
     
     return False, None
 
+@metrics.flush_metrics_after_invocation
 def handler(event, context):
     """
     Lambda handler for document assessment.
@@ -115,7 +116,10 @@ def handler(event, context):
         
     # Convert document data to Document object - handle compression
     working_bucket = os.environ.get('WORKING_BUCKET')
-    document = Document.load_document(document_data, working_bucket, logger)
+    # With delta document state only this section and its pages are read
+    document = Document.load_document(
+        document_data, working_bucket, logger, section_id=section_id, keep_unloaded=False
+    )
     logger.info(f"Processing assessment for document {document.id}, section {section_id}")
 
     # Find the section we're processing
@@ -8,16 +8,14 @@ This function is called as part of the Step Functions workflow after HITLWait
 to update the document with the final HITL completion status.
 """
 import json
-import boto3
 import logging
 from typing import Any, Dict
 from urllib.parse import urlparse
+from idp_common.models import Document
 
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
-s3 = boto3.resource('s3')
-
 # Configure logger
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
@@ -66,19 +64,15 @@ def handler(event: Dict[str, Any], context) -> Dict[str, Any]:
         bucket = parsed.netloc
         key = parsed.path.lstrip('/')
 
-        try:
-            # Read the JSON file from S3
-            obj = s3.Object(bucket, key)
-            file_content = obj.get()['Body'].read().decode('utf-8')
-            data = json.loads(file_content)
-
+        def mark_hitl_completed(data):
             # Update hitl_completed for every object in hitl_metadata
-            hitl_metadata = data.get('hitl_metadata', [])
-            for item in hitl_metadata:
+            for item in data.get('hitl_metadata', []):
                 item['hitl_completed'] = True
 
-            # Write the updated JSON back to S3
-            obj.put(Body=json.dumps(data, separators=(',', ':')).encode('utf-8'))
+        try:
+            # Update the stored document in place (JSON or delta state), so later
+            # steps reading the same document reference see the change
+            Document.update_compressed_fields(bucket, document, mark_hitl_completed)
 
             logger.info(f"Updated hitl_completed for all items in {bucket}/{key}")
             
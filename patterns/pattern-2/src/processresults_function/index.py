@@ -537,6 +537,12 @@ def create_metadata_file(file_uri, class_type, file_type=None):
         bucket = parsed_uri.netloc
         key = parsed_uri.path.lstrip('/')
         
+        # Bundled OCR page artifacts are byte ranges of a pack object shared by
+        # many pages, so there is no per-page object to put a sidecar next to
+        if parsed_uri.fragment.startswith('range='):
+            logger.info(f"Skipping metadata file for bundled page artifact {file_uri}")
+            return
+        
         # Create the metadata key by adding '.metadata.json' to the original key
         metadata_key = f"{key}.metadata.json"
         
@@ -6,7 +6,7 @@ import json
 import time
 import logging
 
-from idp_common import get_config, assessment
+from idp_common import get_config, assessment, metrics
 from idp_common.models import Document, Status
 from idp_common.docs_service import create_document_service
 from idp_common.utils import calculate_lambda_metering, merge_metering_data
@@ -17,6 +17,7 @@ logger = logging.getLogger()
 logger.setLevel(os.environ.get("LOG_LEVEL", "INFO"))
 logging.getLogger('idp_common.bedrock.client').setLevel(os.environ.get("BEDROCK_LOG_LEVEL", "INFO"))
 
+@metrics.flush_metrics_after_invocation
 def handler(event, context):
     """
     Lambda handler for document assessment.
@@ -43,7 +44,10 @@ def handler(event, context):
         
     # Convert document data to Document object - handle compression
     working_bucket = os.environ.get('WORKING_BUCKET')
-    document = Document.load_document(document_data, working_bucket, logger)
+    # With delta document state only this section and its pages are read
+    document = Document.load_document(
+        document_data, working_bucket, logger, section_id=section_id, keep_unloaded=False
+    )
     logger.info(f"Processing assessment for document {document.id}, section {section_id}")
 
     # Find the section we're processing
@@ -25,6 +25,7 @@ logger.setLevel(os.environ.get("LOG_LEVEL", "INFO"))
 logging.getLogger('idp_common.bedrock.client').setLevel(os.environ.get("BEDROCK_LOG_LEVEL", "INFO"))
 
 
+@metrics.flush_metrics_after_invocation
 def handler(event, context):
     """
     Lambda handler for document classification using SageMaker UDOP model.
@@ -21,6 +21,7 @@ logger.setLevel(os.environ.get("LOG_LEVEL", "INFO"))
 logging.getLogger('idp_common.bedrock.client').setLevel(os.environ.get("BEDROCK_LOG_LEVEL", "INFO"))
 
 
+@metrics.flush_metrics_after_invocation
 def handler(event, context):
     """
     Process a single section of a document for information extraction
@@ -34,8 +35,15 @@ def handler(event, context):
     
     # For Map state, we get just one section from the document
     # Extract the document and section from the event - handle both compressed and uncompressed
+    # Get the section ID directly from the Map state input
+    # Now using the simplified array of section IDs format
+    section_id = event.get("section_id")
+    
     working_bucket = os.environ.get('WORKING_BUCKET')
-    full_document = Document.load_document(event.get("document", {}), working_bucket, logger)
+    # With delta document state only this section and its pages are read
+    full_document = Document.load_document(
+        event.get("document", {}), working_bucket, logger, section_id=section_id, keep_unloaded=False
+    )
     
     # Log loaded document for troubleshooting
     logger.info(f"Loaded document - ID: {full_document.id}, input_key: {full_document.input_key}")
@@ -44,10 +52,6 @@ def handler(event, context):
     logger.info(f"Document pages count: {len(full_document.pages)}, sections count: {len(full_document.sections)}")
     logger.info(f"Full document content: {json.dumps(full_document.to_dict(), default=str)}")
     
-    # Get the section ID directly from the Map state input
-    # Now using the simplified array of section IDs format
-    section_id = event.get("section_id")
-    
     if not section_id:
         raise ValueError("No section_id found in event")
     
@@ -88,9 +92,15 @@ def handler(event, context):
     # Normal extraction processing
     # Update document status to EXTRACTING
     full_document.status = Status.EXTRACTING
+    # Create new 'shell' document since the loaded document may hold only this section
+    docStatus = Document(
+        id=full_document.id,
+        input_key=full_document.input_key,
+        status=Status.EXTRACTING,
+    )
     document_service = create_document_service()
-    logger.info(f"Updating document status to {full_document.status}")
-    document_service.update_document(full_document)
+    logger.info(f"Updating document status to {docStatus.status}")
+    document_service.update_document(docStatus)
        
     # Create a section-specific document by modifying the original document
     section_document = full_document
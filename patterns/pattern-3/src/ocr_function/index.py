@@ -11,7 +11,7 @@ import logging
 import os
 import time
 
-from idp_common import get_config, ocr
+from idp_common import get_config, ocr, metrics
 from idp_common.models import Document, Status
 from idp_common.docs_service import create_document_service
 from idp_common.utils import calculate_lambda_metering, merge_metering_data
@@ -27,6 +27,7 @@ region = os.environ['AWS_REGION']
 METRIC_NAMESPACE = os.environ.get('METRIC_NAMESPACE')
 MAX_WORKERS = int(os.environ.get('MAX_WORKERS', 20))
 
+@metrics.flush_metrics_after_invocation
 def handler(event, context): 
     """
     Lambda handler for OCR processing.
@@ -100,8 +101,16 @@ def handler(event, context):
         backend=backend
     )
     
-    # Process the document - the service will read the PDF content directly
-    document = service.process_document(document)
+    # Process the document - the service will read the PDF content directly.
+    # The deadline keeps asynchronous Textract waits within the Lambda timeout.
+    deadline = None
+    if context and hasattr(context, 'get_remaining_time_in_millis'):
+        deadline = time.time() + context.get_remaining_time_in_millis() / 1000
+    try:
+        document = service.process_document(document, deadline=deadline)
+    finally:
+        # Stop rasterization worker processes, if any
+        service.close()
     
     # Check if document processing failed
     if document.status == Status.FAILED:
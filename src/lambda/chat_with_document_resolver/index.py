@@ -12,7 +12,9 @@ import os
 import re 
 from urllib.parse import urlparse
 from botocore.exceptions import ClientError
+from idp_common import metrics
 from idp_common.bedrock.client import BedrockClient
+from idp_common.s3 import parse_range_uri
 
 # Set up logging
 logger = logging.getLogger()
@@ -65,11 +67,14 @@ def get_full_text(bucket, key):
         
         for page in sorted_pages:
             if 'TextUri' in page:
-                # Extract S3 key from URI
-                text_key = page['TextUri'].replace(f"s3://{bucket}/", "")
+                # Extract S3 key (and the byte range of a bundled OCR page) from URI
+                text_bucket, text_key, byte_range, _ = parse_range_uri(page['TextUri'])
+                get_args = {'Bucket': text_bucket, 'Key': text_key}
+                if byte_range:
+                    get_args['Range'] = byte_range
                 
                 try:
-                    response = s3.get_object(Bucket=bucket, Key=text_key)
+                    response = s3.get_object(**get_args)
                     page_text = response['Body'].read().decode('utf-8')
                     all_text += f"<page-number>{page['Id']}</page-number>\n{page_text}\n\n"
                 except Exception as e:
@@ -106,6 +111,7 @@ def get_summarization_model():
         logger.error(f"Error getting summarization model from config: {str(e)}")
         return 'us.amazon.nova-pro-v1:0'  # Fallback default
 
+@metrics.flush_metrics_after_invocation
 def handler(event, context):
     response_data = {}
 
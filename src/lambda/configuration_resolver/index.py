@@ -7,6 +7,8 @@ import boto3
 from botocore.exceptions import ClientError
 import logging
 
+from idp_common.config import bump_configuration_version
+
 logger = logging.getLogger()
 logger.setLevel(os.environ.get("LOG_LEVEL", "INFO"))
 logging.getLogger('idp_common.bedrock.client').setLevel(os.environ.get("BEDROCK_LOG_LEVEL", "INFO"))
@@ -177,6 +179,7 @@ def handle_update_configuration(custom_config):
                     'Configuration': 'Custom'
                 }
             )
+            bump_configuration_version(table)
             logger.info("Stored empty Custom configuration")
             return True
         
@@ -215,6 +218,7 @@ def handle_update_configuration(custom_config):
                 }
             )
             
+            bump_configuration_version(table)
             logger.info(f"Updated Default configuration and cleared Custom")
             
         else:
@@ -227,6 +231,7 @@ def handle_update_configuration(custom_config):
                     **stringified_config
                 }
             )
+            bump_configuration_version(table)
             
             logger.info(f"Updated Custom configuration")
             
@@ -7,7 +7,7 @@ import logging
 import html
 import mimetypes
 import os
-from urllib.parse import urlparse
+from urllib.parse import urlparse, parse_qs
 from botocore.exceptions import ClientError
 
 # Set up logging
@@ -44,18 +44,29 @@ def handler(event, context):
         bucket = parsed_uri.netloc.split('.')[0]  # Extract bucket name from hostname
         key = parsed_uri.path.lstrip('/')  # Remove leading slash from path
         
-        logger.info(f"Fetching from bucket: {bucket}, key: {key}")
+        # OCR page bundles store page artifacts as byte ranges of a pack object
+        # (s3://bucket/key#range=start-end&name=...); fetch only that range
+        fragment = parse_qs(parsed_uri.fragment)
+        byte_range = fragment.get('range', [None])[0]
+        
+        logger.info(f"Fetching from bucket: {bucket}, key: {key}, range: {byte_range}")
         
         # Get object from S3
-        response = s3_client.get_object(
-            Bucket=bucket,
-            Key=key
-        )
+        get_args = {'Bucket': bucket, 'Key': key}
+        if byte_range:
+            get_args['Range'] = f"bytes={byte_range}"
+        response = s3_client.get_object(**get_args)
         
         # Get content type from S3 response or infer from file extension
+        # (for a range, from the name of the packed artifact)
         content_type = response.get('ContentType', '')
+        if byte_range:
+            content_type = ''
+            key_for_type = fragment.get('name', [key])[0]
+        else:
+            key_for_type = key
         if not content_type or content_type == 'binary/octet-stream' or content_type == 'application/octet-stream':
-            content_type = mimetypes.guess_type(key)[0] or 'text/plain'
+            content_type = mimetypes.guess_type(key_for_type)[0] or 'text/plain'
         
         logger.info(f"File content type: {content_type}")
         logger.info(f"File size: {response['ContentLength']}")
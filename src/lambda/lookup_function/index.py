@@ -5,6 +5,7 @@
 import boto3
 import json
 import os
+import time
 from datetime import datetime, timezone
 import logging
 
@@ -13,20 +14,34 @@ logger.setLevel(os.environ.get("LOG_LEVEL", "INFO"))
 logging.getLogger('idp_common.bedrock.client').setLevel(os.environ.get("BEDROCK_LOG_LEVEL", "INFO"))
 # Get LOG_LEVEL from environment variable with INFO as default
 
+# Clients are created once per container and reused across invocations
+dynamodb = boto3.resource('dynamodb')
+sfn = boto3.client('stepfunctions')
+
+# BatchGetItem accepts at most 100 keys per request
+BATCH_GET_MAX_KEYS = 100
+BATCH_GET_MAX_RETRIES = 8
+
+# Attributes needed for status_only batch lookups
+STATUS_ATTRIBUTES = ['PK', 'ObjectStatus', 'InitialEventTime', 'QueuedTime', 'WorkflowStartTime', 'CompletionTime']
+
+TERMINAL_STATUSES = {'COMPLETED', 'FAILED'}
+
 def calculate_durations(timestamps):
+    # Timestamps of steps not reached yet are None and are skipped
     try:
         durations = {}
-        if 'QueuedTime' in timestamps and 'WorkflowStartTime' in timestamps:
+        if timestamps.get('QueuedTime') and timestamps.get('WorkflowStartTime'):
             queue_time = (datetime.fromisoformat(timestamps['WorkflowStartTime']) - 
                          datetime.fromisoformat(timestamps['QueuedTime'])).total_seconds() * 1000
             durations['queue'] = int(queue_time)
             
-        if 'WorkflowStartTime' in timestamps and 'CompletionTime' in timestamps:
+        if timestamps.get('WorkflowStartTime') and timestamps.get('CompletionTime'):
             processing_time = (datetime.fromisoformat(timestamps['CompletionTime']) - 
                              datetime.fromisoformat(timestamps['WorkflowStartTime'])).total_seconds() * 1000
             durations['processing'] = int(processing_time)
             
-        if 'InitialEventTime' in timestamps and 'CompletionTime' in timestamps:
+        if timestamps.get('InitialEventTime') and timestamps.get('CompletionTime'):
             total_time = (datetime.fromisoformat(timestamps['CompletionTime']) - 
                          datetime.fromisoformat(timestamps['InitialEventTime'])).total_seconds() * 1000
             durations['total'] = int(total_time)
@@ -36,6 +51,85 @@ def calculate_durations(timestamps):
         logger.error(f"Error calculating durations: {e}", exc_info=True)
         return {}
 
+def build_status_result(object_key, item):
+    """
+    Build the status and timing part of a lookup result from a tracking item
+    """
+    timestamps = {
+        'InitialEventTime': item.get('InitialEventTime'),
+        'QueuedTime': item.get('QueuedTime'),
+        'WorkflowStartTime': item.get('WorkflowStartTime'),
+        'CompletionTime': item.get('CompletionTime')
+    }
+    
+    return {
+        'object_key': object_key,
+        'status': item.get('ObjectStatus', 'UNKNOWN'),
+        'timing': {
+            'timestamps': timestamps,
+            'elapsed': calculate_durations(timestamps)
+        }
+    }
+
+def get_document_statuses(object_keys, known_statuses=None):
+    """
+    Get status and timing for many documents with BatchGetItem
+    
+    Keys are read in chunks of 100 with a projection limited to status and
+    timestamps, using eventually consistent reads. Unprocessed keys are retried
+    with exponential backoff.
+    
+    Args:
+        object_keys: Document object keys
+        known_statuses: Optional {object_key: status} the caller already has;
+            documents whose status is unchanged are left out of the results
+    
+    Returns:
+        Tuple of (results in object_keys order, number of unchanged documents omitted)
+    """
+    table_name = os.environ['TRACKING_TABLE']
+    known_statuses = known_statuses or {}
+    items = {}
+    
+    # Deduplicate while keeping order; BatchGetItem rejects duplicate keys
+    unique_keys = list(dict.fromkeys(object_keys))
+    for start in range(0, len(unique_keys), BATCH_GET_MAX_KEYS):
+        chunk = unique_keys[start:start + BATCH_GET_MAX_KEYS]
+        request = {
+            table_name: {
+                'Keys': [{'PK': f"doc#{key}", 'SK': 'none'} for key in chunk],
+                'ProjectionExpression': ', '.join(f"#a{i}" for i in range(len(STATUS_ATTRIBUTES))),
+                'ExpressionAttributeNames': {f"#a{i}": name for i, name in enumerate(STATUS_ATTRIBUTES)}
+            }
+        }
+        attempt = 0
+        while request:
+            response = dynamodb.batch_get_item(RequestItems=request)
+            for item in response.get('Responses', {}).get(table_name, []):
+                items[item['PK'][len('doc#'):]] = item
+            request = response.get('UnprocessedKeys') or None
+            if request:
+                attempt += 1
+                if attempt > BATCH_GET_MAX_RETRIES:
+                    raise RuntimeError(
+                        f"BatchGetItem left {len(request[table_name]['Keys'])} keys unprocessed after {BATCH_GET_MAX_RETRIES} retries"
+                    )
+                time.sleep(min(0.05 * 2 ** attempt, 2))
+    
+    results = []
+    unchanged = 0
+    for key in object_keys:
+        item = items.get(key)
+        if item is None:
+            result = {'object_key': key, 'status': 'NOT_FOUND'}
+        else:
+            result = build_status_result(key, item)
+        if key in known_statuses and known_statuses[key] == result['status']:
+            unchanged += 1
+            continue
+        results.append(result)
+    return results, unchanged
+
 def get_document_status(object_key, status_only=False):
     """
     Get status for a single document
@@ -47,7 +141,6 @@ def get_document_status(object_key, status_only=False):
     Returns:
         Dictionary with document status
     """
-    dynamodb = boto3.resource('dynamodb')
     tracking_table = dynamodb.Table(os.environ['TRACKING_TABLE'])
     
     try:
@@ -63,21 +156,7 @@ def get_document_status(object_key, status_only=False):
         item = response['Item']
         
         # Always include status and timing
-        timestamps = {
-            'InitialEventTime': item.get('InitialEventTime'),
-            'QueuedTime': item.get('QueuedTime'),
-            'WorkflowStartTime': item.get('WorkflowStartTime'),
-            'CompletionTime': item.get('CompletionTime')
-        }
-        
-        result = {
-            'object_key': object_key,
-            'status': item.get('ObjectStatus', 'UNKNOWN'),
-            'timing': {
-                'timestamps': timestamps,
-                'elapsed': calculate_durations(timestamps)
-            }
-        }
+        result = build_status_result(object_key, item)
         
         # If status_only mode, skip expensive Step Functions queries
         if status_only:
@@ -86,7 +165,6 @@ def get_document_status(object_key, status_only=False):
         execution_arn = item.get('WorkflowExecutionArn')
         if execution_arn:
             try:
-                sfn = boto3.client('stepfunctions')
                 execution = sfn.describe_execution(executionArn=execution_arn)
                 history = sfn.get_execution_history(
                     executionArn=execution_arn,
@@ -127,10 +205,16 @@ def handler(event, context):
     Request formats:
         Single: {'object_key': 'doc-123', 'status_only': False}
         Batch: {'object_keys': ['doc-1', 'doc-2', ...], 'status_only': True}
+        Batch, changed only: {'object_keys': [...], 'status_only': True,
+                              'known_statuses': {'doc-1': 'RUNNING', ...}}
     
     Response formats:
         Single: {'status': 'RUNNING', 'timing': {...}, 'processingDetail': {...}}
         Batch: {'results': [{'object_key': 'doc-1', 'status': 'COMPLETED'}, ...]}
+        Batch, changed only: {'results': [...], 'unchanged': 12}
+    
+    status_only batch requests use BatchGetItem; documents listed in
+    known_statuses whose status has not changed are omitted from the results.
     """
     logger.info(f"Event: {json.dumps(event)}")
 
@@ -146,6 +230,12 @@ def handler(event, context):
     # Handle batch request
     if object_keys:
         logger.info(f"Batch query for {len(object_keys)} documents (status_only={status_only})")
+        if status_only:
+            results, unchanged = get_document_statuses(object_keys, event.get('known_statuses'))
+            response = {'results': results}
+            if 'known_statuses' in event:
+                response['unchanged'] = unchanged
+            return response
         results = []
         for key in object_keys:
             result = get_document_status(key, status_only)
@@ -0,0 +1,123 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+"""
+Unit tests for the lookup_function Lambda batch status path.
+"""
+
+import os
+
+os.environ.setdefault('AWS_DEFAULT_REGION', 'us-east-1')
+
+import boto3
+import pytest
+from unittest.mock import patch
+from moto import mock_aws
+
+import index
+
+TABLE = 'test-tracking-table'
+
+
+@pytest.fixture
+def tracking_table():
+    with mock_aws(), patch.dict(os.environ, {'TRACKING_TABLE': TABLE}):
+        dynamodb = boto3.resource('dynamodb', region_name='us-east-1')
+        table = dynamodb.create_table(
+            TableName=TABLE,
+            KeySchema=[
+                {'AttributeName': 'PK', 'KeyType': 'HASH'},
+                {'AttributeName': 'SK', 'KeyType': 'RANGE'}
+            ],
+            AttributeDefinitions=[
+                {'AttributeName': 'PK', 'AttributeType': 'S'},
+                {'AttributeName': 'SK', 'AttributeType': 'S'}
+            ],
+            BillingMode='PAY_PER_REQUEST'
+        )
+        with patch.object(index, 'dynamodb', dynamodb):
+            yield table
+
+
+def _put_documents(table, count, status='RUNNING'):
+    with table.batch_writer() as batch:
+        for i in range(count):
+            batch.put_item(Item={
+                'PK': f"doc#batch/doc{i}.pdf",
+                'SK': 'none',
+                'ObjectStatus': status,
+                'InitialEventTime': '2025-10-15T10:00:00+00:00',
+                'QueuedTime': '2025-10-15T10:00:01+00:00',
+                'WorkflowStartTime': '2025-10-15T10:00:02+00:00',
+                'Sections': ['x' * 100] * 10
+            })
+
+
+@pytest.mark.unit
+def test_batch_status_uses_batch_get_item(tracking_table):
+    """status_only batch requests read keys in chunks of 100 and keep request order"""
+    _put_documents(tracking_table, 250)
+    keys = [f"batch/doc{i}.pdf" for i in reversed(range(250))] + ['batch/missing.pdf']
+
+    with patch.object(index.dynamodb, 'batch_get_item', wraps=index.dynamodb.batch_get_item) as batch_get:
+        response = index.handler({'object_keys': keys, 'status_only': True}, None)
+
+    assert batch_get.call_count == 3
+    request = batch_get.call_args_list[0].kwargs['RequestItems'][TABLE]
+    assert len(request['Keys']) == 100
+    assert set(request['ExpressionAttributeNames'].values()) == set(index.STATUS_ATTRIBUTES)
+
+    results = response['results']
+    assert [r['object_key'] for r in results] == keys
+    assert results[0]['status'] == 'RUNNING'
+    assert results[0]['timing']['elapsed'] == {'queue': 1000}
+    assert results[-1] == {'object_key': 'batch/missing.pdf', 'status': 'NOT_FOUND'}
+    assert 'unchanged' not in response
+
+
+@pytest.mark.unit
+def test_known_statuses_return_only_changes(tracking_table):
+    """Documents whose status matches known_statuses are omitted"""
+    _put_documents(tracking_table, 3)
+    tracking_table.update_item(
+        Key={'PK': 'doc#batch/doc1.pdf', 'SK': 'none'},
+        UpdateExpression='SET ObjectStatus = :s',
+        ExpressionAttributeValues={':s': 'COMPLETED'}
+    )
+    keys = [f"batch/doc{i}.pdf" for i in range(3)]
+
+    response = index.handler({
+        'object_keys': keys,
+        'status_only': True,
+        'known_statuses': {key: 'RUNNING' for key in keys[:2]}
+    }, None)
+
+    assert [(r['object_key'], r['status']) for r in response['results']] == [
+        ('batch/doc1.pdf', 'COMPLETED'),
+        ('batch/doc2.pdf', 'RUNNING')
+    ]
+    assert response['unchanged'] == 1
+
+
+@pytest.mark.unit
+def test_unprocessed_keys_are_retried(tracking_table):
+    """UnprocessedKeys from BatchGetItem are requested again"""
+    _put_documents(tracking_table, 2)
+    real_batch_get = index.dynamodb.batch_get_item
+    calls = []
+
+    def throttled_batch_get(RequestItems):
+        calls.append(RequestItems)
+        if len(calls) == 1:
+            keys = RequestItems[TABLE]['Keys']
+            response = real_batch_get(RequestItems={TABLE: dict(RequestItems[TABLE], Keys=keys[:1])})
+            response['UnprocessedKeys'] = {TABLE: dict(RequestItems[TABLE], Keys=keys[1:])}
+            return response
+        return real_batch_get(RequestItems=RequestItems)
+
+    with patch.object(index.dynamodb, 'batch_get_item', side_effect=throttled_batch_get), \
+            patch.object(index.time, 'sleep'):
+        results, unchanged = index.get_document_statuses(['batch/doc0.pdf', 'batch/doc1.pdf'])
+
+    assert len(calls) == 2
+    assert [r['status'] for r in results] == ['RUNNING', 'RUNNING']
+    assert unchanged == 0
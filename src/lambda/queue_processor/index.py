@@ -4,10 +4,11 @@
 import boto3
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from botocore.exceptions import ClientError
 import logging
-from typing import Dict, Any, Tuple
+from typing import Dict, Any, List, Optional, Tuple
 from idp_common.models import Document, Status
 from idp_common.docs_service import create_document_service
 
@@ -23,6 +24,11 @@ concurrency_table = dynamodb.Table(os.environ['CONCURRENCY_TABLE'])
 state_machine_arn = os.environ['STATE_MACHINE_ARN']
 MAX_CONCURRENT = int(os.environ.get('MAX_CONCURRENT', '5'))
 COUNTER_ID = 'workflow_counter'
+# Batch admission reserves counter slots for a whole SQS batch at once and starts
+# the admitted workflows concurrently
+BATCH_ADMISSION = os.environ.get('BATCH_ADMISSION', 'false').lower() == 'true'
+START_WORKERS = max(1, int(os.environ.get('START_WORKERS', '10')))
+RESERVE_MAX_ATTEMPTS = 3
 
 def update_counter(increment: bool = True) -> bool:
     """
@@ -64,6 +70,72 @@ def update_counter(increment: bool = True) -> bool:
         logger.error(f"Error updating counter: {e}")
         raise
 
+def reserve_slots(requested: int) -> int:
+    """
+    Reserve up to `requested` concurrency slots with one conditional atomic add
+    
+    If fewer slots are free, the count read from the failed condition check is
+    used to retry with the number still available.
+    
+    Args:
+        requested: Number of slots wanted
+        
+    Returns:
+        int: Number of slots reserved (0 if the limit is reached)
+        
+    Raises:
+        ClientError: If DynamoDB operation fails
+    """
+    count = min(requested, MAX_CONCURRENT)
+    for _ in range(RESERVE_MAX_ATTEMPTS):
+        if count <= 0:
+            break
+        try:
+            concurrency_table.update_item(
+                Key={'counter_id': COUNTER_ID},
+                UpdateExpression='ADD active_count :inc',
+                ConditionExpression='active_count <= :limit',
+                ExpressionAttributeValues={
+                    ':inc': count,
+                    ':limit': MAX_CONCURRENT - count
+                },
+                ReturnValuesOnConditionCheckFailure='ALL_OLD'
+            )
+            logger.info(f"Reserved {count} of {requested} requested slots")
+            return count
+        except ClientError as e:
+            if e.response['Error']['Code'] != 'ConditionalCheckFailedException':
+                logger.error(f"Error reserving slots: {e}")
+                raise
+            # The failed check returns the current item in low-level format
+            active = e.response.get('Item', {}).get('active_count', {}).get('N')
+            if active is None:
+                active = concurrency_table.get_item(
+                    Key={'counter_id': COUNTER_ID}, ConsistentRead=True
+                ).get('Item', {}).get('active_count', MAX_CONCURRENT)
+            active = int(active)
+            count = min(count, MAX_CONCURRENT - active)
+    logger.warning("Concurrency limit reached")
+    return 0
+
+def release_slots(count: int) -> None:
+    """
+    Release reserved slots that were not used, with one atomic add
+    
+    Args:
+        count: Number of slots to release
+    """
+    if count <= 0:
+        return
+    try:
+        concurrency_table.update_item(
+            Key={'counter_id': COUNTER_ID},
+            UpdateExpression='ADD active_count :dec',
+            ExpressionAttributeValues={':dec': -count}
+        )
+    except Exception as e:
+        logger.error(f"Failed to release {count} slots: {e}", exc_info=True)
+
 def start_workflow(document: Document) -> Dict[str, Any]:
     """
     Start Step Functions workflow
@@ -175,16 +247,97 @@ def process_message(record: Dict[str, Any]) -> Tuple[bool, str]:
         logger.error(f"Unexpected error processing message {message_id}: {str(e)}", exc_info=True)
         return False, message_id
 
+def load_message(record: Dict[str, Any]) -> Optional[Document]:
+    """
+    Load the document from an SQS message
+    
+    Returns:
+        The Document, or None if the message cannot be parsed
+    """
+    message_id = record['messageId']
+    try:
+        working_bucket = os.environ.get('WORKING_BUCKET')
+        return Document.load_document(json.loads(record['body']), working_bucket, logger)
+    except json.JSONDecodeError as e:
+        logger.error(f"Invalid JSON in message {message_id}: {str(e)}")
+    except KeyError as e:
+        logger.error(f"Missing required field in message {message_id}: {str(e)}")
+    except Exception as e:
+        logger.error(f"Unexpected error processing message {message_id}: {str(e)}", exc_info=True)
+    return None
+
+def launch_document(document: Document) -> bool:
+    """
+    Start the workflow for an admitted document and update its status
+    
+    Returns:
+        bool: True if the workflow started and the document was updated
+    """
+    try:
+        start_workflow(document)
+        updated_doc = document_service.update_document(document)
+        logger.info(f"Document updated: {updated_doc}")
+        return True
+    except Exception as e:
+        logger.error(f"Error processing {document.input_key}: {str(e)}", exc_info=True)
+        return False
+
+def process_batch(records: List[Dict[str, Any]]) -> List[str]:
+    """
+    Admit a batch of SQS messages with a single counter reservation
+    
+    Documents are admitted in record order up to the number of slots reserved,
+    and their workflows are started concurrently. Slots of workflows that fail
+    to start are released with one counter update.
+    
+    Args:
+        records: SQS message records
+        
+    Returns:
+        List of message IDs to report as batch item failures (unparseable,
+        not admitted, or failed to start)
+    """
+    failed_message_ids = []
+    loaded = []
+    for record in records:
+        document = load_message(record)
+        if document is None:
+            failed_message_ids.append(record['messageId'])
+        else:
+            loaded.append((record['messageId'], document))
+    
+    try:
+        reserved = reserve_slots(len(loaded)) if loaded else 0
+    except Exception as e:
+        logger.error(f"Error reserving slots: {e}", exc_info=True)
+        reserved = 0
+    admitted, waiting = loaded[:reserved], loaded[reserved:]
+    if waiting:
+        logger.warning(f"Concurrency limit reached, {len(waiting)} messages not admitted")
+        failed_message_ids.extend(message_id for message_id, _ in waiting)
+    
+    if admitted:
+        logger.info(f"Starting {len(admitted)} workflows")
+        with ThreadPoolExecutor(max_workers=min(START_WORKERS, len(admitted))) as executor:
+            started = list(executor.map(launch_document, [document for _, document in admitted]))
+        failed_starts = [message_id for (message_id, _), ok in zip(admitted, started) if not ok]
+        release_slots(len(failed_starts))
+        failed_message_ids.extend(failed_starts)
+    
+    return failed_message_ids
+
 def handler(event, context):
     logger.info(f"Processing event: {json.dumps(event)}")
     logger.info(f"Processing batch of {len(event['Records'])} messages")
     
-    failed_message_ids = []
-    
-    for record in event['Records']:
-        success, message_id = process_message(record)
-        if not success:
-            failed_message_ids.append(message_id)
+    if BATCH_ADMISSION:
+        failed_message_ids = process_batch(event['Records'])
+    else:
+        failed_message_ids = []
+        for record in event['Records']:
+            success, message_id = process_message(record)
+            if not success:
+                failed_message_ids.append(message_id)
     
     return {
         "batchItemFailures": [
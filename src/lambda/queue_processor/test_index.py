@@ -0,0 +1,125 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+"""
+Unit tests for the queue_processor Lambda batch admission mode.
+"""
+
+import json
+import os
+import threading
+import time
+
+os.environ.setdefault('AWS_DEFAULT_REGION', 'us-east-1')
+os.environ.setdefault('CONCURRENCY_TABLE', 'test-concurrency-table')
+os.environ.setdefault('STATE_MACHINE_ARN', 'arn:aws:states:us-east-1:123456789012:stateMachine:test')
+
+import boto3
+import pytest
+from unittest.mock import MagicMock, patch
+from moto import mock_aws
+
+with patch('idp_common.docs_service.create_document_service'):
+    import index
+
+
+def _record(i):
+    return {
+        'messageId': f"msg-{i}",
+        'body': json.dumps({'id': f"doc{i}.pdf", 'input_key': f"doc{i}.pdf", 'status': 'QUEUED'})
+    }
+
+
+@pytest.fixture
+def counter():
+    """Moto concurrency table holding the workflow counter"""
+    with mock_aws():
+        table = boto3.resource('dynamodb', region_name='us-east-1').create_table(
+            TableName='test-concurrency-table',
+            KeySchema=[{'AttributeName': 'counter_id', 'KeyType': 'HASH'}],
+            AttributeDefinitions=[{'AttributeName': 'counter_id', 'AttributeType': 'S'}],
+            BillingMode='PAY_PER_REQUEST'
+        )
+
+        def set_active(count):
+            table.put_item(Item={'counter_id': index.COUNTER_ID, 'active_count': count})
+
+        def get_active():
+            return int(table.get_item(Key={'counter_id': index.COUNTER_ID})['Item']['active_count'])
+
+        set_active(0)
+        with patch.object(index, 'concurrency_table', table), \
+                patch.object(index, 'MAX_CONCURRENT', 10), \
+                patch.object(index, 'BATCH_ADMISSION', True), \
+                patch.object(index, 'document_service', MagicMock()):
+            yield set_active, get_active
+
+
+@pytest.mark.unit
+def test_reserve_slots_is_capped_by_max_concurrent(counter):
+    set_active, get_active = counter
+    set_active(7)
+
+    assert index.reserve_slots(5) == 3
+    assert get_active() == 10
+    assert index.reserve_slots(1) == 0
+    assert get_active() == 10
+
+
+@pytest.mark.unit
+@patch('index.sfn')
+def test_batch_admits_only_free_slots(mock_sfn, counter):
+    """Records beyond the free slots are returned as batchItemFailures"""
+    set_active, get_active = counter
+    set_active(6)
+    mock_sfn.start_execution.side_effect = lambda **kwargs: {
+        'executionArn': json.loads(kwargs['input'])['document']['input_key']
+    }
+
+    response = index.handler({'Records': [_record(i) for i in range(6)]}, None)
+
+    assert response['batchItemFailures'] == [{'itemIdentifier': 'msg-4'}, {'itemIdentifier': 'msg-5'}]
+    started = sorted(c.kwargs['input'] for c in mock_sfn.start_execution.call_args_list)
+    assert [json.loads(i)['document']['input_key'] for i in started] == [f"doc{i}.pdf" for i in range(4)]
+    assert get_active() == 10
+
+
+@pytest.mark.unit
+@patch('index.sfn')
+def test_failed_starts_release_their_slots(mock_sfn, counter):
+    set_active, get_active = counter
+
+    def start_execution(**kwargs):
+        if 'doc1.pdf' in kwargs['input']:
+            raise RuntimeError('ExecutionLimitExceeded')
+        return {'executionArn': 'arn'}
+
+    mock_sfn.start_execution.side_effect = start_execution
+    records = [_record(i) for i in range(3)] + [{'messageId': 'msg-bad', 'body': 'not json'}]
+
+    response = index.handler({'Records': records}, None)
+
+    assert sorted(f['itemIdentifier'] for f in response['batchItemFailures']) == ['msg-1', 'msg-bad']
+    assert get_active() == 2
+
+
+@pytest.mark.unit
+@patch('index.sfn')
+def test_workflows_start_concurrently(mock_sfn, counter):
+    active, peak = [0], [0]
+    lock = threading.Lock()
+
+    def start_execution(**kwargs):
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        time.sleep(0.05)
+        with lock:
+            active[0] -= 1
+        return {'executionArn': 'arn'}
+
+    mock_sfn.start_execution.side_effect = start_execution
+    with patch.object(index, 'START_WORKERS', 4):
+        response = index.handler({'Records': [_record(i) for i in range(8)]}, None)
+
+    assert response['batchItemFailures'] == []
+    assert peak[0] == 4
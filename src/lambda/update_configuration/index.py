@@ -10,6 +10,8 @@ from typing import Dict, Any, Union
 import yaml
 from decimal import Decimal
 
+from idp_common.config import bump_configuration_version
+
 logger = logging.getLogger()
 logger.setLevel(os.environ.get("LOG_LEVEL", "INFO"))
 logging.getLogger('idp_common.bedrock.client').setLevel(os.environ.get("BEDROCK_LOG_LEVEL", "INFO"))
@@ -90,6 +92,7 @@ def update_configuration(configuration_type: str, data: Dict[str, Any]) -> None:
                 **converted_data
             }
         )
+        bump_configuration_version(table)
     except ClientError as e:
         logger.error(f"Error updating configuration {configuration_type}: {str(e)}")
         raise
@@ -104,6 +107,7 @@ def delete_configuration(configuration_type: str) -> None:
                 'Configuration': configuration_type
             }
         )
+        bump_configuration_version(table)
     except ClientError as e:
         logger.error(f"Error deleting configuration {configuration_type}: {str(e)}")
         raise
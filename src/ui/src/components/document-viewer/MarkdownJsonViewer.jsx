@@ -374,6 +374,9 @@ const MarkdownJsonViewer = ({ fileUri, textConfidenceUri, fileType = 'text', but
     setIsViewerOpen(true);
   };
 
+  // Bundled OCR page artifacts are byte ranges of a pack object and cannot be saved in place
+  const isBundledRange = fileUri.includes('#range=');
+
   return (
     <Box className="w-full">
       {!isViewerOpen && (
@@ -399,9 +402,11 @@ const MarkdownJsonViewer = ({ fileUri, textConfidenceUri, fileType = 'text', but
           <Box>
             <SpaceBetween direction="horizontal" size="xs">
               <Button onClick={closeViewer}>Close</Button>
-              <Toggle onChange={handleEditToggle} checked={isEditing}>
-                Edit mode
-              </Toggle>
+              {!isBundledRange && (
+                <Toggle onChange={handleEditToggle} checked={isEditing}>
+                  Edit mode
+                </Toggle>
+              )}
               {isEditing && (
                 <Button
                   variant="primary"
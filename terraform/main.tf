@@ -884,6 +884,8 @@ module "queue_processor_function" {
       STATE_MACHINE_ARN = aws_sfn_state_machine.pattern2_document_processing.arn
       CONCURRENCY_TABLE = module.concurrency_table.table_name
       MAX_CONCURRENT    = tostring(var.max_concurrent_workflows)
+      BATCH_ADMISSION   = tostring(var.queue_processor_batch_admission)
+      START_WORKERS     = tostring(var.queue_processor_start_workers)
       WORKING_BUCKET    = module.working_bucket.bucket_id
       LOG_LEVEL         = var.log_level
       BEDROCK_LOG_LEVEL = var.bedrock_log_level
@@ -973,10 +975,21 @@ module "queue_processor_function" {
 resource "aws_lambda_event_source_mapping" "queue_processor_sqs" {
   event_source_arn = aws_sqs_queue.document_processing_queue.arn
   function_name    = module.queue_processor_function.function_arn
-  batch_size       = 1
+  batch_size       = var.queue_processor_batch_size
+
+  # Lambda requires a batching window for batch sizes above 10. On a quiet queue
+  # it may wait up to 20 seconds before invoking, even with a shorter window.
+  maximum_batching_window_in_seconds = var.queue_processor_batching_window_seconds
 
   function_response_types = ["ReportBatchItemFailures"]
 
+  lifecycle {
+    precondition {
+      condition     = var.queue_processor_batch_size <= 10 || var.queue_processor_batching_window_seconds >= 1
+      error_message = "queue_processor_batching_window_seconds must be at least 1 when queue_processor_batch_size is above 10"
+    }
+  }
+
   depends_on = [
     module.queue_processor_function,
     aws_sqs_queue.document_processing_queue
@@ -1237,7 +1250,12 @@ module "ocr_function" {
       Effect = "Allow"
       Action = [
         "textract:DetectDocumentText",
-        "textract:AnalyzeDocument"
+        "textract:AnalyzeDocument",
+        # Asynchronous mode for large PDFs (ocr.textract_async)
+        "textract:StartDocumentTextDetection",
+        "textract:StartDocumentAnalysis",
+        "textract:GetDocumentTextDetection",
+        "textract:GetDocumentAnalysis"
       ]
       Resource = "*"
     },
@@ -10,6 +10,10 @@ import yaml
 import boto3
 from decimal import Decimal
 import math
+from datetime import datetime, timezone
+
+# Version marker read by idp_common.config.get_config (see bump_configuration_version)
+CONFIGURATION_VERSION_KEY = "ConfigurationVersion"
 
 
 def convert_to_dynamodb_format(obj):
@@ -36,6 +40,23 @@ def convert_to_dynamodb_format(obj):
         return {"S": str(obj)}
 
 
+def bump_configuration_version(client, table_name):
+    """
+    Increment the configuration version marker so deployed Lambdas with a
+    cached configuration reload it on their next version check.
+    """
+    client.update_item(
+        TableName=table_name,
+        Key={"Configuration": {"S": CONFIGURATION_VERSION_KEY}},
+        UpdateExpression="ADD #v :one SET #u = :now",
+        ExpressionAttributeNames={"#v": "Version", "#u": "UpdatedAt"},
+        ExpressionAttributeValues={
+            ":one": {"N": "1"},
+            ":now": {"S": datetime.now(timezone.utc).isoformat()},
+        },
+    )
+
+
 def load_config_to_dynamodb(yaml_file_path, table_name, region, config_id="Default"):
     """
     Load configuration from YAML file into DynamoDB table.
@@ -76,11 +97,18 @@ def load_config_to_dynamodb(yaml_file_path, table_name, region, config_id="Defau
         )
         print("✓ Configuration loaded successfully!")
         print(f"Response: {response['ResponseMetadata']['HTTPStatusCode']}")
-        return True
     except Exception as e:
         print(f"✗ Error loading configuration: {e}")
         return False
 
+    try:
+        bump_configuration_version(client, table_name)
+        print("✓ Configuration version updated")
+    except Exception as e:
+        # The configuration was written; cached readers pick it up at their maximum cache age
+        print(f"⚠ Error updating configuration version: {e}")
+    return True
+
 
 def main():
     if len(sys.argv) < 4:
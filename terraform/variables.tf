@@ -341,6 +341,45 @@ variable "max_concurrent_workflows" {
   }
 }
 
+variable "queue_processor_batch_admission" {
+  description = "Admit a whole SQS batch with one conditional counter update and start its workflows in parallel (BATCH_ADMISSION)"
+  type        = bool
+  default     = true
+}
+
+variable "queue_processor_start_workers" {
+  description = "Threads the queue processor uses to start Step Functions executions for an admitted batch (START_WORKERS)"
+  type        = number
+  default     = 10
+
+  validation {
+    condition     = var.queue_processor_start_workers >= 1 && var.queue_processor_start_workers <= 50
+    error_message = "Queue processor start workers must be between 1 and 50"
+  }
+}
+
+variable "queue_processor_batch_size" {
+  description = "Maximum number of SQS messages per queue processor invocation (use 1 without batch admission)"
+  type        = number
+  default     = 50
+
+  validation {
+    condition     = var.queue_processor_batch_size >= 1 && var.queue_processor_batch_size <= 10000
+    error_message = "Queue processor batch size must be between 1 and 10000"
+  }
+}
+
+variable "queue_processor_batching_window_seconds" {
+  description = "Seconds Lambda waits to fill a queue processor batch; required (>= 1) for batch sizes above 10. On a quiet queue Lambda may wait up to 20 seconds"
+  type        = number
+  default     = 1
+
+  validation {
+    condition     = var.queue_processor_batching_window_seconds >= 0 && var.queue_processor_batching_window_seconds <= 300
+    error_message = "Queue processor batching window must be between 0 and 300 seconds"
+  }
+}
+
 # Reporting Configuration (optional)
 variable "reporting_bucket_name" {
   description = "Name of the reporting S3 bucket (optional, for analytics data)"